@@ -34,7 +34,7 @@ from glob import glob
 from os.path import basename
 from os.path import splitext
 
-from setuptools import find_packages, setup
+from setuptools import Extension, find_packages, setup
 setup(
     name='keri',
     version='2.0.0-dev3',  # also change in src/keri/__init__.py
@@ -47,6 +47,8 @@ setup(
     packages=find_packages('src'),
     package_dir={'': 'src'},
     py_modules=[splitext(basename(path))[0] for path in glob('src/*.py')],
+    ext_modules=[Extension('keri.core._cesr', ['src/keri/core/_cesr.c'],
+                           optional=True)],  # pure python fallback when not built
     include_package_data=True,
     zip_safe=False,
     classifiers=[
@@ -100,6 +102,7 @@ setup(
                         'wheel>=0.45.1',
     ],
     extras_require={
+                    'asgi': ['uvicorn>=0.30.0'],
     },
     tests_require=[
                     'coverage>=7.9.2',
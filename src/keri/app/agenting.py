@@ -4,6 +4,7 @@ KERI
 keri.app.agenting module
 
 """
+import bisect
 import random
 from urllib.parse import urlparse, urljoin
 
@@ -290,12 +291,29 @@ class WitnessReceiptor(doing.DoDoer):
     for receipts from each of those witnesses, and propagates those receipts to each
     of the other witnesses after receiving the complete set.
 
-    Removes all Doers and exits as Done once all witnesses have been sent the entire
-    receipt set.  Could be enhanced to have a `once` method that runs once and cleans up
-    and an `all` method that runs and waits for more messages to receipt.
+    Events are receipted concurrently. Each event is sent to all its witnesses
+    at once and is cued as receipted as soon as the witness threshold, toad, of
+    receipts is reached so one slow witness does not gate progress. Collection
+    of the remaining receipts and their propagation to the other witnesses
+    continue in the background for up to .timeout seconds after the threshold
+    is reached. Use .idle to wait for background propagation to finish before
+    removing this doer. The latency from send to receipt of each witness is
+    recorded in a histogram in .latencies.
+
+    Attributes:
+        timeout (float): seconds to wait for remaining receipts after toad is met
+        receipting (list): generators of events being receipted
+        latencies (dict): histogram of receipt latency of each witness keyed by
+            witness prefix. Each histogram is a list of counts of receipts
+            whose latency is at most the corresponding bound in .Buckets with a
+            final count for those above the last bound.
     """
 
-    def __init__(self, hby, msgs=None, cues=None, force=False, auths=None, **kwa):
+    Timeout = 30.0  # seconds to wait for stragglers once toad receipts are in
+    Buckets = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)  # seconds
+
+    def __init__(self, hby, msgs=None, cues=None, force=False, auths=None, clienter=None,
+                 timeout=None, **kwa):
         """
         For the current event, gather the current set of witnesses, send the event,
         gather all receipts and send them to all other witnesses
@@ -304,23 +322,36 @@ class WitnessReceiptor(doing.DoDoer):
             hby (Habery): Habitat of the identifier to receipt witnesses
             msgs (Deck): events to send the event and receipt to all witnesses
                 Messages should have {"pre": <str>, "sn": <int>, "auths": <dict>}
-            cues (Deck): outgoing cues of events confirmed as fully receipted
+            cues (Deck): outgoing cues of events confirmed as receipted by at least toad witnesses
                 Messages have {"pre": <str>, "sn": <int>, "auths": <dict>}
             force (bool): True means to send witnesses all receipts even if we have a full complement.
             auths (dict): map of witness AIDs to (time,auth) tuples for providing TOTP auth for witnessing
+            clienter (Clienter): pooled HTTP connections to witnesses reused across events
+            timeout (float | None): seconds to wait for remaining receipts after
+                toad is met. Default .Timeout
         """
         self.hby = hby
         self.force = force
         self.msgs = msgs if msgs is not None else decking.Deck()
         self.cues = cues if cues is not None else decking.Deck()
         self.auths = auths if auths is not None else dict()
+        self.clienter = clienter if clienter is not None else httping.Clienter()
+        self.timeout = timeout if timeout is not None else self.Timeout
+        self.receipting = []
+        self.latencies = dict()
 
-        super(WitnessReceiptor, self).__init__(doers=[doing.doify(self.receiptDo)], **kwa)
+        super(WitnessReceiptor, self).__init__(doers=[self.clienter, doing.doify(self.receiptDo)],
+                                               **kwa)
+
+    @property
+    def idle(self):
+        """ True means no events waiting or being receipted or propagated """
+        return not self.msgs and not self.receipting
 
     def receiptDo(self, tymth=None, tock=0.0, **kwa):
         """
-        Sends events, their receipts, receipt signatures, delegation chain, and location record
-         URLs between witnesses in the set of current witnesses.
+        Starts receipting of each event in .msgs and advances all events being
+        receipted once per run.
 
         Returns:
              a doifiable Hio generator to perform event and receipt sending.
@@ -338,110 +369,157 @@ class WitnessReceiptor(doing.DoDoer):
 
         while True:
             while self.msgs:
-                evt = self.msgs.popleft()
-                pre = evt["pre"]
+                self.receipting.append(self.receipt(self.msgs.popleft()))
 
-                if pre not in self.hby.habs:
-                    continue
-
-                hab = self.hby.habs[pre]
+            for receipting in list(self.receipting):
+                try:
+                    next(receipting)
+                except StopIteration:
+                    self.receipting.remove(receipting)
 
-                sn = evt["sn"] if "sn" in evt else hab.kever.sner.num
-                wits = hab.kever.wits
+            yield self.tock
 
-                if len(wits) == 0:
-                    continue
+    def receipt(self, evt):
+        """
+        Generator that receipts one event. Sends the event, delegation chain and
+        if needed the full KEL to all witnesses at once, cues the event once
+        toad witnesses have receipted it, then collects the remaining receipts
+        and sends each witness the receipts of the others along with location
+        records of newly introduced witnesses.
 
-                msg = hab.makeOwnEvent(sn=sn)
-                ser = serdering.SerderKERI(raw=msg)
+        Parameters:
+            evt (dict): {"pre": <str>, "sn": <int>, "auths": <dict>} of event
+        """
+        pre = evt["pre"]
+        if pre not in self.hby.habs:
+            return
 
-                dgkey = dbing.dgKey(ser.preb, ser.saidb)
+        hab = self.hby.habs[pre]
 
-                witers = []
-                for wit in wits:
-                    auth = self.auths[wit] if wit in self.auths else None
-                    witer = messenger(hab, wit, auth=auth)
-                    witers.append(witer)
-                    self.extend([witer])
+        sn = evt["sn"] if "sn" in evt else hab.kever.sner.num
+        wits = hab.kever.wits
+        toad = hab.kever.toader.num
 
-                # Check to see if we already have all the receipts we need for this event
-                wigs = hab.db.getWigs(dgkey)
-                completed = len(wigs) == len(wits)
-                if len(wigs) != len(wits):  # We have all the receipts, skip
-                    for idx, witer in enumerate(witers):
-                        wit = wits[idx]
+        if len(wits) == 0:
+            return
 
-                        for dmsg in hab.db.cloneDelegation(hab.kever):
-                            witer.msgs.append(bytearray(dmsg))
+        msg = hab.makeOwnEvent(sn=sn)
+        ser = serdering.SerderKERI(raw=msg)
 
-                        if ser.ked['t'] in (coring.Ilks.icp, coring.Ilks.dip) or \
-                                "ba" in ser.ked and wit in ser.ked["ba"]:  # Newly added witness, must send full KEL to catch up
-                            for fmsg in hab.db.clonePreIter(pre=pre):
-                                witer.msgs.append(bytearray(fmsg))
+        dgkey = dbing.dgKey(ser.preb, ser.saidb)
 
-                        witer.msgs.append(bytearray(msg))  # make a copy
-                        _ = (yield self.tock)
+        witers = []
+        for wit in wits:
+            auth = self.auths[wit] if wit in self.auths else None
+            witer = messenger(hab, wit, auth=auth, clienter=self.clienter)
+            witers.append(witer)
+        self.extend(witers)
+
+        cued = False  # True once cued at toad
+        try:
+            # Check to see if we already have all the receipts we need for this event
+            wigs = hab.db.getWigs(dgkey)
+            completed = len(wigs) == len(wits)
+            if not completed:
+                for idx, witer in enumerate(witers):  # fan out to all witnesses at once
+                    wit = wits[idx]
+
+                    for dmsg in hab.db.cloneDelegation(hab.kever):
+                        witer.msgs.append(bytearray(dmsg))
+
+                    if ser.ked['t'] in (coring.Ilks.icp, coring.Ilks.dip) or \
+                            "ba" in ser.ked and wit in ser.ked["ba"]:  # Newly added witness, must send full KEL to catch up
+                        for fmsg in hab.db.clonePreIter(pre=pre):
+                            witer.msgs.append(bytearray(fmsg))
+
+                    witer.msgs.append(bytearray(msg))  # make a copy
+
+                start = self.tyme
+                seen = {indexing.Siger(qb64b=bytes(wig)).index for wig in wigs}
+                quorum = None  # time toad was met
+                while True:
+                    wigs = hab.db.getWigs(dgkey)
+                    now = self.tyme
+                    for idx in {indexing.Siger(qb64b=bytes(wig)).index for wig in wigs} - seen:
+                        seen.add(idx)
+                        if idx < len(wits):
+                            self.observe(wits[idx], now - start)
+
+                    if quorum is None and len(wigs) >= toad:
+                        quorum = now
+                        self.cues.push(evt)
+                        cued = True
+
+                    if len(wigs) == len(wits):
+                        break
 
-                    while True:
-                        wigs = hab.db.getWigs(dgkey)
-                        if len(wigs) == len(wits):
-                            break
-                        _ = yield self.tock
+                    if quorum is not None and now - quorum > self.timeout:
+                        missing = [wit for idx, wit in enumerate(wits) if idx not in seen]
+                        logger.info("WitnessReceiptor: gave up on receipts of %s for "
+                                    "event %s of %s", missing, sn, pre)
+                        break
 
-                # If we started with all our receipts, exit unless told to force resubmit of all receipts
-                if completed and not self.force:
-                    self.cues.push(evt)
-                    continue
+                    _ = yield self.tock
 
-                # generate all rct msgs to send to all witnesses
-                awigers = [indexing.Siger(qb64b=bytes(wig)) for wig in wigs]
+            # If we started with all our receipts, exit unless told to force resubmit of all receipts
+            if completed and not self.force:
+                self.cues.push(evt)
+                return
 
-                # make sure all witnesses have fully receipted KERL and know about each other
-                for witer in witers:
-                    ewits = []
-                    wigers = []
-                    for i, wit in enumerate(wits):
-                        if wit == witer.wit:
-                            continue
-                        ewits.append(wit)
-                        wigers.append(awigers[i])
+            # generate all rct msgs to send to all witnesses
+            awigers = [indexing.Siger(qb64b=bytes(wig)) for wig in wigs]
 
-                    if len(wigers) == 0:
+            # make sure all witnesses have fully receipted KERL and know about each other
+            for witer in witers:
+                ewits = []
+                wigers = []
+                for wiger in awigers:
+                    if wiger.index >= len(wits) or wits[wiger.index] == witer.wit:
                         continue
+                    ewits.append(wits[wiger.index])
+                    wigers.append(wiger)
 
-                    rctMsg = bytearray()
-
-                    # Now that the witnesses have not met each other, send them each other's receipts
-                    if ser.ked['t'] in (coring.Ilks.icp, coring.Ilks.dip):  # introduce new witnesses
-                        rctMsg.extend(schemes(self.hby.db, eids=ewits))
-                    elif ser.ked['t'] in (coring.Ilks.rot, coring.Ilks.drt) and \
-                            ("ba" in ser.ked and witer.wit in ser.ked["ba"]):  # Newly added witness, introduce to all
-                        rctMsg.extend(schemes(self.hby.db, eids=ewits))
+                if len(wigers) == 0:
+                    continue
 
-                    rserder = eventing.receipt(pre=ser.pre,
-                                               sn=sn,
-                                               said=ser.said)
-                    rctMsg.extend(eventing.messagize(serder=rserder, wigers=wigers))
+                rctMsg = bytearray()
 
-                    witer.msgs.append(rctMsg)
-                    _ = (yield self.tock)
+                # Now that the witnesses have not met each other, send them each other's receipts
+                if ser.ked['t'] in (coring.Ilks.icp, coring.Ilks.dip):  # introduce new witnesses
+                    rctMsg.extend(schemes(self.hby.db, eids=ewits))
+                elif ser.ked['t'] in (coring.Ilks.rot, coring.Ilks.drt) and \
+                        ("ba" in ser.ked and witer.wit in ser.ked["ba"]):  # Newly added witness, introduce to all
+                    rctMsg.extend(schemes(self.hby.db, eids=ewits))
 
-                while True:
-                    done = True
-                    for witer in witers:
-                        if not witer.idle:
-                            yield 1.0
-                            done = False
-                            break
-                    if done:
-                        break
+                rserder = eventing.receipt(pre=ser.pre,
+                                           sn=sn,
+                                           said=ser.said)
+                rctMsg.extend(eventing.messagize(serder=rserder, wigers=wigers))
 
-                self.remove(witers)
+                witer.msgs.append(rctMsg)
 
+            if not cued:
                 self.cues.push(evt)
-                yield self.tock
 
-            yield self.tock
+            start = self.tyme
+            while any(witer.msgs or not witer.idle for witer in witers):
+                if self.tyme - start > self.timeout:
+                    break
+                _ = yield self.tock
+
+        finally:
+            self.remove(witers)
+
+    def observe(self, wit, latency):
+        """
+        Adds latency of receipt of wit to its histogram in .latencies
+
+        Parameters:
+            wit (str): qb64 prefix of witness
+            latency (float): seconds from send of event to receipt
+        """
+        histogram = self.latencies.setdefault(wit, [0] * (len(self.Buckets) + 1))
+        histogram[bisect.bisect_left(self.Buckets, latency)] += 1
 
 
 class WitnessInquisitor(doing.DoDoer):
@@ -890,13 +968,16 @@ class HTTPMessenger(doing.DoDoer):
 
     """
 
-    def __init__(self, hab, wit, url, msgs=None, sent=None, doers=None, auth=None, **kwa):
+    def __init__(self, hab, wit, url, msgs=None, sent=None, doers=None, auth=None, clienter=None,
+                 **kwa):
         """
         For the current event, gather the current set of witnesses, send the event,
         gather all receipts and send them to all other witnesses
 
         Parameters:
             hab: Habitat of the identifier to populate witnesses
+            clienter (Clienter): pooled HTTP connections to send over instead of a
+                connection of this messenger's own. Must be run by its owner
 
         """
         self.hab = hab
@@ -913,10 +994,11 @@ class HTTPMessenger(doing.DoDoer):
         if up.scheme != kering.Schemes.http and up.scheme != kering.Schemes.https:
             raise ValueError(f"invalid scheme {up.scheme} for HTTPMessenger")
 
-        self.client = http.clienting.Client(scheme=up.scheme, hostname=up.hostname, port=up.port)
-        clientDoer = http.clienting.ClientDoer(client=self.client)
-
-        doers.extend([clientDoer])
+        if clienter is not None:
+            self.client = clienter.patron(url)
+        else:
+            self.client = http.clienting.Client(scheme=up.scheme, hostname=up.hostname, port=up.port)
+            doers.extend([http.clienting.ClientDoer(client=self.client)])
 
         super(HTTPMessenger, self).__init__(doers=doers, **kwa)
 
@@ -973,26 +1055,33 @@ class HTTPStreamMessenger(doing.DoDoer):
 
     """
 
-    def __init__(self, hab, wit, url, msg=b'', headers=None, **kwa):
+    def __init__(self, hab, wit, url, msg=b'', headers=None, clienter=None, **kwa):
         """
         For the current event, gather the current set of witnesses, send the event,
         gather all receipts and send them to all other witnesses
 
         Parameters:
             hab: Habitat of the identifier to populate witnesses
+            clienter (Clienter): pooled HTTP connections to send over instead of a
+                connection of this messenger's own. Must be run by its owner
 
         """
         self.hab = hab
         self.wit = wit
         self.rep = None
+        self.clienter = clienter
         headers = headers if headers is not None else {}
 
         up = urlparse(url)
         if up.scheme != kering.Schemes.http and up.scheme != kering.Schemes.https:
             raise ValueError(f"invalid scheme {up.scheme} for HTTPMessenger")
 
-        self.client = http.clienting.Client(scheme=up.scheme, hostname=up.hostname, port=up.port)
-        clientDoer = http.clienting.ClientDoer(client=self.client)
+        doers = []
+        if clienter is not None:
+            self.client = clienter.patron(url)
+        else:
+            self.client = http.clienting.Client(scheme=up.scheme, hostname=up.hostname, port=up.port)
+            doers.append(http.clienting.ClientDoer(client=self.client))
 
         headers = Hict([
             ("Content-Type", "application/cesr"),
@@ -1007,8 +1096,6 @@ class HTTPStreamMessenger(doing.DoDoer):
             body=bytes(msg)
         )
 
-        doers = [clientDoer]
-
         super(HTTPStreamMessenger, self).__init__(doers=doers, **kwa)
 
     def recur(self, tyme, deeds=None):
@@ -1023,6 +1110,9 @@ class HTTPStreamMessenger(doing.DoDoer):
             self.remove([self.client])
             return True
 
+        if self.clienter is not None:  # pooled so response arrives through clienter
+            return False
+
         return super(HTTPStreamMessenger, self).recur(tyme, deeds)
 
 
@@ -1052,22 +1142,23 @@ def mailbox(hab, cid):
     return mbx
 
 
-def messenger(hab, pre, auth=None):
+def messenger(hab, pre, auth=None, clienter=None):
     """ Create a Messenger (tcp or http) based on available endpoints
 
     Parameters:
         hab (Habitat): Environment to use to look up witness URLs
         pre (str): qb64 identifier prefix of recipient to create a messanger for
         auth (str): optional auth code to send with any request for messenger
+        clienter (Clienter): optional pooled HTTP connections for http messenger
 
     Returns:
         Optional(TcpWitnesser, HTTPMessenger): witnesser for ensuring full reciepts
     """
     urls = hab.fetchUrls(eid=pre)
-    return messengerFrom(hab, pre, urls, auth)
+    return messengerFrom(hab, pre, urls, auth, clienter=clienter)
 
 
-def messengerFrom(hab, pre, urls, auth=None):
+def messengerFrom(hab, pre, urls, auth=None, clienter=None):
     """ Create a Witnesser (tcp or http) based on provided endpoints
 
     Parameters:
@@ -1075,13 +1166,14 @@ def messengerFrom(hab, pre, urls, auth=None):
         pre (str): qb64 identifier prefix of recipient to create a messanger for
         urls (dict): map of schemes to urls of available endpoints
         auth (str): optional auth code to send with any request for messenger
+        clienter (Clienter): optional pooled HTTP connections for http messenger
 
     Returns:
         Optional(TcpWitnesser, HTTPMessenger): witnesser for ensuring full reciepts
     """
     if kering.Schemes.http in urls or kering.Schemes.https in urls:
         url = urls[kering.Schemes.http] if kering.Schemes.http in urls else urls[kering.Schemes.https]
-        witer = HTTPMessenger(hab=hab, wit=pre, url=url, auth=auth)
+        witer = HTTPMessenger(hab=hab, wit=pre, url=url, auth=auth, clienter=clienter)
     elif kering.Schemes.tcp in urls:
         url = urls[kering.Schemes.tcp]
         witer = TCPMessenger(hab=hab, wit=pre, url=url)
@@ -1091,7 +1183,7 @@ def messengerFrom(hab, pre, urls, auth=None):
     return witer
 
 
-def streamMessengerFrom(hab, pre, urls, msg, headers=None):
+def streamMessengerFrom(hab, pre, urls, msg, headers=None, clienter=None):
     """ Create a Witnesser (tcp or http) based on provided endpoints
 
     Parameters:
@@ -1100,13 +1192,15 @@ def streamMessengerFrom(hab, pre, urls, msg, headers=None):
         urls (dict): map of schemes to urls of available endpoints
         msg (bytes): bytes of message to send
         headers (dict): optional headers to send with HTTP requests
+        clienter (Clienter): optional pooled HTTP connections for http messenger
 
     Returns:
         Optional(TcpWitnesser, HTTPMessenger): witnesser for ensuring full reciepts
     """
     if kering.Schemes.http in urls or kering.Schemes.https in urls:
         url = urls[kering.Schemes.http] if kering.Schemes.http in urls else urls[kering.Schemes.https]
-        witer = HTTPStreamMessenger(hab=hab, wit=pre, url=url, msg=msg, headers=headers)
+        witer = HTTPStreamMessenger(hab=hab, wit=pre, url=url, msg=msg, headers=headers,
+                                    clienter=clienter)
     elif kering.Schemes.tcp in urls:
         url = urls[kering.Schemes.tcp]
         witer = TCPStreamMessenger(hab=hab, wit=pre, url=url)
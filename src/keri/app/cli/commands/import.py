@@ -11,10 +11,9 @@ from hio import help
 from hio.base import doing
 
 from keri.kering import Vrsn_1_0, Vrsn_2_0
-from keri.app import habbing
+from keri.app import habbing, importing
 from keri.app.cli.common import existing
 from keri.app.cli.common.parsing import Parsery
-from keri.core import coring, serdering, parsing
 
 logger = help.ogler.getLogger()
 
@@ -22,6 +21,10 @@ parser = argparse.ArgumentParser(description='Import key events in CESR stream f
                                  parents=[Parsery.keystore()])
 parser.set_defaults(handler=lambda args: export(args))
 parser.add_argument("--file", help="File of streamed CESR events to import", required=True)
+parser.add_argument("--chunk", help="bytes of file read and buffered ahead of parsing at a time, default "
+                                    f"{importing.ChunkSize}", type=int, default=importing.ChunkSize)
+parser.add_argument("--batch", help="events committed per database transaction, default "
+                                    f"{importing.BatchSize}", type=int, default=importing.BatchSize)
 
 
 def export(args):
@@ -32,14 +35,19 @@ def export(args):
     ed = ImportDoer(name=args.name,
                     base=args.base,
                     bran=args.bran,
-                    file=args.file)
+                    file=args.file,
+                    chunk=args.chunk,
+                    batch=args.batch)
     return [ed]
 
 
 class ImportDoer(doing.DoDoer):
 
-    def __init__(self, name, base, bran, file):
+    def __init__(self, name, base, bran, file, chunk=importing.ChunkSize,
+                 batch=importing.BatchSize):
         self.file = file
+        self.chunk = chunk
+        self.batch = batch
 
         self.hby = existing.setupHby(name=name, base=base, bran=bran)
 
@@ -63,11 +71,26 @@ class ImportDoer(doing.DoDoer):
         self.tock = tock
         _ = (yield self.tock)
 
-        with open(self.file, 'rb') as f:
-            ims = f.read()
-            parsing.Parser(kvy=self.hby.kvy, rvy=self.hby.rvy, local=False,
-                           version=Vrsn_1_0).parse(ims=ims)
-            self.hby.kvy.processEscrows()
+        importer = importing.Importer(db=self.hby.db,
+                                      kvy=self.hby.kvy,
+                                      rvy=self.hby.rvy,
+                                      size=self.chunk,
+                                      batch=self.batch,
+                                      progress=self.report,
+                                      local=False,
+                                      version=Vrsn_1_0)
+        for chunk in importing.chunker(self.file, size=self.chunk):
+            importer.feed(chunk)
+            yield self.tock
+
+        count = importer.finish()
+        print(f"Imported {count} messages at {importer.rate:.0f} msgs/sec")
 
         self.exit()
         return True
+
+    @staticmethod
+    def report(count, rate):
+        """ Prints import progress after each batch """
+        print(f"{count} messages imported ({rate:.0f} msgs/sec)", end="\r",
+              flush=True)
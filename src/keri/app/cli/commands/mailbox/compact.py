@@ -0,0 +1,55 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.kli.commands module
+
+"""
+import argparse
+
+from hio.base import doing
+
+from keri import help
+from keri.app import storing
+
+logger = help.ogler.getLogger()
+
+parser = argparse.ArgumentParser(description='Prune, garbage collect and compact the mailbox database of a stopped '
+                                             'witness')
+parser.set_defaults(handler=lambda args: handler(args))
+parser.add_argument('--name', '-n', help='name of mailbox database, the alias of the witness', required=True)
+parser.add_argument('--base', '-b', help='additional optional prefix to file location of KERI keystore',
+                    required=False, default="")
+parser.add_argument('--count', '-c', help='maximum number of messages kept per topic', type=int, default=None)
+parser.add_argument('--age', '-a', help='maximum age in seconds of messages kept', type=float, default=None)
+
+
+def handler(args):
+    """
+    Run one offline maintenance pass with compaction of a mailbox database
+
+    Args:
+        args(Namespace): arguments object from command line
+    """
+    kwa = dict(args=args)
+    return [doing.doify(compact, **kwa)]
+
+
+def compact(tymth, tock=0.0, **opts):
+    """ Command line mailbox compaction handler
+
+    """
+    _ = (yield tock)
+    args = opts["args"]
+
+    retain = None
+    if args.count is not None or args.age is not None:
+        retain = storing.Retainage(count=args.count, age=args.age)
+
+    mbx = storing.Mailboxer(name=args.name, base=args.base, retain=retain)
+    try:
+        compactage = mbx.maintain(compact=True)
+    finally:
+        mbx.close()
+
+    print(f"Pruned {compactage.pruned} topic entries, collected {compactage.collected} messages "
+          f"and reclaimed {compactage.reclaimed} bytes in {compactage.duration:.3f} sec")
@@ -0,0 +1,83 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.kli.commands module
+
+"""
+import argparse
+
+from hio.base import doing
+
+from keri import help
+from keri.app import habbing, indirecting, watching
+from keri.app.cli.common import existing
+from keri.app.cli.common.parsing import Parsery
+
+logger = help.ogler.getLogger()
+
+parser = argparse.ArgumentParser(description='Continuously adjudicate key state of all watched AIDs from watchers.',
+                                 parents=[Parsery.keystore()])
+parser.set_defaults(handler=lambda args: handle(args))
+parser.add_argument('--alias', '-a', help='human readable alias for the identifier whose watchers are queried',
+                    required=True)
+parser.add_argument('--toad', '-t', default=None, required=False, type=int,
+                    help='int of watcher threshold (threshold of acceptable duplicity)', )
+parser.add_argument('--period', default=60.0, required=False, type=float,
+                    help='seconds between queries of each watcher for unchanged watched AIDs')
+
+
+def handle(args):
+    """ Command line handler for monitoring the key state of all watched AIDs
+
+    Parameters:
+        args(Namespace): parsed command line arguments
+
+    """
+    hby = existing.setupHby(name=args.name, base=args.base, bran=args.bran)
+    hab = hby.habByName(args.alias)
+    if hab is None:
+        raise ValueError(f"unknown alias {args.alias}")
+
+    adj = watching.Adjudicator(hby=hby, hab=hab, period=args.period)
+    surveyor = watching.Surveyor(adjudicator=adj, toad=args.toad)
+    mbx = indirecting.MailboxDirector(hby=hby, topics=['/reply', '/replay'])
+    doers = [habbing.HaberyDoer(habery=hby), mbx, surveyor, doing.doify(cueDo, adj=adj)]
+
+    return doers
+
+
+def cueDo(tymth, tock=0.0, adj=None, **opts):
+    """ Print the adjudication outcome cued for each watched AID
+
+    Parameters:
+        tymth (function): injected function wrapper closure returned by .tymen() of
+            Tymist instance. Calling tymth() returns associated Tymist .tyme.
+        tock (float): injected initial tock value
+        adj (Adjudicator): adjudicator whose cues are printed
+
+    """
+    _ = (yield tock)
+
+    while True:
+        while adj.cues:
+            cue = adj.cues.pull()
+            match cue["kin"]:
+                case "keyStateConsistent":
+                    print(f"{cue['oid']}: consistent with {len(cue['states'])} (out of "
+                          f"{len(cue['wids'])} total) watchers that responded")
+
+                case "keyStateLagging":
+                    for state in cue["behind"]:
+                        print(f"{cue['oid']}: watcher {state.wit} behind at seq No. {state.sn}")
+
+                case "keyStateUpdate":
+                    for state in cue["aheads"]:
+                        print(f"{cue['oid']}: watcher {state.wit} ahead at seq No. {state.sn} "
+                              f"with digest: {state.dig}")
+
+                case "keyStateDuplicitous":
+                    for state in cue["dups"]:
+                        print(f"{cue['oid']}: DUPLICITY on watcher {state.wit} at seq No. {state.sn} "
+                              f"with digest: {state.dig}")
+
+        yield tock
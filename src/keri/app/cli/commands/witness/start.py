@@ -44,6 +44,9 @@ parser.add_argument('--config-file',
 parser.add_argument("--keypath", action="store", required=False, default=None)
 parser.add_argument("--certpath", action="store", required=False, default=None)
 parser.add_argument("--cafilepath", action="store", required=False, default=None)
+parser.add_argument("--asgi", action="store_true", required=False, default=False,
+                    help="serve HTTP with async ingress that processes each event before responding. "
+                         "Requires uvicorn, pip install keri[asgi]")
 parser.add_argument("--loglevel", action="store", required=False, default="CRITICAL",
                     help="Set log level to DEBUG | INFO | WARNING | ERROR | CRITICAL. Default is CRITICAL")
 parser.add_argument("--logfile", action="store", required=False, default=None,
@@ -70,14 +73,15 @@ def launch(args):
                configFile=args.configFile,
                keypath=args.keypath,
                certpath=args.certpath,
-               cafilepath=args.cafilepath)
+               cafilepath=args.cafilepath,
+               asgi=args.asgi)
 
     logger.info("\n******* Ended Witness for %s listening: http/%s, tcp/%s"
                 ".******\n\n", args.name, args.http, args.tcp)
 
 
 def runWitness(name="witness", base="", alias="witness", bran="", tcp=5631, http=5632, expire=0.0,
-               configDir="", configFile="", keypath=None, certpath=None, cafilepath=None):
+               configDir="", configFile="", keypath=None, certpath=None, cafilepath=None, asgi=False):
     """
     Setup and run one witness
     """
@@ -107,6 +111,7 @@ def runWitness(name="witness", base="", alias="witness", bran="", tcp=5631, http
                                           httpPort=http,
                                           keypath=keypath,
                                           certpath=certpath,
-                                          cafilepath=cafilepath))
+                                          cafilepath=cafilepath,
+                                          asgi=asgi))
 
     directing.runController(doers=doers, expire=expire)
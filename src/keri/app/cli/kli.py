@@ -3,17 +3,15 @@
 keri.kli.commands module
 
 """
-import multicommand
 from keri import help
 
-from keri.app import directing
-from keri.app.cli import commands
+from keri.app.cli import registry
 
 logger = help.ogler.getLogger()
 
 
 def main():
-    parser = multicommand.create_parser(commands)
+    parser = registry.createParser()
     args = parser.parse_args()
 
     if not hasattr(args, 'handler'):
@@ -21,6 +19,8 @@ def main():
         return
 
     try:
+        from keri.app import directing  # import after parse so help and errors stay fast
+
         doers = args.handler(args)
         directing.runController(doers=doers, expire=0.0)
 
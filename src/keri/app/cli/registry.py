@@ -0,0 +1,247 @@
+# -*- encoding: utf-8 -*-
+"""
+keri.app.cli.registry module
+
+Lazy registry of kli commands. The argparse parser tree is built from the static
+Manifest of command paths and descriptions so that only the module of the
+selected command is imported instead of every module in keri.app.cli.commands.
+The parser built for a selected command is the same one multicommand builds for it.
+
+Regenerate the Manifest after adding, removing or renaming a command or changing
+its description with:
+
+    python -c "from keri.app.cli import registry; registry.dump()"
+"""
+import argparse
+import importlib
+import pkgutil
+import sys
+
+Package = "keri.app.cli.commands"  # package of command modules
+SummaryLength = 50  # maximum length of description used as short help summary as in multicommand
+
+# command path (dotted relative to Package) to parser description. Groups
+# (subpackages) are included with the description of their parser if any.
+Manifest = {
+    'aid': 'Print the AID for a given alias',
+    'challenge': None,
+    'challenge.generate': 'Generate a cryptographically random challenge phrase',
+    'challenge.respond': 'Respond to a list of challenge words by signing and sending an EXN response',
+    'challenge.verify': 'Check mailbox for EXN challenge response messages and verify their signatures and data against provided words and signer',
+    'clean': 'Cleans and migrates a database and keystore',
+    'contacts': None,
+    'contacts.list': 'List existing contacts',
+    'contacts.replace': 'Replace contact information for identifier prefix with alias information',
+    'decrypt': 'Decrypt arbitrary data for AIDs with Ed25519 public keys only',
+    'delegate': None,
+    'delegate.confirm': 'Confirm success delegate event (icp or rot) and gather and propagate witness receipts.',
+    'delegate.request': 'Resend a delegation request message to a delegator that has not approved a previous delegation.',
+    'did': None,
+    'did.generate': "Generate and print an AID's DID.",
+    'ends': None,
+    'ends.add': 'Add new endpoint role authorization.',
+    'ends.export': 'Export end points',
+    'ends.list': 'Add new endpoint role authorization.',
+    'escrow': 'A collection of escrow operations',
+    'escrow.clear': 'Clear escrows',
+    'escrow.list': 'Views events in escrow state.',
+    'event': 'Print an event from an AID, or specific values from an event (defaults to latest event).',
+    'export': 'Export key events in CESR stream format',
+    'import': 'Import key events in CESR stream format',
+    'incept': 'Initialize a prefix',
+    'init': 'Create a database and keystore',
+    'interact': 'Create and publish an interaction event',
+    'introduce': 'Send an rpy /introduce message to recipient with OOBI',
+    'ipex': None,
+    'ipex.admit': 'Accept a credential being issued or presented in response to an IPEX grant',
+    'ipex.agree': 'Reply to IPEX offer message acknowledged willingness to accept offered credential',
+    'ipex.apply': 'Request a credential from another party by initiating an IPEX exchange',
+    'ipex.grant': 'Reply to IPEX agree message or initiate an IPEX exchange with a credential issuance or presentation',
+    'ipex.join': 'Join group multisig ipex events',
+    'ipex.list': 'List notifications related to IPEX protocol messages',
+    'ipex.offer': 'Reply to IPEX apply message or initiate an IPEX exchange with an offer for a credential with certain characteristics',
+    'ipex.spurn': 'Reject an IPEX apply, offer, agree or grant message',
+    'kevers': 'Poll events at controller for prefix',
+    'list': 'List existing identifiers',
+    'local': None,
+    'local.watch': 'Perform a one time watch of all current local AIDs',
+    'location': None,
+    'location.add': 'Add new endpoint location record.',
+    'mailbox': None,
+    'mailbox.add': 'Add mailbox role',
+    'mailbox.compact': 'Prune, garbage collect and compact the mailbox database of a stopped witness',
+    'mailbox.debug': 'Display mailbox status for an identifier and witness',
+    'mailbox.list': 'List current mailboxes',
+    'mailbox.update': 'Update the index for a given topic for a witness',
+    'migrate': None,
+    'migrate.list': 'Lists the local LMDB migrations and their completion status',
+    'migrate.run': 'Migrates a database and keystore',
+    'migrate.show': 'Cleans and migrates a database and keystore',
+    'multisig': None,
+    'multisig.continue': 'Process any incoming events that will progress local pending multisig events.',
+    'multisig.demo': 'Run a demo collection of witnesses',
+    'multisig.incept': 'Initialize a group identifier prefix',
+    'multisig.interact': 'Begin or join a rotation of a group identifier',
+    'multisig.join': 'Join group multisig inception, rotation or interaction event.',
+    'multisig.notice': 'Notify other participants of the last event in a group multisig AID',
+    'multisig.rotate': 'Begin or join a rotation of a group identifier',
+    'multisig.shell': 'Initialize a prefix',
+    'multisig.update': 'Request KEL for local multisig AID from witness',
+    'nonce': 'Print a new random nonce',
+    'notifications': None,
+    'notifications.list': 'Display notifications for an identifier',
+    'notifications.mark': 'Display notifications for an identifier',
+    'notifications.rem': 'Display notifications for an identifier',
+    'oobi': None,
+    'oobi.clean': 'Display OOBIs waiting for resolution and allow for clean up',
+    'oobi.generate': 'Generate and print role OOBIs for the AID of the provide alias.',
+    'oobi.resolve': 'Resolve the provided OOBI',
+    'passcode': None,
+    'passcode.generate': 'Print a new random salt',
+    'passcode.remove': 'Initialize a prefix',
+    'passcode.set': 'Initialize a prefix',
+    'query': 'Request KEL from Witness',
+    'rename': 'Change the alias for a local identifier',
+    'rollback': 'Revert an unpublished interaction event at the end of a local KEL',
+    'rotate': 'Rotate keys',
+    'saidify': 'Saidify a JSON file.',
+    'salt': 'Print a new random passcode',
+    'sign': 'Sign an arbitrary string',
+    'ssh': None,
+    'ssh.export': 'Export keys of specified identifier for use with SSH',
+    'status': 'View status of a local AID',
+    'time': 'Print a new time',
+    'vc': None,
+    'vc.create': 'Issue a verifiable credential',
+    'vc.export': 'Export credential from store and any related material',
+    'vc.list': 'List credentials and check mailboxes for any newly issued credentials',
+    'vc.registry': None,
+    'vc.registry.incept': 'Initialize a new credential registry',
+    'vc.registry.list': 'List credential registry names and identifiers',
+    'vc.registry.status': 'Checks the status of a credential registry',
+    'vc.revoke': 'Revoke a verifiable credential',
+    'verify': 'Verify signature(s) on arbitrary data',
+    'version': 'Print version of KLI',
+    'watcher': None,
+    'watcher.add': 'Add AID or Alias to list of AIDs for a watcher to watch',
+    'watcher.adjudicate': 'Perform key event adjudication on any new key state from watchers.',
+    'watcher.list': 'List current watchers',
+    'watcher.monitor': 'Continuously adjudicate key state of all watched AIDs from watchers.',
+    'witness': None,
+    'witness.authenticate': 'Perform authentication against an witness to get a OTP code',
+    'witness.demo': 'Run a demo collection of witnesses',
+    'witness.list': 'List AIDs of witness for the provided AID',
+    'witness.start': 'Runs KERI witness controller.\nExample:\nwitness -H 5631 -t 5632\n',
+    'witness.submit': 'Submit current event to witnesses for receipting',
+}
+
+
+def scan(pkg=None, prefix=""):
+    """
+    Returns manifest dict of command path to description built by importing
+    every command module of pkg as multicommand does. Used to regenerate and
+    check the static Manifest.
+
+    Parameters:
+        pkg (module | None): package of command modules. None means Package
+        prefix (str): dotted command path of pkg
+    """
+    pkg = pkg if pkg is not None else importlib.import_module(Package)
+    manifest = dict()
+    for info in pkgutil.iter_modules(pkg.__path__, pkg.__name__ + "."):
+        *_, suffix = info.name.split(".")
+        mod = importlib.import_module(info.name)
+        parser = getattr(mod, "parser", None)
+        if info.ispkg:
+            manifest[prefix + suffix] = (parser.description
+                                         if isinstance(parser, argparse.ArgumentParser) else None)
+            manifest.update(scan(mod, prefix + suffix + "."))
+        elif isinstance(parser, argparse.ArgumentParser):
+            manifest[prefix + suffix] = parser.description
+
+    return manifest
+
+
+def dump():
+    """ Prints Manifest source generated by scan """
+    print("Manifest = {")
+    for path, description in scan().items():
+        print(f"    {path!r}: {description!r},")
+    print("}")
+
+
+def summary(description):
+    """ Returns short help summary of description as multicommand does """
+    if description is None or len(description) <= SummaryLength:
+        return description
+    return description[:SummaryLength - 4] + " ..."
+
+
+def children(path, manifest=None):
+    """
+    Returns list of names of commands and groups directly under group path
+
+    Parameters:
+        path (str): dotted command path of group, empty for top level
+        manifest (dict | None): command path to description. None means Manifest
+    """
+    manifest = manifest if manifest is not None else Manifest
+    prefix = path + "." if path else ""
+    return [key[len(prefix):] for key in manifest
+            if key.startswith(prefix) and "." not in key[len(prefix):]]
+
+
+def createParser(argv=None, prog=None, manifest=None):
+    """
+    Returns ArgumentParser for kli command line argv that imports only the
+    module of the command selected by argv. The commands and groups not
+    selected are added as stub subparsers so that help and invalid choice
+    errors list all of them.
+
+    Parameters:
+        argv (list | None): command line arguments without program name.
+            None means sys.argv[1:]
+        prog (str | None): program name. None means basename of sys.argv[0]
+        manifest (dict | None): command path to description. None means Manifest
+    """
+    argv = argv if argv is not None else sys.argv[1:]
+    if prog is None:
+        *_, prog = sys.argv[0].split("/")
+    manifest = manifest if manifest is not None else Manifest
+
+    # select longest path of groups and command named by leading argv
+    path = ""
+    for arg in argv:
+        name = f"{path}.{arg}" if path else arg
+        if name not in manifest:
+            break
+        path = name
+        if not children(path, manifest=manifest):  # command not group
+            break
+
+    top = parser = argparse.ArgumentParser(prog=prog)
+    group = ""
+    names = [prog]
+    while parser is not None:
+        subparsers = parser.add_subparsers(description=" ", metavar="command")
+        parser = None
+        for name in children(group, manifest=manifest):
+            key = f"{group}.{name}" if group else name
+            description = manifest[key]
+            if key == path and not children(key, manifest=manifest):  # selected command
+                command = importlib.import_module(f"{Package}.{key}").parser
+                config = {k: v for k, v in vars(command).items() if not k.startswith("_")}
+                config.update(prog=" ".join(names + [name]), help=summary(command.description),
+                              add_help=False)
+                subparsers.add_parser(name, parents=[command], **config)
+            elif path == key or path.startswith(key + "."):  # selected group
+                parser = subparsers.add_parser(name, prog=" ".join(names + [name]),
+                                               help=summary(description),
+                                               description=description)
+                names.append(name)
+                selected = key
+            else:  # stub of command or group not selected
+                subparsers.add_parser(name, help=summary(description), description=description)
+        group = selected if parser is not None else group
+
+    return top
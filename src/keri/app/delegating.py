@@ -157,7 +157,7 @@ class Anchorer(doing.DoDoer):
 
     def processPartialWitnessEscrow(self):
         """
-        Process escrow of delegated events that do not have a full complement of receipts
+        Process escrow of delegated events that do not have a witness threshold (toad) of receipts
         from witnesses yet.  When receipting is complete, remove from escrow and cue up a message
         that the event is complete.
 
@@ -169,7 +169,7 @@ class Anchorer(doing.DoDoer):
 
             # Load all the witness receipts we have so far
             wigs = self.hby.db.getWigs(dgkey)
-            if len(wigs) == len(kever.wits):  # We have all of them, this event is finished
+            if len(wigs) >= kever.toader.num:  # witness threshold met so this event is finished
                 if len(kever.wits) > 0:
                     witnessed = False
                     for cue in self.witDoer.cues:
@@ -13,7 +13,7 @@ from hio.base import doing
 from hio.help import decking, ogler
 
 from keri import kering
-from keri.app import agenting
+from keri.app import agenting, httping
 from keri.core import coring, eventing, serdering, MtrDex, Counter, Codens
 from keri.db import dbing
 from keri.kering import Roles
@@ -27,17 +27,19 @@ class Poster(doing.DoDoer):
     """
     DoDoer that wraps any KERI event (KEL, TEL, Peer to Peer) in a /fwd `exn` envelope and
     delivers them to one of the target recipient's witnesses for store and forward
-    to the intended recipient
+    to the intended recipient. HTTP deliveries share the pooled keep alive
+    connections of .clienter.
 
     """
 
-    def __init__(self, hby, mbx=None, evts=None, cues=None, **kwa):
+    def __init__(self, hby, mbx=None, evts=None, cues=None, clienter=None, **kwa):
         self.hby = hby
         self.mbx = mbx
         self.evts = evts if evts is not None else decking.Deck()
         self.cues = cues if cues is not None else decking.Deck()
+        self.clienter = clienter if clienter is not None else httping.Clienter()
 
-        doers = [doing.doify(self.deliverDo)]
+        doers = [self.clienter, doing.doify(self.deliverDo)]
         super(Poster, self).__init__(doers=doers, **kwa)
 
     def deliverDo(self, tymth=None, tock=0.0, **kwa):
@@ -155,7 +157,7 @@ class Poster(doing.DoDoer):
 
     def sendDirect(self, hab, ends, serder, atc):
         for ctrl, locs in ends.items():
-            witer = agenting.messengerFrom(hab=hab, pre=ctrl, urls=locs)
+            witer = agenting.messengerFrom(hab=hab, pre=ctrl, urls=locs, clienter=self.clienter)
 
             msg = bytearray(serder.raw)
             if atc is not None:
@@ -192,7 +194,7 @@ class Poster(doing.DoDoer):
         ims = hab.endorse(serder=fwd, last=False, pipelined=False)
 
         # Transpose the signatures to point to the new location
-        witer = agenting.messengerFrom(hab=hab, pre=mbx, urls=mailbox)
+        witer = agenting.messengerFrom(hab=hab, pre=mbx, urls=mailbox, clienter=self.clienter)
         msg.extend(ims)
         msg.extend(atc)
 
@@ -202,6 +204,8 @@ class Poster(doing.DoDoer):
         while not witer.idle:
             _ = (yield self.tock)
 
+        self.remove([witer])
+
     def forwardToWitness(self, hab, ends, recp, serder, atc, topic):
         # If we are one of the mailboxes, just store locally in mailbox
         owits = oset(ends.keys())
@@ -225,7 +229,7 @@ class Poster(doing.DoDoer):
         ims = hab.endorse(serder=fwd, last=False, pipelined=False)
 
         # Transpose the signatures to point to the new location
-        witer = agenting.messengerFrom(hab=hab, pre=mbx, urls=mailbox)
+        witer = agenting.messengerFrom(hab=hab, pre=mbx, urls=mailbox, clienter=self.clienter)
         msg.extend(ims)
         msg.extend(atc)
 
@@ -235,6 +239,8 @@ class Poster(doing.DoDoer):
         while not witer.idle:
             _ = (yield self.tock)
 
+        self.remove([witer])
+
 
 class StreamPoster:
     """
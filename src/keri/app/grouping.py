@@ -211,7 +211,7 @@ class Counselor(doing.DoDoer):
 
     def processPartialWitnessEscrow(self):
         """
-        Process escrow of group multisig events that do not have a full complement of receipts
+        Process escrow of group multisig events that do not have a witness threshold (toad) of receipts
         from witnesses yet.  When receipting is complete, remove from escrow and cue up a message
         that the event is complete.
 
@@ -225,7 +225,7 @@ class Counselor(doing.DoDoer):
             ghab = self.hby.habs[pre]
             keys = [verfer.qb64 for verfer in kever.verfers]
             witer = ghab.mhab.kever.verfers[0].qb64 == keys[0]
-            if len(wigs) == len(kever.wits):  # We have all of them, this event is finished
+            if len(wigs) >= kever.toader.num:  # witness threshold met so this event is finished
                 if witer and len(kever.wits) > 0:
                     witnessed = False
                     for cue in self.witDoer.cues:
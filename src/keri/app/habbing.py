@@ -1533,8 +1533,8 @@ class BaseHab:
         for msg in self.db.cloneDelegation(kever=kever):
             msgs.extend(msg)
 
-        for msg in self.db.clonePreIter(pre=pre, fn=fn):
-            msgs.extend(msg)
+        for chunk in self.db.cloneChunkIter(pre=pre, fn=fn):
+            msgs.extend(chunk)
 
         return msgs
 
@@ -1547,8 +1547,8 @@ class BaseHab:
 
         """
         msgs = bytearray()
-        for msg in self.db.cloneAllPreIter():
-            msgs.extend(msg)
+        for chunk in self.db.cloneChunkIter():
+            msgs.extend(chunk)
         return msgs
 
     def makeOtherEvent(self, pre, sn):
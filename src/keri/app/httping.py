@@ -5,6 +5,7 @@ keri.peer.httping module
 """
 import datetime
 import json
+from collections import deque
 from dataclasses import dataclass
 from urllib import parse
 from pathlib import Path
@@ -112,6 +113,41 @@ def parseCesrHttpRequest(req):
     return cr
 
 
+async def parseCesrHttpRequestAsync(req):
+    """
+    Parse Falcon ASGI HTTP request and create a CESR message from the body of
+    the request and the two CESR HTTP headers (Date, Attachment).
+    Same as parseCesrHttpRequest but reads the body from the async stream.
+
+    Parameters
+        req (falcon.asgi.Request) http request object in CESR format:
+
+    """
+    if req.content_type != CESR_CONTENT_TYPE:
+        raise falcon.HTTPError(falcon.HTTP_NOT_ACCEPTABLE,
+                               title="Content type error",
+                               description="Unacceptable content type.")
+
+    try:
+        data = json.loads(await req.stream.read())
+    except ValueError:
+        raise falcon.HTTPError(falcon.HTTP_400,
+                               title="Malformed JSON",
+                               description="Could not decode the request body. The "
+                                           "JSON was incorrect.")
+
+    if (attachment := req.get_header(CESR_ATTACHMENT_HEADER)) is None:
+        raise falcon.HTTPError(falcon.HTTP_PRECONDITION_FAILED,
+                               title="Attachment error",
+                               description="Missing required attachment header.")
+
+    cr = CesrRequest(
+        payload=data,
+        attachments=attachment)
+
+    return cr
+
+
 def createCESRRequest(msg, client, dest, path=None):
     """
     Turns a KERI message into a CESR http request against the provided hio http Client
@@ -166,7 +202,7 @@ def streamCESRRequests(client, ims, dest, path=None, headers=None):
 
     """
     path = path if path is not None else "/"
-    path = parse.urljoin(client.requester.path, path)
+    path = parse.urljoin(getattr(client, "requester", client).path, path)
 
     cold = kering.sniff(ims)  # check for spurious counters at front of stream
     if cold in (parsing.Colds.txt, parsing.Colds.bny):  # not message error out to flush stream
@@ -211,35 +247,191 @@ def streamCESRRequests(client, ims, dest, path=None, headers=None):
     return cnt
 
 
+class Patron:
+    """
+    Patron is one user of the pooled connections of a Clienter to a single
+    origin. It quacks like the hio http Client it replaces for its users.
+    Requests made with .request are queued until the Clienter assigns them to
+    a pooled connection, and responses are delivered to .responses in request
+    order.
+
+    Attributes:
+        clienter (Clienter): pool that sends requests of this patron
+        origin (tuple): (scheme, hostname, port) key of pool
+        path (str): base path of origin URL
+        requests (deque): request dicts not yet assigned to a connection
+        responses (deque): response dicts received for this patron
+        flights (int): requests assigned to a connection awaiting response
+        closed (bool): True means removed from Clienter so responses dropped
+    """
+
+    def __init__(self, clienter, origin, path="/"):
+        self.clienter = clienter
+        self.origin = origin
+        self.path = path or "/"
+        self.requests = deque()
+        self.responses = deque()
+        self.flights = 0
+        self.closed = False
+
+    def request(self, method="GET", path=None, qargs=None, headers=None, body=None,
+                **kwa):
+        """
+        Queues request for this patron's origin with hio Client.request
+        compatible parameters and assigns it to a pooled connection if any is
+        free.
+        """
+        if hasattr(body, "encode"):
+            body = body.encode("utf-8")
+        self.requests.append(dict(method=method,
+                                  path=path if path is not None else self.path,
+                                  qargs=qargs,
+                                  headers=headers,
+                                  body=body if body is not None else b''))
+        self.clienter.assign(self)
+
+    def respond(self):
+        """
+        Pops and returns next response from .responses as attribute object
+        like hio Client.respond. Otherwise returns None
+        """
+        if self.responses:
+            return http.clienting.Client.attrify(self.responses.popleft())
+        return None
+
+    @property
+    def idle(self):
+        """ True means no request queued or awaiting response """
+        return not self.requests and not self.flights
+
+
+class Conduit:
+    """
+    Conduit is one pooled keep alive connection of a Clienter, a hio http
+    Client run by its ClientDoer. Requests queued on the client are sent one
+    after the other over the same connection so responses arrive in the order
+    of .flights.
+
+    Attributes:
+        client (http.clienting.Client): hio client of connection
+        doer (http.clienting.ClientDoer): doer servicing client
+        flights (deque): (patron, request, tries, sent) of requests sent or
+            queued on client in order awaiting response where sent is the
+            datetime the request was assigned to the connection
+        used (datetime): time of last request assigned or response received
+        served (int): responses received over connection
+    """
+
+    def __init__(self, client, doer):
+        self.client = client
+        self.doer = doer
+        self.flights = deque()
+        self.used = helping.nowUTC()
+        self.served = 0
+
+
 class Clienter(doing.DoDoer):
     """
-    Clienter is a DoDoer that manages hio HTTP clients using a ClientDoer for each HTTP request.
-    It executes HTTP requests using a HIO HTTP Client run by a ClientDoer. Once a request has
-    received a response then the corresponding Doer is removed from this Clienter.
+    Clienter is a DoDoer that pools keep alive hio HTTP client connections per
+    origin, that is per (scheme, hostname, port), and shares them between all
+    its Patrons. Requests go to an idle pooled connection if any, else to a
+    new connection while the origin has fewer than .limit of them, else are
+    queued on the least loaded connection. Up to .depth requests are queued on
+    one connection and sent back to back over it as each response arrives.
+    Beyond that requests wait in their Patron until a connection frees up.
+    Connections idle for .idle seconds are evicted, as are connections closed
+    by the server. Requests in flight on a closed connection are retried once
+    on another connection.
 
     Doers:
-        - clientDo: Periodically checks for stale clients and removes them if they have not received a response
-          within the specified timeout period.
+        - clientDo: Delivers responses to patrons, retries or times out
+          requests, and evicts idle and closed connections.
+
+    Attributes:
+        pools (dict): list of Conduit keyed by origin (scheme, hostname, port)
+        patrons (dict): list of Patron with requests waiting for a connection
+            keyed by origin in arrival order
+        limit (int): maximum connections per origin
+        depth (int): maximum requests queued per connection
+        idle (float): seconds a connection may be idle before eviction
+        timeout (float): seconds to wait for response to each request from
+            when it was assigned to a connection before giving up
+        opened (int): connections opened so far
+        evicted (int): connections evicted so far
+        sent (int): requests assigned to connections so far
+        reused (int): requests assigned to an already used connection so far
+        timeouts (int): requests timed out so far
+
+    Properties:
+        stats (dict): pool statistics
     """
 
-    TimeoutClient = 300  # seconds to wait for response before removing client, default is 5 minutes
+    TimeoutClient = 300  # seconds to wait for response before giving up, default is 5 minutes
+    TimeoutIdle = 30.0  # seconds before idle pooled connection is evicted
+    MaxConnections = 4  # maximum pooled connections per origin
+    Depth = 8  # maximum requests queued on one connection
 
-    def __init__(self):
+    def __init__(self, limit=None, depth=None, idle=None, timeout=None):
         """
-        Initialize clienter with an empty list of client tuples.
+        Initialize clienter with empty pools.
 
-        Attributes:
-            clients (list((client, clientdoer, timestamp)):
-                list of client tuples containing (client, clientDoer, datetime) for each active client.
-            doers (list): List of Doers to be managed by this Clienter, initialized with clientDo method.
+        Parameters:
+            limit (int | None): maximum connections per origin. Default .MaxConnections
+            depth (int | None): maximum requests queued per connection. Default .Depth
+            idle (float | None): seconds before idle connection is evicted.
+                Default .TimeoutIdle
+            timeout (float | None): seconds to wait for response. Default .TimeoutClient
         """
-        self.clients = []
+        self.pools = dict()
+        self.patrons = dict()
+        self.limit = max(1, limit if limit is not None else self.MaxConnections)
+        self.depth = max(1, depth if depth is not None else self.Depth)
+        self.idle = idle if idle is not None else self.TimeoutIdle
+        self.timeout = timeout if timeout is not None else self.TimeoutClient
+        self.opened = 0
+        self.evicted = 0
+        self.sent = 0
+        self.reused = 0
+        self.timeouts = 0
         doers = [doing.doify(self.clientDo)]
         super(Clienter, self).__init__(doers=doers)
 
+    @property
+    def stats(self):
+        """ Returns dict of pool statistics """
+        conduits = [conduit for pool in self.pools.values() for conduit in pool]
+        return dict(origins=len(self.pools),
+                    connections=len(conduits),
+                    flights=sum(len(conduit.flights) for conduit in conduits),
+                    waiting=sum(len(patron.requests) for patrons in self.patrons.values()
+                                for patron in patrons),
+                    opened=self.opened,
+                    evicted=self.evicted,
+                    sent=self.sent,
+                    reused=self.reused,
+                    timeouts=self.timeouts)
+
+    def patron(self, url):
+        """
+        Returns new Patron of the pooled connections to the origin of url
+
+        Parameters:
+            url (str): URL whose scheme, host and port select the pool and
+                whose path is the Patron's base path
+        """
+        purl = parse.urlparse(url)
+        if purl.scheme not in (kering.Schemes.http, kering.Schemes.https) or not purl.hostname:
+            raise ValueError(f"invalid url {url} for http client")
+        port = purl.port
+        if port is None:
+            port = 443 if purl.scheme == kering.Schemes.https else 80
+        return Patron(clienter=self, origin=(purl.scheme, purl.hostname, port),
+                      path=purl.path)
+
     def request(self, method, url, body=None, headers=None):
         """
-        Perform an HTTP request using a hio http Client and ClientDoer and returns the Client.
+        Perform an HTTP request over a pooled connection and returns the Patron
+        that receives the response.
 
         Parameters:
             method (str): HTTP method to use (e.g., "GET", "POST")
@@ -248,56 +440,51 @@ class Clienter(doing.DoDoer):
             headers (dict, optional): Headers to include in the request, defaults to None
 
         Returns:
-            http.clienting.Client: The hio HTTP Client used for the request, or None if an error occurs.
+            Patron: with .responses and .respond like a hio HTTP Client, or None
+                if url is invalid.
         """
-        purl = parse.urlparse(url)
-
         try:
-            client = http.clienting.Client(scheme=purl.scheme,
-                                           hostname=purl.hostname,
-                                           port=purl.port,
-                                           portOptional=True)
-        except Exception as e:
-            print(f"error establishing client connection={e}")
+            patron = self.patron(url)
+        except (ValueError, TypeError) as e:
+            logger.error("error establishing client connection=%s", e)
             return None
 
-        if hasattr(body, "encode"):
-            body = body.encode("utf-8")
-
-        client.request(
-            method=method,
-            path=f"{purl.path}?{purl.query}",
-            qargs=None,
-            headers=headers,
-            body=body
-        )
-
-        clientDoer = http.clienting.ClientDoer(client=client)
-        self.extend([clientDoer])
-        self.clients.append((client, clientDoer, helping.nowUTC()))
+        purl = parse.urlparse(url)
+        patron.request(method=method, path=f"{purl.path}?{purl.query}",
+                       headers=headers, body=body)
+        return patron
 
-        return client
+    def assign(self, patron):
+        """
+        Assigns queued requests of patron to pooled connections of its origin,
+        opening a new connection when all are at depth and the pool is not
+        full. Patrons whose requests can not all be assigned wait in turn.
+        """
+        waiting = self.patrons.setdefault(patron.origin, [])
+        if patron not in waiting:
+            waiting.append(patron)
+        self._assign(patron.origin)
 
-    def remove(self, client):
+    def remove(self, patron):
         """
-        Find a client tuple by hio HTTP Client and remove it and its Doer from the Clienter.
+        Removes patron so any responses still due it are dropped. The pooled
+        connections remain open for other patrons.
 
         Parameters:
-            client (http.clienting.Client): The hio HTTP Client to remove from the Clienter.
+            patron (Patron): patron to remove from the Clienter.
         """
-        doers = [(c, d, dt) for (c, d, dt) in self.clients if c == client]
-        if len(doers) == 0:
-            return
-
-        tup = doers[0]
-        self.clients.remove(doers[0])
-        (_, doer, _) = tup
-        super(Clienter, self).remove([doer])
+        patron.closed = True
+        patron.requests.clear()
+        if patron in (waiting := self.patrons.get(patron.origin, [])):
+            waiting.remove(patron)
 
     def clientDo(self, tymth, tock=0.0, **kwa):
-        """ Periodically prune stale clients
+        """ Service pooled connections
 
-        Process existing clients and prune any that have receieved a response longer than timeout
+        Delivers responses to their patrons, retries requests in flight on
+        connections closed by the server, gives up on requests without
+        response after timeout, evicts idle connections and assigns waiting
+        requests.
 
         Parameters:
             tymth (function): injected function wrapper closure returned by .tymen() of
@@ -310,17 +497,120 @@ class Clienter(doing.DoDoer):
         yield self.tock
 
         while True:
-            toRemove = []
-            for (client, doer, dt) in self.clients:
-                if client.responses:
-                    now = helping.nowUTC()
-                    if (now - dt) > datetime.timedelta(seconds=self.TimeoutClient):
-                        toRemove.append(client)
-
-                yield self.tock
+            self.service()
+            yield self.tock
 
-            for client in toRemove:
-                self.remove(client)
+    def service(self):
+        """ Runs one pass of pool servicing. See .clientDo """
+        now = helping.nowUTC()
+        for origin, pool in list(self.pools.items()):
+            for conduit in list(pool):
+                client = conduit.client
+                while client.responses and conduit.flights:
+                    patron, _, _, _ = conduit.flights.popleft()
+                    patron.flights -= 1
+                    rep = client.responses.popleft()
+                    if not patron.closed:  # copy body since client reuses its buffer
+                        patron.responses.append(dict(rep, body=bytearray(rep["body"])))
+                    conduit.used = now
+                    conduit.served += 1
+                client.responses.clear()  # unsolicited
+
+                if conduit.flights:
+                    cutoff = now - datetime.timedelta(seconds=self.timeout)
+                    if client.connector.cutoff:  # server closed so retry elsewhere
+                        self.evict(origin, conduit, retry=True)
+                    elif conduit.flights[0][3] < cutoff:  # oldest request timed out
+                        self.evict(origin, conduit, cutoff=cutoff)
+                elif (client.connector.cutoff or
+                      (now - conduit.used) > datetime.timedelta(seconds=self.idle)):
+                    self.evict(origin, conduit)
+
+        for origin in list(self.patrons):
+            self._assign(origin)
+
+    def evict(self, origin, conduit, retry=False, cutoff=None):
+        """
+        Closes pooled connection and removes it from pool of origin. Requests
+        in flight are requeued at the front of their patrons when retry, or
+        when sent after cutoff, and not yet retried. Otherwise their patrons
+        receive a 504 Gateway Timeout response in place of the response that
+        never came.
 
-            yield self.tock
+        Parameters:
+            origin (tuple): (scheme, hostname, port) of pool of conduit
+            conduit (Conduit): pooled connection to evict
+            retry (bool): True means retry requests in flight
+            cutoff (datetime | None): requests sent after cutoff have not
+                timed out so are retried
+        """
+        pool = self.pools.get(origin, [])
+        if conduit in pool:
+            pool.remove(conduit)
+        if not pool:
+            self.pools.pop(origin, None)
+        super(Clienter, self).remove([conduit.doer])
+        self.evicted += 1
+
+        for patron, request, tries, sent in reversed(conduit.flights):
+            patron.flights -= 1
+            if patron.closed:
+                continue
+            if (retry or (cutoff is not None and sent >= cutoff)) and tries < 1:
+                patron.requests.appendleft(dict(request, tries=tries + 1))
+                self.assign(patron)
+            else:
+                self.timeouts += 1
+                patron.responses.append(dict(version=None, status=504,
+                                             reason="Gateway Timeout",
+                                             headers=Hict(), body=bytearray(),
+                                             data=None, request=request,
+                                             errored=True,
+                                             error="connection lost or timed out"))
+        conduit.flights.clear()
+
+    def _assign(self, origin):
+        """ Assigns waiting requests of patrons of origin in turn """
+        waiting = self.patrons.get(origin, [])
+        while waiting:
+            patron = waiting[0]
+            while patron.requests:
+                if (conduit := self._conduit(origin)) is None:
+                    return  # pool exhausted so remaining patrons keep waiting
+                request = patron.requests.popleft()
+                tries = request.pop("tries", 0)
+                if conduit.served or conduit.flights:
+                    self.reused += 1
+                conduit.client.request(**request)
+                conduit.used = helping.nowUTC()
+                conduit.flights.append((patron, request, tries, conduit.used))
+                patron.flights += 1
+                self.sent += 1
+            waiting.pop(0)
+        self.patrons.pop(origin, None)
+
+    def _conduit(self, origin):
+        """
+        Returns pooled Conduit of origin for next request. That is an idle
+        connection if any, else a new connection if pool not full, else the
+        least loaded connection below depth, else None
+        """
+        pool = self.pools.setdefault(origin, [])
+        conduit = min((c for c in pool if not c.client.connector.cutoff),
+                      key=lambda c: len(c.flights), default=None)
+        if conduit is not None and not conduit.flights:
+            return conduit
+        if len(pool) >= self.limit:
+            if conduit is not None and len(conduit.flights) < self.depth:
+                return conduit
+            return None
 
+        scheme, hostname, port = origin
+        client = http.clienting.Client(scheme=scheme, hostname=hostname, port=port,
+                                       portOptional=True)
+        conduit = Conduit(client=client,
+                          doer=http.clienting.ClientDoer(client=client))
+        pool.append(conduit)
+        self.extend([conduit.doer])
+        self.opened += 1
+        return conduit
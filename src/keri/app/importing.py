@@ -0,0 +1,274 @@
+# -*- encoding: utf-8 -*-
+"""
+keri.app.importing module
+
+Bulk import of key event logs from CESR stream files
+"""
+import logging
+import mmap
+import time
+
+from .. import help
+from ..kering import KeriError, Vrsn_1_0
+from ..core import parsing, serdering
+from ..core.coring import Ilks
+
+logger = help.ogler.getLogger()
+
+ChunkSize = 1 << 20  # default bytes per chunk read from import file
+BatchSize = 1024  # default messages per batched database transaction
+
+KelIlks = (Ilks.icp, Ilks.rot, Ilks.ixn, Ilks.dip, Ilks.drt)
+
+
+def chunker(path, size=ChunkSize):
+    """
+    Generator of successive chunks of the file at path read through a read
+    only memory map so that the file is paged in by the OS instead of being
+    read into memory all at once.
+
+    Parameters:
+        path (str): path to file
+        size (int): maximum bytes per chunk
+
+    Yields:
+        chunk (bytes): next chunk of at most size bytes
+    """
+    with open(path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file can not be mapped
+            return
+        with mm:
+            for i in range(0, len(mm), size):
+                yield mm[i:i + size]
+
+
+def ahead(serder, kvy):
+    """
+    Returns True when serder is a key event that can not yet be accepted
+    because its sn is beyond the next sn of the current key state of its
+    prefix in kvy, or when it is a non-inception event of a prefix with no key
+    state yet. False otherwise including for recovery rotations whose sn is
+    at or before the current sn.
+
+    Parameters:
+        serder (Serder): of parsed message
+        kvy (Kevery | None): source of current key state
+    """
+    if (kvy is None or not isinstance(serder, serdering.SerderKERI)
+            or serder.ilk not in KelIlks):
+        return False
+    if serder.pre not in kvy.kevers:
+        return serder.ilk not in (Ilks.icp, Ilks.dip)
+    return serder.sn > kvy.kevers[serder.pre].sner.num + 1
+
+
+class Importer(parsing.Parser):
+    """
+    Importer is a Parser for bulk import of CESR streams of key event logs
+    such as the output of kli export. Instead of dispatching each message as
+    it is parsed, the stream is fed in chunks and parsed messages are
+    collected into batches. Each batch is dispatched inside one database
+    transaction in stream order except that key events ahead of the key state
+    of their prefix are deferred until the events before them have been
+    dispatched, which avoids out of order escrow churn. Escrow processing is
+    deferred until the whole stream has been imported.
+
+    Attributes:
+        db (Baser): database whose transaction batches dispatch
+        size (int): bytes of stream kept buffered ahead of parsing. Messages
+            with attachments not enclosed in an AttachmentGroup must fit in
+            size bytes so the parser never sees a partial attachment tail.
+        batch (int): messages dispatched per database transaction
+        pending (list): (exts, kwa) of collected messages awaiting dispatch
+        count (int): messages dispatched so far
+        start (float | None): perf_counter time of first fed chunk
+        progress (Callable | None): called as progress(count, rate) after
+            each dispatched batch
+
+    Properties:
+        rate (float): messages dispatched per second so far
+
+    Usage:
+        importer = Importer(db=hby.db, kvy=hby.kvy, rvy=hby.rvy)
+        importer.importFile(path)
+    """
+
+    def __init__(self, db, size=ChunkSize, batch=BatchSize, progress=None,
+                 local=False, version=Vrsn_1_0, **kwa):
+        """
+        Initialize instance
+
+        Parameters:
+            db (Baser): database of kvy whose transaction batches dispatch
+            size (int): bytes of stream kept buffered ahead of parsing
+            batch (int): messages dispatched per database transaction
+            progress (Callable | None): called as progress(count, rate) after
+                each dispatched batch
+            local (bool): True means event source is local (protected)
+            version (Versionage): default version of CESR of stream
+
+        Remaining keyword arguments are passed to Parser such as kvy and rvy
+        """
+        super(Importer, self).__init__(framed=False, local=local,
+                                       version=version, **kwa)
+        self.db = db
+        self.size = max(1, size)
+        self.batch = max(1, batch)
+        self.progress = progress
+        self.pending = []
+        self.count = 0
+        self.start = None
+        self._parsator = self.parsator(ims=self.ims, framed=False)
+
+    @property
+    def rate(self):
+        """ Returns messages dispatched per second so far """
+        if self.start is None or not self.count:
+            return 0.0
+        return self.count / max(time.perf_counter() - self.start, 1e-9)
+
+    def dispatch(self, exts, kvy=None, tvy=None, exc=None, rvy=None, vry=None):
+        """
+        Collects extracted message exts for batched dispatch by .flush
+        instead of dispatching it immediately.
+
+        Parameters: same as Parser.dispatch
+        """
+        self.pending.append((exts, dict(kvy=kvy, tvy=tvy, exc=exc, rvy=rvy,
+                                        vry=vry)))
+        if len(self.pending) >= self.batch:
+            self.flush()
+
+    def flush(self):
+        """
+        Dispatches all pending messages inside one database transaction in
+        stream order. A key event that is ahead of the key state of its prefix
+        is deferred and dispatched, in stream order with the other deferred
+        events of its prefix, as soon as the events before it have been
+        dispatched. Deferred events still ahead at the end of the batch are
+        dispatched last and so go to the out of order escrow.
+        """
+        if not self.pending:
+            return
+
+        msgs = self.pending
+        self.pending = []
+        deferred = {}  # lists of deferred (exts, kwa) keyed by prefix
+        with self.db.transaction():
+            for exts, kwa in msgs:
+                serder = exts['serder']
+                if ahead(serder, kwa['kvy']):
+                    deferred.setdefault(serder.pre, []).append((exts, kwa))
+                    continue
+
+                self._dispatch(exts, kwa)
+                waiting = deferred.get(getattr(serder, "pre", None), [])
+                while ready := [msg for msg in waiting if not ahead(msg[0]['serder'],
+                                                                    msg[1]['kvy'])]:
+                    for msg in ready:
+                        waiting.remove(msg)
+                        self._dispatch(*msg)
+
+            for waiting in deferred.values():
+                for exts, kwa in waiting:
+                    self._dispatch(exts, kwa)
+
+        self.count += len(msgs)
+
+        logger.info("Importer dispatched %d messages at %.0f msgs/sec",
+                    self.count, self.rate)
+        if self.progress is not None:
+            self.progress(self.count, self.rate)
+
+    def _dispatch(self, exts, kwa):
+        """
+        Dispatches one message in its own savepoint. A KeriError means the
+        message was rejected or escrowed, so the writes made for it, such as
+        escrow entries, are kept. Any other error discards all the writes of
+        the message. Errors are logged per message as Parser does so that one
+        bad message neither aborts the batch nor the import. When the message
+        was the inception of a prefix without key state the kever it created
+        is dropped since its writes were discarded. Existing kevers, whose key
+        state is already committed, are kept.
+
+        Parameters:
+            exts (dict): extracted message serder and attachments
+            kwa (dict): processors for Parser.dispatch
+        """
+        pre = getattr(exts['serder'], "pre", None)
+        kevers = self.db.kevers
+        known = pre is not None and pre in kevers
+        try:
+            with self.db.savepoint():
+                try:
+                    super(Importer, self).dispatch(exts=exts, **kwa)
+                except KeriError as ex:  # escrowed or rejected so keep
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.error("Importer msg dispatch error: %s", ex)
+        except Exception as ex:  # unexpected so discard msg writes
+            if pre is not None and not known:
+                kevers.pop(pre, None)
+            logger.error("Importer discarded msg for pre=%s said=%s: %s", pre,
+                         getattr(exts['serder'], "said", None), ex)
+
+    def feed(self, chunk):
+        """
+        Appends chunk of stream and parses all complete messages while at
+        least .size bytes remain buffered ahead of the parser.
+
+        Parameters:
+            chunk (bytes | bytearray | memoryview): next chunk of stream
+        """
+        if self.start is None:
+            self.start = time.perf_counter()
+        self.ims.extend(chunk)
+        self._drive(reserve=self.size)
+
+    def finish(self):
+        """
+        Parses the remainder of the stream, dispatches all pending messages,
+        and then processes escrows once.
+
+        Returns:
+            count (int): messages dispatched
+        """
+        self._drive(reserve=0)
+        if self.ims:
+            logger.error("Importer truncated stream, dropped %d trailing "
+                         "bytes", len(self.ims))
+            self.ims.clear()
+        self.flush()
+
+        if self.kvy is not None:
+            self.kvy.processEscrows()
+        if self.rvy is not None:
+            self.rvy.processEscrowReply()
+
+        return self.count
+
+    def importFile(self, path):
+        """
+        Imports all messages of the CESR stream file at path
+
+        Parameters:
+            path (str): path to stream file
+
+        Returns:
+            count (int): messages dispatched
+        """
+        for chunk in chunker(path, size=self.size):
+            self.feed(chunk)
+        return self.finish()
+
+    def _drive(self, reserve):
+        """
+        Runs parser over .ims until fewer than reserve bytes remain or the
+        parser makes no progress because it is waiting on more of the stream.
+        """
+        while self.ims and len(self.ims) >= reserve:
+            size = len(self.ims)
+            next(self._parsator)
+            if len(self.ims) == size:  # parser waiting on more of stream
+                break
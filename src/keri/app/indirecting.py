@@ -5,12 +5,16 @@ keri.app.indirecting module
 
 simple indirect mode demo support classes
 """
+import asyncio
 import datetime
+import io
 import platform
 import falcon
+import falcon.asgi
 import time
 import sys
 import traceback
+from collections import deque
 from ordered_set import OrderedSet as oset
 
 from hio.base import doing
@@ -37,10 +41,19 @@ logger = help.ogler.getLogger()
 
 
 def setupWitness(hby, alias="witness", mbx=None, aids=None, tcpPort=5631, httpPort=5632,
-                 keypath=None, certpath=None, cafilepath=None):
+                 keypath=None, certpath=None, cafilepath=None, asgi=False,
+                 retain=None):
     """
     Setup witness controller and doers
 
+    Parameters:
+        asgi (bool): True means serve HTTP with uvicorn through AsgiBridge whose
+            AsyncHttpEnd processes each message before responding with keep
+            alive and backpressure. False means hio HTTP server with HttpEnd
+        retain (float | None): seconds between online mailbox retention and
+            garbage collection passes. None means never. Compaction is
+            offline only with kli mailbox compact
+
     """
     host = "0.0.0.0"
     if platform.system() == "Windows":
@@ -88,17 +101,34 @@ def setupWitness(hby, alias="witness", mbx=None, aids=None, tcpPort=5631, httpPo
                             rvy=rvy,
                             version=Vrsn_1_0)
 
-    httpEnd = HttpEnd(rxbs=parser.ims, mbx=mbx)
-    app.add_route("/", httpEnd)
     receiptEnd = ReceiptEnd(hab=hab, inbound=cues, aids=aids)
     app.add_route("/receipts", receiptEnd)
     queryEnd = QueryEnd(hab=hab)
     app.add_route("/query", queryEnd)
 
-    server = createHttpServer(host, httpPort, app, keypath, certpath, cafilepath)
-    if not server.reopen():
-        raise RuntimeError(f"cannot create http server on port {httpPort}")
-    httpServerDoer = http.ServerDoer(server=server)
+    if asgi:
+        ingress = Ingress(parser=parsing.Parser(framed=True,
+                                                kvy=kvy,
+                                                tvy=tvy,
+                                                exc=exchanger,
+                                                rvy=rvy,
+                                                version=Vrsn_1_0))
+        httpEnd = AsyncHttpEnd(ingress=ingress, mbx=mbx)
+        httpServerDoer = AsgiServerDoer(app=AsgiBridge(end=httpEnd, wsgi=app),
+                                        host=host,
+                                        port=httpPort,
+                                        keypath=keypath,
+                                        certpath=certpath,
+                                        cafilepath=cafilepath)
+        doers.append(ingress)
+    else:
+        httpEnd = HttpEnd(rxbs=parser.ims, mbx=mbx)
+        app.add_route("/", httpEnd)
+
+        server = createHttpServer(host, httpPort, app, keypath, certpath, cafilepath)
+        if not server.reopen():
+            raise RuntimeError(f"cannot create http server on port {httpPort}")
+        httpServerDoer = http.ServerDoer(server=server)
 
     # setup doers
     regDoer = basing.BaserDoer(baser=verfer.reger)
@@ -117,6 +147,8 @@ def setupWitness(hby, alias="witness", mbx=None, aids=None, tcpPort=5631, httpPo
                             responses=rep.cues, queries=httpEnd.qrycues)
 
     doers.extend([regDoer, httpServerDoer, rep, witStart, receiptEnd, *oobiery.doers])
+    if retain is not None:
+        doers.append(storing.Retainer(mbx=mbx, period=retain))
     return doers
 
 
@@ -965,6 +997,452 @@ class HttpEnd:
         rep.status = falcon.HTTP_204
 
 
+# errors raised by processors after escrowing a message so it may yet be accepted
+EscrowErrors = (kering.MissingSignatureError,
+                kering.MissingWitnessSignatureError,
+                kering.MissingDelegationError,
+                kering.MissingDelegableApprovalError,
+                kering.OutOfOrderError,
+                kering.LikelyDuplicitousError,
+                kering.UnverifiedWitnessReceiptError,
+                kering.UnverifiedReceiptError,
+                kering.UnverifiedTransferableReceiptError,
+                kering.UnverifiedReplyError,
+                kering.MissingAnchorError,
+                kering.MissingRegistryError,
+                kering.MissingIssuerError,
+                kering.OutOfOrderKeyStateError,
+                kering.OutOfOrderTxnStateError,
+                kering.QueryNotFoundError)
+
+
+class Ingress(doing.Doer):
+    """
+    Ingress is a bounded queue of inbound messages from AsyncHttpEnd requests
+    into a parser. Requests submit messages with a future that is resolved
+    once the message has actually been processed so the response can report
+    the outcome. The queue is drained by this Doer in the Doist loop so all
+    processing stays on the one thread that owns the databases.
+
+    Attributes:
+        parser (Parser): framed parser that processes each message
+        size (int): maximum queued messages. Submissions beyond are refused
+        limit (int | None): maximum messages processed per recur. None means all
+        local (bool): True means messages are processed as local source,
+            same as WitnessStart.msgDo for messages of HttpEnd
+        msgs (deque): queued (msg, future) duples
+
+    Properties:
+        full (bool): True means queue is at size and refuses submissions
+    """
+
+    def __init__(self, parser, size=1024, limit=64, local=True, **kwa):
+        """
+        Initialize instance
+
+        Parameters:
+            parser (Parser): framed parser that processes each message
+            size (int): maximum queued messages
+            limit (int | None): maximum messages processed per recur
+            local (bool): True means messages are processed as local source
+        """
+        super(Ingress, self).__init__(**kwa)
+        self.parser = parser
+        self.size = size
+        self.limit = limit
+        self.local = local
+        self.msgs = deque()
+
+    @property
+    def full(self):
+        """ Returns True when queue is at size """
+        return len(self.msgs) >= self.size
+
+    def submit(self, msg):
+        """
+        Queues msg for processing. Must be called from a coroutine.
+
+        Parameters:
+            msg (bytes | bytearray): one message with its attachments
+
+        Returns:
+            future (asyncio.Future | None): resolved with the outcome of
+                .parse once processed. None means refused since queue full
+        """
+        if self.full:
+            return None
+        future = asyncio.get_running_loop().create_future()
+        self.msgs.append((msg, future))
+        return future
+
+    def process(self, limit=None):
+        """
+        Processes queued messages in order and resolves their futures
+
+        Parameters:
+            limit (int | None): maximum messages to process. None means all
+
+        Returns:
+            count (int): messages processed
+        """
+        count = 0
+        while self.msgs and (limit is None or count < limit):
+            msg, future = self.msgs.popleft()
+            ex = self.parse(msg)
+            if not future.done():  # requester may have timed out
+                future.set_result(ex)
+            count += 1
+        return count
+
+    def parse(self, msg):
+        """
+        Parses and processes one framed message. Unlike Parser.parse errors
+        are returned instead of logged and swallowed so they may be reported.
+
+        Returns:
+            ex (Exception | None): error raised by extraction or processing
+                None means processed successfully
+        """
+        parser = self.parser
+        try:
+            for _ in parser.msgParsator(ims=bytearray(msg),
+                                        framed=True,
+                                        kvy=parser.kvy,
+                                        tvy=parser.tvy,
+                                        exc=parser.exc,
+                                        rvy=parser.rvy,
+                                        vry=parser.vry,
+                                        local=self.local):
+                pass
+        except Exception as ex:
+            if not isinstance(ex, EscrowErrors):
+                logger.error("Ingress msg error: %s", ex)
+            return ex
+        return None
+
+    def recur(self, tyme):
+        """ Processes up to .limit queued messages per run """
+        self.process(limit=self.limit)
+        return False
+
+
+class AsyncHttpEnd:
+    """
+    ASGI HTTP handler that accepts KERI events POSTed as the body of a request
+    with all attachments to the message as a CESR attachment HTTP header.
+    Async counterpart of HttpEnd. Instead of appending to a shared stream for
+    later parsing each message is submitted to a bounded Ingress and the
+    response waits until the message has been processed. Connections are
+    kept alive.
+
+    Responses:
+        204: processed and accepted
+        202: escrowed pending more information or still queued at timeout
+        400: rejected as invalid
+        503: ingress queue full, retry after .RetryAfter seconds
+    """
+
+    RetryAfter = 1  # seconds client should wait when ingress full
+    Timeout = 10.0  # seconds to wait for processing before responding 202
+    Tock = 0.05  # seconds between polls of mailbox stream when empty
+
+    def __init__(self, ingress, mbx=None, qrycues=None, timeout=None):
+        """
+        Parameters
+             ingress (Ingress): bounded queue into parser
+             mbx (Mailboxer): Mailbox storage
+             qrycues (Deck): inbound qry response queues
+             timeout (float | None): seconds to wait for processing
+        """
+        self.ingress = ingress
+        self.mbx = mbx
+        self.qrycues = qrycues if qrycues is not None else decking.Deck()
+        self.timeout = timeout if timeout is not None else self.Timeout
+
+    async def on_post(self, req, rep):
+        """
+        Handles POST for KERI event messages.
+
+        Parameters:
+              req (Request) Falcon ASGI HTTP request
+              rep (Response) Falcon ASGI HTTP response
+
+        ---
+        summary:  Accept KERI events with attachment headers and process
+        description:  Accept KERI events with attachment headers and process.
+        tags:
+           - Events
+        requestBody:
+           required: true
+           content:
+             application/json:
+               schema:
+                 type: object
+                 description: KERI event message
+        responses:
+           200:
+              description: Mailbox query response for server sent events
+           202:
+              description: KEL or EXN event escrowed or still queued.
+           204:
+              description: KEL or EXN event accepted.
+           400:
+              description: KEL or EXN event rejected.
+           503:
+              description: Too busy, retry later.
+        """
+        rep.set_header('Cache-Control', "no-cache")
+
+        cr = await httping.parseCesrHttpRequestAsync(req=req)
+        sadder = coring.Sadder(ked=cr.payload, kind=eventing.Kinds.json)
+        msg = bytearray(sadder.raw)
+        msg.extend(cr.attachments.encode("utf-8"))
+
+        if not await self.ingest(msg=msg, rep=rep):
+            return
+
+        if (sadder.proto not in ("ACDC",) and sadder.ked["t"] in (Ilks.qry,)
+                and sadder.ked["r"] in ("mbx",)):
+            rep.set_header('Content-Type', "text/event-stream")
+            rep.status = falcon.HTTP_200
+            rep.stream = self.streamer(QryRpyMailboxIterable(mbx=self.mbx,
+                                                             cues=self.qrycues,
+                                                             said=sadder.said))
+
+    async def on_put(self, req, rep):
+        """
+        Handles PUT for KERI mbx event messages.
+
+        Parameters:
+              req (Request) Falcon ASGI HTTP request
+              rep (Response) Falcon ASGI HTTP response
+
+        ---
+        summary:  Accept KERI events with attachments and process
+        description:  Accept KERI events with attachments and process.
+        tags:
+           - Events
+        responses:
+           202:
+              description: KEL or EXN event escrowed or still queued.
+           204:
+              description: KEL or EXN event accepted.
+           400:
+              description: KEL or EXN event rejected.
+           503:
+              description: Too busy, retry later.
+        """
+        rep.set_header('Cache-Control', "no-cache")
+        await self.ingest(msg=await req.stream.read(), rep=rep)
+
+    async def ingest(self, msg, rep):
+        """
+        Submits msg to .ingress, waits for it to be processed, and sets the
+        status of rep from the outcome.
+
+        Returns:
+            processed (bool): True means processed and accepted
+        """
+        future = self.ingress.submit(msg)
+        if future is None:
+            raise falcon.HTTPServiceUnavailable(title="Ingress full",
+                                                description="Too many messages "
+                                                            "pending processing.",
+                                                retry_after=self.RetryAfter)
+
+        rep.set_header('Content-Type', "application/json")
+        try:
+            ex = await asyncio.wait_for(asyncio.shield(future), self.timeout)
+        except asyncio.TimeoutError:
+            rep.status = falcon.HTTP_202  # queued so will still be processed
+            return False
+
+        if ex is None:
+            rep.status = falcon.HTTP_204
+            return True
+        if isinstance(ex, EscrowErrors):
+            rep.status = falcon.HTTP_202
+            return False
+        raise falcon.HTTPBadRequest(title="Message rejected",
+                                    description=str(ex.args[0]) if ex.args else str(ex))
+
+    async def streamer(self, iterable):
+        """ Async generator of chunks of iterable that polls while it is empty """
+        for chunk in iterable:
+            if chunk:
+                yield bytes(chunk)
+            else:
+                await asyncio.sleep(self.Tock)
+
+
+class AsgiBridge:
+    """
+    AsgiBridge is the ASGI application of a witness with an AsyncHttpEnd. It
+    serves the message ingress route natively and passes all other requests
+    to the witness WSGI app, called inline so that its resources run on the
+    same thread as the Doist just as they do under the hio HTTP server.
+
+    Attributes:
+        end (AsyncHttpEnd): message ingress end
+        asgi (falcon.asgi.App): app with .end routed at /
+        wsgi (falcon.App): app of all other routes
+        tock (float): seconds between polls of WSGI stream when empty
+    """
+
+    def __init__(self, end, wsgi, tock=0.05):
+        """
+        Parameters:
+            end (AsyncHttpEnd): message ingress end
+            wsgi (falcon.App): app of all other routes
+            tock (float): seconds between polls of WSGI stream when empty
+        """
+        self.end = end
+        self.asgi = falcon.asgi.App(cors_enable=True)
+        self.asgi.add_route("/", end)
+        self.wsgi = wsgi
+        self.tock = tock
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] == "/":
+            await self.asgi(scope, receive, send)
+        else:
+            await self.bridge(scope, receive, send)
+
+    async def bridge(self, scope, receive, send):
+        """ Serves one HTTP request of scope with .wsgi """
+        body = bytearray()
+        while True:
+            event = await receive()
+            if event["type"] == "http.disconnect":
+                return
+            body.extend(event.get("body", b""))
+            if not event.get("more_body", False):
+                break
+
+        started = {}
+
+        def start_response(status, headers, exc_info=None):
+            started.update(status=status, headers=headers)
+
+        result = self.wsgi(self.environ(scope, body), start_response)
+        disconnect = asyncio.ensure_future(receive())  # next event is disconnect
+        try:
+            await send({"type": "http.response.start",
+                        "status": int(started["status"].split(" ", 1)[0]),
+                        "headers": [(k.lower().encode("latin-1"), v.encode("latin-1"))
+                                    for k, v in started["headers"]]})
+            for chunk in result:
+                if disconnect.done():
+                    return
+                if chunk:
+                    await send({"type": "http.response.body", "body": bytes(chunk),
+                                "more_body": True})
+                else:  # streaming response waiting on more
+                    await asyncio.sleep(self.tock)
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        finally:
+            disconnect.cancel()
+            if hasattr(result, "close"):
+                result.close()
+
+    @staticmethod
+    def environ(scope, body):
+        """ Returns WSGI environ for ASGI http scope and request body """
+        host, port = scope.get("server") or ("localhost", 80)
+        environ = {"REQUEST_METHOD": scope["method"],
+                   "SCRIPT_NAME": scope.get("root_path", "").encode("utf-8").decode("latin-1"),
+                   "PATH_INFO": scope["path"].encode("utf-8").decode("latin-1"),
+                   "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+                   "SERVER_NAME": host,
+                   "SERVER_PORT": str(port),
+                   "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+                   "CONTENT_LENGTH": str(len(body)),
+                   "wsgi.version": (1, 0),
+                   "wsgi.url_scheme": scope.get("scheme", "http"),
+                   "wsgi.input": io.BytesIO(body),
+                   "wsgi.errors": sys.stderr,
+                   "wsgi.multithread": False,
+                   "wsgi.multiprocess": False,
+                   "wsgi.run_once": False}
+        for name, value in scope.get("headers", []):
+            name = name.decode("latin-1")
+            value = value.decode("latin-1")
+            if name == "content-type":
+                environ["CONTENT_TYPE"] = value
+            elif name != "content-length":
+                key = "HTTP_" + name.upper().replace("-", "_")
+                environ[key] = f"{environ[key]},{value}" if key in environ else value
+        return environ
+
+
+class AsgiServerDoer(doing.Doer):
+    """
+    AsgiServerDoer serves an ASGI app with uvicorn on an asyncio event loop
+    that is pumped one iteration per run of this Doer so that the app runs in
+    the Doist thread alongside all the other doers.
+
+    Requires the optional uvicorn dependency, pip install keri[asgi]
+
+    Attributes:
+        app (Callable): ASGI application
+        host (str): host to bind to
+        port (int): port to listen on
+        keypath (str | None): file path to the TLS private key
+        certpath (str | None): file path to the TLS signed certificate
+        cafilepath (str | None): file path to the TLS CA certificate chain
+        loop (asyncio.AbstractEventLoop | None): event loop when entered
+        server (uvicorn.Server | None): server when entered
+    """
+
+    def __init__(self, app, host, port, keypath=None, certpath=None,
+                 cafilepath=None, **kwa):
+        super(AsgiServerDoer, self).__init__(**kwa)
+        self.app = app
+        self.host = host
+        self.port = port
+        self.keypath = keypath
+        self.certpath = certpath
+        self.cafilepath = cafilepath
+        self.loop = None
+        self.server = None
+        self.task = None
+
+    def enter(self, *, temp=None):
+        """ Starts uvicorn server task on new event loop """
+        import uvicorn  # optional dependency so only needed when used
+
+        self.loop = asyncio.new_event_loop()
+        config = uvicorn.Config(app=self.app,
+                                host=self.host,
+                                port=self.port,
+                                lifespan="off",
+                                log_level="warning",
+                                ssl_keyfile=self.keypath,
+                                ssl_certfile=self.certpath,
+                                ssl_ca_certs=self.cafilepath)
+        self.server = uvicorn.Server(config=config)
+        self.task = self.loop.create_task(self.server.serve())
+
+    def recur(self, tyme):
+        """ Runs one iteration of event loop. Done when server stops """
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+        if self.task.done():
+            self.task.result()  # raises if server failed
+            return True
+        return False
+
+    def exit(self):
+        """ Shuts down server and closes event loop """
+        if self.loop is None:
+            return
+        if self.task is not None and not self.task.done():
+            self.server.should_exit = True
+            self.loop.run_until_complete(self.task)
+        self.loop.close()
+        self.loop = None
+
+
 class QryRpyMailboxIterable:
 
     def __init__(self, cues, mbx, said, retry=5000):
@@ -996,6 +1474,12 @@ class QryRpyMailboxIterable:
 
 
 class MailboxIterable:
+    """
+    Iterable of server sent events of mailbox messages of topics of pre. Each
+    topic's index in .topics is this stream's cursor. Stored topics are pushed
+    by the Mailboxer announcer to .listener so that only announced topics are
+    read from the database and an idle stream does no database reads.
+    """
     TimeoutMBX = 30000000
 
     def __init__(self, mbx, pre, topics, retry=5000):
@@ -1003,6 +1487,7 @@ class MailboxIterable:
         self.pre = pre
         self.topics = topics
         self.retry = retry
+        self.listener = mbx.announcer.listen(pre + topic for topic in topics)
 
     def __iter__(self):
         self.start = self.end = time.perf_counter()
@@ -1015,20 +1500,24 @@ class MailboxIterable:
                 return bytearray(f"retry: {self.retry}\n\n".encode("utf-8"))
 
             data = bytearray()
-            for topic, idx in self.topics.items():
-                key = self.pre + topic
-                for fn, _, msg in self.mbx.cloneTopicIter(key, idx):
-                    data.extend(bytearray("id: {}\nevent: {}\nretry: {}\ndata: ".format(fn, topic, self.retry)
-                                          .encode("utf-8")))
-                    data.extend(msg)
-                    data.extend(b'\n\n')
-                    idx = idx + 1
-                    self.start = time.perf_counter()
-
-                self.topics[topic] = idx
+            if pending := self.listener.drain():
+                for topic, idx in self.topics.items():
+                    key = self.pre + topic
+                    if key.encode("utf-8") not in pending:
+                        continue
+                    for fn, _, msg in self.mbx.cloneTopicIter(key, idx):
+                        data.extend(bytearray("id: {}\nevent: {}\nretry: {}\ndata: ".format(fn, topic, self.retry)
+                                              .encode("utf-8")))
+                        data.extend(msg)
+                        data.extend(b'\n\n')
+                        idx = idx + 1
+                        self.start = time.perf_counter()
+
+                    self.topics[topic] = idx
             self.end = time.perf_counter()
             return data
 
+        self.mbx.announcer.ignore(self.listener)
         raise StopIteration
 
 
@@ -1257,8 +1746,8 @@ class QueryEnd:
                         continue  # skip this event
                     evnts.extend(msg)
             else:
-                for msg in self.hab.db.clonePreIter(pre=pre):
-                    evnts.extend(msg)
+                for chunk in self.hab.db.cloneChunkIter(pre=pre):
+                    evnts.extend(chunk)
 
 
             rep.set_header('Content-Type', "application/json+cesr")
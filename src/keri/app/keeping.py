@@ -23,7 +23,8 @@ raw = json.dumps(ked, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
 
 """
 import math
-from collections import namedtuple, deque
+import time
+from collections import namedtuple, deque, OrderedDict
 from dataclasses import dataclass, asdict, field
 
 import pysodium
@@ -383,6 +384,16 @@ class Creator:
         """
         return []
 
+    def prime(self, batches, temp=False):
+        """
+        Prepares to create the key pairs of all batches at once so that
+        subsequent .create calls for them are fast. Default does nothing.
+
+        Parameters:
+            batches (list): of (codes, pidx, ridx, kidx) tuples of .create calls
+            temp is Boolean True means use temp stretch
+        """
+
     @property
     def salt(self):
         """
@@ -455,6 +466,8 @@ class SaltyCreator(Creator):
 
     Attributes:
         .salter is salter instance
+        .stretcher is optional Stretcher instance that stretches all the seeds
+            of a create at once
 
     Properties:
 
@@ -466,7 +479,7 @@ class SaltyCreator(Creator):
         ._salter holds instance for .salter property
     """
 
-    def __init__(self, salt=None, stem=None, tier=None, **kwa):
+    def __init__(self, salt=None, stem=None, tier=None, stretcher=None, **kwa):
         """
         Setup Creator.
 
@@ -475,11 +488,13 @@ class SaltyCreator(Creator):
             stem is path modifier used with salt to derive private keys.
                     if stem is None then uses pidx
             tier is derivation criticality that determines how much hashing to use.
+            stretcher is optional Stretcher to stretch seeds concurrently
 
         """
         super(SaltyCreator, self).__init__(**kwa)
         self.salter = core.Salter(qb64=salt, tier=tier)
         self._stem = stem if stem is not None else ''
+        self.stretcher = stretcher
 
     @property
     def salt(self):
@@ -522,9 +537,13 @@ class SaltyCreator(Creator):
         if not codes:  # if not codes make list len count of same code
             codes = [code for i in range(count)]
 
-        stem = self.stem if self.stem else "{:x}".format(pidx)  # if not stem use pidx
-        for i, code in enumerate(codes):
-            path = "{}{:x}{:x}".format(stem, ridx, kidx + i)
+        paths = self.paths(codes=codes, pidx=pidx, ridx=ridx, kidx=kidx)
+        if self.stretcher is not None:
+            return self.stretcher.signers(self.salter, paths=paths, codes=codes,
+                                          transferable=transferable,
+                                          tier=self.tier, temp=temp)
+
+        for path, code in zip(paths, codes):
             signers.append(self.salter.signer(path=path,
                                               code=code,
                                               transferable=transferable,
@@ -532,6 +551,38 @@ class SaltyCreator(Creator):
                                               temp=temp))
         return signers
 
+    def paths(self, codes, pidx=0, ridx=0, kidx=0):
+        """
+        Returns list of derivation paths one per code in codes
+
+        Parameters:
+            codes is list of derivation codes one per key pair
+            pidx is int prefix index for key pair sequence
+            ridx is int rotation index for key pair set
+            kidx is int starting key index for key pair set
+        """
+        stem = self.stem if self.stem else "{:x}".format(pidx)  # if not stem use pidx
+        return ["{}{:x}{:x}".format(stem, ridx, kidx + i) for i in range(len(codes))]
+
+    def prime(self, batches, temp=False):
+        """
+        Stretches the seeds of all batches at once with .stretcher so that
+        subsequent .create calls for them take the primed seeds.
+
+        Parameters:
+            batches (list): of (codes, pidx, ridx, kidx) tuples of .create calls
+            temp is Boolean True means use temp stretch
+        """
+        if self.stretcher is None:
+            return
+
+        paths, sizes = [], []
+        for codes, pidx, ridx, kidx in batches:
+            paths.extend(self.paths(codes=codes, pidx=pidx, ridx=ridx, kidx=kidx))
+            sizes.extend(coring.Matter._rawSize(code) for code in codes)
+        self.stretcher.stretch(self.salter, paths=paths, sizes=sizes,
+                               tier=self.tier, temp=temp, prime=True)
+
 
 class Creatory:
     """
@@ -587,6 +638,104 @@ class Creatory:
         return SaltyCreator(**kwa)
 
 
+class SignerCache:
+    """
+    In memory cache of decrypted Signers keyed by qb64 public key so that
+    repeated signing with the same keys does not fetch and decrypt the private
+    key from the keystore every time. Entries expire after .ttl seconds and at
+    most .size entries are kept, least recently used are evicted first.
+    Evicting an entry only drops the cache reference to its Signer so that a
+    Signer still referenced by a caller stays usable.
+
+    Attributes:
+        ttl (float): seconds an entry may be used after it was cached
+        size (int): maximum number of entries
+        clock (Callable): returns current monotonic time in seconds
+        entries (OrderedDict): (Signer, expiration time) keyed by qb64 public key
+        hits (int): lookups served from cache
+        misses (int): lookups not served from cache
+        evictions (int): entries evicted
+
+    Usage:
+        manager = Manager(ks=ks, seed=seed, cache=SignerCache())
+    """
+    TTL = 300.0  # default seconds an entry may be used
+    Size = 64  # default maximum number of entries
+
+    def __init__(self, ttl=None, size=None, clock=None):
+        """
+        Initialize instance
+
+        Parameters:
+            ttl (float): seconds an entry may be used after it was cached
+            size (int): maximum number of entries
+            clock (Callable): returns current monotonic time in seconds
+        """
+        self.ttl = ttl if ttl is not None else self.TTL
+        self.size = max(1, size if size is not None else self.Size)
+        self.clock = clock if clock is not None else time.monotonic
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, pub):
+        """
+        Returns cached Signer for qb64 public key pub or None if not cached or expired
+
+        Parameters:
+            pub (str): qb64 public key
+        """
+        if (entry := self.entries.get(pub)) is None:
+            self.misses += 1
+            return None
+
+        signer, expire = entry
+        if self.clock() >= expire:
+            self.evict(pub)
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(pub)
+        self.hits += 1
+        return signer
+
+    def put(self, pub, signer):
+        """
+        Caches signer for qb64 public key pub evicting least recently used
+        entries beyond .size
+
+        Parameters:
+            pub (str): qb64 public key
+            signer (Signer): decrypted signer of pub
+        """
+        if pub in self.entries:
+            self.evict(pub)
+        self.entries[pub] = (signer, self.clock() + self.ttl)
+        while len(self.entries) > self.size:
+            self.evict(next(iter(self.entries)))
+
+    def evict(self, pub):
+        """
+        Removes the entry for qb64 public key pub if any
+
+        Parameters:
+            pub (str): qb64 public key
+        """
+        if self.entries.pop(pub, None) is not None:
+            self.evictions += 1
+
+    def clear(self):
+        """
+        Evicts all entries
+        """
+        for pub in list(self.entries):
+            self.evict(pub)
+
+
 # default values to init manager's globals database
 Initage = namedtuple("Initage", 'aeid pidx salt tier')
 
@@ -642,12 +791,17 @@ class Manager:
 
     """
 
-    def __init__(self, *, ks=None, seed=None, **kwa):
+    def __init__(self, *, ks=None, seed=None, stretcher=None, cache=None, **kwa):
         """
         Setup Manager.
 
         Parameters:
             ks (Keeper): key store instance (LMDB)
+            stretcher (Stretcher): stretches salty key pair seeds concurrently.
+                Default makes one that does not cache seeds. Its cache is
+                cleared when private keys are erased or the aeid changes.
+            cache (SignerCache | None): opt in cache of decrypted signers used
+                by .sign. None means decrypt private keys on every sign.
             seed (str): qb64 private-signing key (seed) for the aeid from which
                 the private decryption key may be derived. If aeid stored in
                 database is not empty then seed may required to do any key
@@ -676,6 +830,8 @@ class Manager:
         self.encrypter = None
         self.decrypter = None
         self._seed = seed if seed is not None else ""
+        self.stretcher = stretcher if stretcher is not None else core.Stretcher()
+        self.cache = cache
         self.inited = False
 
         # save keyword arg parameters to init later if db not opened yet
@@ -773,6 +929,10 @@ class Manager:
             seed (str): qb64 of new seed from which new aeid is derived (private signing
                         key seed)
         """
+        if self.cache is not None:  # cached signers were decrypted under last aeid
+            self.cache.clear()
+        self.stretcher.clear()  # forget plaintext seeds stretched under last aeid
+
         if self.aeid:  # check that last current seed matches last current .aeid
             # verifies seed belongs to aeid
             if not self.seed or not self.encrypter.verifySeed(self.seed):
@@ -989,23 +1149,28 @@ class Manager:
         ridx = 0  # rotation index
         kidx = 0  # key pair index
 
-        creator = Creatory(algo=algo).make(salt=salt, stem=stem, tier=tier)
+        creator = Creatory(algo=algo).make(salt=salt, stem=stem, tier=tier,
+                                           stretcher=self.stretcher)
 
         if not icodes:  # all same code, make list of len icount of same code
             if icount <= 0:
                 raise ValueError("Invalid icount={} must be > 0.".format(icount))
             icodes = [icode for i in range(icount)]
 
-        isigners = creator.create(codes=icodes,
-                                  pidx=pidx, ridx=ridx, kidx=kidx,
-                                  transferable=transferable, temp=temp)
-        verfers = [signer.verfer for signer in isigners]
-
         if not ncodes:  # all same code, make list of len ncount of same code
             if ncount < 0:  # next may be zero if non-trans
                 raise ValueError("Invalid ncount={} must be >= 0.".format(ncount))
             ncodes = [ncode for i in range(ncount)]
 
+        # derive current and next key pairs all at once
+        creator.prime(batches=[(icodes, pidx, ridx, kidx),
+                               (ncodes, pidx, ridx+1, kidx+len(icodes))], temp=temp)
+
+        isigners = creator.create(codes=icodes,
+                                  pidx=pidx, ridx=ridx, kidx=kidx,
+                                  transferable=transferable, temp=temp)
+        verfers = [signer.verfer for signer in isigners]
+
         # count set to 0 to ensure does not create signers if ncodes is empty
         nsigners = creator.create(codes=ncodes, count=0,
                                   pidx=pidx, ridx=ridx+1, kidx=kidx+len(icodes),
@@ -1189,7 +1354,8 @@ class Manager:
             else:
                 salt = core.Salter(qb64=salt).qb64  # ensures salt was unencrypted
 
-        creator = Creatory(algo=pp.algo).make(salt=salt, stem=pp.stem, tier=pp.tier)
+        creator = Creatory(algo=pp.algo).make(salt=salt, stem=pp.stem, tier=pp.tier,
+                                              stretcher=self.stretcher)
 
         if not ncodes:  # all same code, make list of len count of same code
             if ncount < 0:  # next may be zero if non-trans
@@ -1223,6 +1389,9 @@ class Manager:
         if erase:
             for pub in old.pubs:  # remove prior old prikeys not current old
                 self.ks.pris.rem(pub)
+                if self.cache is not None:
+                    self.cache.evict(pub)
+            self.stretcher.clear()  # forget plaintext seeds of erased keys
 
         return (verfers, digers)
 
@@ -1333,26 +1502,23 @@ class Manager:
             paths = []
             # use paths to generate signers
 
-        if pubs:
-            for pub in pubs:
-                if self.aeid and not self.decrypter:
-                    raise kering.DecryptError("Unauthorized decryption attempt. "
-                                              "Aeid but no decrypter.")
-                if ((signer := self.ks.pris.get(pub, decrypter=self.decrypter))
-                        is None):
-                    raise ValueError("Missing prikey in db for pubkey={}".format(pub))
-                signers.append(signer)
+        if not pubs:
+            pubs = [verfer.qb64 for verfer in verfers]
 
-        else:
-            for verfer in verfers:
-                if self.aeid and not self.decrypter:
-                    raise kering.DecryptError("Unauthorized decryption attempt. "
-                                              "Aeid but no decrypter.")
-                if ((signer := self.ks.pris.get(verfer.qb64,
-                                                decrypter=self.decrypter))
-                        is None):
-                    raise ValueError("Missing prikey in db for pubkey={}".format(verfer.qb64))
+        fetched = []  # (pub, signer) decrypted from .ks to cache after signing
+        for pub in pubs:
+            if self.aeid and not self.decrypter:
+                raise kering.DecryptError("Unauthorized decryption attempt. "
+                                          "Aeid but no decrypter.")
+            if self.cache is not None and (signer := self.cache.get(pub)) is not None:
                 signers.append(signer)
+                continue
+
+            if ((signer := self.ks.pris.get(pub, decrypter=self.decrypter))
+                    is None):
+                raise ValueError("Missing prikey in db for pubkey={}".format(pub))
+            fetched.append((pub, signer))
+            signers.append(signer)
 
         if indices and len(indices) != len(signers):
             raise ValueError(f"Mismatch indices length={len(indices)} and resultant"
@@ -1387,13 +1553,18 @@ class Manager:
                                           index=i,
                                           only=True if o is None else False,
                                           ondex=o))
-            return sigers
+            sigs = sigers
 
         else:
             cigars = []
             for signer in signers:
                 cigars.append(signer.sign(ser))  # assigns .verfer to cigar
-            return cigars
+            sigs = cigars
+
+        if self.cache is not None:  # after signing so eviction cannot affect signers
+            for pub, signer in fetched:
+                self.cache.put(pub, signer)
+        return sigs
 
 
     def decrypt(self, qb64, pubs=None, verfers=None):
@@ -1527,7 +1698,8 @@ class Manager:
 
         pidx = self.pidx  # get next pidx
 
-        creator = Creatory(algo=algo).make(salt=salt, stem=stem, tier=tier)
+        creator = Creatory(algo=algo).make(salt=salt, stem=stem, tier=tier,
+                                           stretcher=self.stretcher)
         ipre = ""
         dt = ""  # empty for incept of old
         pubs = []
@@ -1703,6 +1875,9 @@ class Manager:
             if erase:
                 for pub in old.pubs:  # remove prior old prikeys not current old
                     self.ks.pris.rem(pub)
+                    if self.cache is not None:
+                        self.cache.evict(pub)
+                self.stretcher.clear()  # forget plaintext seeds of erased keys
 
         return (verfers, digers)
 
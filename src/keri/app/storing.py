@@ -4,35 +4,141 @@ keri.app.storing module
 
 """
 
+import os
+import tempfile
+import time
+import weakref
+from collections import namedtuple
+
 from hio.base import doing
 from hio.help import decking
 from ordered_set import OrderedSet as oset
 
 from . import forwarding
-from .. import help
+from .. import help, core
 from ..core import coring, serdering
 from ..core.coring import MtrDex
 from ..db import dbing, subing
+from ..help import helping
 
 logger = help.ogler.getLogger()
 
+# retention policy of mailbox topic, count is maximum number of messages
+# kept at topic and age is maximum age in seconds of kept messages. None means
+# unbounded.
+Retainage = namedtuple("Retainage", "count age", defaults=(None, None))
+
+# report of one Mailboxer.maintain pass, pruned topic entries, collected
+# unreferenced message bodies, reclaimed bytes of disk and duration in seconds
+Compactage = namedtuple("Compactage", "pruned collected reclaimed duration")
+
+
+class Listener:
+    """
+    Listener is the subscription of one mailbox stream to its topic keys in an
+    Announcer. Announcements of its keys accumulate in .pending until drained
+    so an idle stream need not read the database at all.
+
+    Attributes:
+        keys (set[bytes]): full topic keys, pre plus topic, listened to
+        pending (set[bytes]): keys announced since last drain
+    """
+    __slots__ = ('keys', 'pending', '__weakref__')
+
+    def __init__(self, keys):
+        self.keys = set(keys)
+        self.pending = set(self.keys)  # all pending so first drain scans all
+
+    def drain(self):
+        """ Returns set of pending keys and clears pending """
+        pending = self.pending
+        self.pending = set()
+        return pending
+
+
+class Announcer:
+    """
+    Announcer is an in-process topic notification hub. Mailboxer announces
+    each topic key it stores to so only the Listeners of that key are marked
+    pending. Listeners are held weakly so abandoned streams drop out without
+    being ignored explicitly.
+
+    Attributes:
+        listeners (dict): of weakref.WeakSet of Listener keyed by topic key
+    """
+
+    def __init__(self):
+        self.listeners = {}
+
+    @staticmethod
+    def key(topic):
+        """ Returns topic as bytes key """
+        return topic.encode("utf-8") if hasattr(topic, "encode") else bytes(topic)
+
+    def listen(self, topics):
+        """
+        Returns new Listener of topics
+
+        Parameters:
+            topics (Iterable[str | bytes]): full topic keys, pre plus topic
+        """
+        listener = Listener(keys=[self.key(topic) for topic in topics])
+        for key in listener.keys:
+            self.listeners.setdefault(key, weakref.WeakSet()).add(listener)
+        return listener
+
+    def ignore(self, listener):
+        """ Removes listener from all its topic keys """
+        for key in listener.keys:
+            if (listeners := self.listeners.get(key)) is not None:
+                listeners.discard(listener)
+                if not listeners:
+                    del self.listeners[key]
+
+    def announce(self, topic):
+        """
+        Marks topic pending for all its listeners
+
+        Returns:
+            count (int): listeners announced to
+        """
+        key = self.key(topic)
+        if not (listeners := self.listeners.get(key)):
+            self.listeners.pop(key, None)  # drop emptied by garbage collection
+            return 0
+        for listener in listeners:
+            listener.pending.add(key)
+        return len(listeners)
+
 
 class Mailboxer(dbing.LMDBer):
     """
     Mailboxer stores exn messages in order and provider iterator access at an index.
+    Each stored topic is announced to .announcer so that mailbox streams are
+    woken only when one of their topics changes instead of polling.
+
+    Message bodies are reference counted by the topic entries that index them
+    so a body is removed once no topic entry refers to it. Topic entries are
+    pruned by the Retainage retention policy of their topic, see .prune, and
+    .maintain runs a full retention, garbage collection and compaction pass.
 
     """
     TailDirPath = "keri/mbx"
     AltTailDirPath = ".keri/mbx"
     TempPrefix = "keri_mbx_"
 
-    def __init__(self, name="mbx", headDirPath=None, reopen=True, **kwa):
+    def __init__(self, name="mbx", headDirPath=None, reopen=True, retention=None,
+                 retain=None, **kwa):
         """
 
         Parameters:
             headDirPath:
             perm:
             reopen:
+            retention (dict | None): Retainage retention policies keyed by
+                topic suffix such as "/receipt" of the full topic pre/receipt
+            retain (Retainage | None): retention policy of topics without one
+                in retention. None means retain forever
             kwa:
 
         Mailboxer uses two dbs for mailbox messages these are .tpcs and .msgs.
@@ -44,10 +150,18 @@ class Mailboxer(dbing.LMDBer):
         The message itself is stored in .msgs where the key is the msg digest
             and the value is the serialized messag itself.
         Multiple messages can share the same topic but with a different ordinal.
+        The datetime each topic entry was stored is in .tdts at the same key
+            as its .tpcs entry.
+        The count of .tpcs entries that refer to each digest is in .rcts.
 
         """
         self.tpcs = None
+        self.tdts = None
         self.msgs = None
+        self.rcts = None
+        self.announcer = Announcer()  # wakes mailbox streams of stored topics
+        self.retention = dict(retention) if retention else {}
+        self.retain = retain
 
         super(Mailboxer, self).__init__(name=name, headDirPath=headDirPath, reopen=reopen, **kwa)
 
@@ -59,19 +173,28 @@ class Mailboxer(dbing.LMDBer):
         """
         super(Mailboxer, self).reopen(**kwa)
         self.tpcs = subing.OnSuber(db=self, subkey='tpcs.')
+        self.tdts = subing.CesrOnSuber(db=self, subkey='tdts.', klas=coring.Dater)
         self.msgs = subing.Suber(db=self, subkey='msgs.')  # key states
+        self.rcts = subing.CesrSuber(db=self, subkey='rcts.', klas=core.Number)
 
         return self.env
 
     def delTopic(self, key, on=0):
-        """Removes topic index from .tpcs without deleting message from .msgs
+        """Removes topic index from .tpcs and message from .msgs once no
+        other topic index refers to it
 
         Returns:
             result (boo): True if full key consisting of key and serialized on
                              exists in database so removed
                           False otherwise (not removed)
         """
-        return self.tpcs.remOn(keys=key, on=on)
+        with self.transaction():
+            if (dig := self.tpcs.getOn(keys=key, on=on)) is None:
+                return False
+            self.tpcs.remOn(keys=key, on=on)
+            self.tdts.remOn(keys=key, on=on)
+            self._unref(dig)
+        return True
 
     def appendToTopic(self, topic, val):
         """Appends val to end of db entries with same topic but with on
@@ -85,7 +208,10 @@ class Mailboxer(dbing.LMDBer):
             topic (bytes):  topic identifier for message
             val (bytes): msg digest
         """
-        return self.tpcs.appendOn(key=topic, val=val)
+        with self.transaction():
+            on = self._index(topic=topic, dig=val)
+        self.announcer.announce(topic)
+        return on
 
 
     def getTopicMsgs(self, topic, fn=0):
@@ -127,8 +253,11 @@ class Mailboxer(dbing.LMDBer):
             msg = msg.encode("utf-8")
 
         digb = coring.Diger(ser=msg, code=MtrDex.Blake3_256).qb64b
-        on = self.tpcs.appendOn(keys=topic, val=digb)
-        return self.msgs.pin(keys=digb, val=msg)
+        with self.transaction():
+            self._index(topic=topic, dig=digb)
+            result = self.msgs.pin(keys=digb, val=msg)
+        self.announcer.announce(topic)
+        return result
 
 
     def cloneTopicIter(self, topic, fn=0):
@@ -154,6 +283,207 @@ class Mailboxer(dbing.LMDBer):
             if msg := self.msgs.get(keys=dig):
                 yield (on, topic, msg.encode("utf-8"))
 
+    def retainage(self, topic):
+        """
+        Returns:
+            retainage (Retainage | None): retention policy of topic from
+                .retention by topic suffix else default .retain
+
+        Parameters:
+            topic (str | bytes): full topic such as pre/receipt
+        """
+        if hasattr(topic, "decode"):
+            topic = topic.decode("utf-8")
+        if (i := topic.find("/")) >= 0 and (policy := self.retention.get(topic[i:])):
+            return policy
+        return self.retain
+
+    def prune(self, now=None):
+        """
+        Removes topic entries beyond the retention policy of their topic. The
+        oldest entries beyond the policy count are removed as are all entries
+        older than the policy age. Entries stored before storage datetimes were
+        kept are stamped with now so they age out one policy age from now.
+
+        Returns:
+            pruned (int): number of topic entries removed
+
+        Parameters:
+            now (datetime | None): current UTC datetime. None means now
+        """
+        now = now if now is not None else helping.nowUTC()
+        topics = {}  # ons of each topic in order, collected so not mutated while iterated
+        for keys, on, dig in self.tpcs.getOnItemIter(keys=b''):
+            topics.setdefault(keys, []).append(on)
+
+        pruned = 0
+        with self.transaction():
+            for keys, ons in topics.items():
+                if (policy := self.retainage(self.tpcs.sep.join(keys))) is None:
+                    continue
+
+                drops = []
+                if policy.count is not None and len(ons) > policy.count:
+                    drops = ons[:len(ons) - policy.count]
+                    ons = ons[len(ons) - policy.count:]
+
+                if policy.age is not None:
+                    for on in ons:
+                        if (dater := self.tdts.getOn(keys=keys, on=on)) is None:
+                            self.tdts.pinOn(keys=keys, on=on,
+                                            val=coring.Dater(dts=helping.toIso8601(now)))
+                            continue
+                        if (now - dater.datetime).total_seconds() <= policy.age:
+                            break  # ons in storage order so rest are younger
+                        drops.append(on)
+
+                for on in drops:
+                    pruned += 1 if self.delTopic(key=keys, on=on) else 0
+
+        return pruned
+
+    def collect(self):
+        """
+        Rebuilds message reference counts in .rcts from the topic entries in
+        .tpcs and removes all message bodies in .msgs that no topic entry
+        refers to, such as those left behind by topic entries removed before
+        bodies were reference counted.
+
+        Returns:
+            collected (int): number of message bodies removed
+        """
+        refs = {}
+        for keys, on, dig in self.tpcs.getOnItemIter(keys=b''):
+            refs[dig] = refs.get(dig, 0) + 1
+
+        collected = 0
+        with self.transaction():
+            for (dig,), _ in list(self.rcts.getItemIter()):
+                if dig not in refs:
+                    self.rcts.rem(keys=dig)
+            for dig, count in refs.items():
+                self.rcts.pin(keys=dig, val=core.Number(num=count))
+            for (dig,), _ in list(self.msgs.getItemIter()):
+                if dig not in refs:
+                    collected += 1 if self.msgs.rem(keys=dig) else 0
+
+        return collected
+
+    def compact(self):
+        """
+        Copies the live pages of .env into a fresh LMDB environment, leaving
+        out free pages, and swaps it in place of the current one so that the
+        disk space of removed entries is given back to the file system.
+
+        Offline only. Closing and replacing the environment invalidates the
+        transactions, cursors and memoryviews of any other user of this
+        Mailboxer so it must not run while the mailbox is being served. Use
+        kli mailbox compact with the witness stopped.
+
+        Returns:
+            reclaimed (int): bytes by which the database file shrank
+        """
+        if self.txn is not None:
+            raise ValueError("Can not compact inside a transaction.")
+
+        path = os.path.join(self.path, "data.mdb")
+        size = os.path.getsize(path)
+        with tempfile.TemporaryDirectory(dir=os.path.dirname(self.path)) as dirpath:
+            self.env.copy(dirpath, compact=True)
+            self.env.close()
+            self.env = None
+            os.replace(os.path.join(dirpath, "data.mdb"), path)
+            self.reopen(reuse=True)
+
+        return size - os.path.getsize(path)
+
+    def maintain(self, now=None, compact=False):
+        """
+        Runs one maintenance pass of .prune and .collect and when compact also
+        of .compact
+
+        Returns:
+            compactage (Compactage): report of pass
+
+        Parameters:
+            now (datetime | None): current UTC datetime. None means now
+            compact (bool): True means also compact which is offline only.
+                False means leave freed pages for reuse by later writes
+        """
+        start = time.perf_counter()
+        pruned = self.prune(now=now)
+        collected = self.collect()
+        reclaimed = self.compact() if compact else 0
+        compactage = Compactage(pruned=pruned,
+                                collected=collected,
+                                reclaimed=reclaimed,
+                                duration=time.perf_counter() - start)
+        logger.info("Mailboxer %s pruned %d topic entries, collected %d "
+                    "messages and reclaimed %d bytes in %.3f sec", self.name,
+                    *compactage)
+        return compactage
+
+    def _index(self, topic, dig):
+        """ Appends dig at topic with storage datetime and references dig """
+        on = self.tpcs.appendOn(keys=topic, val=dig)
+        self.tdts.pinOn(keys=topic, on=on, val=coring.Dater())
+        num = self.rcts.get(keys=dig)
+        self.rcts.pin(keys=dig, val=core.Number(num=num.num + 1 if num else 1))
+        return on
+
+    def _unref(self, dig):
+        """
+        Dereferences dig and removes its message once unreferenced. Digests
+        without a reference count are left to .collect since other topic
+        entries stored before counting may still refer to them.
+        """
+        if (num := self.rcts.get(keys=dig)) is None:
+            return
+        if num.num > 1:
+            self.rcts.pin(keys=dig, val=core.Number(num=num.num - 1))
+        else:
+            self.rcts.rem(keys=dig)
+            self.msgs.rem(keys=dig)
+
+
+class Retainer(doing.Doer):
+    """
+    Retainer runs Mailboxer.maintain retention and garbage collection passes,
+    without compaction, once every .period seconds while the mailbox is
+    served. Removed entries free pages that later writes reuse. The first
+    pass runs one period after entry so startup is not delayed.
+
+    Attributes:
+        mbx (Mailboxer): mailbox database maintained
+        period (float): seconds between passes
+        last (float | None): tyme of last pass or of entry
+        compactage (Compactage | None): report of most recent pass
+    """
+
+    def __init__(self, mbx, period=3600.0, **kwa):
+        """
+        Parameters:
+            mbx (Mailboxer): mailbox database maintained
+            period (float): seconds between passes
+        """
+        super(Retainer, self).__init__(**kwa)
+        self.mbx = mbx
+        self.period = period
+        self.last = None
+        self.compactage = None
+
+    def enter(self, *, temp=None):
+        """ Starts period at entry """
+        self.last = None
+
+    def recur(self, tyme):
+        """ Runs pass when period has elapsed since last pass """
+        if self.last is None:
+            self.last = tyme
+        elif tyme - self.last >= self.period:
+            self.last = tyme
+            self.compactage = self.mbx.maintain()
+        return False
 
 
 class Respondant(doing.DoDoer):
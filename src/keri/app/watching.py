@@ -11,7 +11,8 @@ from dataclasses import dataclass
 from hio.base import doing
 from hio.help import decking
 
-from keri import help
+from keri import help, kering
+from keri.app import agenting
 
 logger = help.ogler.getLogger()
 
@@ -52,9 +53,15 @@ class Adjudicator:
     Consumers of the Adjudicator's cues are safe to retrieve new key state from one of the Watchers listed in the
     cue of `keyStateUpdated` is received.  All other kins require controller intervention and should be bubbled up.
 
+    Besides full adjudication of a single watched AID, the Adjudicator can run incrementally over all watched AIDs.
+    `queries` batches `ksn` queries per watcher for those AIDs whose local key state changed or whose last query
+    is older than `period`, so remote rotations and duplicity are picked up on schedule. `round` adjudicates only
+    those AIDs with a new key state notice said, reusing cached diffs for everything else. The `Surveyor` doer
+    sends the queries and runs the rounds.
+
     """
 
-    def __init__(self, hby, hab, msgs=None, cues=None):
+    def __init__(self, hby, hab, msgs=None, cues=None, period=60.0):
         """ Create instance of Adjudicator for adjudicating key state
 
         Parameters:
@@ -62,22 +69,147 @@ class Adjudicator:
             hab (Hab): identifier database environment
             msgs (Deck): incoming requests to adjudicate key state
             cues (Deck): outgoing responses to adjudication of key state
+            period (float): seconds after which a watched AID is queried again from a watcher
+                even when its local key state has not changed
 
         """
         self.hby = hby
         self.hab = hab
         self.msgs = msgs if msgs is not None else decking.Deck()
         self.cues = cues if cues is not None else decking.Deck()
+        self.period = period
+        self.watchers = None  # watched AID to set of enabled watcher AIDs, loaded lazily
+        self.queried = dict()  # (watched, watcher) to (local said, tyme) when last queried
+        self.pending = dict()  # (watched, watcher) queried to notice said, if any, when queried
+        self.diffs = dict()  # (watched, watcher) to (local said, notice said, DiffState) of last diff
+        self.dirty = set()  # watched AIDs whose local key state changed since last round
 
     def performAdjudications(self):
-        """ Process loop of existing messages requesting key state adjudication """
+        """ Process loop of existing messages requesting key state adjudication
+
+        Messages with an `oid` adjudicate that watched AID in full. Messages without
+        one perform an incremental round over only the watched AIDs whose key state changed.
+
+        """
         while self.msgs:
             msg = self.msgs.pull()
 
-            watched = msg["oid"]
+            watched = msg["oid"] if "oid" in msg else None
             toad = msg["toad"] if "toad" in msg else None
 
-            self.adjudicate(watched, toad)
+            if watched is None:
+                self.round(toad)
+            else:
+                self.adjudicate(watched, toad)
+
+    def load(self):
+        """ (Re)load the enabled watchers of each watched AID from observed records
+
+        Call again after adding or removing watchers to pick up the changes.
+
+        """
+        self.watchers = dict()
+        for (cid, aid, oid), observed in self.hab.db.obvs.getItemIter(keys=(self.hab.pre,)):
+            if observed.enabled:
+                self.watchers.setdefault(oid, set()).add(aid)
+
+    def queries(self, tyme=None):
+        """ Return batches of `ksn` queries per watcher for watched AIDs that are due
+
+        A watched AID is queried again from a watcher once the local key state of that AID moves on
+        from the state it had when last queried or, given `tyme`, once `.period` has elapsed since it
+        was last queried. Queried pairs are tracked as pending until a key state notice with a new
+        said arrives and is picked up by `.round`, so a repeated notice costs no diff.
+
+        Parameters:
+            tyme (float | None): current tyme. None means query only on local key state change
+
+        Returns:
+            dict: qb64 watcher AID to bytearray of concatenated signed query messages
+
+        """
+        if self.watchers is None:
+            self.load()
+
+        batches = dict()
+        for watched, watchers in self.watchers.items():
+            if (kever := self.hab.kevers.get(watched)) is None:
+                continue
+
+            said = kever.serder.said
+            for watcher in watchers:
+                keys = (watched, watcher)
+                if (last := self.queried.get(keys)) is not None:
+                    if last[0] != said:  # local state moved since last round so re-diff
+                        self.dirty.add(watched)
+                    elif tyme is None or (last[1] is not None and tyme - last[1] < self.period):
+                        continue
+
+                self.queried[keys] = (said, tyme)
+                saider = self.hab.db.knas.get(keys=keys)
+                self.pending[keys] = saider.qb64 if saider is not None else None
+                msg = self.hab.query(pre=watched, src=watcher, route="ksn")
+                batches.setdefault(watcher, bytearray()).extend(msg)
+
+        return batches
+
+    def round(self, toad=None):
+        """ Perform one incremental round of adjudication
+
+        Only pending (watched, watcher) pairs are checked for a new key state notice said and only the
+        watched AIDs with a new notice or new local key state are adjudicated.  Unchanged notices reuse
+        their cached diff so a round costs O(changed AIDs) instead of O(watched AIDs).
+
+        Parameters:
+            toad (int): threshold of acceptable duplicity amongst available watchers
+
+        Returns:
+            set: qb64 watched AIDs adjudicated in this round
+
+        """
+        if self.watchers is None:
+            self.load()
+
+        changed = self.dirty
+        self.dirty = set()
+        for keys, prior in list(self.pending.items()):
+            saider = self.hab.db.knas.get(keys=keys)
+            if saider is None or saider.qb64 == prior:  # no new notice yet
+                continue
+
+            del self.pending[keys]
+            if (cached := self.diffs.get(keys)) is None or cached[1] != saider.qb64:
+                changed.add(keys[0])
+
+        for watched in changed:
+            if watched not in self.hab.kevers:
+                continue
+
+            said = self.hab.kevers[watched].serder.said
+            watchers = self.watchers.get(watched, set())
+            mystate = None
+            states = []
+            for watcher in watchers:
+                keys = (watched, watcher)
+                saider = self.hab.db.knas.get(keys=keys)
+                if saider is None:
+                    continue
+
+                cached = self.diffs.get(keys)
+                if cached is not None and cached[0] == said and cached[1] == saider.qb64:
+                    states.append(cached[2])
+                    continue
+
+                if mystate is None:
+                    mystate = self.hab.kevers[watched].state()
+                ksn = self.hab.db.ksns.get(keys=(saider.qb64,))
+                diff = diffState(watcher, mystate, ksn)
+                self.diffs[keys] = (said, saider.qb64, diff)
+                states.append(diff)
+
+            self.judge(watched, watchers, states, min(int(toad), len(watchers)) if toad else None)
+
+        return changed
 
     def adjudicate(self, watched, toad=None):
         """ Perform key state adjudication against the `watched` AID and provided threshold
@@ -111,6 +243,20 @@ class Adjudicator:
             ksn = self.hab.db.ksns.get(keys=(saider.qb64,))
             states.append(diffState(watcher, mystate, ksn))
 
+        self.judge(watched, watchers, states, toad)
+
+    def judge(self, watched, watchers, states, toad):
+        """ Cue the outcome of adjudicating the `states` reported by `watchers` for the `watched` AID
+
+        Parameters:
+            watched (str): qb64 AID being adjudicated
+            watchers (set): qb64 AIDs of all enabled watchers of `watched`
+            states (list): DiffState of each watcher that reported key state
+            toad (int): threshold of acceptable duplicity amongst available watchers
+
+        """
+        toad = int(toad) if toad else len(watchers)
+
         dups = [state for state in states if state.state == States.duplicitous]
         ahds = [state for state in states if state.state == States.ahead]
         bhds = [state for state in states if state.state == States.behind]
@@ -182,6 +328,59 @@ class AdjudicationDoer(doing.Doer):
         self.adjudicator.performAdjudications()
 
 
+class Surveyor(doing.DoDoer):
+    """ DoDoer that keeps an Adjudicator's watched AIDs under watch
+
+    Each recur sends the `ksn` query batches that are due from `Adjudicator.queries` to their
+    watchers and requests an incremental round of adjudication of any new key state notices.
+    Key state notices arrive as replies through a mailbox director run alongside. Adjudication
+    outcomes are cued on the Adjudicator's cues.
+
+    """
+
+    def __init__(self, adjudicator, toad=None, **kwa):
+        """ Create instance of Surveyor
+
+        Parameters:
+            adjudicator (Adjudicator): adjudicator of watched key state
+            toad (int): threshold of acceptable duplicity amongst available watchers
+
+        """
+        self.adjudicator = adjudicator
+        self.toad = toad
+        self.messengers = []
+        doers = [AdjudicationDoer(adjudicator)]
+        super(Surveyor, self).__init__(doers=doers, **kwa)
+
+    def recur(self, tyme, deeds=None):
+        """ Send due queries, clean up finished messengers and request a round while any are pending
+
+        Parameters:
+            tyme (float): relative cycle time
+
+        """
+        hab = self.adjudicator.hab
+        for watcher, msgs in self.adjudicator.queries(tyme=tyme).items():
+            try:
+                witer = agenting.messenger(hab, watcher)
+            except kering.ConfigurationError as ex:
+                logger.error(f"unable to query watcher {watcher}: {ex}")
+                continue
+
+            witer.msgs.append(msgs)
+            self.messengers.append(witer)
+            self.extend([witer])
+
+        sent = [witer for witer in self.messengers if witer.sent]
+        if sent:
+            self.messengers = [witer for witer in self.messengers if not witer.sent]
+            self.remove(sent)
+
+        if self.adjudicator.pending or self.adjudicator.dirty:
+            self.adjudicator.msgs.append(dict(toad=self.toad))
+        return super(Surveyor, self).recur(tyme, deeds)
+
+
 def diffState(wit, preksn, witksn):
     """ Return a record of the differences between the states provided by `wit` and local state
 
@@ -10,10 +10,10 @@ keri.core Package
 # Matter class and its subclasses
 from .coring import (Matter, MtrDex, Number, NumDex, Dater, DecDex, Decimer,
                      Texter, Bexter, Pather, Verfer, Cigar, Diger, DigDex,
-                     Prefixer, PreDex, Seqner, Verser, Tholder,
+                     Prefixer, PreDex, Seqner, Verser, Tholder, Satisfier,
                      Labeler, LabelDex, Decimer, DecDex, Noncer, NonceDex)
 from .indexing import Indexer, Siger, IdrDex, IdxSigDex
-from .signing import (Tiers, Signer, Salter, Cipher, CiXDex,
+from .signing import (Tiers, Signer, Salter, Stretcher, Cipher, CiXDex,
                       Encrypter, Decrypter, Streamer)
 from .counting import Counter, Codens, GenDex, CtrDex_1_0, CtrDex_2_0, ProGen
 from .mapping import Mapper, EscapeDex, Compactor, Aggor
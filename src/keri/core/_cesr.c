@@ -0,0 +1,702 @@
+/*
+ * keri.core._cesr module
+ *
+ * Optional compiled codec for the text domain (qb64) parse and serialize of
+ * CESR primitives by Matter, Indexer and Counter. Each function takes the same
+ * code tables as the pure Python methods and returns the extracted parts or
+ * serialization for well formed input. For any input that is not well formed,
+ * including short input, unknown codes and nonzero pad bits, it returns None
+ * so the caller falls back to the pure Python method which raises the
+ * appropriate error. No function raises for bad input.
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <string.h>
+
+static const char B64Chrs[] =
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_";
+static signed char B64Idxs[256];  /* -1 when not a Base64 URL safe char */
+
+#define MaxIntChars 10  /* max Base64 chars converted to int, 60 bits */
+
+
+/* Views bytes like or str obj as bytes at *buf of size *size. Returns 1 when
+ * view must be released, 0 when not, and -1 with error cleared on failure. */
+static int
+view(PyObject *obj, Py_buffer *vb, const unsigned char **buf, Py_ssize_t *size)
+{
+    if (PyUnicode_Check(obj)) {
+        const char *s = PyUnicode_AsUTF8AndSize(obj, size);
+        if (s == NULL) {
+            PyErr_Clear();
+            return -1;
+        }
+        *buf = (const unsigned char *)s;
+        return 0;
+    }
+    if (PyObject_GetBuffer(obj, vb, PyBUF_SIMPLE) < 0) {
+        PyErr_Clear();
+        return -1;
+    }
+    *buf = (const unsigned char *)vb->buf;
+    *size = vb->len;
+    return 1;
+}
+
+
+/* Returns 1 when all n chars of s are ASCII else 0 */
+static int
+ascii(const unsigned char *s, Py_ssize_t n)
+{
+    for (Py_ssize_t i = 0; i < n; i++) {
+        if (s[i] & 0x80) {
+            return 0;
+        }
+    }
+    return 1;
+}
+
+
+/* Converts n Base64 chars of s to int at *i. Returns -1 when n is zero or
+ * too big or any char is not Base64 */
+static int
+b64ToInt(const unsigned char *s, Py_ssize_t n, unsigned long long *i)
+{
+    if (n <= 0 || n > MaxIntChars) {
+        return -1;
+    }
+    *i = 0;
+    for (Py_ssize_t k = 0; k < n; k++) {
+        signed char v = B64Idxs[s[k]];
+        if (v < 0) {
+            return -1;
+        }
+        *i = (*i << 6) | (unsigned long long)v;
+    }
+    return 0;
+}
+
+
+/* Writes l Base64 chars of int i to out, left padded with 'A'. Returns -1
+ * when i needs more than l chars */
+static int
+intToB64(unsigned long long i, Py_ssize_t l, char *out)
+{
+    for (Py_ssize_t k = l - 1; k >= 0; k--) {
+        out[k] = B64Chrs[i & 0x3f];
+        i >>= 6;
+    }
+    return i ? -1 : 0;
+}
+
+
+/* Decodes ps zero sextets followed by n Base64 chars of s into out which must
+ * hold (ps + n) * 3 / 4 bytes. Returns -1 when ps + n is not a multiple of 4
+ * or any char is not Base64 */
+static int
+decode(const unsigned char *s, Py_ssize_t n, Py_ssize_t ps, unsigned char *out)
+{
+    Py_ssize_t total = ps + n;
+    if (total % 4) {
+        return -1;
+    }
+    unsigned long acc = 0;
+    for (Py_ssize_t k = 0; k < total; k++) {
+        signed char v = 0;
+        if (k >= ps) {
+            v = B64Idxs[s[k - ps]];
+            if (v < 0) {
+                return -1;
+            }
+        }
+        acc = (acc << 6) | (unsigned long)v;
+        if (k % 4 == 3) {
+            *out++ = (unsigned char)(acc >> 16);
+            *out++ = (unsigned char)(acc >> 8);
+            *out++ = (unsigned char)acc;
+            acc = 0;
+        }
+    }
+    return 0;
+}
+
+
+/* Encodes n bytes of b, n a multiple of 3, to n * 4 / 3 Base64 chars at out */
+static void
+encode(const unsigned char *b, Py_ssize_t n, char *out)
+{
+    for (Py_ssize_t k = 0; k < n; k += 3) {
+        unsigned long acc = ((unsigned long)b[k] << 16) |
+                            ((unsigned long)b[k + 1] << 8) | b[k + 2];
+        *out++ = B64Chrs[(acc >> 18) & 0x3f];
+        *out++ = B64Chrs[(acc >> 12) & 0x3f];
+        *out++ = B64Chrs[(acc >> 6) & 0x3f];
+        *out++ = B64Chrs[acc & 0x3f];
+    }
+}
+
+
+/* Returns hard size from hards for selector of first sn chars of s or -1 */
+static Py_ssize_t
+hardSize(PyObject *hards, const unsigned char *s, Py_ssize_t n, Py_ssize_t sn)
+{
+    if (n < sn || !ascii(s, sn)) {
+        return -1;
+    }
+    PyObject *key = PyUnicode_FromStringAndSize((const char *)s, sn);
+    if (key == NULL) {
+        PyErr_Clear();
+        return -1;
+    }
+    PyObject *hs = PyDict_GetItemWithError(hards, key);  /* borrowed */
+    Py_DECREF(key);
+    if (hs == NULL) {
+        PyErr_Clear();
+        return -1;
+    }
+    Py_ssize_t size = PyLong_AsSsize_t(hs);
+    if (size < 0) {
+        PyErr_Clear();
+        return -1;
+    }
+    return size;
+}
+
+
+/* Returns new reference to str of hard code of hs chars of s and sets *szs to
+ * borrowed size tuple of n items from sizes or returns NULL */
+static PyObject *
+hardSizes(PyObject *sizes, const unsigned char *s, Py_ssize_t n, Py_ssize_t hs,
+          Py_ssize_t count, PyObject **szs)
+{
+    if (hs <= 0 || n < hs || !ascii(s, hs)) {
+        return NULL;
+    }
+    PyObject *hard = PyUnicode_FromStringAndSize((const char *)s, hs);
+    if (hard == NULL) {
+        PyErr_Clear();
+        return NULL;
+    }
+    *szs = PyDict_GetItemWithError(sizes, hard);  /* borrowed */
+    if (*szs == NULL || !PyTuple_Check(*szs) || PyTuple_GET_SIZE(*szs) != count) {
+        PyErr_Clear();
+        Py_DECREF(hard);
+        return NULL;
+    }
+    return hard;
+}
+
+
+/* Sets *out to size item i of szs where None is 0. Returns -1 on failure */
+static int
+sizeAt(PyObject *szs, Py_ssize_t i, Py_ssize_t *out)
+{
+    PyObject *item = PyTuple_GET_ITEM(szs, i);
+    if (item == Py_None) {
+        *out = 0;
+        return 0;
+    }
+    *out = PyLong_AsSsize_t(item);
+    if (*out < 0) {
+        PyErr_Clear();
+        return -1;
+    }
+    return 0;
+}
+
+
+PyDoc_STRVAR(matterExfil_doc,
+"matterExfil(qb64b, hards, sizes)\n--\n\n"
+"Returns (hard, soft, raw) extracted from front of qb64b given Matter .Hards\n"
+"and .Sizes tables or None when qb64b is not well formed.");
+
+static PyObject *
+matterExfil(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    if (nargs != 3 || !PyDict_Check(args[1]) || !PyDict_Check(args[2])) {
+        PyErr_SetString(PyExc_TypeError, "matterExfil(qb64b, hards, sizes)");
+        return NULL;
+    }
+    Py_buffer vb;
+    const unsigned char *s;
+    Py_ssize_t n;
+    int release = view(args[0], &vb, &s, &n);
+    if (release < 0) {
+        Py_RETURN_NONE;
+    }
+
+    PyObject *result = NULL, *hard = NULL, *szs = NULL;
+    unsigned char *paw = NULL;
+    Py_ssize_t hs, ss, xs, fs, ls;
+
+    if ((hs = hardSize(args[1], s, n, 1)) < 0 ||
+        (hard = hardSizes(args[2], s, n, hs, 5, &szs)) == NULL ||
+        sizeAt(szs, 0, &hs) || sizeAt(szs, 1, &ss) || sizeAt(szs, 2, &xs) ||
+        sizeAt(szs, 3, &fs) || sizeAt(szs, 4, &ls)) {
+        goto none;
+    }
+    Py_ssize_t cs = hs + ss;
+    if (n < cs || xs > ss || !ascii(s + hs, ss)) {
+        goto none;
+    }
+    for (Py_ssize_t k = hs; k < hs + xs; k++) {  /* prepad xtra */
+        if (s[k] != '_') {
+            goto none;
+        }
+    }
+    if (!fs) {  /* variable size from soft */
+        unsigned long long size;
+        if (b64ToInt(s + hs + xs, ss - xs, &size) || size > (unsigned long long)((PY_SSIZE_T_MAX - cs) / 4)) {
+            goto none;
+        }
+        fs = (Py_ssize_t)size * 4 + cs;
+    }
+    if (n < fs || fs < cs) {
+        goto none;
+    }
+
+    Py_ssize_t ps = cs % 4;
+    Py_ssize_t total = (ps + fs - cs) * 3 / 4;
+    if ((paw = PyMem_Malloc(total ? total : 1)) == NULL) {
+        PyErr_Clear();
+        goto none;
+    }
+    if (decode(s + cs, fs - cs, ps, paw) || ps + ls > total) {
+        goto none;
+    }
+    for (Py_ssize_t k = 0; k < ps + ls; k++) {  /* midpad bytes must be zero */
+        if (paw[k]) {
+            goto none;
+        }
+    }
+    if (total - ps - ls != ((fs - cs) * 3 / 4) - ls) {
+        goto none;
+    }
+    result = Py_BuildValue("(Os#y#)", hard, (const char *)(s + hs + xs), ss - xs,
+                           (const char *)(paw + ps + ls), total - ps - ls);
+    goto done;
+
+none:
+    result = Py_NewRef(Py_None);
+done:
+    PyMem_Free(paw);
+    Py_XDECREF(hard);
+    if (release) {
+        PyBuffer_Release(&vb);
+    }
+    return result;
+}
+
+
+PyDoc_STRVAR(matterInfil_doc,
+"matterInfil(both, raw, sizes)\n--\n\n"
+"Returns qb64b bytes of full code both and raw given Matter size tuple sizes\n"
+"(hs, ss, xs, fs, ls) or None when sizes do not fit.");
+
+static PyObject *
+matterInfil(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    if (nargs != 3 || !PyUnicode_Check(args[0]) || !PyTuple_Check(args[2]) ||
+        PyTuple_GET_SIZE(args[2]) != 5) {
+        PyErr_SetString(PyExc_TypeError, "matterInfil(both, raw, sizes)");
+        return NULL;
+    }
+    Py_ssize_t hs, ss, xs, fs, ls;
+    if (sizeAt(args[2], 0, &hs) || sizeAt(args[2], 1, &ss) || sizeAt(args[2], 2, &xs) ||
+        sizeAt(args[2], 3, &fs) || sizeAt(args[2], 4, &ls)) {
+        Py_RETURN_NONE;
+    }
+    Py_ssize_t bn;
+    const char *both = PyUnicode_AsUTF8AndSize(args[0], &bn);
+    if (both == NULL) {
+        PyErr_Clear();
+        Py_RETURN_NONE;
+    }
+    Py_buffer vb;
+    const unsigned char *raw;
+    Py_ssize_t rs;
+    int release = view(args[1], &vb, &raw, &rs);
+    if (release < 0) {
+        Py_RETURN_NONE;
+    }
+
+    PyObject *result = NULL;
+    unsigned char *pad = NULL;
+    Py_ssize_t cs = hs + ss, ps;
+    if (!fs) {  /* variable size */
+        if ((ls + rs) % 3 || cs % 4) {
+            goto none;
+        }
+        ps = 0;
+    }
+    else {  /* fixed size */
+        ps = (3 - ((rs + ls) % 3)) % 3;
+        if (ps != cs % 4) {
+            goto none;
+        }
+    }
+    if (bn < ps) {
+        goto none;
+    }
+    Py_ssize_t pn = ps + ls + rs;  /* prepad + lead + raw bytes */
+    Py_ssize_t full = bn + pn * 4 / 3 - ps;
+    if (full % 4 || (fs && full != fs)) {
+        goto none;
+    }
+    if ((pad = PyMem_Calloc(pn ? pn : 1, 1)) == NULL) {
+        PyErr_Clear();
+        goto none;
+    }
+    memcpy(pad + ps + ls, raw, rs);
+    if ((result = PyBytes_FromStringAndSize(NULL, bn + pn * 4 / 3)) == NULL) {
+        goto done;
+    }
+    char *out = PyBytes_AS_STRING(result);
+    encode(pad, pn, out + bn - ps);  /* converted prepad chars are overwritten */
+    memcpy(out, both, bn);
+    if (ps) {
+        _PyBytes_Resize(&result, full);
+    }
+    goto done;
+
+none:
+    result = Py_NewRef(Py_None);
+done:
+    PyMem_Free(pad);
+    if (release) {
+        PyBuffer_Release(&vb);
+    }
+    return result;
+}
+
+
+PyDoc_STRVAR(indexerExfil_doc,
+"indexerExfil(qb64b, hards, sizes, currents)\n--\n\n"
+"Returns (hard, index, ondex, raw) extracted from front of qb64b given\n"
+"Indexer .Hards and .Sizes tables and set of current only sig codes\n"
+"currents or None when qb64b is not well formed.");
+
+static PyObject *
+indexerExfil(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    if (nargs != 4 || !PyDict_Check(args[1]) || !PyDict_Check(args[2]) ||
+        !PyAnySet_Check(args[3])) {
+        PyErr_SetString(PyExc_TypeError, "indexerExfil(qb64b, hards, sizes, currents)");
+        return NULL;
+    }
+    Py_buffer vb;
+    const unsigned char *s;
+    Py_ssize_t n;
+    int release = view(args[0], &vb, &s, &n);
+    if (release < 0) {
+        Py_RETURN_NONE;
+    }
+
+    PyObject *result = NULL, *hard = NULL, *szs = NULL;
+    unsigned char *paw = NULL;
+    Py_ssize_t hs, ss, os, fs, ls;
+    unsigned long long index, ondex = 0;
+    int current, hasondex = 1;
+
+    if ((hs = hardSize(args[1], s, n, 1)) < 0 ||
+        (hard = hardSizes(args[2], s, n, hs, 5, &szs)) == NULL ||
+        sizeAt(szs, 0, &hs) || sizeAt(szs, 1, &ss) || sizeAt(szs, 2, &os) ||
+        sizeAt(szs, 3, &fs) || sizeAt(szs, 4, &ls)) {
+        goto none;
+    }
+    Py_ssize_t cs = hs + ss, ms = ss - os;
+    if (n < cs || ms < 0 || b64ToInt(s + hs, ms, &index)) {
+        goto none;
+    }
+    if ((current = PySet_Contains(args[3], hard)) < 0) {
+        PyErr_Clear();
+        goto none;
+    }
+    if (os && b64ToInt(s + hs + ms, os, &ondex)) {
+        goto none;
+    }
+    if (current) {  /* current only sig so ondex from code must be zero */
+        if (ondex) {
+            goto none;
+        }
+        hasondex = 0;
+    }
+    else if (!os) {
+        ondex = index;
+    }
+    if (!fs) {  /* variable size from index */
+        if (cs % 4 || os != 0 || index > (unsigned long long)((PY_SSIZE_T_MAX - cs) / 4)) {
+            goto none;
+        }
+        fs = (Py_ssize_t)index * 4 + cs;
+    }
+    if (n < fs || fs < cs) {
+        goto none;
+    }
+
+    Py_ssize_t ps = cs % 4;
+    Py_ssize_t total = (ps + fs - cs) * 3 / 4;
+    if ((paw = PyMem_Malloc(total ? total : 1)) == NULL) {
+        PyErr_Clear();
+        goto none;
+    }
+    if (decode(s + cs, fs - cs, ps, paw)) {
+        goto none;
+    }
+    Py_ssize_t skip;
+    if (ps) {  /* code pad bits must be zero */
+        unsigned long pi = 0;
+        for (Py_ssize_t k = 0; k < ps; k++) {
+            pi = (pi << 8) | paw[k];
+        }
+        if (pi & ((1UL << (2 * ps)) - 1)) {
+            goto none;
+        }
+        skip = ps;
+    }
+    else {  /* lead bytes must be zero */
+        if (ls > total) {
+            goto none;
+        }
+        for (Py_ssize_t k = 0; k < ls; k++) {
+            if (paw[k]) {
+                goto none;
+            }
+        }
+        skip = ls;
+    }
+    if (total - skip != (fs - cs) * 3 / 4) {
+        goto none;
+    }
+    if (hasondex) {
+        result = Py_BuildValue("(OKKy#)", hard, index, ondex,
+                               (const char *)(paw + skip), total - skip);
+    }
+    else {
+        result = Py_BuildValue("(OKOy#)", hard, index, Py_None,
+                               (const char *)(paw + skip), total - skip);
+    }
+    goto done;
+
+none:
+    result = Py_NewRef(Py_None);
+done:
+    PyMem_Free(paw);
+    Py_XDECREF(hard);
+    if (release) {
+        PyBuffer_Release(&vb);
+    }
+    return result;
+}
+
+
+PyDoc_STRVAR(indexerInfil_doc,
+"indexerInfil(code, index, ondex, raw, sizes)\n--\n\n"
+"Returns qb64b bytes of hard code, index, ondex and raw given Indexer size\n"
+"tuple sizes (hs, ss, os, fs, ls) or None when they do not fit.");
+
+static PyObject *
+indexerInfil(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    if (nargs != 5 || !PyUnicode_Check(args[0]) || !PyTuple_Check(args[4]) ||
+        PyTuple_GET_SIZE(args[4]) != 5) {
+        PyErr_SetString(PyExc_TypeError, "indexerInfil(code, index, ondex, raw, sizes)");
+        return NULL;
+    }
+    Py_ssize_t hs, ss, os, fs, ls;
+    if (sizeAt(args[4], 0, &hs) || sizeAt(args[4], 1, &ss) || sizeAt(args[4], 2, &os) ||
+        sizeAt(args[4], 3, &fs) || sizeAt(args[4], 4, &ls)) {
+        Py_RETURN_NONE;
+    }
+    if (!PyLong_CheckExact(args[1]) ||
+        (args[2] != Py_None && !PyLong_CheckExact(args[2]))) {
+        Py_RETURN_NONE;
+    }
+    int overflow;
+    long long index = PyLong_AsLongLongAndOverflow(args[1], &overflow);
+    if (overflow || index < 0) {
+        Py_RETURN_NONE;
+    }
+    long long ondex = 0;
+    if (args[2] != Py_None) {
+        ondex = PyLong_AsLongLongAndOverflow(args[2], &overflow);
+        if (overflow || ondex < 0) {
+            Py_RETURN_NONE;
+        }
+    }
+    Py_ssize_t bn;
+    const char *code = PyUnicode_AsUTF8AndSize(args[0], &bn);
+    if (code == NULL) {
+        PyErr_Clear();
+        Py_RETURN_NONE;
+    }
+    Py_ssize_t cs = hs + ss, ms = ss - os;
+    if (ms < 0 || ms > MaxIntChars || os > MaxIntChars || bn + ms + os != cs) {
+        Py_RETURN_NONE;
+    }
+    if (!fs) {  /* variable size from index */
+        if (cs % 4 || os != 0 || index > (PY_SSIZE_T_MAX - cs) / 4) {
+            Py_RETURN_NONE;
+        }
+        fs = (Py_ssize_t)index * 4 + cs;
+    }
+
+    Py_buffer vb;
+    const unsigned char *raw;
+    Py_ssize_t rs;
+    int release = view(args[3], &vb, &raw, &rs);
+    if (release < 0) {
+        Py_RETURN_NONE;
+    }
+    PyObject *result = NULL;
+    unsigned char *pad = NULL;
+    Py_ssize_t ps = (3 - (rs % 3)) % 3;
+    Py_ssize_t pn = ps + rs;
+    Py_ssize_t full = cs + pn * 4 / 3 - (ps - ls);
+    if (cs % 4 != ps - ls || ps < ls || full != fs) {
+        goto none;
+    }
+    if ((pad = PyMem_Calloc(pn ? pn : 1, 1)) == NULL) {
+        PyErr_Clear();
+        goto none;
+    }
+    memcpy(pad + ps, raw, rs);
+    if ((result = PyBytes_FromStringAndSize(NULL, cs + pn * 4 / 3)) == NULL) {
+        goto done;
+    }
+    char *out = PyBytes_AS_STRING(result);
+    encode(pad, pn, out + cs - (ps - ls));  /* converted prepad chars are overwritten */
+    memcpy(out, code, bn);
+    if (intToB64((unsigned long long)index, ms, out + bn) ||
+        (os && intToB64((unsigned long long)ondex, os, out + bn + ms))) {
+        Py_DECREF(result);
+        goto none;
+    }
+    if (ps - ls) {
+        _PyBytes_Resize(&result, full);
+    }
+    goto done;
+
+none:
+    result = Py_NewRef(Py_None);
+done:
+    PyMem_Free(pad);
+    if (release) {
+        PyBuffer_Release(&vb);
+    }
+    return result;
+}
+
+
+PyDoc_STRVAR(counterExfil_doc,
+"counterExfil(qb64b, hards, sizes)\n--\n\n"
+"Returns (hard, count) extracted from front of qb64b given Counter .Hards\n"
+"and version ._sizes tables or None when qb64b is not well formed.");
+
+static PyObject *
+counterExfil(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    if (nargs != 3 || !PyDict_Check(args[1]) || !PyDict_Check(args[2])) {
+        PyErr_SetString(PyExc_TypeError, "counterExfil(qb64b, hards, sizes)");
+        return NULL;
+    }
+    Py_buffer vb;
+    const unsigned char *s;
+    Py_ssize_t n;
+    int release = view(args[0], &vb, &s, &n);
+    if (release < 0) {
+        Py_RETURN_NONE;
+    }
+
+    PyObject *result = NULL, *hard = NULL, *szs = NULL;
+    Py_ssize_t hs, ss, fs;
+    unsigned long long count;
+    if ((hs = hardSize(args[1], s, n, 2)) < 0 ||
+        (hard = hardSizes(args[2], s, n, hs, 3, &szs)) == NULL ||
+        sizeAt(szs, 0, &hs) || sizeAt(szs, 1, &ss) || sizeAt(szs, 2, &fs) ||
+        n < fs || b64ToInt(s + hs, fs - hs, &count)) {
+        result = Py_NewRef(Py_None);
+    }
+    else {
+        result = Py_BuildValue("(OK)", hard, count);
+    }
+    Py_XDECREF(hard);
+    if (release) {
+        PyBuffer_Release(&vb);
+    }
+    return result;
+}
+
+
+PyDoc_STRVAR(counterInfil_doc,
+"counterInfil(code, count, sizes)\n--\n\n"
+"Returns qb64b bytes of hard code and count given Counter size tuple sizes\n"
+"(hs, ss, fs) or None when they do not fit.");
+
+static PyObject *
+counterInfil(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    if (nargs != 3 || !PyUnicode_Check(args[0]) || !PyTuple_Check(args[2]) ||
+        PyTuple_GET_SIZE(args[2]) != 3) {
+        PyErr_SetString(PyExc_TypeError, "counterInfil(code, count, sizes)");
+        return NULL;
+    }
+    Py_ssize_t hs, ss, fs;
+    if (sizeAt(args[2], 0, &hs) || sizeAt(args[2], 1, &ss) || sizeAt(args[2], 2, &fs) ||
+        ss > MaxIntChars || !PyLong_CheckExact(args[1])) {
+        Py_RETURN_NONE;
+    }
+    int overflow;
+    long long count = PyLong_AsLongLongAndOverflow(args[1], &overflow);
+    Py_ssize_t bn;
+    const char *code = PyUnicode_AsUTF8AndSize(args[0], &bn);
+    if (code == NULL) {
+        PyErr_Clear();
+        Py_RETURN_NONE;
+    }
+    if (overflow || count < 0 || (bn + ss) % 4) {
+        Py_RETURN_NONE;
+    }
+    PyObject *result = PyBytes_FromStringAndSize(NULL, bn + ss);
+    if (result == NULL) {
+        return NULL;
+    }
+    char *out = PyBytes_AS_STRING(result);
+    memcpy(out, code, bn);
+    if (intToB64((unsigned long long)count, ss, out + bn)) {
+        Py_DECREF(result);
+        Py_RETURN_NONE;
+    }
+    return result;
+}
+
+
+static PyMethodDef CesrMethods[] = {
+    {"matterExfil", (PyCFunction)(void (*)(void))matterExfil, METH_FASTCALL, matterExfil_doc},
+    {"matterInfil", (PyCFunction)(void (*)(void))matterInfil, METH_FASTCALL, matterInfil_doc},
+    {"indexerExfil", (PyCFunction)(void (*)(void))indexerExfil, METH_FASTCALL, indexerExfil_doc},
+    {"indexerInfil", (PyCFunction)(void (*)(void))indexerInfil, METH_FASTCALL, indexerInfil_doc},
+    {"counterExfil", (PyCFunction)(void (*)(void))counterExfil, METH_FASTCALL, counterExfil_doc},
+    {"counterInfil", (PyCFunction)(void (*)(void))counterInfil, METH_FASTCALL, counterInfil_doc},
+    {NULL, NULL, 0, NULL}
+};
+
+
+static struct PyModuleDef CesrModule = {
+    PyModuleDef_HEAD_INIT,
+    "keri.core._cesr",
+    "Optional compiled codec for text domain CESR primitives",
+    -1,
+    CesrMethods
+};
+
+
+PyMODINIT_FUNC
+PyInit__cesr(void)
+{
+    memset(B64Idxs, -1, sizeof(B64Idxs));
+    for (int k = 0; k < 64; k++) {
+        B64Idxs[(unsigned char)B64Chrs[k]] = (signed char)k;
+    }
+    return PyModule_Create(&CesrModule);
+}
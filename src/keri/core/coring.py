@@ -5,6 +5,7 @@ keri.core.coring module
 """
 import re
 import json
+import math
 from typing import Union
 from collections import namedtuple, deque
 from collections.abc import Sequence, Mapping
@@ -49,6 +50,11 @@ from ..help.helping import (intToB64, intToB64b, b64ToInt, B64_CHARS,
                             codeB64ToB2, codeB2ToB64, Reb64, nabSextets, Reatt,
                             Repath)
 
+try:  # optional compiled codec, see _cesr.c, else pure python
+    from . import _cesr
+except ImportError:
+    _cesr = None
+
 
 
 
@@ -1336,6 +1342,11 @@ class Matter:
         code = self.code  # hard part of full code == codex value
         both = self.both  # code + soft, soft may be empty
         raw = self.raw  # bytes or bytearray, raw may be empty
+        if _cesr is not None:  # None when not well formed so raise below
+            full = _cesr.matterInfil(both, raw, self.Sizes[code])
+            if full is not None:
+                return full
+
         rs = len(raw)  # raw size
         hs, ss, xs, fs, ls = self.Sizes[code]
         cs = hs + ss
@@ -1431,6 +1442,12 @@ class Matter:
         if not qb64b:  # empty need more bytes
             raise ShortageError("Empty material.")
 
+        if _cesr is not None:  # None when not well formed so raise below
+            parts = _cesr.matterExfil(qb64b, self.Hards, self.Sizes)
+            if parts is not None:
+                self._code, self._soft, self._raw = parts
+                return
+
         first = qb64b[:1]  # extract first char code selector
         if isinstance(first, memoryview):
             first = bytes(first)
@@ -1551,7 +1568,8 @@ class Matter:
         if len(qb2) < bcs:  # need more bytes
             raise ShortageError("Need {} more bytes.".format(bcs - len(qb2)))
 
-        both = codeB2ToB64(qb2, cs)  # extract and convert both hard and soft part of code
+        # extract and convert both hard and soft part of code, only hard when no soft
+        both = codeB2ToB64(qb2, cs) if ss else hard
 
         # extract soft chars including xtra, empty when ss==0 and xs == 0
         # assumes that when ss == 0 then xs must be 0
@@ -4436,6 +4454,12 @@ class Tholder:
         ._satisfy is method reference of threshold specified verification method
         ._satisfy_numeric is numeric threshold verification method
         ._satisfy_weighted is fractional weighted threshold verification method
+        ._scale is int common denominator of all weights when weighted
+        ._leaves is list of (clause, group, numerator) one per key index when
+            weighted. group is index into ._groups or -1 when not nested and
+            numerator is int weight of key scaled by ._scale
+        ._groups is list of (clause, numerator) one per nested weighted set when
+            weighted. numerator is int weight of set scaled by ._scale
 
 
     """
@@ -4754,6 +4778,7 @@ class Tholder:
                 else:
                     s += 1
         self._size = s
+        self._compile(thold)
 
         self._satisfy = self._satisfy_weighted
         # make bext str of thold for .bexter for limen
@@ -4777,6 +4802,40 @@ class Tholder:
         self._bexter = Bexter(bext=bext)
 
 
+    def _compile(self, thold):
+        """
+        Compiles weighted thold into integer numerators over a common
+        denominator, ._scale, indexed by key index so that satisfaction is
+        evaluated with int sums instead of walking Fraction clauses.
+
+        Parameters:
+            thold (list): of clauses of weights or (weight, [weights]) tuples
+        """
+        weights = []
+        for clause in thold:
+            for e in clause:
+                if isinstance(e, tuple):
+                    weights.append(e[0])
+                    weights.extend(e[1])
+                else:
+                    weights.append(e)
+        scale = math.lcm(*[w.denominator for w in weights]) if weights else 1
+
+        leaves = []
+        groups = []
+        for c, clause in enumerate(thold):
+            for e in clause:
+                if isinstance(e, tuple):
+                    groups.append((c, int(e[0] * scale)))
+                    leaves.extend((c, len(groups) - 1, int(w * scale)) for w in e[1])
+                else:
+                    leaves.append((c, -1, int(e * scale)))
+
+        self._scale = scale
+        self._leaves = leaves
+        self._groups = groups
+
+
     @staticmethod
     def weight(w: str) -> Fraction:
         """Returns valid weight from w else raises error (ValueError or TypeError).
@@ -4816,6 +4875,14 @@ class Tholder:
         return (self._satisfy(indices=indices))
 
 
+    def satisfier(self):
+        """
+        Returns Satisfier that incrementally evaluates satisfaction of this
+        threshold as indices of verified signatures arrive.
+        """
+        return Satisfier(tholder=self)
+
+
     def _satisfy_numeric(self, indices):
         """
         Returns True if satisfies numeric threshold False otherwise
@@ -4848,33 +4915,25 @@ class Tholder:
             if not indices:  # empty indices
                 return False
 
-            # remove duplicates with set, sort low to high
-            indices = sorted(set(indices))
-            sats = [False] * self.size  # default all satifactions to False
+            keys = range(self.size)
+            # remove duplicates with set, keys[idx] raises IndexError when out of range
+            indices = set(keys[idx] for idx in indices)
+
+            cws = [0] * len(self.thold)  # scaled weight of each clause
+            gws = [0] * len(self._groups)  # scaled weight of each nested set
             for idx in indices:
-                sats[idx] = True  # set verified signature index to True
+                c, g, n = self._leaves[idx]
+                if g < 0:
+                    cws[c] += n
+                else:
+                    gws[g] += n
 
-            wio = 0  # weight index offset
-            for clause in self.thold:
-                cw = 0  # init clause weight
-                for e in clause:
-                    if isinstance(e, tuple):
-                        vw = 0  # init element value weight
-                        for w in e[1]:   # sum weights of value
-                            if sats[wio]:
-                                vw += w
-                            wio += 1
-                        if vw >= 1:  # element true
-                            cw += e[0]  # add element key weight to clause weight
-                    else:
-                        w = e
-                        if sats[wio]:  # verified signature so weight applies
-                            cw += w
-                        wio += 1
-                if cw < 1:  # each clause must sum to at least 1
-                    return False
+            for g, (c, n) in enumerate(self._groups):
+                if gws[g] >= self._scale:  # nested set satisfied so its weight applies
+                    cws[c] += n
 
-            return True  # all clauses have cw >= 1 including final one, AND true
+            # each clause must sum to at least 1, AND of all clauses
+            return all(cw >= self._scale for cw in cws)
 
         except Exception as ex:
             return False
@@ -4882,6 +4941,95 @@ class Tholder:
         return False
 
 
+class Satisfier:
+    """
+    Satisfier incrementally evaluates satisfaction of a Tholder threshold as
+    indices of verified signatures arrive. Each added index updates running
+    scaled clause sums so checking satisfaction after new signatures costs
+    O(new indices) instead of re-evaluating the whole threshold.
+
+    Attributes:
+        tholder (Tholder): threshold being satisfied
+        indices (set): distinct key indices added so far
+        satisfied (bool): True when indices added so far satisfy threshold
+
+    Hidden:
+        ._cws is list of scaled weight of each clause when weighted
+        ._gws is list of scaled weight of each nested weighted set when weighted
+        ._met is int number of clauses with weight at least 1 when weighted
+        ._invalid is bool True when an invalid index was added which like
+            Tholder.satisfy makes threshold unsatisfiable
+    """
+
+    def __init__(self, tholder):
+        """
+        Initialize instance
+
+        Parameters:
+            tholder (Tholder): threshold to satisfy
+        """
+        self.tholder = tholder
+        self.indices = set()
+        self._cws = [0] * len(tholder.thold) if tholder.weighted else []
+        self._gws = [0] * len(tholder._groups) if tholder.weighted else []
+        self._met = 0
+        self._invalid = False
+
+    @property
+    def satisfied(self):
+        """ satisfied property getter """
+        if self._invalid or not self.indices:
+            return False
+        if self.tholder.weighted:
+            return self._met == len(self._cws)
+        return self.tholder.thold > 0 and len(self.indices) >= self.tholder.thold
+
+    def add(self, indices):
+        """
+        Returns True if threshold is satisfied after adding indices of verified
+        signatures, False otherwise.
+
+        Parameters:
+            indices is iterable of indices (offsets into key list) of verified
+                signatures. Indices already added are ignored.
+        """
+        for idx in indices:
+            if self.tholder.weighted:
+                try:
+                    idx = range(self.tholder.size)[idx]
+                except (IndexError, TypeError):
+                    self._invalid = True
+                    continue
+            elif not isinstance(idx, int):
+                self._invalid = True
+                continue
+
+            if idx in self.indices:
+                continue
+            self.indices.add(idx)
+
+            if self.tholder.weighted:
+                c, g, n = self.tholder._leaves[idx]
+                if g >= 0:
+                    scale = self.tholder._scale
+                    gw = self._gws[g]
+                    self._gws[g] = gw + n
+                    if gw >= scale or gw + n < scale:  # nested set unchanged
+                        continue
+                    c, n = self.tholder._groups[g]  # nested set now satisfied
+                self._credit(c, n)
+
+        return self.satisfied
+
+    def _credit(self, c, n):
+        """ Adds scaled weight n to clause c counting clause when it becomes met """
+        cw = self._cws[c]
+        self._cws[c] = cw + n
+        scale = self.tholder._scale
+        if cw < scale <= cw + n:
+            self._met += 1
+
+
 class Dicter:
     """ Dicter class is base class for objects that can be stored in a Suber
 
@@ -18,6 +18,7 @@ from .. import kering
 from ..kering import (Colds, Versionage, Vrsn_1_0, Vrsn_2_0)
 
 from ..core.coring import IceMapDom
+from ..core.coring import _cesr  # optional compiled codec else None
 
 
 @dataclass(frozen=True)
@@ -1089,6 +1090,10 @@ class Counter:
         """
         code = self.code  # codex value chars hard code
         count = self.count  # index value int used for soft
+        if _cesr is not None:  # None when not well formed so raise below
+            both = _cesr.counterInfil(code, count, self._sizes[code])
+            if both is not None:
+                return both
 
         hs, ss, fs = self._sizes[code]
         # assumes fs = hs + ss  # both hard + soft size
@@ -1140,8 +1145,15 @@ class Counter:
         if not qb64b or len(qb64b) < 2:  # need more bytes
             raise kering.ShortageError("Empty material, Need more characters.")
 
+        if _cesr is not None:  # None when not well formed so raise below
+            parts = _cesr.counterExfil(qb64b, self.Hards, self._sizes)
+            if parts is not None:
+                self._code, self._count = parts
+                return
 
         first = qb64b[:2]  # extract first two char code selector
+        if isinstance(first, memoryview):
+            first = bytes(first)
         if hasattr(first, "decode"):
             first = first.decode("utf-8")
         if first not in self.Hards:
@@ -1156,6 +1168,8 @@ class Counter:
             raise kering.ShortageError("Need {} more characters.".format(hs - len(qb64b)))
 
         hard = qb64b[:hs]  # get hard code
+        if isinstance(hard, memoryview):
+            hard = bytes(hard)
         if hasattr(hard, "decode"):
             hard = hard.decode("utf-8")  # decode converts bytearray/bytes to str
         if hard not in self._sizes:  # Sizes needs str not bytes
@@ -1171,6 +1185,8 @@ class Counter:
             raise kering.ShortageError("Need {} more characters.".format(fs - len(qb64b)))
 
         count = qb64b[hs:fs]  # extract count chars
+        if isinstance(count, memoryview):
+            count = bytes(count)
         if hasattr(count, "decode"):
             count = count.decode("utf-8")
         count = b64ToInt(count)  # compute int count
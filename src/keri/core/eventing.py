@@ -305,7 +305,7 @@ def deTransReceiptQuintuple(data, strip=False):
 
 
 
-def verifySigs(raw, sigers, verfers):
+def verifySigs(raw, sigers, verfers, verifieds=None):
     """
     Returns tuple of (vsigers, vindices) where:
         vsigers is list  of unique verified sigers with assigned verfer
@@ -320,6 +320,9 @@ def verifySigs(raw, sigers, verfers):
         raw (bytes) signed data
         sigers is list of indexed Siger instances (signatures)
         verfers is list of Verfer instance (public keys)
+        verifieds (frozenset | None): of (code, key, sig, ser) quadruples of
+            signatures already verified such as by a parser pipeline worker.
+            Matching sigers are not verified again.
 
     """
     if sigers is None:
@@ -346,7 +349,8 @@ def verifySigs(raw, sigers, verfers):
     vindices = []
     vsigers = []
     for siger in uvsigers:
-        if siger.verfer.verify(siger.raw, raw):
+        if ((verifieds and (siger.verfer.code, siger.verfer.raw, siger.raw, raw) in verifieds)
+                or siger.verfer.verify(siger.raw, raw)):
             vindices.append(siger.index)
             vsigers.append(siger)
 
@@ -1702,9 +1706,19 @@ class Kever:
     EstOnly = False
     DoNotDelegate = False
 
+    # lazily hydrated after .reload from state, see properties below
+    _state = None  # KeyStateRecord source of lazy attributes
+    _raw = None  # raw of current event source of lazy .serder
+    _serder = None
+    _tholder = None
+    _ntholder = None
+    _verfers = None
+    _ndigers = None
+
     def __init__(self, *, state=None, serder=None, sigers=None, wigers=None,
                  db=None, estOnly=None, delseqner=None, delsaider=None, firner=None,
-                 dater=None, cues=None, eager=False, local=True, check=False):
+                 dater=None, cues=None, eager=False, local=True, check=False,
+                 verifieds=None):
         """
         Create incepting kever and state from inception serder
         Verify incepting serder against sigers raises ValidationError if not
@@ -1745,6 +1759,8 @@ class Kever:
                 non-idempotent way. Useful for reinitializing the Kevers from
                 a persisted KEL without updating non-idempotent first seen .fels
                 and timestamps.
+            verifieds (frozenset | None): of (code, key, sig, ser) quadruples
+                of signatures already verified. See verifySigs
         """
         if not (state or (serder and sigers)):
             raise ValueError("Missing required arguments. Need state or serder"
@@ -1787,7 +1803,8 @@ class Kever:
                                                         delseqner=delseqner,
                                                         delsaider=delsaider,
                                                         eager=eager,
-                                                        local=local)
+                                                        local=local,
+                                                        verifieds=verifieds)
 
         self.delpre = delpre  # may be None
         self.delegated = True if self.delpre else False
@@ -1796,17 +1813,90 @@ class Kever:
         # .validateSigsDelWigs above ensures thresholds met otherwise raises exception
         # all validated above so may add to KEL and FEL logs as first seen
         # returns fn == None if already logged fn log is non idempotent
-        fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers,
-                                wits=wits,
-                                first=True if not check else False,
-                                seqner=delseqner, saider=delsaider,
-                                firner=firner, dater=dater, local=local)
-        if fn is not None:  # first is non-idempotent for fn check mode fn is None
-            self.fner = Number(num=fn)
-            self.dater = Dater(dts=dts)
-            self.db.states.pin(keys=self.prefixer.qb64,
-                               val=self.state())
+        with self.db.savepoint():  # commit accepted event once
+            fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers,
+                                    wits=wits,
+                                    first=True if not check else False,
+                                    seqner=delseqner, saider=delsaider,
+                                    firner=firner, dater=dater, local=local)
+            if fn is not None:  # first is non-idempotent for fn check mode fn is None
+                self.fner = Number(num=fn)
+                self.dater = Dater(dts=dts)
+                self.db.states.pin(keys=self.prefixer.qb64,
+                                   val=self.state())
+
+
+    @property
+    def serder(self):
+        """
+        Returns .serder (SerderKERI) of current event. Lazily hydrated from raw
+        event after .reload without reverifying its said.
+        """
+        if self._serder is None and self._raw is not None:
+            self._serder = serdering.SerderKERI(raw=self._raw, verify=False)
+            self._raw = None
+        return self._serder
+
+    @serder.setter
+    def serder(self, serder):
+        self._serder = serder
+        self._raw = None
+
+    @property
+    def tholder(self):
+        """
+        Returns .tholder (Tholder) of current signing threshold. Lazily
+        hydrated from state after .reload.
+        """
+        if self._tholder is None and self._state is not None:
+            self._tholder = Tholder(sith=self._state.kt)
+        return self._tholder
 
+    @tholder.setter
+    def tholder(self, tholder):
+        self._tholder = tholder
+
+    @property
+    def ntholder(self):
+        """
+        Returns .ntholder (Tholder) of next rotation threshold. Lazily
+        hydrated from state after .reload.
+        """
+        if self._ntholder is None and self._state is not None:
+            self._ntholder = Tholder(sith=self._state.nt)
+        return self._ntholder
+
+    @ntholder.setter
+    def ntholder(self, ntholder):
+        self._ntholder = ntholder
+
+    @property
+    def verfers(self):
+        """
+        Returns .verfers (list) of Verfer of current signing keys. Lazily
+        hydrated from state after .reload.
+        """
+        if self._verfers is None and self._state is not None:
+            self._verfers = [Verfer(qb64=key) for key in self._state.k]
+        return self._verfers
+
+    @verfers.setter
+    def verfers(self, verfers):
+        self._verfers = verfers
+
+    @property
+    def ndigers(self):
+        """
+        Returns .ndigers (list) of Diger of next key digests. Lazily hydrated
+        from state after .reload.
+        """
+        if self._ndigers is None and self._state is not None:
+            self._ndigers = [Diger(qb64=dig) for dig in self._state.n]
+        return self._ndigers
+
+    @ndigers.setter
+    def ndigers(self, ndigers):
+        self._ndigers = ndigers
 
     @property
     def sn(self):
@@ -2012,6 +2102,11 @@ class Kever:
         """
         Reload Kever attributes (aka its state) from state (KeyStateRecord)
 
+        Derived attributes .serder, .tholder, .ntholder, .verfers, and .ndigers
+        are hydrated lazily on first access so a reload does not re-derive them
+        nor reparse the current event. The current event is not reverified
+        since it was verified before it was first accepted into the database.
+
         Parameters:
             state (KeyStateRecord | None): instance for key state notice
 
@@ -2022,10 +2117,9 @@ class Kever:
         self.fner = Number(numh=state.f) # first seen ordinal Number hex str
         self.dater = Dater(dts=state.dt)
         self.ilk = state.et
-        self.tholder = Tholder(sith=state.kt)
-        self.ntholder = Tholder(sith=state.nt)
-        self.verfers = [Verfer(qb64=key) for key in state.k]
-        self.ndigers = [Diger(qb64=dig) for dig in state.n]
+        # .tholder .ntholder .verfers .ndigers hydrated from state on first access
+        self._state = state
+        self._tholder = self._ntholder = self._verfers = self._ndigers = None
         self.toader = Number(numh=state.bt)  # auto converts from hex num
         self.wits = state.b
         self.cuts = state.ee.br
@@ -2042,7 +2136,8 @@ class Kever:
                                             dig=state.d))) is None:
             raise MissingEntryError(f"Corresponding event not found for state="
                                     f"{state}.")
-        self.serder = serdering.SerderKERI(raw=bytes(raw))
+        self._raw = bytes(raw)  # .serder hydrated on first access
+        self._serder = None
 
         # May want to do additional checks here
 
@@ -2138,7 +2233,8 @@ class Kever:
 
 
     def update(self, serder, sigers, wigers=None, delseqner=None, delsaider=None,
-               firner=None, dater=None, eager=False, local=True, check=False):
+               firner=None, dater=None, eager=False, local=True, check=False,
+               verifieds=None):
         """
         Not an inception event. Verify event serder and indexed signatures
         in sigers and update state
@@ -2175,6 +2271,8 @@ class Kever:
                 non-idempotent way. Useful for reinitializing the Kevers from
                 a persisted KEL without updating non-idempotent first seen .fels
                 and timestamps.
+            verifieds (frozenset | None): of (code, key, sig, ser) quadruples
+                of signatures already verified. See verifySigs
 
         """
         ked = serder.ked
@@ -2215,38 +2313,40 @@ class Kever:
                                                         delseqner=delseqner,
                                                         delsaider=delsaider,
                                                         eager=eager,
-                                                        local=local)
+                                                        local=local,
+                                                        verifieds=verifieds)
 
 
 
             # .valSigWigsDel above ensures thresholds met otherwise raises exception
             # all validated above so may add to KEL and FEL logs as first seen
-            fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers,
-                                    wits=wits,
-                                    first=True if not check else False,
-                                    seqner=delseqner, saider=delsaider,
-                                    firner=firner, dater=dater, local=local)
-
-            # nxt and signatures verify so update state
-            self.sner = sner  # sequence number Number instance
-            self.serder = serder  # need whole serder for digest agility compare
-            self.ilk = ilk
-            self.tholder = tholder
-            self.verfers = serder.verfers
-            self.ndigers = serder.ndigers
-            self.ntholder = serder.ntholder
-
-            self.toader = toader
-            self.wits = wits
-            self.cuts = cuts
-            self.adds = adds
-
-            # last establishment event location need this to recognize recovery events
-            self.lastEst = LastEstLoc(s=self.sner.num, d=self.serder.said)
-            if fn is not None:  # first is non-idempotent for fn check mode fn is None
-                self.fner = Number(num=fn)
-                self.dater = Dater(dts=dts)
-                self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
+            with self.db.savepoint():  # commit accepted event once
+                fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers,
+                                        wits=wits,
+                                        first=True if not check else False,
+                                        seqner=delseqner, saider=delsaider,
+                                        firner=firner, dater=dater, local=local)
+
+                # nxt and signatures verify so update state
+                self.sner = sner  # sequence number Number instance
+                self.serder = serder  # need whole serder for digest agility compare
+                self.ilk = ilk
+                self.tholder = tholder
+                self.verfers = serder.verfers
+                self.ndigers = serder.ndigers
+                self.ntholder = serder.ntholder
+
+                self.toader = toader
+                self.wits = wits
+                self.cuts = cuts
+                self.adds = adds
+
+                # last establishment event location need this to recognize recovery events
+                self.lastEst = LastEstLoc(s=self.sner.num, d=self.serder.said)
+                if fn is not None:  # first is non-idempotent for fn check mode fn is None
+                    self.fner = Number(num=fn)
+                    self.dater = Dater(dts=dts)
+                    self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
 
 
         elif ilk == Ilks.ixn:  # subsequent interaction event
@@ -2282,21 +2382,23 @@ class Kever:
                                                         toader=self.toader,
                                                         wits=self.wits,
                                                         eager=eager,
-                                                        local=local)
+                                                        local=local,
+                                                        verifieds=verifieds)
 
             # .validateSigsDelWigs above ensures thresholds met otherwise raises exception
             # all validated above so may add to KEL and FEL logs as first seen
-            fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers,
-                                    first=True if not check else False)  # First seen accepted
-
-            # validates so update state
-            self.sner = sner  # sequence number Number instance
-            self.serder = serder  # need for digest agility includes .serder.diger
-            self.ilk = ilk
-            if fn is not None:  # first is non-idempotent for fn check mode fn is None
-                self.fner = Number(num=fn)
-                self.dater = Dater(dts=dts)
-                self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
+            with self.db.savepoint():  # commit accepted event once
+                fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers,
+                                        first=True if not check else False)  # First seen accepted
+
+                # validates so update state
+                self.sner = sner  # sequence number Number instance
+                self.serder = serder  # need for digest agility includes .serder.diger
+                self.ilk = ilk
+                if fn is not None:  # first is non-idempotent for fn check mode fn is None
+                    self.fner = Number(num=fn)
+                    self.dater = Dater(dts=dts)
+                    self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
 
         else:  # unsupported event ilk so discard
             raise ValidationError("Unsupported ilk = {} for evt = {}.".format(ilk, ked))
@@ -2459,7 +2561,7 @@ class Kever:
     def valSigsWigsDel(self, serder, sigers, verfers, tholder,
                                 wigers, toader, wits, *,
                                 delseqner=None, delsaider=None, eager=False,
-                                local=True):
+                                local=True, verifieds=None):
         """
         Returns triple (sigers, wigers, delegator) where:
         sigers is unique validated signature verified members of inputed sigers
@@ -2497,6 +2599,8 @@ class Kever:
                 True means event source is local (protected).
                 False means event source is remote (unprotected).
                 Event validation logic is a function of local or remote
+            verifieds (frozenset | None): of (code, key, sig, ser) quadruples
+                of signatures already verified. See verifySigs
 
         """
         if len(verfers) < tholder.size:
@@ -2520,7 +2624,8 @@ class Kever:
 
 
         # get unique verified sigers and indices lists from sigers list
-        sigers, indices = verifySigs(raw=serder.raw, sigers=sigers, verfers=verfers)
+        sigers, indices = verifySigs(raw=serder.raw, sigers=sigers, verfers=verfers,
+                                     verifieds=verifieds)
         # sigers  now have .verfer assigned
 
         # check if minimally signed in order to continue processing
@@ -2559,7 +2664,8 @@ class Kever:
 
         werfers = [Verfer(qb64=wit) for wit in wits]  # get witness public key verifiers
         # get unique verified wigers and windices lists from wigers list
-        wigers, windices = verifySigs(raw=serder.raw, sigers=wigers, verfers=werfers)
+        wigers, windices = verifySigs(raw=serder.raw, sigers=wigers, verfers=werfers,
+                                      verifieds=verifieds)
         # each wiger now has added to it a werfer of its wit in its .verfer property
 
         # escrow if not fully signed vs signing threshold
@@ -3376,62 +3482,66 @@ class Kever:
         dgkeys = (serder.pre, serder.said)
         dgkey = dgKey(serder.preb, serder.saidb)
         dtsb = helping.nowIso8601().encode("utf-8")
-        self.db.putDts(dgkey, dtsb)  # idempotent do not change dts if already
-        if sigers:
-            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])  # idempotent
-        if wigers:
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
-        if wits:
-            self.db.wits.put(keys=dgkey, vals=[coring.Prefixer(qb64=w) for w in wits])
-
-        self.db.putEvt(dgkey, serder.raw)  # idempotent (maybe already excrowed)
-        # update event source
-
-        # delegation for authorized delegated or issued event
-        # when seqner and saider are provided they are only assured to be valid
-        # kever for event if kel is delegated and not locallyOwned
-        # and not locallyWitnessed as the validateDelegation is short circuited
-        # for non delegated kels, local controllers, and local witnesses.
-        # These checks prevent ddos via malicious source seal attachments.
-        # MUST NOT setAes if not delegated or locallyOwned or locallyWitnessed
-        if (self.delpre and not serder.ilk == Ilks.ixn and not self.locallyOwned()
-            and not self.locallyWitnessed(wits=wits) and seqner and saider):
-            couple = seqner.qb64b + saider.qb64b
-            self.db.setAes(dgkey, couple)  # authorizer (delegator/issuer) event seal
-
-        #if seqner and saider:
-            #couple = seqner.qb64b + saider.qb64b
-            #self.db.setAes(dgkey, couple)  # authorizer (delegator/issuer) event seal
-
-        if esr := self.db.esrs.get(keys=dgkeys):  # preexisting esr
-            if local and not esr.local:  # local overwrites prexisting remote
-                esr.local = local
-                self.db.esrs.pin(keys=dgkeys, val=esr)
-            # otherwise don't change
-        else:  # not preexisting so put
-            esr = basing.EventSourceRecord(local=local)
-            self.db.esrs.put(keys=dgkeys, val=esr)
+        with self.db.savepoint():  # log accepted event in one commit
+            self.db.putDts(dgkey, dtsb)  # idempotent do not change dts if already
+            if sigers:
+                self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])  # idempotent
+            if wigers:
+                self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            if wits:
+                self.db.wits.put(keys=dgkey, vals=[coring.Prefixer(qb64=w) for w in wits])
+
+            self.db.putEvt(dgkey, serder.raw)  # idempotent (maybe already excrowed)
+            # update event source
+
+            # delegation for authorized delegated or issued event
+            # when seqner and saider are provided they are only assured to be valid
+            # kever for event if kel is delegated and not locallyOwned
+            # and not locallyWitnessed as the validateDelegation is short circuited
+            # for non delegated kels, local controllers, and local witnesses.
+            # These checks prevent ddos via malicious source seal attachments.
+            # MUST NOT setAes if not delegated or locallyOwned or locallyWitnessed
+            if (self.delpre and not serder.ilk == Ilks.ixn and not self.locallyOwned()
+                and not self.locallyWitnessed(wits=wits) and seqner and saider):
+                couple = seqner.qb64b + saider.qb64b
+                self.db.setAes(dgkey, couple)  # authorizer (delegator/issuer) event seal
 
-        pre = self.prefixer.qb64
-        if first:  # append event dig to first seen database in order
-            fn = self.db.appendFe(serder.preb, serder.saidb)
-            if firner and fn != firner.sn:  # cloned replay but replay fn not match
-                if self.cues is not None:  # cue to notice BadCloneFN
-                    self.cues.push(dict(kin="noticeBadCloneFN", serder=serder,
-                                        fn=fn, firner=firner, dater=dater))
-                logger.info("Kever: Mismatch Cloned Replay FN: %s First seen "
-                            "ordinal fn %s and clone fn %s, said=%s",
-                            serder.preb, fn, firner.sn, serder.said)
-                logger.debug("Event body=\n%s\n", serder.pretty())
-            if dater:  # cloned replay use original's dts from dater
-                dtsb = dater.dtsb
-            self.db.setDts(dgkey, dtsb)  # first seen so set dts to now
-            self.db.fons.pin(keys=dgkey, val=Seqner(sn=fn))
-            logger.debug("AID %s...%s: First seen %s at sn=%s valid event SAID=%s for %s at %s",
-                         pre[:4], pre[-4:], serder.ilk, fn, serder.said,
-                         serder.pre, dtsb.decode("utf-8"))
-            logger.debug("Event Body=\n%s\n", serder.pretty())
-        self.db.addKe(snKey(serder.preb, serder.sn), serder.saidb)
+            #if seqner and saider:
+                #couple = seqner.qb64b + saider.qb64b
+                #self.db.setAes(dgkey, couple)  # authorizer (delegator/issuer) event seal
+
+            if esr := self.db.esrs.get(keys=dgkeys):  # preexisting esr
+                if local and not esr.local:  # local overwrites prexisting remote
+                    esr.local = local
+                    self.db.esrs.pin(keys=dgkeys, val=esr)
+                # otherwise don't change
+            else:  # not preexisting so put
+                esr = basing.EventSourceRecord(local=local)
+                self.db.esrs.put(keys=dgkeys, val=esr)
+
+            pre = self.prefixer.qb64
+            if first:  # append event dig to first seen database in order
+                fn = self.db.appendFe(serder.preb, serder.saidb)
+                if firner and fn != firner.sn:  # cloned replay but replay fn not match
+                    if self.cues is not None:  # cue to notice BadCloneFN
+                        self.cues.push(dict(kin="noticeBadCloneFN", serder=serder,
+                                            fn=fn, firner=firner, dater=dater))
+                    logger.info("Kever: Mismatch Cloned Replay FN: %s First seen "
+                                "ordinal fn %s and clone fn %s, said=%s",
+                                serder.preb, fn, firner.sn, serder.said)
+                    logger.debug("Event body=\n%s\n", serder.pretty())
+                if dater:  # cloned replay use original's dts from dater
+                    dtsb = dater.dtsb
+                self.db.setDts(dgkey, dtsb)  # first seen so set dts to now
+                self.db.fons.pin(keys=dgkey, val=Seqner(sn=fn))
+                logger.debug("AID %s...%s: First seen %s at sn=%s valid event SAID=%s for %s at %s",
+                             pre[:4], pre[-4:], serder.ilk, fn, serder.said,
+                             serder.pre, dtsb.decode("utf-8"))
+                logger.debug("Event Body=\n%s\n", serder.pretty())
+            self.db.addKe(snKey(serder.preb, serder.sn), serder.saidb)
+            # wake only the escrow entries whose dependency this event satisfies
+            self.db.wakers["ooes"].wake(snKey(serder.preb, serder.sn + 1))  # next event
+            self.db.wakers["ures"].wake(snKey(serder.preb, serder.sn))  # its receipts
         logger.info("AID %s...%s: Added to KEL %s at sn=%s valid event SAID=%s",
                     pre[:4], pre[-4:], serder.ilk, serder.sn, serder.said)
         logger.debug("Event Body=\n%s\n", serder.pretty())
@@ -3455,27 +3565,28 @@ class Kever:
                 Event validation logic is a function of local or remote
         """
         local = True if local else False
-        dgkey = dgKey(serder.preb, serder.saidb)
-        if esr := self.db.esrs.get(keys=dgkey):  # preexisting esr
-            if local and not esr.local:  # local overwrites prexisting remote
-                esr.local = local
-                self.db.esrs.pin(keys=dgkey, val=esr)
-            # otherwise don't change
-        else:  # not preexisting so put
-            esr = basing.EventSourceRecord(local=local)
-            self.db.esrs.put(keys=dgkey, val=esr)
-
-        self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
-        self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        self.db.putEvt(dgkey, serder.raw)
-        if wigers:
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
-        if seqner and saider:
-            #couple = seqner.qb64b + saider.qb64b
-            #self.db.putUde(dgkey, couple)  # idempotent
-            self.db.udes.put(keys=dgkey, val=(seqner, saider))  # idempotent
+        with self.db.savepoint():  # escrow event in one commit
+            dgkey = dgKey(serder.preb, serder.saidb)
+            if esr := self.db.esrs.get(keys=dgkey):  # preexisting esr
+                if local and not esr.local:  # local overwrites prexisting remote
+                    esr.local = local
+                    self.db.esrs.pin(keys=dgkey, val=esr)
+                # otherwise don't change
+            else:  # not preexisting so put
+                esr = basing.EventSourceRecord(local=local)
+                self.db.esrs.put(keys=dgkey, val=esr)
+
+            self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
+            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            self.db.putEvt(dgkey, serder.raw)
+            if wigers:
+                self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            if seqner and saider:
+                #couple = seqner.qb64b + saider.qb64b
+                #self.db.putUde(dgkey, couple)  # idempotent
+                self.db.udes.put(keys=dgkey, val=(seqner, saider))  # idempotent
 
-        res = self.db.misfits.add(keys=(serder.pre, serder.snh), val=serder.saidb)
+            res = self.db.misfits.add(keys=(serder.pre, serder.snh), val=serder.saidb)
         # log escrowed
         logger.debug("Kever: escrowed misfit event=\n%s\n", serder.pretty())
 
@@ -3497,22 +3608,23 @@ class Kever:
                 Event validation logic is a function of local or remote
         """
         local = True if local else False
-        dgkey = dgKey(serder.preb, serder.saidb)
-        if esr := self.db.esrs.get(keys=dgkey):  # preexisting esr
-            if local and not esr.local:  # local overwrites prexisting remote
-                esr.local = local
-                self.db.esrs.pin(keys=dgkey, val=esr)
-            # otherwise don't change
-        else:  # not preexisting so put
-            esr = basing.EventSourceRecord(local=local)
-            self.db.esrs.put(keys=dgkey, val=esr)
-
-        self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
-        self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        self.db.putEvt(dgkey, serder.raw)
-        if wigers:
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
-        self.db.delegables.add(snKey(serder.preb, serder.sn), serder.saidb)
+        with self.db.savepoint():  # escrow event in one commit
+            dgkey = dgKey(serder.preb, serder.saidb)
+            if esr := self.db.esrs.get(keys=dgkey):  # preexisting esr
+                if local and not esr.local:  # local overwrites prexisting remote
+                    esr.local = local
+                    self.db.esrs.pin(keys=dgkey, val=esr)
+                # otherwise don't change
+            else:  # not preexisting so put
+                esr = basing.EventSourceRecord(local=local)
+                self.db.esrs.put(keys=dgkey, val=esr)
+
+            self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
+            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            self.db.putEvt(dgkey, serder.raw)
+            if wigers:
+                self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            self.db.delegables.add(snKey(serder.preb, serder.sn), serder.saidb)
         # log escrowed
         logger.debug("Kever: escrowed delegable event =\n%s\n", serder.pretty())
 
@@ -3535,28 +3647,29 @@ class Kever:
                 Event validation logic is a function of local or remote
         """
         local = True if local else False
-        dgkey = dgKey(serder.preb, serder.saidb)
-        self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))  # idempotent
-        if sigers:
-            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        if wigers:
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
-        if seqner and saider:
-            self.db.udes.put(keys=dgkey, val=(seqner, saider))  # idempotent
-
-        self.db.putEvt(dgkey, serder.raw)
-        # update event source
-        if esr := self.db.esrs.get(keys=dgkey):  # preexisting esr
-            if local and not esr.local:  # local overwrites prexisting remote
-                esr.local = local
-                self.db.esrs.pin(keys=dgkey, val=esr)
-            # otherwise don't change
-        else:  # not preexisting so put
-            esr = basing.EventSourceRecord(local=local)
-            self.db.esrs.put(keys=dgkey, val=esr)
+        with self.db.savepoint():  # escrow event in one commit
+            dgkey = dgKey(serder.preb, serder.saidb)
+            self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))  # idempotent
+            if sigers:
+                self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            if wigers:
+                self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            if seqner and saider:
+                self.db.udes.put(keys=dgkey, val=(seqner, saider))  # idempotent
 
-        snkey = snKey(serder.preb, serder.sn)
-        self.db.addPse(snkey, serder.saidb)
+            self.db.putEvt(dgkey, serder.raw)
+            # update event source
+            if esr := self.db.esrs.get(keys=dgkey):  # preexisting esr
+                if local and not esr.local:  # local overwrites prexisting remote
+                    esr.local = local
+                    self.db.esrs.pin(keys=dgkey, val=esr)
+                # otherwise don't change
+            else:  # not preexisting so put
+                esr = basing.EventSourceRecord(local=local)
+                self.db.esrs.put(keys=dgkey, val=esr)
+
+            snkey = snKey(serder.preb, serder.sn)
+            self.db.addPse(snkey, serder.saidb)
         logger.debug("Kever: Escrowed partially signed or delegated event = \n%s\n", serder.pretty())
 
 
@@ -3578,30 +3691,32 @@ class Kever:
 
         """
         local = True if local else False
-        dgkey = dgKey(serder.preb, serder.saidb)
-        self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))  # idempotent
-
-        if sigers:
-            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        if wigers:
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
-        if seqner and saider:
-            self.db.udes.put(keys=dgkey, val=(seqner, saider))  # idempotent
+        with self.db.savepoint():  # escrow event in one commit
+            dgkey = dgKey(serder.preb, serder.saidb)
+            self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))  # idempotent
 
-        self.db.putEvt(dgkey, serder.raw)
-        # update event source
-        if (esr := self.db.esrs.get(keys=dgkey)):  # preexisting esr
-            if local and not esr.local:  # local overwrites prexisting remote
-                esr.local = local
-                self.db.esrs.pin(keys=dgkey, val=esr)
-            # otherwise don't change
-        else: # not preexisting so put
-            esr = basing.EventSourceRecord(local=local)
-            self.db.esrs.put(keys=dgkey, val=esr)
+            if sigers:
+                self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            if wigers:
+                self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            if seqner and saider:
+                self.db.udes.put(keys=dgkey, val=(seqner, saider))  # idempotent
 
-        logger.trace("Kever state: Escrowed partially witnessed event = %s", serder.said)
-        logger.trace("Event Body=\n%s\n", serder.pretty())
-        return self.db.addPwe(snKey(serder.preb, serder.sn), serder.saidb)
+            self.db.putEvt(dgkey, serder.raw)
+            # update event source
+            if (esr := self.db.esrs.get(keys=dgkey)):  # preexisting esr
+                if local and not esr.local:  # local overwrites prexisting remote
+                    esr.local = local
+                    self.db.esrs.pin(keys=dgkey, val=esr)
+                # otherwise don't change
+            else: # not preexisting so put
+                esr = basing.EventSourceRecord(local=local)
+                self.db.esrs.put(keys=dgkey, val=esr)
+
+            logger.trace("Kever state: Escrowed partially witnessed event = %s", serder.said)
+            logger.trace("Event Body=\n%s\n", serder.pretty())
+            self.db.wakers["ures"].wake(snKey(serder.preb, serder.sn))  # receipts may now find it
+            return self.db.addPwe(snKey(serder.preb, serder.sn), serder.saidb)
 
 
     def escrowPDEvent(self, serder, *, sigers=None, wigers=None,
@@ -3634,38 +3749,39 @@ class Kever:
 
         """
         local = True if local else False
-        dgkey = dgKey(serder.preb, serder.saidb)
-        self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))  # idempotent
-
-        if sigers:  # idempotent
-            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        if wigers:  # idempotent
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
-        if seqner and saider:  # non-idempotent pin to repair replace
-            self.db.udes.pin(keys=dgkey, val=(seqner, saider))  # non-idempotent
-            logger.debug(f"Kever state: Replaced escrow source couple sn="
-                         f"{seqner.sn}, said={saider.qb64} for partially "
-                         f"delegated/authorized event said={serder.said}.")
-        else:
-            self.db.udes.rem(keys=dgkey)  # nullify non-idempotent
-            logger.debug(f"Kever state: Nullified escrow source couple for "
-                         f"partially delegated/authorized event said="
-                         f"{serder.said}.")
+        with self.db.savepoint():  # escrow event in one commit
+            dgkey = dgKey(serder.preb, serder.saidb)
+            self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))  # idempotent
+
+            if sigers:  # idempotent
+                self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            if wigers:  # idempotent
+                self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            if seqner and saider:  # non-idempotent pin to repair replace
+                self.db.udes.pin(keys=dgkey, val=(seqner, saider))  # non-idempotent
+                logger.debug(f"Kever state: Replaced escrow source couple sn="
+                             f"{seqner.sn}, said={saider.qb64} for partially "
+                             f"delegated/authorized event said={serder.said}.")
+            else:
+                self.db.udes.rem(keys=dgkey)  # nullify non-idempotent
+                logger.debug(f"Kever state: Nullified escrow source couple for "
+                             f"partially delegated/authorized event said="
+                             f"{serder.said}.")
 
-        self.db.putEvt(dgkey, serder.raw)  # idempotent
+            self.db.putEvt(dgkey, serder.raw)  # idempotent
 
-        # update event source local or remote
-        if (esr := self.db.esrs.get(keys=dgkey)):  # preexisting esr
-            if local and not esr.local:  # local overwrites prexisting remote
-                esr.local = local
-                self.db.esrs.pin(keys=dgkey, val=esr)
-            # otherwise don't change
-        else: # not preexisting so put
-            esr = basing.EventSourceRecord(local=local)
-            self.db.esrs.put(keys=dgkey, val=esr)
+            # update event source local or remote
+            if (esr := self.db.esrs.get(keys=dgkey)):  # preexisting esr
+                if local and not esr.local:  # local overwrites prexisting remote
+                    esr.local = local
+                    self.db.esrs.pin(keys=dgkey, val=esr)
+                # otherwise don't change
+            else: # not preexisting so put
+                esr = basing.EventSourceRecord(local=local)
+                self.db.esrs.put(keys=dgkey, val=esr)
 
-        logger.debug(f"Kever: Escrowed partially delegated event=\n%s\n", serder.pretty())
-        return self.db.pdes.addOn(keys=serder.pre, on=serder.sn, val=serder.said)
+            logger.debug(f"Kever: Escrowed partially delegated event=\n%s\n", serder.pretty())
+            return self.db.pdes.addOn(keys=serder.pre, on=serder.sn, val=serder.said)
 
 
     def state(self):
@@ -3976,7 +4092,8 @@ class Kevery:
 
     def processEvent(self, serder, sigers, *, wigers=None,
                      delseqner=None, delsaider=None,
-                     firner=None, dater=None, eager=False, local=None, **kwa):
+                     firner=None, dater=None, eager=False, local=None,
+                     verifieds=None, **kwa):
         """
         Process one event serder with attached indexd signatures sigers
 
@@ -4004,6 +4121,8 @@ class Kevery:
             local (bool|None): True means local (protected) event source.
                                False means remote (unprotected).
                                None means use default .local .
+            verifieds (frozenset|None): of (code, key, sig, ser) quadruples of
+                signatures already verified. See verifySigs
         """
         local = local if local is not None else self.local
         local = True if local else False  # force boolean
@@ -4041,7 +4160,8 @@ class Kevery:
                               cues=self.cues,
                               eager=eager,
                               local=local,
-                              check=self.check)
+                              check=self.check,
+                              verifieds=verifieds)
                 self.kevers[pre] = kever  # not exception so add to kevers
 
                 # At this point  the inceptive event (icp or dip) given by serder
@@ -4086,11 +4206,13 @@ class Kevery:
                     # get unique verified lists of sigers and indices from sigers
                     sigers, indices = verifySigs(raw=serder.raw,
                                                  sigers=sigers,
-                                                 verfers=eserder.verfers)
+                                                 verfers=eserder.verfers,
+                                                 verifieds=verifieds)
 
                     wigers, windices = verifySigs(raw=serder.raw,
                                                   sigers=wigers,
-                                                  verfers=eserder.berfers)
+                                                  verfers=eserder.berfers,
+                                                  verifieds=verifieds)
 
                     if sigers or wigers:  # at least one verified sig or wig so log evt
                         # this allows late arriving witness receipts or controller
@@ -4132,7 +4254,8 @@ class Kevery:
                                  delseqner=delseqner, delsaider=delsaider,
                                  firner=firner if self.cloned else None,
                                  dater=dater if self.cloned else None,
-                                 eager=eager, local=local, check=self.check)
+                                 eager=eager, local=local, check=self.check,
+                                 verifieds=verifieds)
 
                     # At this point the non-inceptive event (rot, drt, or ixn)
                     # given by serder together with its attachments has been
@@ -4169,13 +4292,15 @@ class Kevery:
                         # get unique verified lists of sigers and indices from sigers
                         sigers, indices = verifySigs(raw=serder.raw,
                                                      sigers=sigers,
-                                                     verfers=eserder.verfers)
+                                                     verfers=eserder.verfers,
+                                                     verifieds=verifieds)
 
                         wits = [wit.qb64 for wit in self.fetchWitnessState(pre, sn)]
                         werfers = [Verfer(qb64=wit) for wit in wits]
                         wigers, windices = verifySigs(raw=serder.raw,
                                                       sigers=wigers,
-                                                      verfers=werfers)
+                                                      verfers=werfers,
+                                                      verifieds=verifieds)
 
                         if sigers or wigers:  # at least one verified sig or wig so log evt
                             # this allows late arriving witness receipts or controller
@@ -4369,7 +4494,7 @@ class Kevery:
             raise UnverifiedReceiptError(msg)
 
     def processAttachedReceiptCouples(self, serder, cigars, *, firner=None,
-                                      local=None, **kwa):
+                                      local=None, verifieds=None, **kwa):
         """
         Process one attachment couple that represents an endorsement from
         a nontransferable AID  that may or may not be a witness, maybe a watcher.
@@ -4389,6 +4514,8 @@ class Kevery:
             local (bool|None): True means local (protected) event source.
                                False means remote (unprotected).
                                None means use default .local .
+            verifieds (frozenset|None): of (code, key, sig, ser) quadruples of
+                signatures already verified. See verifySigs
 
         """
         local = local if local is not None else self.local
@@ -4437,7 +4564,9 @@ class Kevery:
 
                     continue  # skip own receipt attachment on non-local event
 
-            if cigar.verfer.verify(cigar.raw, serder.raw):
+            if ((verifieds and (cigar.verfer.code, cigar.verfer.raw, cigar.raw,
+                                serder.raw) in verifieds)
+                    or cigar.verfer.verify(cigar.raw, serder.raw)):
                 wits = self.fetchWitnessState(pre, sn)
                 rpre = cigar.verfer.qb64  # prefix of receiptor
                 if rpre in wits:  # its a witness receipt
@@ -5311,7 +5440,10 @@ class Kevery:
             #couple = seqner.qb64b + saider.qb64b
             #self.db.putUde(dgkey, couple)  # idempotent
             self.db.udes.put(keys=dgkey, val=(seqner, saider))  # idempotent
-        self.db.addOoe(snKey(serder.preb, serder.sn), serder.saidb)
+        snkey = snKey(serder.preb, serder.sn)
+        self.db.addOoe(snkey, serder.saidb)
+        dte = helping.fromIso8601(bytes(self.db.getDts(dgkey)))
+        self.db.wakers["ooes"].date(snkey, serder.saidb, dte)
         # log escrowed
         logger.debug("Kevery process: escrowed out of order event=\n%s", serder.pretty())
 
@@ -5426,12 +5558,17 @@ class Kevery:
         # so can compare digs from receipt and in database for receipted event
         # with different algos.  Can't lookup event by dig for same reason. Must
         # lookup last event by sn not by dig.
-        self.db.putDts(dgKey(serder.preb, said), helping.nowIso8601().encode("utf-8"))
+        dgkey = dgKey(serder.preb, said)
+        self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
+        dte = helping.fromIso8601(bytes(self.db.getDts(dgkey)))
+        snkey = snKey(serder.preb, serder.sn)
         for cigar in cigars:  # escrow each triple
             if cigar.verfer.transferable:  # skip transferable verfers
                 continue  # skip invalid triplets
             triple = said.encode("utf-8") + cigar.verfer.qb64b + cigar.qb64b
-            self.db.addUre(key=snKey(serder.preb, serder.sn), val=triple)  # should be snKey
+            self.db.addUre(key=snkey, val=triple)  # should be snKey
+            self.db.wakers["ures"].date(snkey, triple, dte)
+        self.db.wakers["ures"].wake(snkey)  # event may be in .pwes
         # log escrowed
         logger.debug("Kevery process: escrowed unverified receipt of pre= %s "
                      " sn=%x dig=%s", serder.pre, serder.sn, said)
@@ -5580,6 +5717,36 @@ class Kevery:
                 logger.exception("Kevery other escrow process error: %s\n", ex.args[0])
             raise ex
 
+    def _processEscrowWoken(self, waker, itemize, process, timeout):
+        """
+        Process the entries of an escrow indexed by waker. Walks the whole
+        escrow when waker.full such as on the first pass after open. Otherwise
+        only walks the entries at the escrow keys woken since the last pass
+        and the entries escrowed longer than timeout so their staleness is
+        checked without the date math on every entry of every pass.
+
+        Parameters:
+            waker (Waker): index of escrow entries by dependency and escrow time
+            itemize (Callable): iterator of escrow (key, val) items given top key
+            process (Callable): processes one escrow entry given key and val
+            timeout (int): seconds to timeout escrow entries
+        """
+        if waker.full:
+            for ekey, eitem in itemize(b''):
+                process(ekey, eitem)
+            waker.full = False
+
+        while waker.woken:  # processed entries may wake more
+            key = waker.woken.pop()
+            for ekey, eitem in itemize(key):
+                process(ekey, eitem)
+
+        cutoff = helping.nowUTC() - datetime.timedelta(seconds=timeout)
+        for key, val in waker.expired(cutoff):
+            for ekey, eitem in itemize(key):
+                if bytes(eitem) == val:  # still escrowed
+                    process(ekey, eitem)
+
     def processEscrowOutOfOrders(self):
         """
         Process events escrowed by Kever that are recieved out-of-order.
@@ -5609,7 +5776,8 @@ class Kevery:
                 sn is int sequence number of event
 
         Steps:
-            Each pass  (walk index table)
+            Each pass  (walk index table entries woken or due in .db.wakers["ooes"]
+                        or whole index table on first pass)
                 For each prefix,sn
                     For each escrow item dup at prefix,sn:
                         Get Event
@@ -5618,102 +5786,139 @@ class Kevery:
                         If successful then remove from escrow table
         """
 
-        key = ekey = b''  # both start same. when not same means escrows found
-        while True:  # break when done
-            for ekey, edig in self.db.getOoeItemIter(key=key):
-                try:
-                    pre, sn = splitSnKey(ekey)  # get pre and sn from escrow item
-                    dgkey = dgKey(pre, bytes(edig))
-                    if not (esr := self.db.esrs.get(keys=dgkey)):  # get event source, otherwise error
-                        # no local source so raise ValidationError which unescrows below
-                        # no local source so raise ValidationError which unescrows below
-                        msg = f"OOO Missing escrowed event source at dig = {bytes(edig)}"
-                        logger.trace("Kevery unescrow error: %s", msg)
-                        raise ValidationError(msg)
+        self._processEscrowWoken(waker=self.db.wakers["ooes"],
+                                 itemize=self.db.getOoeItemIter,
+                                 process=self._processEscrowOutOfOrder,
+                                 timeout=self.TimeoutOOE)
 
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgkey)
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        msg = f"OOO Missing escrowed event datetime at dig = {bytes(edig)}"
-                        logger.trace("Kevery unescrow error: %s", msg)
-                        raise ValidationError(msg)
+    def _processEscrowOutOfOrder(self, ekey, edig):
+        """
+        Process one out of order escrow entry
 
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutOOE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        msg = f"OOO Stale event escrow at dig = {bytes(edig)}"
-                        logger.trace("Kevery unescrow error: %s", msg)
-                        raise ValidationError(msg)
+        Parameters:
+            ekey (bytes): snKey of escrowed event
+            edig (bytes): said of escrowed event
+        """
+        try:
+            pre, sn = splitSnKey(ekey)  # get pre and sn from escrow item
+            dgkey = dgKey(pre, bytes(edig))
+            if not (esr := self.db.esrs.get(keys=dgkey)):  # get event source, otherwise error
+                # no local source so raise ValidationError which unescrows below
+                # no local source so raise ValidationError which unescrows below
+                msg = f"OOO Missing escrowed event source at dig = {bytes(edig)}"
+                logger.trace("Kevery unescrow error: %s", msg)
+                raise ValidationError(msg)
 
-                    # get the escrowed event using edig
-                    eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
-                    if eraw is None:
-                        # no event so raise ValidationError which unescrows below
-                        msg = f"OOO Missing escrowed event at dig = {bytes(edig)}"
-                        logger.trace("Kevery unescrow error: %s", msg)
-                        raise ValidationError(msg)
+            # check date if expired then remove escrow.
+            dtb = self.db.getDts(dgkey)
+            if dtb is None:  # othewise is a datetime as bytes
+                # no date time so raise ValidationError which unescrows below
+                msg = f"OOO Missing escrowed event datetime at dig = {bytes(edig)}"
+                logger.trace("Kevery unescrow error: %s", msg)
+                raise ValidationError(msg)
 
-                    eserder = serdering.SerderKERI(raw=bytes(eraw))  # escrowed event
+            # do date math here and discard if stale nowIso8601() bytes
+            dtnow = helping.nowUTC()
+            dte = helping.fromIso8601(bytes(dtb))
+            if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutOOE):
+                # escrow stale so raise ValidationError which unescrows below
+                msg = f"OOO Stale event escrow at dig = {bytes(edig)}"
+                logger.trace("Kevery unescrow error: %s", msg)
+                raise ValidationError(msg)
+            self.db.wakers["ooes"].date(ekey, edig, dte)
 
-                    #  get sigs and attach
-                    sigs = self.db.getSigs(dgKey(pre, bytes(edig)))
-                    if not sigs:  # otherwise its a list of sigs
-                        # no sigs so raise ValidationError which unescrows below
-                        msg = f"OOO Missing escrowed event sigs at dig = {bytes(edig)}"
-                        logger.trace("Kevery unescrow error: %s", msg)
-                        raise ValidationError(msg)
+            # get the escrowed event using edig
+            eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
+            if eraw is None:
+                # no event so raise ValidationError which unescrows below
+                msg = f"OOO Missing escrowed event at dig = {bytes(edig)}"
+                logger.trace("Kevery unescrow error: %s", msg)
+                raise ValidationError(msg)
 
-                    # process event
-                    sigers = [Siger(qb64b=bytes(sig)) for sig in sigs]
+            eserder = serdering.SerderKERI(raw=bytes(eraw))  # escrowed event
 
-                    #  get wigs
-                    wigs = self.db.getWigs(dgKey(pre, bytes(edig)))  # list of wigs
-                    wigers = [Siger(qb64b=bytes(wig)) for wig in wigs]
+            #  get sigs and attach
+            sigs = self.db.getSigs(dgKey(pre, bytes(edig)))
+            if not sigs:  # otherwise its a list of sigs
+                # no sigs so raise ValidationError which unescrows below
+                msg = f"OOO Missing escrowed event sigs at dig = {bytes(edig)}"
+                logger.trace("Kevery unescrow error: %s", msg)
+                raise ValidationError(msg)
 
-                    self.processEvent(serder=eserder, sigers=sigers, wigers=wigers, local=esr.local)
+            # process event
+            sigers = [Siger(qb64b=bytes(sig)) for sig in sigs]
 
-                    # If process does NOT validate event with sigs, becasue it is
-                    # still out of order then process will attempt to re-escrow
-                    # and then raise OutOfOrderError (subclass of ValidationError)
-                    # so we can distinquish between ValidationErrors that are
-                    # re-escrow vs non re-escrow. We want process to be idempotent
-                    # with respect to processing events that result in escrow items.
-                    # On re-escrow attempt by process, Ooe escrow is called by
-                    # Kevery.self.escrowOOEvent Which calls
-                    # self.db.addOoe(snKey(pre, sn), serder.digb)
-                    # which in turn will not enter dig as dup if one already exists.
-                    # So re-escrow attempt will not change the escrowed ooe db.
-                    # Non re-escrow ValidationError means some other issue so unescrow.
-                    # No error at all means processed successfully so also unescrow.
+            #  get wigs
+            wigs = self.db.getWigs(dgKey(pre, bytes(edig)))  # list of wigs
+            wigers = [Siger(qb64b=bytes(wig)) for wig in wigs]
 
-                except OutOfOrderError as ex:
-                    # still waiting on missing prior event to validate
-                    if logger.isEnabledFor(logging.TRACE):
-                        logger.trace("Kevery OOO escrow unescrow failed: %s\n", ex.args[0])
-                        logger.exception("Kevery OOO escrow unescrow failed: %s\n", ex.args[0])
+            self.processEvent(serder=eserder, sigers=sigers, wigers=wigers, local=esr.local)
+
+            # If process does NOT validate event with sigs, becasue it is
+            # still out of order then process will attempt to re-escrow
+            # and then raise OutOfOrderError (subclass of ValidationError)
+            # so we can distinquish between ValidationErrors that are
+            # re-escrow vs non re-escrow. We want process to be idempotent
+            # with respect to processing events that result in escrow items.
+            # On re-escrow attempt by process, Ooe escrow is called by
+            # Kevery.self.escrowOOEvent Which calls
+            # self.db.addOoe(snKey(pre, sn), serder.digb)
+            # which in turn will not enter dig as dup if one already exists.
+            # So re-escrow attempt will not change the escrowed ooe db.
+            # Non re-escrow ValidationError means some other issue so unescrow.
+            # No error at all means processed successfully so also unescrow.
+
+        except OutOfOrderError as ex:
+            # still waiting on missing prior event to validate
+            if logger.isEnabledFor(logging.TRACE):
+                logger.trace("Kevery OOO escrow unescrow failed: %s\n", ex.args[0])
+                logger.exception("Kevery OOO escrow unescrow failed: %s\n", ex.args[0])
 
-                except Exception as ex:  # log diagnostics errors etc
-                    # error other than out of order so remove from OO escrow
-                    self.db.delOoe(snKey(pre, sn), edig)  # removes one escrow at key val
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.debug("Kevery: OOO escrow other error on escrow: %s\n", ex.args[0])
-                        logger.exception("Kevery: OOO escrow other error on : %s\n", ex.args[0])
+        except Exception as ex:  # log diagnostics errors etc
+            # error other than out of order so remove from OO escrow
+            self.db.delOoe(snKey(pre, sn), edig)  # removes one escrow at key val
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Kevery: OOO escrow other error on escrow: %s\n", ex.args[0])
+                logger.exception("Kevery: OOO escrow other error on : %s\n", ex.args[0])
 
-                else:  # unescrow succeeded, remove from escrow
-                    # We don't remove all escrows at pre,sn because some might be
-                    # duplicitous so we process remaining escrows in spite of found
-                    # valid event escrow.
-                    self.db.delOoe(snKey(pre, sn), edig)  # removes one escrow at key val
-                    logger.info("Kevery OOO unescrow succeeded in valid event: "
-                                "event=%s", eserder.said)
-                    logger.debug("Event=\n%s\n", eserder.pretty())
+        else:  # unescrow succeeded, remove from escrow
+            # We don't remove all escrows at pre,sn because some might be
+            # duplicitous so we process remaining escrows in spite of found
+            # valid event escrow.
+            self.db.delOoe(snKey(pre, sn), edig)  # removes one escrow at key val
+            logger.info("Kevery OOO unescrow succeeded in valid event: "
+                        "event=%s", eserder.said)
+            logger.debug("Event=\n%s\n", eserder.pretty())
 
-            if ekey == key:  # still same so no escrows found on last while iteration
-                break
-            key = ekey  # setup next while iteration, with key after ekey
+
+    def satisfiable(self, serder, sigers):
+        """
+        Returns False when the signature indices of escrowed sigers can not
+        satisfy the signing threshold of partially signed escrowed serder so
+        that escrow processing may skip reprocessing it. Returns True otherwise
+        including whenever the applicable threshold is not certain, such as for
+        out of order or recovery events, so those are fully reprocessed.
+
+        Escrowed sigers were verified when escrowed so the threshold is
+        evaluated over their indices without verifying them again.
+
+        Parameters:
+            serder (SerderKERI): partially signed escrowed event
+            sigers (list): of Siger instances escrowed with serder
+        """
+        kever = self.kevers.get(serder.pre)
+        if serder.ilk in (Ilks.icp, Ilks.dip):
+            if kever is not None:  # duplicate so let processEvent decide
+                return True
+            tholder = serder.tholder
+        elif kever is not None and serder.sn == kever.sn + 1:
+            tholder = serder.tholder if serder.ilk in (Ilks.rot, Ilks.drt) else kever.tholder
+        else:
+            return True
+
+        if tholder is None:
+            return True
+        return tholder.satisfy(indices=[siger.index for siger in sigers])
 
 
     def processEscrowPartialSigs(self):
@@ -5827,6 +6032,12 @@ class Kevery:
 
                 # process event
                 sigers = [Siger(qb64b=bytes(sig)) for sig in sigs]
+                if not self.satisfiable(serder=eserder, sigers=sigers):
+                    # escrowed sigs still short of threshold so processEvent
+                    # would only verify them all again and reescrow
+                    raise MissingSignatureError(f"PSE unsatisfied sith for evt"
+                                                f" = {eserder.said}")
+
                 wigers = [Siger(qb64b=bytes(wig)) for wig in wigs]
                 self.processEvent(serder=eserder, sigers=sigers, wigers=wigers,
                                   delseqner=delseqner, delsaider=delsaider,
@@ -6355,7 +6566,8 @@ class Kevery:
                 sn is int sequence number of receipted event
 
         Steps:
-            Each pass  (walk index table)
+            Each pass  (walk index table entries woken or due in .db.wakers["ures"]
+                        or whole index table on first pass)
                 For each prefix,sn
                     For each escrow item dup at prefix,sn:
                         Get Event
@@ -6364,116 +6576,122 @@ class Kevery:
                         If successful then remove from escrow table
         """
 
-        ims = bytearray()
-        key = ekey = b''  # both start same. when not same means escrows found
-        while True:  # break when done
-            for ekey, etriplet in self.db.getUreItemIter(key=key):
-                try:
-                    pre, sn = splitSnKey(ekey)  # get pre and sn from escrow item
-                    rsaider, sprefixer, cigar = deReceiptTriple(etriplet)
-                    cigar.verfer = Verfer(qb64b=sprefixer.qb64b)
+        self._processEscrowWoken(waker=self.db.wakers["ures"],
+                                 itemize=self.db.getUreItemIter,
+                                 process=self._processEscrowUnverNonTrans,
+                                 timeout=self.TimeoutURE)
 
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgKey(pre, bytes(rsaider.qb64b)))
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        msg = f"URE Missing escrowed event datetime at dig = {rsaider.qb64b}"
-                        logger.trace("Kevery unescrow error: %s", msg)
-                        raise ValidationError(msg)
+    def _processEscrowUnverNonTrans(self, ekey, etriplet):
+        """
+        Process one unverified nontrans receipt escrow entry
 
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutURE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        msg = f"URE Stale event escrow at dig = {rsaider.qb64b}"
-                        logger.trace("Kevery unescrow error: %s", msg)
-                        raise ValidationError(msg)
+        Parameters:
+            ekey (bytes): snKey of receipted event
+            etriplet (bytes): escrowed receipt triple edig+rpre+cig
+        """
+        try:
+            pre, sn = splitSnKey(ekey)  # get pre and sn from escrow item
+            rsaider, sprefixer, cigar = deReceiptTriple(etriplet)
+            cigar.verfer = Verfer(qb64b=sprefixer.qb64b)
+
+            # check date if expired then remove escrow.
+            dtb = self.db.getDts(dgKey(pre, bytes(rsaider.qb64b)))
+            if dtb is None:  # othewise is a datetime as bytes
+                # no date time so raise ValidationError which unescrows below
+                msg = f"URE Missing escrowed event datetime at dig = {rsaider.qb64b}"
+                logger.trace("Kevery unescrow error: %s", msg)
+                raise ValidationError(msg)
 
-                    # Is receipt for unverified witnessed event in .Pwes escrow
-                    # if found then try else clause will remove from escrow
-                    found = self._processEscrowFindUnver(pre=pre,
-                                                         sn=sn,
-                                                         rsaider=rsaider,
-                                                         cigar=cigar)
-
-                    if not found:  # no partial witness escrow of event found
-                        # so process as escrow of receipt for accept event
-                        # not two stage witnessed event escrow
-                        # get dig of receipted accepted event in kel using lastEvt
-                        # at pre and sn
-
-                        dig = self.db.getKeLast(snKey(pre, sn))
-                        if dig is None:  # no receipted event so keep in escrow
-                            msg = f"URE Missing receipted evt at pre={pre} sn={sn:x}"
-                            logger.trace("Kevery unescrow error: %s", msg)
-                            raise UnverifiedReceiptError(msg)
-
-                        # get receipted event using pre and edig
-                        raw = self.db.getEvt(dgKey(pre, dig))
-                        if raw is None:  # receipted event superseded so remove from escrow
-                            msg = f"URE Invalid receipted event reference at pre={pre} sn={sn:x}"
-                            logger.trace("Kevery unescrow error: %s", msg)
-                            raise ValidationError(msg)
-
-                        serder = serdering.SerderKERI(raw=bytes(raw))  # receipted event
-
-                        #  compare digs
-                        if rsaider.qb64b != serder.saidb:
-                            msg = f"URE Bad escrowed receipt dig at pre={pre} sn={sn:x} receipter={sprefixer.qb64}"
-                            logger.trace("Kevery unescrow error: %s", msg)
-                            raise ValidationError(msg)
-
-                        #  verify sig verfer key is prefixer from triple
-                        if not cigar.verfer.verify(cigar.raw, serder.raw):
-                            # no sigs so raise ValidationError which unescrows below
-                            msg = f"URE Bad escrowed receipt sig at pre={pre} sn={sn:x} receipter={sprefixer.qb64}"
-                            logger.trace("Kevery unescrow error: %s", msg)
-                            raise ValidationError(msg)
-
-                        # get current wits from kever state assuming not stale
-                        # receipt. Need function here to compute wits for actual
-                        # state at pre, sn. XXXX
-                        wits = self.kevers[serder.pre].wits
-                        rpre = cigar.verfer.qb64  # prefix of receiptor
-                        if rpre in wits:  # its a witness receipt
-                            # this only works for extra receipts that come in later
-                            # after event is out of .Pwes escrow
-                            index = wits.index(rpre)
-                            # create witness indexed signature and write to db
-                            wiger = Siger(raw=cigar.raw, index=index, verfer=cigar.verfer)
-                            self.db.addWig(key=dgKey(pre, serder.said), val=wiger.qb64b)
-                        else:  # write receipt couple to database
-                            couple = cigar.verfer.qb64b + cigar.qb64b
-                            self.db.addRct(key=dgKey(pre, serder.said), val=couple)
-
-
-                except UnverifiedReceiptError as ex:
-                    # still waiting on missing prior event to validate
-                    # only happens if we process above
-                    if logger.isEnabledFor(logging.TRACE):  # adds exception data
-                        logger.trace("Kevery: UNT other error on unescrow: %s\n", ex.args[0])
-                        logger.exception("Kevery: UNT other error on unescrow: %s\n", ex.args[0])
+            # do date math here and discard if stale nowIso8601() bytes
+            dtnow = helping.nowUTC()
+            dte = helping.fromIso8601(bytes(dtb))
+            if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutURE):
+                # escrow stale so raise ValidationError which unescrows below
+                msg = f"URE Stale event escrow at dig = {rsaider.qb64b}"
+                logger.trace("Kevery unescrow error: %s", msg)
+                raise ValidationError(msg)
+            self.db.wakers["ures"].date(ekey, etriplet, dte)
+
+            # Is receipt for unverified witnessed event in .Pwes escrow
+            # if found then try else clause will remove from escrow
+            found = self._processEscrowFindUnver(pre=pre,
+                                                 sn=sn,
+                                                 rsaider=rsaider,
+                                                 cigar=cigar)
+
+            if not found:  # no partial witness escrow of event found
+                # so process as escrow of receipt for accept event
+                # not two stage witnessed event escrow
+                # get dig of receipted accepted event in kel using lastEvt
+                # at pre and sn
+
+                dig = self.db.getKeLast(snKey(pre, sn))
+                if dig is None:  # no receipted event so keep in escrow
+                    msg = f"URE Missing receipted evt at pre={pre} sn={sn:x}"
+                    logger.trace("Kevery unescrow error: %s", msg)
+                    raise UnverifiedReceiptError(msg)
 
-                except Exception as ex:  # log diagnostics errors etc
-                    # error other than out of order so remove from OO escrow
-                    self.db.delUre(snKey(pre, sn), etriplet)  # removes one escrow at key val
-                    if logger.isEnabledFor(logging.DEBUG):  # adds exception data
-                        logger.exception("Kevery URE unescrowed: %s", ex.args[0])
-                    else:
-                        logger.error("Kevery URE unescrowed: %s", ex.args[0])
+                # get receipted event using pre and edig
+                raw = self.db.getEvt(dgKey(pre, dig))
+                if raw is None:  # receipted event superseded so remove from escrow
+                    msg = f"URE Invalid receipted event reference at pre={pre} sn={sn:x}"
+                    logger.trace("Kevery unescrow error: %s", msg)
+                    raise ValidationError(msg)
 
-                else:  # unescrow succeeded, remove from escrow
-                    # We don't remove all escrows at pre,sn because some might be
-                    # duplicitous so we process remaining escrows in spite of found
-                    # valid event escrow.
-                    self.db.delUre(snKey(pre, sn), etriplet)  # removes one escrow at key val
-                    logger.info("Kevery URE unescrow succeeded for event pre=%s "
-                                "sn=%s", pre, sn)
+                serder = serdering.SerderKERI(raw=bytes(raw))  # receipted event
 
-            if ekey == key:  # still same so no escrows found on last while iteration
-                break
-            key = ekey  # setup next while iteration, with key after ekey
+                #  compare digs
+                if rsaider.qb64b != serder.saidb:
+                    msg = f"URE Bad escrowed receipt dig at pre={pre} sn={sn:x} receipter={sprefixer.qb64}"
+                    logger.trace("Kevery unescrow error: %s", msg)
+                    raise ValidationError(msg)
+
+                #  verify sig verfer key is prefixer from triple
+                if not cigar.verfer.verify(cigar.raw, serder.raw):
+                    # no sigs so raise ValidationError which unescrows below
+                    msg = f"URE Bad escrowed receipt sig at pre={pre} sn={sn:x} receipter={sprefixer.qb64}"
+                    logger.trace("Kevery unescrow error: %s", msg)
+                    raise ValidationError(msg)
+
+                # get current wits from kever state assuming not stale
+                # receipt. Need function here to compute wits for actual
+                # state at pre, sn. XXXX
+                wits = self.kevers[serder.pre].wits
+                rpre = cigar.verfer.qb64  # prefix of receiptor
+                if rpre in wits:  # its a witness receipt
+                    # this only works for extra receipts that come in later
+                    # after event is out of .Pwes escrow
+                    index = wits.index(rpre)
+                    # create witness indexed signature and write to db
+                    wiger = Siger(raw=cigar.raw, index=index, verfer=cigar.verfer)
+                    self.db.addWig(key=dgKey(pre, serder.said), val=wiger.qb64b)
+                else:  # write receipt couple to database
+                    couple = cigar.verfer.qb64b + cigar.qb64b
+                    self.db.addRct(key=dgKey(pre, serder.said), val=couple)
+
+
+        except UnverifiedReceiptError as ex:
+            # still waiting on missing prior event to validate
+            # only happens if we process above
+            if logger.isEnabledFor(logging.TRACE):  # adds exception data
+                logger.trace("Kevery: UNT other error on unescrow: %s\n", ex.args[0])
+                logger.exception("Kevery: UNT other error on unescrow: %s\n", ex.args[0])
+
+        except Exception as ex:  # log diagnostics errors etc
+            # error other than out of order so remove from OO escrow
+            self.db.delUre(snKey(pre, sn), etriplet)  # removes one escrow at key val
+            if logger.isEnabledFor(logging.DEBUG):  # adds exception data
+                logger.exception("Kevery URE unescrowed: %s", ex.args[0])
+            else:
+                logger.error("Kevery URE unescrowed: %s", ex.args[0])
+
+        else:  # unescrow succeeded, remove from escrow
+            # We don't remove all escrows at pre,sn because some might be
+            # duplicitous so we process remaining escrows in spite of found
+            # valid event escrow.
+            self.db.delUre(snKey(pre, sn), etriplet)  # removes one escrow at key val
+            logger.info("Kevery URE unescrow succeeded for event pre=%s "
+                        "sn=%s", pre, sn)
 
 
     def processEscrowDelegables(self):
@@ -27,6 +27,11 @@ from ..help import helping
 from ..help.helping import (sceil, intToB64, b64ToInt,
                             codeB64ToB2, codeB2ToB64, nabSextets)
 
+try:  # optional compiled codec, see _cesr.c, else pure python
+    from . import _cesr
+except ImportError:
+    _cesr = None
+
 
 @dataclass(frozen=True)
 class IndexerCodex:
@@ -127,6 +132,7 @@ class IndexedCurrentSigCodex:
         return iter(astuple(self))
 
 IdxCrtSigDex = IndexedCurrentSigCodex()  # Make instance
+IdxCrtSigCodes = frozenset(IdxCrtSigDex)  # hashed for compiled codec lookup
 
 
 
@@ -420,6 +426,10 @@ class Indexer:
         index = self.index  # main index value
         ondex = self.ondex  # other index value
         raw = self.raw  # bytes or bytearray
+        if _cesr is not None:  # None when not well formed so raise below
+            full = _cesr.indexerInfil(code, index, ondex, raw, self.Sizes[code])
+            if full is not None:
+                return full
 
         ps = (3 - (len(raw) % 3)) % 3  # if lead then same pad size chars & lead size bytes
         hs, ss, os, fs, ls = self.Sizes[code]
@@ -535,7 +545,15 @@ class Indexer:
         if not qb64b:  # empty need more bytes
             raise ShortageError("Empty material.")
 
+        if _cesr is not None:  # None when not well formed so raise below
+            parts = _cesr.indexerExfil(qb64b, self.Hards, self.Sizes, IdxCrtSigCodes)
+            if parts is not None:
+                self._code, self._index, self._ondex, self._raw = parts
+                return
+
         first = qb64b[:1]  # extract first char code selector
+        if isinstance(first, memoryview):
+            first = bytes(first)
         if hasattr(first, "decode"):
             first = first.decode("utf-8")
         if first not in self.Hards:
@@ -553,6 +571,8 @@ class Indexer:
             raise ShortageError(f"Need {hs - len(qb64b)} more characters.")
 
         hard = qb64b[:hs]  # get hard code
+        if isinstance(hard, memoryview):
+            hard = bytes(hard)
         if hasattr(hard, "decode"):
             hard = hard.decode("utf-8")
         if hard not in self.Sizes:
@@ -570,11 +590,15 @@ class Indexer:
             raise ShortageError(f"Need {cs - len(qb64b)} more characters.")
 
         index = qb64b[hs:hs+ms]  # extract index/size chars
+        if isinstance(index, memoryview):
+            index = bytes(index)
         if hasattr(index, "decode"):
             index = index.decode("utf-8")
         index = b64ToInt(index)  # compute int index
 
         ondex = qb64b[hs+ms:hs+ms+os]  # extract ondex chars
+        if isinstance(ondex, memoryview):
+            ondex = bytes(ondex)
         if hasattr(ondex, "decode"):
             ondex = ondex.decode("utf-8")
 
@@ -601,6 +625,8 @@ class Indexer:
             raise ShortageError(f"Need {fs - len(qb64b)} more chars.")
 
         qb64b = qb64b[:fs]  # fully qualified primitive code plus material
+        if isinstance(qb64b, memoryview):
+            qb64b = bytes(qb64b)
         if hasattr(qb64b, "encode"):  # only convert extracted chars from stream
             qb64b = qb64b.encode("utf-8")
 
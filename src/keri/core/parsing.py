@@ -5,9 +5,11 @@ keri.core.parsing module
 message stream parsing support
 """
 import copy
+import functools
 import logging
 from dataclasses import asdict
-from collections import deque
+from collections import deque, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from base64 import urlsafe_b64decode as decodeB64
 from base64 import urlsafe_b64encode as encodeB64
 
@@ -53,6 +55,9 @@ class Parser:
         vry (Verfifier): credential verifier with wallet storage
         local (bool): True means event source is local (protected) for validation
                          False means event source is remote (unprotected) for validation
+        pipeliner (Pipeliner | None): pipelined mode when not None. Pure crypto
+            checks are fanned out to its worker processes while messages
+            are dispatched in stream order on this thread.
 
     Properties:
         genus (str): genus portion of default CESR code table protocol genus code
@@ -143,7 +148,7 @@ class Parser:
 
     def __init__(self, ims=None, framed=True, piped=False, kvy=None,
                  tvy=None, exc=None, rvy=None, vry=None, local=False,
-                 version=Vrsn_2_0):
+                 version=Vrsn_2_0, pipeliner=None):
         """
         Initialize instance:
 
@@ -162,6 +167,8 @@ class Parser:
                          False means event source is remote (unprotected) for validation
             version (Versionage): instance of version portion of genus version code
                                   for default code table
+            pipeliner (Pipeliner | None): pipelined mode when not None.
+                None means verify and dispatch each message inline.
         """
         self.ims = ims if ims is not None else bytearray()
         self.framed = True if framed else False  # extract until end-of-stream
@@ -172,6 +179,7 @@ class Parser:
         self.rvy = rvy
         self.vry = vry
         self.local = True if local else False
+        self.pipeliner = pipeliner
 
         self._genus = GenDex.KERI  # only supports KERI
         self.version = version  # provided version may be earlier than supported version
@@ -489,6 +497,9 @@ class Parser:
                     logger.error("Parser msg non-extraction error: %s", ex)
             yield
 
+        if self.pipeliner is not None:  # ims exhausted so dispatch all in flight
+            self.pipeliner.flush()
+
         return True
 
 
@@ -575,6 +586,9 @@ class Parser:
             finally:
                 done = True
 
+        if self.pipeliner is not None:  # dispatch the one message
+            self.pipeliner.flush()
+
         return done
 
 
@@ -672,6 +686,9 @@ class Parser:
                     logger.exception("Parser msg non-extraction error: %s", ex.args[0])
                 if logger.isEnabledFor(logging.DEBUG):
                     logger.error("Parser msg non-extraction error: %s", ex.args[0])
+
+            if self.pipeliner is not None and not ims:  # dispatch all in flight
+                self.pipeliner.flush()
             yield
 
         return True  # should never return
@@ -888,7 +905,7 @@ class Parser:
                     ptds=[], essrs=[], bsqs=[], bsss=[], tmqs=[], local=local)
 
         serdery = serdering.Serdery(version=kering.Version)
-
+        deferred = False  # True means said(s) verified later by .pipeliner
 
         try:
             while not ims and not framed:
@@ -1029,11 +1046,14 @@ class Parser:
                                                 f" got code={ctr.code}")
 
             else:   # Otherwise its JSON, CBOR, or MGPK message at top level
+                # pipeliner workers verify said(s) so do not verify here
+                deferred = self.pipeliner is not None
                 while True:  # extract, deserialize, and strip message from ims
                     try:
                         serder = serdery.reap(ims=ims,
                                               genus=self.genus,
-                                              svrsn=self.version)
+                                              svrsn=self.version,
+                                              verify=not deferred)
                     except kering.ShortageError as ex:  # need more bytes
                         if framed:  # pre-extracted
                             raise  # incomplete frame or group so abort by raising error
@@ -1149,6 +1169,42 @@ class Parser:
             while verstack:  # restore version to what it was
                 self.version = verstack.pop()
 
+        if self.pipeliner is not None:  # pipelined so dispatch in order later
+            self.pipeliner.push(exts=exts, kvy=kvy, deferred=deferred,
+                                dispatcher=functools.partial(self.dispatch,
+                                                           exts=exts,
+                                                           kvy=kvy,
+                                                           tvy=tvy,
+                                                           exc=exc,
+                                                           rvy=rvy,
+                                                           vry=vry))
+        else:
+            self.dispatch(exts=exts, kvy=kvy, tvy=tvy, exc=exc, rvy=rvy, vry=vry)
+
+        return True  # done state
+
+    def dispatch(self, exts, kvy=None, tvy=None, exc=None, rvy=None, vry=None,
+                 verifieds=None):
+        """Dispatches processing of extracted message with its attachments
+        to the processor for its message type.
+
+        Parameters:
+            exts (dict): extracted message serder and attachments as built by
+                .msgParsator
+            kvy (Kevery): route KERI KEL message types to this instance
+            tvy (Tevery): route TEL message types to this instance
+            exc (Exchanger): route EXN message types to this instance
+            rvy (Revery): reply (RPY) message handler
+            vry (Verifier): ACDC credential processor
+            verifieds (frozenset | None): of (code, key, sig, ser) quadruples of
+                signatures already verified by .pipeliner. Passed on to the
+                processor as verifieds so it does not verify them again.
+
+        """
+        serder = exts['serder']
+        if verifieds:
+            exts['verifieds'] = verifieds
+
         if isinstance(serder, serdering.SerderKERI):
             ilk = serder.ilk  # dispatch abased on ilk
 
@@ -1301,7 +1357,8 @@ class Parser:
             raise kering.ValidationError(f"Unexpected protocol type={serder.proto}"
                                          f" for event message={serder.pretty()}.")
 
-        return True  # done state
+        return True
+
 
     # Group parse/extract methods for dispatch based on CESR version
     def _ControllerIdxSigs1(self, exts, ims, ctr, cold, abort):
@@ -2331,3 +2388,232 @@ class Parser:
             exts['tmqs'].extend(tmqs)
         except KeyError:
             exts['tmqs'] = tmqs
+
+
+def precheck(items):
+    """Returns list of (said, results) duples, one for each item in items, where
+    said is True when the said(s) of the message verify or were not deferred
+    and results is list of bool verification results, one for each signature
+    triple of the item.
+
+    Module level function so it may be pickled to the worker processes of a
+    Pipeliner process pool. Only pure crypto checks are performed here, no
+    database access.
+
+    Parameters:
+        items (list): of (proto, raw, triples) triples where:
+            proto (str | None): Protocols value of message when its said(s)
+                verification was deferred. None means already verified.
+            raw (bytes): serialized message
+            triples (list): of (code, key, sig) triples where code is verfer
+                code, key is raw public key and sig is raw signature on raw
+
+    """
+    prechecks = []
+    for proto, raw, triples in items:
+        said = True
+        if proto == kering.Protocols.keri:
+            said = serdering.SerderKERI(raw=raw, verify=False).verify()
+        elif proto == kering.Protocols.acdc:
+            said = serdering.SerderACDC(raw=raw, verify=False).verify()
+
+        results = [Verfer(raw=key, code=code).verify(sig, raw)
+                   for code, key, sig in triples]
+        prechecks.append((said, results))
+
+    return prechecks
+
+
+class Pipeliner:
+    """Pipeliner is the optional pipelined stage of a Parser. Said(s) of
+    extracted messages and their signatures verifiable without key state
+    from the database are checked by a pool of worker processes. Messages are
+    then dispatched in stream order on the parser's thread so that all state
+    changes such as those in Kevery.processEvent are applied in order.
+
+    Verified signatures are given to the dispatch of their message as
+    verifieds so the event and receipt handlers do not verify them again.
+    Signatures with keys given by the message itself (icp, rot, dip, drt and
+    witnesses of icp, dip) or by the latest key state of the AID
+    (ixn) as well as non-transferable receipt couples are prechecked. Latest
+    key state is speculative, when it turns out stale the signature is just
+    verified again on dispatch. Only the latest key state of the .limit most
+    recently seen AIDs is kept.
+
+    Attributes:
+        workers (int): number of worker processes
+        size (int): number of messages per worker task
+        window (int): max number of messages in flight before pushing blocks
+        limit (int): max number of AIDs in .keys
+        executor (ProcessPoolExecutor): worker process pool
+        keys (OrderedDict): latest establishment event verfers seen in stream
+            keyed by AID qb64, least recently seen first
+        pending (list): of pushed entries not yet submitted to .executor
+        flights (deque): of (future, entries) duples submitted in stream order
+        count (int): number of messages dispatched
+
+    """
+
+    Limit = 4096  # default max number of AIDs in .keys
+
+    def __init__(self, workers=4, size=64, window=None, limit=None,
+                 executor=None):
+        """Initialize instance
+
+        Parameters:
+            workers (int): number of worker processes
+            size (int): number of messages per worker task
+            window (int | None): max number of messages in flight.
+                None means 4 tasks per worker
+            limit (int | None): max number of AIDs in .keys.
+                None means .Limit
+            executor (ProcessPoolExecutor | None): worker process pool
+                None means create one with workers processes
+
+        """
+        self.workers = workers
+        self.size = max(1, size)
+        self.window = window if window is not None else 4 * workers * self.size
+        self.limit = max(1, limit if limit is not None else self.Limit)
+        self.executor = (executor if executor is not None
+                         else ProcessPoolExecutor(max_workers=workers))
+        self.keys = OrderedDict()
+        self.pending = []
+        self.flights = deque()
+        self.count = 0
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+    @property
+    def inflight(self):
+        """Returns number of messages pushed but not yet dispatched"""
+        return len(self.pending) + sum(len(entries) for _, entries in self.flights)
+
+
+    def push(self, exts, dispatcher, kvy=None, deferred=False):
+        """Queue extracted message for prechecks and later in order dispatch
+
+        Parameters:
+            exts (dict): extracted message serder and attachments
+            dispatcher (Callable): no argument callable that dispatches message
+            kvy (Kevery | None): source of speculative latest key state
+            deferred (bool): True means said(s) of serder not yet verified
+
+        """
+        serder = exts['serder']
+        raw = bytes(serder.raw)
+        verfers = []  # (verfer, sig) to precheck
+
+        for cigar in exts['cigars']:
+            verfers.append((cigar.verfer, cigar.raw))
+
+        if isinstance(serder, serdering.SerderKERI):
+            if serder.ilk in (Ilks.icp, Ilks.rot, Ilks.dip, Ilks.drt):
+                keys = serder.verfers
+                self.keys[serder.pre] = keys
+                self.keys.move_to_end(serder.pre)
+                if len(self.keys) > self.limit:
+                    self.keys.popitem(last=False)
+                if serder.ilk in (Ilks.icp, Ilks.dip):
+                    wits = serder.berfers or []
+                    for wiger in exts['wigers']:
+                        if wiger.index < len(wits):
+                            verfers.append((wits[wiger.index], wiger.raw))
+            elif serder.ilk == Ilks.ixn:
+                keys = self.keys.get(serder.pre)
+                if keys is not None:
+                    self.keys.move_to_end(serder.pre)
+                elif kvy is not None and serder.pre in kvy.kevers:
+                    keys = kvy.kevers[serder.pre].verfers
+            else:
+                keys = None
+
+            if keys:
+                for siger in exts['sigers']:
+                    if siger.index < len(keys):
+                        verfers.append((keys[siger.index], siger.raw))
+
+        triples = [(verfer.code, verfer.raw, bytes(sig)) for verfer, sig in verfers]
+        proto = serder.proto if deferred else None
+        self.pending.append((dispatcher, raw, proto, triples))
+
+        if len(self.pending) >= self.size:
+            self.submit()
+
+        self.drain()
+        while self.inflight > self.window:  # backpressure
+            self.drain(block=True, limit=1)
+
+
+    def submit(self):
+        """Submit pending entries as one task to worker processes"""
+        if not self.pending:
+            return
+        entries = self.pending
+        self.pending = []
+        items = [(proto, raw, triples) for _, raw, proto, triples in entries]
+        self.flights.append((self.executor.submit(precheck, items), entries))
+
+
+    def drain(self, block=False, limit=None):
+        """Dispatch in stream order messages whose prechecks are complete
+
+        Parameters:
+            block (bool): True means wait for prechecks of tasks in flight
+                False means only dispatch tasks already complete
+            limit (int | None): max number of tasks to dispatch.
+                None means no limit
+        """
+        while self.flights and (block or self.flights[0][0].done()):
+            if limit is not None:
+                if limit <= 0:
+                    break
+                limit -= 1
+
+            future, entries = self.flights.popleft()
+            for (dispatcher, raw, proto, triples), (said, results) in zip(entries,
+                                                                        future.result()):
+                self.dispatch(dispatcher, raw, triples, said, results)
+
+
+    def dispatch(self, dispatcher, raw, triples, said, results):
+        """Dispatch one message with its verified signatures as verifieds
+
+        Errors are logged and not raised, as the parser does for
+        non-extraction errors, so remaining messages still get dispatched.
+        """
+        self.count += 1
+        if not said:
+            logger.error("Parser pipeline error: invalid said for msg=%s",
+                         raw[:64])
+            return
+
+        verifieds = frozenset((code, key, sig, raw)
+                              for (code, key, sig), result in zip(triples, results)
+                              if result)
+        try:
+            dispatcher(verifieds=verifieds)
+        except Exception as ex:  # non extraction error so log and resume
+            if logger.isEnabledFor(logging.TRACE):
+                logger.exception("Parser pipeline non-extraction error: %s", ex)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.error("Parser pipeline non-extraction error: %s", ex)
+
+
+    def flush(self):
+        """Submit all pending and dispatch all messages in flight"""
+        self.submit()
+        self.drain(block=True)
+
+
+    def close(self):
+        """Dispatch all messages in flight then shutdown worker processes"""
+        self.flush()
+        self.executor.shutdown()
@@ -6,6 +6,7 @@ keri.core.routing module
 import datetime
 import logging
 import re
+from collections import OrderedDict
 
 from hio.help import decking
 
@@ -23,18 +24,31 @@ class Router:
     Reply message router that accepts registration of route `r` handlers and dispatches
     reply messages to the appropriate handler.
 
+    Registered route templates are compiled into a segment trie so that finding the handler for a
+    reply route walks one trie level per route segment instead of matching the regex of every
+    registered route.  Resolved routes are kept in a least recently used cache.
+
     """
 
     defaultResourceFunc = "processReply"
+    CacheSize = 1024  # maximum number of resolved routes to cache
 
-    def __init__(self, routes=None):
+    def __init__(self, routes=None, size=None):
         """ Initialized instance with optiona list of existing routes
 
         Parameters:
             routes (list): preregistered routes for this router
+            size (int): maximum number of resolved routes to cache
 
         """
         self.routes = routes if routes is not None else list()
+        self.size = size if size is not None else self.CacheSize
+        self.trie = Trie()
+        self.cache = OrderedDict()
+        for route in self.routes:
+            if route.template is None:
+                raise ValueError("preregistered route missing its route template")
+            self.trie.insert(route.template, route)
 
     def addRoute(self, routeTemplate, resource, suffix=None):
         """ Add a route between a route template and a resource
@@ -50,7 +64,10 @@ class Router:
         """
 
         fields, regex = compile_uri_template(routeTemplate)
-        self.routes.append(Route(regex=regex, fields=fields, resource=resource, suffix=suffix))
+        route = Route(regex=regex, fields=fields, resource=resource, suffix=suffix, template=routeTemplate)
+        self.routes.append(route)
+        self.trie.insert(routeTemplate, route)
+        self.cache.clear()
 
     def dispatch(self, serder, saider, cigars, tsgs):
         """
@@ -67,7 +84,7 @@ class Router:
         ked = serder.ked
         # Dispatch based on route
         r = ked["r"]
-        route, match = self._find(route=r)
+        route, kwargs = self._find(route=r)
         if route is None:
             raise kering.ValidationError(f"No resource is registered to handle route {r}")
 
@@ -75,7 +92,6 @@ class Router:
         if route.suffix is not None:
             fname += route.suffix
 
-        kwargs = match.groupdict()
         for name in route.fields:
             if name not in kwargs:
                 raise kering.ValidationError(f"parameter {name} not found in route {r}")
@@ -84,24 +100,34 @@ class Router:
         fn(serder=serder, saider=saider, route=r, cigars=cigars, tsgs=tsgs, **kwargs)
 
     def _find(self, route):
-        """ Linear seach thru added routes, returning the first one that matchs
+        """ Trie search thru added routes, returning the first registered one that matches
 
-        Searches through the registered routes until a regex in one of the routes matches
-        the provided route and returns the Route object along with the re.Match object.
+        Looks up the provided route in the resolved route cache and otherwise walks the route trie.
+        When more than one registered template matches, the earliest registered one is returned
+        just as a linear search in registration order would.
 
         Parameters:
             route (str): the route from the `r` of the reply message
 
         Returns:
             Route: the Route object with the resource that is registered to process this rpy message
-            re.Match:  the regular expression match that contains the grouping of matched parameters.
+            dict:  the parameters captured from the route keyed by field name
 
         """
-        for r in self.routes:
-            if res := r.regex.search(route):
-                return r, res
+        if not isinstance(route, str):
+            return None, None
+
+        if (found := self.cache.get(route)) is not None:
+            self.cache.move_to_end(route)
+        else:
+            found = self.trie.search(route.split("/")) or (None, None, None)
+            found = found[1:]
+            self.cache[route] = found
+            if len(self.cache) > self.size:
+                self.cache.popitem(last=False)
 
-        return None, None
+        route, params = found
+        return route, (dict(params) if params is not None else None)
 
     def processRouteNotFound(self, *, serder, saider, route,
                              cigars=None, tsgs=None, **kwargs):
@@ -413,13 +439,14 @@ class Revery:
 
         """
         keys = (saider.qb64,)
-        self.db.sdts.put(keys=keys, val=dater)  # first one idempotent
-        self.db.rpys.put(keys=keys, val=serder)  # first one idempotent
-        if cigar:
-            self.db.scgs.put(keys=keys, vals=[(cigar.verfer, cigar)])
-        if sigers:  # want sn in numerical order so use hex
-            quadkeys = (saider.qb64, prefixer.qb64, f"{seqner.sn:032x}", diger.qb64)
-            self.db.ssgs.put(keys=quadkeys, vals=sigers)
+        with self.db.savepoint():  # update reply in one commit
+            self.db.sdts.put(keys=keys, val=dater)  # first one idempotent
+            self.db.rpys.put(keys=keys, val=serder)  # first one idempotent
+            if cigar:
+                self.db.scgs.put(keys=keys, vals=[(cigar.verfer, cigar)])
+            if sigers:  # want sn in numerical order so use hex
+                quadkeys = (saider.qb64, prefixer.qb64, f"{seqner.sn:032x}", diger.qb64)
+                self.db.ssgs.put(keys=quadkeys, vals=sigers)
 
     def removeReply(self, saider):
         """ Remove Reply SAD artifacts given by saider.
@@ -431,10 +458,11 @@ class Revery:
         if saider:
             keys = (saider.qb64,)
 
-            self.db.ssgs.trim(keys=(saider.qb64, ""))  # remove whole branch
-            self.db.scgs.rem(keys=keys)
-            self.db.rpys.rem(keys=keys)
-            self.db.sdts.rem(keys=keys)
+            with self.db.savepoint():  # remove reply in one commit
+                self.db.ssgs.trim(keys=(saider.qb64, ""))  # remove whole branch
+                self.db.scgs.rem(keys=keys)
+                self.db.rpys.rem(keys=keys)
+                self.db.sdts.rem(keys=keys)
 
     def escrowReply(self, *, serder, saider, dater, route, prefixer, seqner,
                     ssaider, sigers):
@@ -454,11 +482,12 @@ class Revery:
         if not sigers:
             return  # nothing to escrow
         keys = (saider.qb64,)
-        self.db.sdts.put(keys=keys, val=dater)  # first one idempotent
-        self.db.rpys.put(keys=keys, val=serder)  # first one idempotent
-        quadkeys = (saider.qb64, prefixer.qb64, f"{seqner.sn:032x}", ssaider.qb64)
-        self.db.ssgs.put(keys=quadkeys, vals=sigers)
-        self.db.rpes.put(keys=(route,), vals=[saider])
+        with self.db.savepoint():  # escrow reply in one commit
+            self.db.sdts.put(keys=keys, val=dater)  # first one idempotent
+            self.db.rpys.put(keys=keys, val=serder)  # first one idempotent
+            quadkeys = (saider.qb64, prefixer.qb64, f"{seqner.sn:032x}", ssaider.qb64)
+            self.db.ssgs.put(keys=quadkeys, vals=sigers)
+            self.db.rpes.put(keys=(route,), vals=[saider])
 
     def processEscrowReply(self):
         """ Process escrows for reply messages.
@@ -530,10 +559,11 @@ class Route:
         .fields(set): field names for matches in regex
         .resource(object): the handler for this route
         .suffix(Optional(str)): a suffix to be applied to the handler method
+        .template(Optional(str)): the route template the regex was compiled from
 
     """
 
-    def __init__(self, regex, fields, resource, suffix=None):
+    def __init__(self, regex, fields, resource, suffix=None, template=None):
         """ Initialize instance of route
 
         Parameters:
@@ -541,12 +571,124 @@ class Route:
             fields(set): field names for matches in regex
             resource(object): the handler for this route
             suffix(Optional(str)): a suffix to be applied to the handler method
+            template(Optional(str)): the route template the regex was compiled from
 
         """
         self.regex = regex
         self.fields = fields
         self.resource = resource
         self.suffix = suffix
+        self.template = template
+
+
+class Trie:
+    """ Segment trie of route templates for Router lookup
+
+    Each level of the trie matches one `/` separated segment of a route.  Literal segments are
+    matched case insensitively by dict lookup.  A segment that is entirely a `{field}` expression
+    captures any non empty segment and a segment mixing literals and field expressions is matched
+    by its own compiled segment regex, so the trie matches exactly what compile_uri_template does.
+
+    Attributes:
+        .literals(dict): child Trie keyed by lower cased literal segment
+        .dynamics(list): (segment template, field name, segment regex, child Trie) tuples for
+            segments with field expressions. Segment regex is None for whole segment fields.
+        .route(Optional(Route)): route registered for templates ending at this node
+        .order(int): registration order of .route
+
+    """
+
+    def __init__(self):
+        """ Initialize empty trie node """
+        self.literals = dict()
+        self.dynamics = list()
+        self.route = None
+        self.order = None
+        self.count = 0  # number of routes inserted, only maintained at the root
+
+    def insert(self, template, route):
+        """ Insert route at the node for the segments of template
+
+        Parameters:
+            template (str): route template as accepted by compile_uri_template
+            route (Route): route to register at template
+
+        """
+        if template != '/' and template.endswith('/'):
+            template = template[:-1]
+
+        node = self
+        for seg in template.split("/"):
+            if not re.search(FieldPattern, seg):
+                node = node.literals.setdefault(seg.lower(), Trie())
+                continue
+
+            for tmpl, _, _, child in node.dynamics:
+                if tmpl == seg:
+                    node = child
+                    break
+            else:
+                if (m := re.fullmatch(FieldPattern, seg)) is not None:
+                    name, regex = m.group(1), None
+                else:
+                    name, regex = None, re.compile(compile_segment(seg), re.IGNORECASE)
+                child = Trie()
+                node.dynamics.append((seg, name, regex, child))
+                node = child
+
+        if node.route is None:  # first registration of a template wins as in a linear search
+            node.route = route
+            node.order = self.count
+        self.count += 1
+
+    def search(self, segs, index=0):
+        """ Search for the earliest registered route matching route segments
+
+        Parameters:
+            segs (list): route split on `/`
+            index (int): index into segs of the segment to match at this node
+
+        Returns:
+            tuple: (order, Route, params) of the earliest registered match or None when no match
+
+        """
+        if index == len(segs):
+            return (self.order, self.route, dict()) if self.route is not None else None
+
+        seg = segs[index]
+        best = None
+        if (child := self.literals.get(seg.lower())) is not None:
+            best = child.search(segs, index + 1)
+
+        for _, name, regex, child in self.dynamics:
+            if regex is None:
+                if not seg:
+                    continue
+                params = {name: seg}
+            elif (m := regex.fullmatch(seg)) is not None:
+                params = m.groupdict()
+            else:
+                continue
+
+            if (found := child.search(segs, index + 1)) is not None and (best is None or found[0] < best[0]):
+                found[2].update(params)
+                best = found
+
+        return best
+
+
+FieldPattern = r'{([a-zA-Z]\w*)}'  # template field expression, names start with A-Za-z
+
+
+def compile_segment(segment):
+    """ Returns regex pattern string matching one route segment of a template
+
+    Parameters:
+        segment (str): one `/` separated segment of a route template
+
+    """
+    escaped = re.sub(r'[\.\(\)\[\]\?\*\+\^\|]', r'\\\g<0>', segment)
+    return re.sub(FieldPattern, r'(?P<\1>[^/]+)', escaped)
 
 
 def compile_uri_template(template):
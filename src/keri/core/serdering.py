@@ -138,6 +138,92 @@ class FieldDom:
 
 
 
+class SaidCache:
+    """SaidCache is a bounded least recently used cache of the digests of raw
+    serializations whose said(s) have been verified. Assign an instance to
+    Serder.Cache to opt in so that Serders constructed again from an identical
+    raw, such as on clone replay, escrow reprocessing, or Kever reload, skip
+    the said(s) reverification. One instance is shared by all Serder subclasses
+    since entries are keyed by subclass as well as raw digest.
+
+    Attributes:
+        size (int): maximum number of entries
+        hits (int): count of lookups found in cache
+        misses (int): count of lookups not found in cache
+
+    Properties:
+        ratio (float): hit ratio of lookups. 0.0 when no lookups
+
+    Hidden Attributes:
+        ._entries (dict): insertion ordered least recent first keyed by
+            (class name, Blake2b digest of raw) of verified raws
+    """
+
+    def __init__(self, size=65536):
+        """Init instance
+
+        Parameters:
+            size (int): maximum number of entries
+        """
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self._entries = dict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def ratio(self):
+        """ratio property getter
+        Returns:
+            ratio (float): hits over lookups
+        """
+        lookups = self.hits + self.misses
+        return (self.hits / lookups) if lookups else 0.0
+
+    @staticmethod
+    def key(serder):
+        """Returns cache key of serder (class name, digest of serder.raw)"""
+        return (serder.__class__.__name__,
+                hashlib.blake2b(serder.raw, digest_size=32).digest())
+
+    def verified(self, serder):
+        """Returns True if said(s) of raw of serder were verified by a prior
+        Serder of same class. Updates hit and miss counts.
+
+        Parameters:
+            serder (Serder): instance whose said(s) are to be verified
+        """
+        key = self.key(serder)
+        if key not in self._entries:
+            self.misses += 1
+            return False
+        self._entries[key] = self._entries.pop(key)  # reinsert as most recent
+        self.hits += 1
+        return True
+
+    def add(self, serder):
+        """Add serder whose said(s) were verified evicting the least recent
+        entry when full.
+
+        Parameters:
+            serder (Serder): instance whose said(s) were verified
+        """
+        key = self.key(serder)
+        self._entries.pop(key, None)
+        self._entries[key] = True
+        while len(self._entries) > self.size:
+            del self._entries[next(iter(self._entries))]
+
+    def clear(self):
+        """Remove all entries and reset counts"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+
 class Serdery:
     """Serder factory class for generating serder instances by protocol type
     from an incoming message stream.
@@ -156,7 +242,8 @@ class Serdery:
         self.version = version
 
 
-    def reap(self, ims, genus, svrsn, cold=None, ctr=None, size=None, fixed=True):
+    def reap(self, ims, genus, svrsn, cold=None, ctr=None, size=None, fixed=True,
+             verify=True):
         """Extract and return Serder subclass based on protocol type reaped from
         version string inside serialized raw of Serder.
 
@@ -184,6 +271,9 @@ class Serdery:
             fixed (bool): when CESR native message.
                                True means top-level fixed field
                                False means top-level field map
+            verify (bool): True means verify said(s) of reaped serder.
+                           False means caller verifies said(s) later such as
+                           in a parser pipeline worker process.
         """
         if ctr:  # parser sniffed and peekd so native and assigned ctr, size, fixed
             # parser already peeked to see .FixBodyGroup or .MapBodyGroup so
@@ -236,9 +326,9 @@ class Serdery:
 
 
         if smellage.proto == Protocols.keri:
-            return SerderKERI(raw=ims, strip=True, smellage=smellage)
+            return SerderKERI(raw=ims, strip=True, smellage=smellage, verify=verify)
         elif smellage.proto == Protocols.acdc:
-            return SerderACDC(raw=ims, strip=True, smellage=smellage)
+            return SerderACDC(raw=ims, strip=True, smellage=smellage, verify=verify)
         else:
             raise ProtocolError(f"Unsupported protocol type = {smellage.proto}.")
 
@@ -285,6 +375,8 @@ class Serder:
             named tuple (saids, reqs, alls) that governs field type and presence.
             None is default message type (ilk) when no ilk needed in a message.
             See below for detailed logic associated with Fields class attribute
+        Cache (SaidCache | None): opt in cache of verified raws shared by all
+            subclasses. None means always verify said(s) of raw.
 
     Properties:
         raw (bytes): of serialized event only
@@ -347,6 +439,7 @@ class Serder:
 
     """
     Dummy = "#"  # dummy spaceholder char for SAID. Must not be a valid Base64 char
+    Cache = None  # opt in SaidCache of verified raws shared by subclasses
 
     # Spans dict keyed by version (Versionage instance) of version string span (size)
     Spans = {Vrsn_1_0: VER1FULLSPAN, Vrsn_2_0: VER2FULLSPAN}
@@ -633,14 +726,16 @@ class Serder:
             except Exception as ex:
                 self._said = None  # no saidive field
 
-            if verify:  # verify fields including the said(s) provided in raw
-                try:
+            if verify and (self.Cache is None or not self.Cache.verified(self)):
+                try:  # verify fields including the said(s) provided in raw
                     self._verify()  # raises exception when not verify
                 except Exception as ex:
                     logger.error("Invalid raw for Serder %s\n%s",
                                  self.pretty(), ex.args[0])
                     raise ValidationError(f"Invalid raw for Serder = "
                                           f"{self._sad}. {ex.args[0]}") from ex
+                if self.Cache is not None:
+                    self.Cache.add(self)
 
         elif sad or makify:  # serialize sad into raw or make sad
             if makify:  # recompute properties and said(s) and reset sad
@@ -5,7 +5,8 @@ keri.core.signing module
 Provides support Signer class
 """
 from dataclasses import dataclass, astuple, asdict
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 import pysodium
 
@@ -412,20 +413,17 @@ class Salter(Matter):
 
         self.tier = tier if tier is not None else self.Tier
 
-    def stretch(self, *, size=32, path="", tier=None, temp=False):
+    @staticmethod
+    def limits(tier=None, temp=False):
         """
-        Returns (bytes): raw binary seed (secret) derived from path and .raw
-        and stretched to size given by code using argon2d stretching algorithm.
+        Returns tuple (opslimit, memlimit) of argon2id stretch parameters
+        where memlimit is the bytes of memory used by one stretch.
 
         Parameters:
-            size (int): number of bytes in stretched seed
-            path (str): unique chars used in derivation of seed (secret)
             tier (str): value from Tierage for security level of stretch
             temp is Boolean, True means use quick method to stretch salt
                     for testing only, Otherwise use time set by tier to stretch
         """
-        tier = tier if tier is not None else self.tier
-
         if temp:
             opslimit = 1  # pysodium.crypto_pwhash_OPSLIMIT_MIN
             memlimit = 8192  # pysodium.crypto_pwhash_MEMLIMIT_MIN
@@ -442,6 +440,23 @@ class Salter(Matter):
             else:
                 raise ValueError("Unsupported security tier = {}.".format(tier))
 
+        return (opslimit, memlimit)
+
+    def stretch(self, *, size=32, path="", tier=None, temp=False):
+        """
+        Returns (bytes): raw binary seed (secret) derived from path and .raw
+        and stretched to size given by code using argon2d stretching algorithm.
+
+        Parameters:
+            size (int): number of bytes in stretched seed
+            path (str): unique chars used in derivation of seed (secret)
+            tier (str): value from Tierage for security level of stretch
+            temp is Boolean, True means use quick method to stretch salt
+                    for testing only, Otherwise use time set by tier to stretch
+        """
+        tier = tier if tier is not None else self.tier
+        opslimit, memlimit = self.limits(tier=tier, temp=temp)
+
         # stretch algorithm is argon2id
         seed = pysodium.crypto_pwhash(outlen=size,
                                       passwd=path,
@@ -484,6 +499,132 @@ class Salter(Matter):
         return [self.signer(path=f"{path}{i + start:x}", **kwa) for i in range(count)]
 
 
+class Stretcher:
+    """
+    Stretcher schedules many Salter stretches (argon2id key derivations) at once.
+    Stretches run concurrently in a thread pool because libsodium releases the
+    GIL while hashing. The number of concurrent stretches is capped so that their
+    combined argon2id memory stays within .budget.
+
+    Stretched seeds are plaintext secrets so by default none are kept. Seeds
+    stretched with prime are held in .primed only until a later stretch takes
+    them. Opt in with size to cache at most size seeds, least recently used
+    evicted first, so that rederiving the same keys does not stretch again.
+    Owners must call .clear when the keys of cached seeds are erased.
+
+    Attributes:
+        workers (int): maximum number of concurrent stretches
+        budget (int): maximum bytes of argon2id memory used by concurrent stretches
+        size (int): maximum number of cached seeds. 0 means do not cache
+        cache (OrderedDict): stretched seed bytes keyed by (salt, path, tier, temp, size)
+        primed (dict): stretched seed bytes keyed as .cache held until taken
+
+    Usage:
+        stretcher = Stretcher(size=64)
+        seeds = stretcher.stretch(salter, paths=["00", "01"])
+        stretcher.clear()
+    """
+    Workers = 4  # default maximum concurrent stretches
+    Budget = 2147483648  # default memory budget, 2 GiB, two Tiers.high stretches
+    Size = 0  # default maximum cached seeds, no cache
+
+    def __init__(self, workers=None, budget=None, size=None):
+        """
+        Initialize instance
+
+        Parameters:
+            workers (int): maximum number of concurrent stretches
+            budget (int): maximum bytes of argon2id memory used by concurrent stretches
+            size (int): maximum number of cached seeds. 0 means do not cache
+        """
+        self.workers = max(1, workers if workers is not None else self.Workers)
+        self.budget = budget if budget is not None else self.Budget
+        self.size = max(0, size if size is not None else self.Size)
+        self.cache = OrderedDict()
+        self.primed = dict()
+
+    def stretch(self, salter, paths, sizes=None, tier=None, temp=False, prime=False):
+        """
+        Returns list of raw binary seeds one per path in paths stretched from
+        salter as Salter.stretch does. Primed and cached seeds are reused and
+        all others are stretched concurrently.
+
+        Parameters:
+            salter (Salter): salter whose .raw is stretched
+            paths (list): of str unique chars used in derivation of each seed
+            sizes (list | None): of int number of bytes of each stretched seed.
+                None means 32 bytes each.
+            tier (str): value from Tierage for security level of stretch.
+                None means use salter.tier
+            temp is Boolean, True means use quick method to stretch salt
+                    for testing only, Otherwise use time set by tier to stretch
+            prime (bool): True means hold seeds in .primed until a later
+                stretch takes them instead of caching them
+        """
+        tier = tier if tier is not None else salter.tier
+        sizes = sizes if sizes is not None else [32] * len(paths)
+        keys = [(salter.raw, path, tier, temp, size) for path, size in zip(paths, sizes)]
+
+        found = {}
+        for key in dict.fromkeys(keys):
+            if key in self.primed:
+                found[key] = self.primed.pop(key)
+            elif key in self.cache:
+                self.cache.move_to_end(key)
+                found[key] = self.cache[key]
+
+        misses = [key for key in dict.fromkeys(keys) if key not in found]
+        if misses:
+            _, memlimit = salter.limits(tier=tier, temp=temp)
+            count = min(len(misses), self.workers, max(1, self.budget // memlimit))
+
+            def stretch(key):
+                return salter.stretch(size=key[4], path=key[1], tier=tier, temp=temp)
+
+            if count == 1:
+                seeds = [stretch(key) for key in misses]
+            else:
+                with ThreadPoolExecutor(max_workers=count) as pool:
+                    seeds = list(pool.map(stretch, misses))
+            found.update(zip(misses, seeds))
+
+        if prime:
+            self.primed.update(found)
+        elif self.size:
+            for key, seed in found.items():
+                self.cache[key] = seed
+                self.cache.move_to_end(key)
+            while len(self.cache) > self.size:
+                self.cache.popitem(last=False)
+
+        return [found[key] for key in keys]
+
+    def signers(self, salter, paths, codes, transferable=True, tier=None, temp=False):
+        """
+        Returns list of Signer instances one per path and code whose seeds are
+        stretched at once by .stretch
+
+        Parameters:
+            salter (Salter): salter whose .raw is stretched
+            paths (list): of str unique chars used in derivation of each seed
+            codes (list): of str code of secret crypto suite one per path
+            transferable is Boolean, True means use transferace code for public key
+            tier (str): value from Tierage for security level of stretch
+            temp is Boolean, True means use quick method to stretch salt
+        """
+        seeds = self.stretch(salter, paths=paths, sizes=[Matter._rawSize(code) for code in codes],
+                             tier=tier, temp=temp)
+        return [Signer(raw=seed, code=code, transferable=transferable)
+                for seed, code in zip(seeds, codes)]
+
+    def clear(self):
+        """
+        Forget all cached and primed seeds
+        """
+        self.cache.clear()
+        self.primed.clear()
+
+
 
 
 # Codes for for ciphers of variable sized sniffable QB2 or QB64 plain text
@@ -18,9 +18,12 @@ database will never have these flags set.
 So only need to set dupsort first time opened each other opening does not
 need to call it
 """
+import functools
+import heapq
 import importlib
 import os
 import shutil
+from base64 import urlsafe_b64encode as encodeB64
 from collections import namedtuple
 from contextlib import contextmanager
 from dataclasses import dataclass, asdict, field
@@ -50,12 +53,29 @@ from ..help import helping
 logger = help.ogler.getLogger()
 
 
+ReplayChunkSize = 65536  # default minimum bytes per chunk of cloneChunkIter
+DtsSize = 32  # length of iso8601 datetime stamp with microseconds and offset
+DtsToB64 = bytes.maketrans(b":.+", b"cdp")  # same translation as Dater
+
+
+@functools.lru_cache(maxsize=1024)
+def replayCounter(code, count):
+    """
+    Returns qb64b of CESR 1.0 counter with code and count for replay
+    attachments. Cached since replay uses only a few distinct counters.
+    """
+    return core.Counter(code=code, count=count, version=Vrsn_1_0).qb64b
+
+
 MIGRATIONS = [
     ("0.6.8", ["hab_data_rename"]),
     ("1.0.0", ["add_key_and_reg_state_schemas"]),
     ("1.2.0", ["rekey_habs"])
 ]
 
+Qb2Migration = "qb2_storage"  # opt in migration of CESR sub db values to qb2
+PackedMigration = "packed_records"  # opt in migration of Komer records to Packer
+
 
 # ToDo XXXX maybe
 '''
@@ -88,17 +108,36 @@ class dbdict(dict):
     Subclass of dict that has db as attribute and employs read through cache
     from db Baser.stts of kever states to reload kever from state in database
     when not found in memory as dict item.
+
+    When .cap is not None the cache is bounded to at most .cap kevers held in
+    memory. Items are kept in least recently used order so that adding an
+    item beyond .cap evicts the least recently used kevers. Kevers of locally
+    owned prefixes in .db.prefixes are pinned and never evicted. An evicted
+    kever is reloaded from its key state in .db.states via Kever.reload on its
+    next access.
+
+    Attributes:
+        db (Baser | None): database of key states for read through
+        cap (int | None): maximum number of kevers in memory. None is unbounded
+        hits (int): count of lookups found in memory
+        misses (int): count of lookups not found in memory
+        evictions (int): count of kevers evicted from memory
     """
-    __slots__ = ('db')  # no .__dict__ just for db reference
+    __slots__ = ('db', 'cap', 'hits', 'misses', 'evictions')  # no .__dict__
 
-    def __init__(self, *pa, **kwa):
+    def __init__(self, *pa, cap=None, **kwa):
         super(dbdict, self).__init__(*pa, **kwa)
         self.db = None
+        self.cap = cap
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
 
     def __getitem__(self, k):
         try:
-            return super(dbdict, self).__getitem__(k)
+            kever = super(dbdict, self).__getitem__(k)
         except KeyError as ex:
+            self.misses += 1
             if not self.db:
                 raise ex  # reraise KeyError
             if (ksr := self.db.states.get(keys=k)) is None:
@@ -110,6 +149,19 @@ class dbdict(dict):
             self.__setitem__(k, kever)
             return kever
 
+        self.hits += 1
+        if self.cap is not None:  # move to most recently used end
+            super(dbdict, self).__delitem__(k)
+            super(dbdict, self).__setitem__(k, kever)
+        return kever
+
+    def __setitem__(self, k, kever):
+        if self.cap is not None and super(dbdict, self).__contains__(k):
+            super(dbdict, self).__delitem__(k)  # reinsert at most recent end
+        super(dbdict, self).__setitem__(k, kever)
+        if self.cap is not None and len(self) > self.cap:
+            self.evict(keep=k)
+
     def __contains__(self, k):
         if not super(dbdict, self).__contains__(k):
             try:
@@ -136,8 +188,95 @@ class dbdict(dict):
         else:
             return self.__getitem__(k)
 
+    def evict(self, keep=None):
+        """
+        Evict least recently used unpinned kevers until at most .cap remain
+        in memory. Pinned kevers of .db.prefixes are skipped so may leave more
+        than .cap when .cap or more are pinned.
+
+        Parameters:
+            keep (str | None): key not to evict such as the one just added
 
+        Returns:
+            count (int): number of kevers evicted
+        """
+        if self.cap is None:
+            return 0
+        pins = self.db.prefixes if self.db is not None else ()
+        count = 0
+        while len(self) > self.cap:
+            for k in super(dbdict, self).__iter__():  # least recent first
+                if k not in pins and k != keep:
+                    break
+            else:  # all pinned
+                break
+            super(dbdict, self).__delitem__(k)
+            count += 1
+        self.evictions += count
+        return count
+
+
+class Waker:
+    """
+    Waker is an in memory index of the entries of an escrow keyed by snKey
+    of the event they are waiting on together with a time index of when each
+    entry was escrowed so stale entries may be found without walking the
+    whole escrow. The first pass after open must walk the whole escrow to
+    build the time index. Thereafter a pass only needs to walk the entries
+    at woken escrow keys, those whose dependency was satisfied since the
+    last pass, and the entries escrowed before the timeout cutoff.
 
+    Attributes:
+        full (bool): True means next pass must walk whole escrow
+        woken (oset): escrow keys as bytes woken since last pass
+        dates (dict): escrow datetime keyed by escrow entry (key, val) as bytes
+        heap (list): heap of (datetime, key, val) escrow entries oldest first
+
+    """
+
+    def __init__(self):
+        self.full = True
+        self.woken = oset()
+        self.dates = dict()
+        self.heap = []
+
+    def wake(self, key):
+        """
+        Wake escrow entries at escrow key whose dependency was satisfied
+
+        Parameters:
+            key (str | bytes): escrow key such as snKey(pre, sn)
+        """
+        self.woken.add(key.encode() if hasattr(key, "encode") else bytes(key))
+
+    def date(self, key, val, dte):
+        """
+        Index escrow entry (key, val) by escrow datetime when not already indexed
+
+        Parameters:
+            key (bytes): escrow entry key
+            val (bytes): escrow entry val
+            dte (datetime.datetime): when escrow entry was escrowed
+        """
+        entry = (bytes(key), bytes(val))
+        if entry not in self.dates:
+            self.dates[entry] = dte
+            heapq.heappush(self.heap, (dte, *entry))
+
+    def expired(self, cutoff):
+        """
+        Returns list of escrow entries (key, val) escrowed at or before cutoff
+        and removes them from the time index
+
+        Parameters:
+            cutoff (datetime.datetime): current time less escrow timeout
+        """
+        entries = []
+        while self.heap and self.heap[0][0] <= cutoff:
+            _, key, val = heapq.heappop(self.heap)
+            self.dates.pop((key, val), None)
+            entries.append((key, val))
+        return entries
 
 
 @dataclass
@@ -598,6 +737,7 @@ def reopenDB(db, clear=False, **kwa):
 
 
 KERIBaserMapSizeKey = "KERI_BASER_MAP_SIZE"
+KERIBaserKeverCapKey = "KERI_BASER_KEVER_CAP"
 
 
 class Baser(dbing.LMDBer):
@@ -609,6 +749,7 @@ class Baser(dbing.LMDBer):
 
         kevers (dict): Kever instances indexed by identifier prefix qb64
         prefixes (OrderedSet): local prefixes corresponding to habitats for this db
+            whose kevers are pinned in .kevers
 
         .evts is named sub DB whose values are serialized key events
             dgKey
@@ -940,12 +1081,24 @@ class Baser(dbing.LMDBer):
         Missing ToDo XXXX other attributes as sub dbs not documented here
             such as .wits etc
 
+        wakers (dict): Waker instances keyed by escrow name that index the
+            escrow entries by dependency and by escrow time. Only .ooes and
+            .ures are indexed. The other escrows are walked in full each pass.
+        qb2 (bool): True means values of CESR sub dbs, all but .migs, are
+            stored as qb2 binary instead of qb64b text. Once the database has
+            been converted by migration Qb2Migration it stays qb2.
+        packed (bool): True means records of Komer sub dbs are serialized by
+            the positional Packer of their schema instead of as JSON. Once
+            the database has been converted by migration PackedMigration it
+            stays packed.
+
     Properties:
         kevers (dbdict): read through cache of kevers of states for KELs in db
 
     """
 
-    def __init__(self, headDirPath=None, reopen=False, **kwa):
+    def __init__(self, headDirPath=None, reopen=False, kevercap=None, qb2=False,
+                 packed=False, **kwa):
         """
         Setup named sub databases.
 
@@ -960,13 +1113,35 @@ class Baser(dbing.LMDBer):
                 If not provided use default .HeadDirpath
             mode is int numeric os dir permissions for database directory
             reopen (bool): True means database will be reopened by this init
+            kevercap (int | None): maximum number of kevers held in memory by
+                .kevers before least recently used are evicted. None means
+                unbounded unless set by env var KERI_BASER_KEVER_CAP
+            qb2 (bool): True means store values of CESR sub dbs as qb2 binary
+                converting any existing qb64b values by migration Qb2Migration
+                False means use storage already in database, qb64b when new
+            packed (bool): True means serialize records of Komer sub dbs with
+                positional Packer converting any existing JSON records by
+                migration PackedMigration
+                False means use serialization already in database, JSON when new
 
 
         """
+        self.qb2 = qb2
+        self.packed = packed
         self.prefixes = oset()  # should change to hids for hab ids
         self.groups = oset()  # group hab ids
-        self._kevers = dbdict()
+
+        if kevercap is None and (kevercap := os.getenv(KERIBaserKeverCapKey)) is not None:
+            try:
+                kevercap = int(kevercap)
+            except ValueError:
+                logger.error("KERI_BASER_KEVER_CAP must be an integer value >0!")
+                raise
+
+        self._kevers = dbdict(cap=kevercap)
         self._kevers.db = self  # assign db for read through cache of kevers
+        # escrow indices of entries by dependency and escrow time
+        self.wakers = dict(ooes=Waker(), ures=Waker())
 
         if (mapSize := os.getenv(KERIBaserMapSizeKey)) is not None:
             try:
@@ -1304,10 +1479,43 @@ class Baser(dbing.LMDBer):
         # TODO: clean
         self.maids = subing.CesrIoSetSuber(db=self, subkey="maids.", klas=coring.Prefixer)
 
+        stored = self.migs.get(keys=(Qb2Migration,)) is not None
+        for suber in self.cesrSubers():
+            suber.qb2 = stored
+        if self.qb2 and not stored:  # opt in converts existing qb64b values
+            importlib.import_module(f"keri.db.migrations.{Qb2Migration}").migrate(self)
+        self.qb2 = self.qb2 or stored
+
+        stored = self.migs.get(keys=(PackedMigration,)) is not None
+        for komer in self.komers():
+            komer.packed = stored
+        if self.packed and not stored:  # opt in converts existing JSON records
+            importlib.import_module(f"keri.db.migrations.{PackedMigration}").migrate(self)
+        self.packed = self.packed or stored
+
         self.reload()
 
         return self.env
 
+    def cesrSubers(self):
+        """
+        Returns list of sub dbs with CESR primitive values whose storage as
+        qb2 or qb64b follows .qb2. Excludes .migs which records the storage
+        and encrypted signer sub dbs.
+        """
+        return [suber for suber in vars(self).values()
+                if isinstance(suber, subing.CesrSuberBase)
+                and not isinstance(suber, subing.CryptSignerSuber)
+                and suber is not self.migs]
+
+    def komers(self):
+        """
+        Returns list of Komer and IoSetKomer sub dbs whose record serialization
+        follows .packed
+        """
+        return [komer for komer in vars(self).values()
+                if isinstance(komer, (koming.Komer, koming.IoSetKomer))]
+
     def reload(self):
         """
         Reload stored prefixes and Kevers from .habs
@@ -1472,12 +1680,14 @@ class Baser(dbing.LMDBer):
         readonly mode
 
         """
-        # create copy to clone into
+        # create copy to clone into with same storage as copied .migs records
         with openDB(name=self.name,
                     temp=False,
                     headDirPath=self.headDirPath,
                     perm=self.perm,
-                    clean=True) as copy:  # copy is Baser instance
+                    clean=True,
+                    qb2=self.qb2,
+                    packed=self.packed) as copy:  # copy is Baser instance
 
             with reopenDB(db=self, reuse=True, readonly=True):  # reopen as readonly
                 if not os.path.exists(self.path):
@@ -1501,11 +1711,8 @@ class Baser(dbing.LMDBer):
                              "kdts", "ksns", "knas", "oobis", "roobi", "woobi", "moobi", "mfa", "rmfa",
                              "cfld", "cons", "ccigs", "cdel", "migs"]
 
-                for name in unsecured:
-                    srcdb = getattr(self, name)
-                    cpydb = getattr(copy, name)
-                    for keys, val in srcdb.getItemIter():
-                        cpydb.put(keys=keys, val=val)
+                for name in unsecured:  # bulk put each in one transaction
+                    getattr(copy, name).putMany(getattr(self, name).getItemIter())
 
                 # This is the list of set based databases that are not created as part of event processing.
                 # for now we are just copying them from self to copy without worrying about being able to
@@ -1597,12 +1804,7 @@ class Baser(dbing.LMDBer):
         if hasattr(pre, 'encode'):
             pre = pre.encode("utf-8")
 
-        for _, fn, dig in self.getFelItemPreIter(pre, fn=fn):
-            try:
-                msg = self.cloneEvtMsg(pre=pre, fn=fn, dig=dig)
-            except Exception:
-                continue  # skip this event
-            yield msg
+        yield from self._cloneIter(pre=pre, fn=fn)
 
 
     def cloneAllPreIter(self):
@@ -1617,12 +1819,29 @@ class Baser(dbing.LMDBer):
            msgs (Iterator): over all items in db
 
         """
-        for pre, fn, dig in self.getFelItemAllPreIter():
-            try:
-                msg = self.cloneEvtMsg(pre=pre, fn=fn, dig=dig)
-            except Exception:
-                continue  # skip this event
-            yield msg
+        yield from self._cloneIter()
+
+
+    def cloneChunkIter(self, pre=b'', fn=0, size=ReplayChunkSize):
+        """
+        Returns iterator of chunks of replayed first seen event messages with
+        attachments sized for socket or file writes. Each chunk holds one or
+        more whole messages and is at least size bytes except for the last.
+        Same replay as clonePreIter when pre is provided otherwise same as
+        cloneAllPreIter.
+
+        Parameters:
+            pre (str | bytes): identifier prefix. Empty means all prefixes
+            fn (int): first seen order number to resume replay of pre
+            size (int): minimum bytes per chunk
+
+        Returns:
+           chunks (Iterator[bytearray]): of whole messages
+        """
+        if hasattr(pre, 'encode'):
+            pre = pre.encode("utf-8")
+
+        yield from self._cloneIter(pre=pre, fn=fn, size=size)
 
 
     def cloneEvtMsg(self, pre, fn, dig):
@@ -1638,67 +1857,133 @@ class Baser(dbing.LMDBer):
             bytearray: message body with attachments
         """
         msg = bytearray()  # message
-        atc = bytearray()  # attachments
+        with self.begin(write=False) as txn:
+            self._cloneEvt(txn=txn, cursors={}, msg=msg, pre=pre,
+                           fnr=fn.to_bytes(16, "big"), dig=dig)
+        return msg
+
+
+    def _cloneIter(self, pre=b'', fn=0, size=None):
+        """
+        Returns iterator of replay of first seen events with attachments
+        walking .fels with one read transaction and one cursor per sub db for
+        all events instead of one read transaction per sub db per event.
+        Events with missing entries are skipped.
+
+        Parameters:
+            pre (bytes): identifier prefix. Empty means all prefixes
+            fn (int): first seen order number to resume replay of pre
+            size (int | None): minimum bytes per yielded chunk of whole
+                messages. None means yield each message
+
+        Returns:
+           msgs (Iterator[bytearray]): messages or chunks of messages
+        """
+        with self.begin(write=False) as txn:
+            cursors = {}  # cursor per sub db reused across events
+            felc = txn.cursor(db=self.fels)
+            if not felc.set_range(dbing.onKey(pre, fn) if pre else b''):
+                return
+
+            buf = bytearray()
+            for fkey, dig in felc.iternext():
+                cpre, _, fnh = bytes(fkey).rpartition(b'.')
+                if pre and cpre != pre:
+                    break
+                mark = len(buf)
+                try:
+                    self._cloneEvt(txn=txn, cursors=cursors, msg=buf, pre=cpre,
+                                   fnr=bytes.fromhex(fnh.decode()), dig=bytes(dig))
+                except Exception:
+                    del buf[mark:]
+                    continue  # skip this event
+                if size is None or len(buf) >= size:
+                    yield buf
+                    buf = bytearray()
+
+            if buf:
+                yield buf
+
+
+    def _cloneEvt(self, txn, cursors, msg, pre, fnr, dig):
+        """
+        Appends to msg the event with digest dig as serialized CESR message
+        with body and attached foot read in transaction txn. Counters come
+        from cache and the first seen couple is encoded directly from the
+        stored raw values so no intermediate primitive instances are made.
+
+        Parameters:
+            txn (lmdb.Transaction | DbTxn): read transaction
+            cursors (dict): cursors of txn keyed by sub db reused across calls
+            msg (bytearray): message buffer to extend
+            pre (bytes): identifier prefix of event
+            fnr (bytes): 16 byte big endian first seen number of event
+            dig (bytes): digest of event
+        """
         dgkey = dbing.dgKey(pre, dig)  # get message
-        if not (raw := self.getEvt(key=dgkey)):
+        if not (raw := txn.get(dgkey, db=self.evts)):
             raise kering.MissingEntryError("Missing event for dig={}.".format(dig))
-        msg.extend(raw)
+        if not (dts := txn.get(dgkey, db=self.dtss)):
+            raise kering.MissingEntryError("Missing datetime for dig={}.".format(dig))
 
+        atc = bytearray()  # attachments
         # add indexed signatures to attachments
-        if not (sigs := self.getSigs(key=dgkey)):
+        if not self._cloneDups(txn, cursors, self.sigs, dgkey,
+                               core.Codens.ControllerIdxSigs, atc):
             raise kering.MissingEntryError("Missing sigs for dig={}.".format(dig))
-        atc.extend(core.Counter(code=core.Codens.ControllerIdxSigs,
-                                count=len(sigs), version=kering.Vrsn_1_0).qb64b)
-        for sig in sigs:
-            atc.extend(sig)
 
         # add indexed witness signatures to attachments
-        if wigs := self.getWigs(key=dgkey):
-            atc.extend(core.Counter(code=core.Codens.WitnessIdxSigs,
-                                    count=len(wigs), version=kering.Vrsn_1_0).qb64b)
-            for wig in wigs:
-                atc.extend(wig)
+        self._cloneDups(txn, cursors, self.wigs, dgkey,
+                        core.Codens.WitnessIdxSigs, atc)
 
         # add authorizer (delegator/issuer) source seal event couple to attachments
-        couple = self.getAes(dgkey)
-        if couple is not None:
-            atc.extend(core.Counter(code=core.Codens.SealSourceCouples,
-                                    count=1, version=kering.Vrsn_1_0).qb64b)
+        if (couple := txn.get(dgkey, db=self.aess)) is not None:
+            atc.extend(replayCounter(core.Codens.SealSourceCouples, 1))
             atc.extend(couple)
 
         # add trans endorsement quadruples to attachments not controller
         # may have been originally key event attachments or receipted endorsements
-        if quads := self.getVrcs(key=dgkey):
-            atc.extend(core.Counter(code=core.Codens.TransReceiptQuadruples,
-                                    count=len(quads), version=kering.Vrsn_1_0).qb64b)
-            for quad in quads:
-                atc.extend(quad)
+        self._cloneDups(txn, cursors, self.vrcs, dgkey,
+                        core.Codens.TransReceiptQuadruples, atc)
 
         # add nontrans endorsement couples to attachments not witnesses
         # may have been originally key event attachments or receipted endorsements
-        if coups := self.getRcts(key=dgkey):
-            atc.extend(core.Counter(code=core.Codens.NonTransReceiptCouples,
-                                    count=len(coups), version=kering.Vrsn_1_0).qb64b)
-            for coup in coups:
-                atc.extend(coup)
+        self._cloneDups(txn, cursors, self.rcts, dgkey,
+                        core.Codens.NonTransReceiptCouples, atc)
 
         # add first seen replay couple to attachments
-        if not (dts := self.getDts(key=dgkey)):
-            raise kering.MissingEntryError("Missing datetime for dig={}.".format(dig))
-        atc.extend(core.Counter(code=core.Codens.FirstSeenReplayCouples,
-                                count=1, version=kering.Vrsn_1_0).qb64b)
-        atc.extend(core.Number(num=fn, code=core.NumDex.Huge).qb64b)  # may not need to be Huge
-        atc.extend(coring.Dater(dts=bytes(dts)).qb64b)
+        atc.extend(replayCounter(core.Codens.FirstSeenReplayCouples, 1))
+        atc.extend(b'0A' + encodeB64(bytes(2) + fnr)[2:])  # Huge Number of fn
+        if len(dts) == DtsSize:  # Dater qb64 is code plus translated dts
+            atc.extend(b'1AAG' + bytes(dts).translate(DtsToB64))
+        else:
+            atc.extend(coring.Dater(dts=bytes(dts)).qb64b)
 
         # prepend pipelining counter to attachments
         if len(atc) % 4:
             raise ValueError("Invalid attachments size={}, nonintegral"
                              " quadlets.".format(len(atc)))
-        pcnt = core.Counter(code=core.Codens.AttachmentGroup,
-                            count=(len(atc) // 4), version=kering.Vrsn_1_0).qb64b
-        msg.extend(pcnt)
+        msg.extend(raw)
+        msg.extend(replayCounter(core.Codens.AttachmentGroup, len(atc) // 4))
         msg.extend(atc)
-        return msg
+
+
+    @staticmethod
+    def _cloneDups(txn, cursors, db, key, code, atc):
+        """
+        Appends to atc the counter with code and all the dup values at key
+        in dupsort sub db db. Returns count of values appended.
+        """
+        if (cursor := cursors.get(db)) is None:
+            cursor = cursors[db] = txn.cursor(db=db)
+        if not cursor.set_key(key):
+            return 0
+        count = cursor.count()
+        atc.extend(replayCounter(code, count))
+        for val in cursor.iternext_dup():
+            atc.extend(val)
+        return count
+
 
     def cloneDelegation(self, kever):
         """
@@ -1738,7 +2023,7 @@ class Baser(dbing.LMDBer):
         seal = eventing.SealEvent(**seal)  #convert to namedtuple
 
         for evt in self.getEvtPreIter(pre=pre, sn=sn):  # includes disputed & superseded
-            srdr = serdering.SerderKERI(raw=evt.tobytes())
+            srdr = serdering.SerderKERI(raw=bytes(evt))
             for eseal in srdr.seals or []:  # or [] for seals 'a' field missing
                 if tuple(eseal) == eventing.SealEvent._fields:
                     eseal = eventing.SealEvent(**eseal)  # convert to namedtuple
@@ -1776,7 +2061,7 @@ class Baser(dbing.LMDBer):
         seal = eventing.SealEvent(**seal)  #convert to namedtuple
 
         for evt in self.getEvtLastPreIter(pre=pre, sn=sn):  # no disputed or superseded
-            srdr = serdering.SerderKERI(raw=evt.tobytes())
+            srdr = serdering.SerderKERI(raw=bytes(evt))
             for eseal in srdr.seals or []:  # or [] for seals 'a' field missing
                 if tuple(eseal) == eventing.SealEvent._fields:
                     eseal = eventing.SealEvent(**eseal)  # convert to namedtuple
@@ -1806,7 +2091,7 @@ class Baser(dbing.LMDBer):
         Seal = namedtuple('Seal', list(seal))  # matching type
 
         for evt in self.getEvtLastPreIter(pre=pre, sn=sn):  # only last evt at sn
-            srdr = serdering.SerderKERI(raw=evt.tobytes())
+            srdr = serdering.SerderKERI(raw=bytes(evt))
             for eseal in srdr.seals or []:  # or [] for seals 'a' field missing
                 if tuple(eseal) == Seal._fields:  # same type of seal
                     eseal = Seal(**eseal)  #convert to namedtuple
@@ -50,6 +50,7 @@ import platform
 import shutil
 import stat
 import tempfile
+import threading
 from collections import abc
 from contextlib import contextmanager
 from typing import Union
@@ -292,6 +293,125 @@ def openLMDB(*, cls=None, name="test", temp=True, **kwa):
             lmdber.close(clear=lmdber.temp)  # clears if lmdber.temp
 
 
+class DbTxn:
+    """
+    DbTxn binds a sub db to a shared LMDB transaction so that helpers written
+    for a transaction begun on their own sub db, as in env.begin(db=db), may
+    instead join the active transaction of LMDBer.transaction unchanged.
+
+    Attributes:
+        txn (lmdb.Transaction): shared active transaction
+        db (lmdb._Database): named sub db used when none given to a method
+
+    """
+    __slots__ = ('txn', 'db')
+
+    def __init__(self, txn, db=None):
+        self.txn = txn
+        self.db = db
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False  # joined transaction is committed by its owner
+
+    def cursor(self, db=None):
+        return self.txn.cursor(db=db if db is not None else self.db)
+
+    def get(self, key, default=None, db=None):
+        return self.txn.get(key, default, db=db if db is not None else self.db)
+
+    def put(self, key, value, dupdata=True, overwrite=True, append=False, db=None):
+        return self.txn.put(key, value, dupdata=dupdata, overwrite=overwrite,
+                            append=append, db=db if db is not None else self.db)
+
+    def replace(self, key, value, db=None):
+        return self.txn.replace(key, value, db=db if db is not None else self.db)
+
+    def pop(self, key, db=None):
+        return self.txn.pop(key, db=db if db is not None else self.db)
+
+    def delete(self, key, value=b'', db=None):
+        return self.txn.delete(key, value, db=db if db is not None else self.db)
+
+    def stat(self, db=None):
+        return self.txn.stat(db if db is not None else self.db)
+
+
+class Bulker:
+    """
+    Bulker is a mixin that gives the sub db wrapper classes (subers and komers)
+    bulk methods that apply one of their single entry methods to many entries
+    in one LMDBer transaction via LMDBer.bulk.
+
+    The class using Bulker must provide:
+        db (LMDBer): database manager whose .bulk runs the transaction
+        put, pin, get, rem: single entry methods taking keys as first parameter
+        _tokey: method that converts keys to a key bytes
+
+    """
+
+    def putMany(self, items: abc.Iterable):
+        """
+        Puts each val at key made from its keys for each (keys, val) in items
+        in one transaction. Does not overwrite. For set and dup subclasses
+        val is the list of vals to put at keys.
+
+        Parameters:
+            items (Iterable): of (keys, val) tuples
+
+        Returns:
+            results (list[bool]): result of .put for each item in order of items
+        """
+        return self.db.bulk(self.put, items, key=self._tokey)
+
+
+    def pinMany(self, items: abc.Iterable):
+        """
+        Pins (sets) each val at key made from its keys for each (keys, val)
+        in items in one transaction. Overwrites. For set and dup subclasses
+        val is the list of vals that replaces all vals at keys.
+
+        Parameters:
+            items (Iterable): of (keys, val) tuples
+
+        Returns:
+            results (list[bool]): result of .pin for each item in order of items
+        """
+        return self.db.bulk(self.pin, items, key=self._tokey)
+
+
+    def getMany(self, keyses: abc.Iterable):
+        """
+        Gets val at key made from each keys in keyses in one read only
+        transaction
+
+        Parameters:
+            keyses (Iterable): of keys each as given to .get
+
+        Returns:
+            vals (list): result of .get for each keys in order of keyses, None
+                or empty list for set and dup subclasses when no entry
+        """
+        return self.db.bulk(self.get, ((keys, ) for keys in keyses), key=self._tokey,
+                            write=False)
+
+
+    def remMany(self, keyses: abc.Iterable):
+        """
+        Removes entry at key made from each keys in keyses in one transaction.
+        For set and dup subclasses removes all vals at keys.
+
+        Parameters:
+            keyses (Iterable): of keys each as given to .rem
+
+        Returns:
+            results (list[bool]): result of .rem for each keys in order of keyses
+        """
+        return self.db.bulk(self.rem, ((keys, ) for keys in keyses), key=self._tokey)
+
+
 class LMDBer(filing.Filer):
     """
     LBDBer base class for LMDB manager instances.
@@ -317,6 +437,27 @@ class LMDBer(filing.Filer):
         readonly (bool): True means open LMDB env as readonly
 
     Properties:
+        txn (lmdb.Transaction | None): active transaction of .transaction,
+            .savepoint or .reading for the current thread if any
+
+    Methods:
+        transaction: reentrant context for one write transaction
+        savepoint: context for a nested write transaction
+        reading: context for one shared read only transaction
+        bulk: calls method for many keys in key order in one transaction
+        begin: begins or joins transaction for a helper method
+
+    Transactions:
+        Every helper method, including iterator helpers such as
+        .getTopItemIter, begins and commits its own transaction unless called
+        inside the context of .transaction, .savepoint or .reading on the same
+        thread. Inside such a context it joins the active transaction through
+        .begin so that all the writes commit once and atomically when the
+        outermost context exits. Reads and iterations inside a write context
+        see the uncommitted writes made earlier in it, read your writes, and
+        values are bytes not memoryviews. Outside any context, reads and
+        iterations see only committed state. An iterator joined to a context
+        must be exhausted before the context exits.
 
     File/Directory Creation Mode Notes:
         .Perm provides default restricted access permissions to directory and/or files
@@ -383,6 +524,7 @@ class LMDBer(filing.Filer):
 
         self.env = None
         self._version = None
+        self._local = threading.local()  # .txn and .depth of .transaction
         self.readonly = True if readonly else False
         super(LMDBer, self).__init__(**kwa)
 
@@ -473,6 +615,175 @@ class LMDBer(filing.Filer):
 
         return super(LMDBer, self).close(clear=clear)
 
+    @property
+    def txn(self):
+        """Returns active write transaction of .transaction for current
+        thread or None if none
+        """
+        return getattr(self._local, "txn", None)
+
+
+    @contextmanager
+    def transaction(self):
+        """
+        Context manager for one write transaction shared by all the helper
+        methods called inside its context. Reentrant so nested contexts join
+        the outermost one. The transaction commits when the outermost context
+        exits normally and aborts, discarding all its writes, when it exits
+        with an exception.
+
+        Usage:
+            with db.transaction():
+                db.putEvt(dgkey, raw)
+                db.putSigs(dgkey, sigs)
+
+        Yields:
+            txn (lmdb.Transaction): active write transaction
+        """
+        if self.txn is not None:  # nested so join outermost
+            if getattr(self._local, "reading", False):
+                raise ValueError("Can not write inside a read only transaction.")
+            self._local.depth += 1
+            try:
+                yield self._local.txn
+            finally:
+                self._local.depth -= 1
+            return
+
+        # not buffers since memoryviews into dirty pages are invalidated by
+        # subsequent writes in the same transaction
+        txn = self.env.begin(write=True, buffers=False)
+        self._local.txn = txn
+        self._local.depth = 1
+        try:
+            yield txn
+        except BaseException:
+            txn.abort()
+            raise
+        else:
+            txn.commit()
+        finally:
+            self._local.txn = None
+            self._local.depth = 0
+
+
+    @contextmanager
+    def savepoint(self):
+        """
+        Context manager for a nested write transaction, a child of the active
+        write transaction of .transaction, so that an exception inside its
+        context discards only the writes made in its context while the outer
+        transaction goes on. Helper methods and .transaction contexts called
+        inside its context join the nested transaction. Without an active
+        transaction it is the same as .transaction.
+
+        Usage:
+            with db.transaction():
+                for msg in msgs:
+                    try:
+                        with db.savepoint():
+                            process(msg)
+                    except Exception:
+                        pass  # writes of msg discarded, others kept
+
+        Yields:
+            txn (lmdb.Transaction): active nested write transaction
+        """
+        if (parent := self.txn) is None:
+            with self.transaction() as txn:
+                yield txn
+            return
+        if getattr(self._local, "reading", False):
+            raise ValueError("Can not write inside a read only transaction.")
+
+        txn = self.env.begin(write=True, parent=parent, buffers=False)
+        self._local.txn = txn
+        try:
+            yield txn
+        except BaseException:
+            txn.abort()
+            raise
+        else:
+            txn.commit()
+        finally:
+            self._local.txn = parent
+
+
+    @contextmanager
+    def reading(self):
+        """
+        Context manager for one read only transaction shared by all the helper
+        methods called inside its context so that they read one consistent
+        snapshot without beginning a transaction each. Joins the active
+        transaction, read or write, if any. Values are bytes not memoryviews
+        so they stay valid after the context exits. Writes inside its context
+        raise.
+
+        Usage:
+            with db.reading():
+                raw = db.getEvt(dgkey)
+                sigs = db.getSigs(dgkey)
+
+        Yields:
+            txn (lmdb.Transaction): active transaction
+        """
+        if self.txn is not None:  # join active
+            yield self.txn
+            return
+
+        txn = self.env.begin(write=False, buffers=False)
+        self._local.txn = txn
+        self._local.reading = True
+        try:
+            yield txn
+        finally:
+            txn.abort()
+            self._local.txn = None
+            self._local.reading = False
+
+
+    def bulk(self, method, args, key, write=True):
+        """
+        Returns list of results of method(*arg) for each arg in args in order
+        of args. Calls are made inside one shared transaction, in ascending
+        order of db key, key(arg[0]), so that the LMDB B-tree is traversed
+        sequentially. The transaction is a write transaction, committed or
+        aborted as a whole, when write and .readonly is False. Otherwise it is
+        a read only transaction.
+
+        Parameters:
+            method (Callable): bound method such as .put or .get of sub db
+            args (Iterable): of tuples of positional arguments of method whose
+                first element is keys
+            key (Callable): returns db key bytes of keys of sub db
+            write (bool): True means method writes
+        """
+        args = list(args)
+        keys = [key(arg[0]) for arg in args]
+        results = [None] * len(args)
+        with (self.transaction() if write and not self.readonly else self.reading()):
+            for i in sorted(range(len(args)), key=keys.__getitem__):
+                results[i] = method(*args[i])
+        return results
+
+
+    def begin(self, db=None, write=False, buffers=True):
+        """
+        Returns transaction context for helper method on sub db, db. Joins
+        active write transaction of .transaction if any otherwise begins new
+        transaction on db.
+
+        Parameters:
+            db (lmdb._Database | None): named sub db. None means main db
+            write (bool): True means write transaction
+            buffers (bool): True means return memoryviews not bytes when not
+                joining active transaction
+        """
+        if (txn := self.txn) is not None:
+            return DbTxn(txn=txn, db=db)
+        return self.env.begin(db=db, write=write, buffers=buffers)
+
+
     def getVer(self):
         """ Returns the value of the the semver formatted version in the __version__ key in this database
 
@@ -480,7 +791,7 @@ class LMDBer(filing.Filer):
             str: semver formatted version of the database
 
         """
-        with self.env.begin() as txn:
+        with self.begin(buffers=False) as txn:
             cursor = txn.cursor()
             version = cursor.get(b'__version__')
             return version.decode("utf-8") if version is not None else None
@@ -495,7 +806,7 @@ class LMDBer(filing.Filer):
         if hasattr(val, "encode"):
             val = val.encode("utf-8")  # convert str to bytes
 
-        with self.env.begin(write=True) as txn:
+        with self.begin(write=True) as txn:
             cursor = txn.cursor()
             cursor.replace(b'__version__', val)
 
@@ -512,7 +823,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             val is bytes of value to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True) as txn:
             try:
                 return (txn.put(key, val, overwrite=False))
             except lmdb.BadValsizeError as ex:
@@ -533,7 +844,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             val is bytes of value to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True) as txn:
             try:
                 return (txn.put(key, val))
             except lmdb.BadValsizeError as ex:
@@ -551,7 +862,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
 
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False) as txn:
             try:
                 return(txn.get(key))
             except lmdb.BadValsizeError as ex:
@@ -568,7 +879,7 @@ class LMDBer(filing.Filer):
             db is opened named sub db with dupsort=False
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True) as txn:
             try:
                 return (txn.delete(key))
             except lmdb.BadValsizeError as ex:
@@ -583,7 +894,7 @@ class LMDBer(filing.Filer):
         Parameters:
             db is opened named sub db with dupsort=True
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             count = 0
             for _, _ in cursor:
@@ -614,7 +925,7 @@ class LMDBer(filing.Filer):
                         In Python str.startswith('') always returns True so if branch
                         key is empty string it matches all keys in db with startswith.
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             if cursor.set_range(top):  # move to val at key >= key if any
                 for ckey, cval in cursor.iternext():  # get key, val at cursor
@@ -648,7 +959,7 @@ class LMDBer(filing.Filer):
         """
         # when deleting can't use cursor.iternext() because the cursor advances
         # twice (skips one) once for iternext and once for delete.
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True) as txn:
             result = False
             cursor = txn.cursor()
             if cursor.set_range(top):  # move to val at key >= key if any
@@ -682,7 +993,7 @@ class LMDBer(filing.Filer):
             val (bytes): to be written at onkey
             sep (bytes): separator character for split
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True) as txn:
             if key:  # not empty
                 onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
             else:
@@ -711,7 +1022,7 @@ class LMDBer(filing.Filer):
             val (bytes): to be written at onkey
             sep (bytes): separator character for split
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True) as txn:
             if key:  # not empty
                 onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
             else:
@@ -751,7 +1062,7 @@ class LMDBer(filing.Filer):
         # set key with fn at max and then walk backwards to find last entry at pre
         # if any otherwise zeroth entry at pre
         onkey = onKey(key, MaxON, sep=sep)
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True) as txn:
             on = 0  # unless other cases match then zeroth entry at pre
             cursor = txn.cursor()
             if not cursor.set_range(onkey):  # max is past end of database
@@ -799,7 +1110,7 @@ class LMDBer(filing.Filer):
             sep (bytes): separator character for split
 
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False) as txn:
             if key:  # not empty
                 onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
             else:
@@ -823,7 +1134,7 @@ class LMDBer(filing.Filer):
             on (int): ordinal number at which to delete
             sep (bytes): separator character for split
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True) as txn:
             if key:  # not empty
                 onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
             else:
@@ -851,7 +1162,7 @@ class LMDBer(filing.Filer):
             on (int): ordinal number at which to initiate count
             sep (bytes): separator character for split
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             if key:  # not empty
                 onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
@@ -924,7 +1235,7 @@ class LMDBer(filing.Filer):
             on (int): ordinal number at which to initiate retrieval
             sep (bytes): separator character for split
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             if key:  # not empty
                 onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
@@ -973,7 +1284,7 @@ class LMDBer(filing.Filer):
         """
         result = False
         vals = oset(vals)  # make set
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True) as txn:
             ion = 0
             iokey = suffix(key, ion, sep=sep)  # start zeroth entry if any
             cursor = txn.cursor()
@@ -1013,7 +1324,7 @@ class LMDBer(filing.Filer):
             val (bytes): serialized value to add
 
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True) as txn:
             vals = oset()
             ion = 0
             iokey = suffix(key, ion, sep=sep)  # start zeroth entry if any
@@ -1052,7 +1363,7 @@ class LMDBer(filing.Filer):
         self.delIoSetVals(db=db, key=key, sep=sep)
         result = False
         vals = oset(vals)  # make set
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True) as txn:
             for i, val in enumerate(vals):
                 iokey = suffix(key, i, sep=sep)  # ion is at add on amount
                 result = txn.put(iokey, val, dupdata=False, overwrite=True) or result
@@ -1074,7 +1385,7 @@ class LMDBer(filing.Filer):
             ion (int): starting ordinal value, default 0
 
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False) as txn:
             vals = []
             iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
             cursor = txn.cursor()
@@ -1102,7 +1413,7 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
             ion (int): starting ordinal value, default 0
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False) as txn:
             iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
@@ -1130,7 +1441,7 @@ class LMDBer(filing.Filer):
         val = None
         ion = None  # no last value
         iokey = suffix(key, ion=MaxSuffix, sep=sep)  # make iokey at max and walk back
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False) as txn:
             cursor = txn.cursor()  # create cursor to walk back
             if not cursor.set_range(iokey):  # max is past end of database
                 # Three possibilities for max past end of database
@@ -1196,7 +1507,7 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
         """
         result = False
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True) as txn:
             iokey = suffix(key, 0, sep=sep)  # start at zeroth value for key
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
@@ -1239,7 +1550,7 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
             val (bytes): value to delete
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True) as txn:
             iokey = suffix(key, 0, sep=sep)  # start zeroth value for key
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
@@ -1294,7 +1605,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             vals is list of bytes of values to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True) as txn:
             result = True
             try:
                 for val in vals:
@@ -1327,7 +1638,7 @@ class LMDBer(filing.Filer):
         dups = set(self.getVals(db, key))  #get preexisting dups if any
         result = False
         if val not in dups:
-            with self.env.begin(db=db, write=True, buffers=True) as txn:
+            with self.begin(db=db, write=True) as txn:
                 try:
                     result = txn.put(key, val, dupdata=True)
                 except lmdb.BadValsizeError as ex:
@@ -1348,7 +1659,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             vals = []
             try:
@@ -1371,7 +1682,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             val = None
             try:
@@ -1395,7 +1706,7 @@ class LMDBer(filing.Filer):
             db is opened named sub db with dupsort=True
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             vals = []
             try:
@@ -1415,7 +1726,7 @@ class LMDBer(filing.Filer):
             db is opened named sub db with dupsort=True
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             count = 0
             try:
@@ -1440,7 +1751,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             val is bytes of dup val at key to delete
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True) as txn:
             try:
                 return (txn.delete(key, val))
             except lmdb.BadValsizeError as ex:
@@ -1480,7 +1791,7 @@ class LMDBer(filing.Filer):
 
         result = False
         dups = set(self.getIoDupVals(db, key))  #get preexisting dups if any
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True) as txn:
             idx = 0
             cursor = txn.cursor()
             try:
@@ -1555,7 +1866,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             vals = []
             try:
@@ -1594,7 +1905,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             vals = []
             try:
@@ -1631,7 +1942,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             val = None
             try:
@@ -1667,7 +1978,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True) as txn:
             try:
                 return (txn.delete(key))
             except lmdb.BadValsizeError as ex:
@@ -1703,7 +2014,7 @@ class LMDBer(filing.Filer):
             val is bytes of value to be deleted without intersion ordering proem
         """
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True) as txn:
             cursor = txn.cursor()
             try:
                 if cursor.set_key(key):  # move to first_dup
@@ -1739,7 +2050,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             count = 0
             try:
@@ -2021,7 +2332,7 @@ class LMDBer(filing.Filer):
             on (int): ordinal number at which to initiate retrieval
             sep (bytes): separator character for split
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             if key:  # not empty
                 onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
@@ -2103,7 +2414,7 @@ class LMDBer(filing.Filer):
             on (int): ordinal number at which to initiate retrieval
             sep (bytes): separator character for split
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             if not cursor.last():  # pre-position cursor at last dup of last key
                 return  # empty database so raise StopIteration
@@ -4,8 +4,12 @@ KERI
 keri.db.koming module
 
 """
+import dataclasses
+import functools
+import hashlib
 import types
 import json
+import typing
 from dataclasses import dataclass
 from typing import Type, Union
 from collections.abc import Iterable
@@ -23,8 +27,122 @@ from ..help import helping
 logger = help.ogler.getLogger()
 
 
+def _dataclassOf(typ):
+    """
+    Returns dataclass class given by field type typ when typ is a dataclass or
+    an Optional or Union of exactly one dataclass, otherwise None
+    """
+    if dataclasses.is_dataclass(typ) and isinstance(typ, type):
+        return typ
+    klases = [arg for arg in typing.get_args(typ)
+              if dataclasses.is_dataclass(arg) and isinstance(arg, type)]
+    return klases[0] if len(klases) == 1 else None
+
 
-class KomerBase:
+def _layoutTag(names):
+    """
+    Returns int layout tag of field names, the 32 bit blake2b digest of names
+    """
+    return int.from_bytes(hashlib.blake2b("\n".join(names).encode("utf-8"),
+                                          digest_size=4).digest(), "big")
+
+
+class Packer:
+    """
+    Packer is a compact positional msgpack codec compiled once per dataclass
+    schema. A record is packed as the msgpack array of its init field values
+    in field order without field names. Nested dataclass fields are packed as
+    nested arrays. Unpacking constructs the dataclass positionally from the
+    array without building an intermediate dict as datify does.
+
+    Because packing is positional, fields may only be appended to a schema
+    and appended fields must have defaults so that records packed before the
+    append still unpack. This is enforced by a layout tag packed as the first
+    array element of each record and nested record. The tag is the digest of
+    the names of the fields the record was packed with. Unpack checks it
+    against the tag of the same number of leading fields of the current
+    schema so that a record whose fields were since reordered, renamed,
+    inserted or removed raises ValueError instead of unpacking into the
+    wrong fields.
+
+    Use packer(schema) to get the cached Packer of a schema.
+
+    Attributes:
+        schema (Type[dataclass]): class reference of dataclass
+        names (tuple[str]): init field names in field order
+        nesteds (tuple): of (index, Packer) for nested dataclass fields
+        tags (tuple[int]): layout tags where tags[k] is the tag of the first
+            k field names
+    """
+
+    def __init__(self, schema: Type[dataclass]):
+        """
+        Parameters:
+            schema (Type[dataclass]): class reference of dataclass
+        """
+        if not (dataclasses.is_dataclass(schema) and isinstance(schema, type)):
+            raise ValueError(f"Invalid schema={schema}, expected dataclass.")
+        self.schema = schema
+        fields = [f for f in dataclasses.fields(schema) if f.init]
+        self.names = tuple(f.name for f in fields)
+        self.tags = tuple(_layoutTag(self.names[:k]) for k in range(len(self.names) + 1))
+        try:
+            hints = typing.get_type_hints(schema)
+        except NameError:  # unresolvable forward reference so use raw annotations
+            hints = {f.name: f.type for f in fields}
+        self.nesteds = tuple((i, packer(klas)) for i, f in enumerate(fields)
+                             if (klas := _dataclassOf(hints.get(f.name))) is not None
+                             and klas is not schema)
+
+    def encode(self, val):
+        """
+        Returns list of layout tag followed by field values of dataclass
+        instance val with nested dataclass values encoded as lists
+        """
+        vals = [getattr(val, name) for name in self.names]
+        for i, nested in self.nesteds:
+            if dataclasses.is_dataclass(vals[i]):
+                vals[i] = nested.encode(vals[i])
+        return [self.tags[-1]] + vals
+
+    def decode(self, vals):
+        """
+        Returns instance of .schema from list vals as encoded by .encode
+
+        Raises:
+            ValueError: when layout tag of vals does not match the leading
+                fields of .schema
+        """
+        if not vals or len(vals) - 1 > len(self.names):
+            raise ValueError(f"Invalid packed {self.schema.__name__} with "
+                             f"{len(vals) - 1} values, expected at most {len(self.names)}.")
+        tag, *vals = vals
+        if tag != self.tags[len(vals)]:
+            raise ValueError(f"Invalid packed {self.schema.__name__} layout tag="
+                             f"{tag}, fields not appended only since packed.")
+        for i, nested in self.nesteds:
+            if i < len(vals) and isinstance(vals[i], list):
+                vals[i] = nested.decode(vals[i])
+        return self.schema(*vals)
+
+    def pack(self, val):
+        """ Returns msgpack bytes of dataclass instance val """
+        return msgpack.dumps(self.encode(val), default=dataclasses.asdict)
+
+    def unpack(self, raw):
+        """ Returns instance of .schema from msgpack bytes raw as packed by .pack """
+        return self.decode(msgpack.loads(raw))
+
+
+@functools.cache
+def packer(schema: Type[dataclass]):
+    """
+    Returns cached Packer compiled for dataclass schema
+    """
+    return Packer(schema)
+
+
+class KomerBase(dbing.Bulker):
     """
     KomerBase is a base class for Komer (Keyspace Object Mapper) subclasses that
     each use a dataclass as the object mapped via serialization to an dber LMDB
@@ -41,6 +159,11 @@ class KomerBase:
         serializer (types.MethodType): serializer method
         deserializer (types.MethodType): deserializer method
         sep (str): separator for combining keys tuple of strs into key bytes
+
+    Properties:
+        packed (bool): True means records are serialized by the positional
+            Packer of .schema instead of by .kind. Setting rebinds
+            .serializer and .deserializer
     """
     Sep = '.'  # separator for combining key iterables
 
@@ -50,6 +173,7 @@ class KomerBase:
                  kind: str = coring.Kinds.json,
                  dupsort: bool = False,
                  sep: str = None,
+                 packed: bool = False,
                  **kwa):
         """
         Parameters:
@@ -62,17 +186,40 @@ class KomerBase:
                                each key
             sep (str): separator to convert keys iterator to key bytes for db key
                        default is self.Sep == '.'
+            packed (bool): True means serialize with positional Packer of schema
+                           False (default) means serialize with kind
         """
         super(KomerBase, self).__init__()
         self.db = db
         self.sdb = self.db.env.open_db(key=subkey.encode("utf-8"), dupsort=dupsort)
         self.schema = schema
         self.kind = kind
-        self.serializer = self._serializer(kind)
-        self.deserializer = self._deserializer(kind)
+        self.packed = packed
         self.sep = sep if sep is not None else self.Sep
 
 
+    @property
+    def packed(self):
+        """
+        Returns True when records are serialized by positional Packer
+        """
+        return self._packed
+
+
+    @packed.setter
+    def packed(self, packed):
+        """
+        Sets packed and rebinds .serializer and .deserializer accordingly
+        """
+        self._packed = True if packed else False
+        if self._packed:
+            self.serializer = self.__serializePacked
+            self.deserializer = self.__deserializePacked
+        else:
+            self.serializer = self._serializer(self.kind)
+            self.deserializer = self._deserializer(self.kind)
+
+
     def _tokey(self, keys: str|bytes|memoryview|Iterable[str|bytes|memoryview],
                 topive: bool=False):
         """
@@ -228,6 +375,21 @@ class KomerBase:
         return val
 
 
+    def __deserializePacked(self, val):
+        if val is not None:
+            val = packer(self.schema).unpack(bytes(val))
+        return val
+
+
+    def __serializePacked(self, val):
+        if val is not None:
+            if not isinstance(val, self.schema):
+                raise ValueError("Invalid schema type={} of value={}, expected {}."
+                                 "".format(type(val), val, self.schema))
+            val = packer(self.schema).pack(val)
+        return val
+
+
     def __serializeJSON(self, val):
         if val is not None:
             if not isinstance(val, self.schema):
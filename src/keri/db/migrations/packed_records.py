@@ -0,0 +1,113 @@
+# -*- encoding: utf-8 -*-
+"""
+keri.db.migrations.packed_records module
+
+Opt in migration that converts the records of the Komer sub dbs of a Baser
+from JSON to the compact positional serialization of koming.Packer. Run by
+Baser.reopen when the Baser is created with packed=True and the database has
+not already been converted. Completion is recorded in .migs so later opens of
+the database use packed records. All the sub dbs are converted and the .migs
+record written in one write transaction so an interrupted migration leaves the
+database unchanged.
+"""
+from keri.core import coring
+from keri.db import basing, koming
+
+
+def _check_if_needed(db):
+    """
+    Check if the migration is needed
+    Parameters:
+        db(Baser): Baser database object on which to run the migration
+    Returns:
+        bool: True if the migration is needed, False otherwise
+    """
+    return db.migs.get(keys=(basing.PackedMigration,)) is None
+
+
+def convert(db, komer: koming.KomerBase, packed: bool = True):
+    """
+    Rewrites every record of komer from the serialization given by not packed
+    to the serialization given by packed and sets komer.packed to packed. Runs
+    in a child transaction of the active transaction of db if any so that the
+    conversion of komer commits or aborts with it.
+
+    Parameters:
+        db (LMDBer): database of komer
+        komer (KomerBase): Komer or IoSetKomer sub db
+        packed (bool): True means convert to Packer. False means back to .kind
+
+    Returns:
+        count (int): number of records converted
+    """
+    with db.savepoint(), db.begin(db=komer.sdb, write=True, buffers=False) as txn:
+        komer.packed = not packed
+        items = [(key, komer.deserializer(val)) for key, val in txn.cursor()]
+        komer.packed = packed
+        for key, val in items:
+            txn.put(key, komer.serializer(val))
+    return len(items)
+
+
+def _convertAll(db, packed):
+    """
+    Converts records of all Komer sub dbs of db to the serialization given by
+    packed and records it in db.migs all in one write transaction. When the
+    transaction aborts the .packed of every sub db is restored to not packed.
+
+    Parameters:
+        db (Baser): Baser database object on which to run the migration
+        packed (bool): True means convert to Packer. False means back to .kind
+
+    Returns:
+        count (int): number of records converted
+    """
+    komers = db.komers()
+    count = 0
+    try:
+        with db.transaction():
+            for komer in komers:
+                count += convert(db, komer, packed=packed)
+            if packed:
+                db.migs.pin(keys=(basing.PackedMigration,), val=coring.Dater())
+            else:
+                db.migs.rem(keys=(basing.PackedMigration,))
+    except BaseException:
+        for komer in komers:
+            komer.packed = not packed
+        raise
+    return count
+
+
+def migrate(db):
+    """
+    Convert records of all Komer sub dbs of db given by db.komers from JSON to
+    positional Packer serialization
+
+    Parameters:
+        db(Baser): Baser database object on which to run the migration
+    """
+    if not _check_if_needed(db):
+        print(f"{__name__} migration not needed, database already in correct state")
+        return
+
+    count = _convertAll(db, packed=True)
+    db.packed = True
+    print(f"{__name__} converted {count} records to packed")
+
+
+def revert(db):
+    """
+    Convert records of all Komer sub dbs of db given by db.komers from
+    positional Packer serialization back to JSON so that the database may be
+    opened by a version without packed records
+
+    Parameters:
+        db(Baser): Baser database object on which to run the migration
+    """
+    if _check_if_needed(db):
+        print(f"{__name__} revert not needed, database already in correct state")
+        return
+
+    _convertAll(db, packed=False)
+    db.packed = False
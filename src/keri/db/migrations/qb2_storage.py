@@ -0,0 +1,112 @@
+# -*- encoding: utf-8 -*-
+"""
+keri.db.migrations.qb2_storage module
+
+Opt in migration that converts the values of the CESR sub dbs of a Baser from
+qb64b text to qb2 binary. Run by Baser.reopen when the Baser is created with
+qb2=True and the database has not already been converted. Completion is
+recorded in .migs so later opens of the database use qb2 storage. All the sub
+dbs are converted and the .migs record written in one write transaction so an
+interrupted migration leaves the database unchanged.
+"""
+from keri.core import coring
+from keri.db import basing, subing
+
+
+def _check_if_needed(db):
+    """
+    Check if the migration is needed
+    Parameters:
+        db(Baser): Baser database object on which to run the migration
+    Returns:
+        bool: True if the migration is needed, False otherwise
+    """
+    return db.migs.get(keys=(basing.Qb2Migration,)) is None
+
+
+def convert(db, suber: subing.CesrSuberBase, qb2: bool = True):
+    """
+    Rewrites every value of suber from the storage given by not qb2 to the
+    storage given by qb2 and sets suber.qb2 to qb2. Runs in a child
+    transaction of the active transaction of db if any so that the conversion
+    of suber commits or aborts with it.
+
+    Parameters:
+        db (LMDBer): database of suber
+        suber (CesrSuberBase): sub db with CESR primitive values
+        qb2 (bool): True means convert qb64b to qb2. False means qb2 to qb64b
+
+    Returns:
+        count (int): number of values converted
+    """
+    with db.savepoint(), db.begin(db=suber.sdb, write=True, buffers=False) as txn:
+        suber.qb2 = not qb2
+        items = [(key, suber._des(val)) for key, val in txn.cursor()]
+        suber.qb2 = qb2
+        for key, val in items:
+            txn.put(key, suber._ser(val))
+    return len(items)
+
+
+def _convertAll(db, qb2):
+    """
+    Converts values of all CESR sub dbs of db to the storage given by qb2 and
+    records it in db.migs all in one write transaction. When the transaction
+    aborts the .qb2 of every sub db is restored to not qb2.
+
+    Parameters:
+        db (Baser): Baser database object on which to run the migration
+        qb2 (bool): True means convert qb64b to qb2. False means qb2 to qb64b
+
+    Returns:
+        count (int): number of values converted
+    """
+    subers = db.cesrSubers()
+    count = 0
+    try:
+        with db.transaction():
+            for suber in subers:
+                count += convert(db, suber, qb2=qb2)
+            if qb2:
+                db.migs.pin(keys=(basing.Qb2Migration,), val=coring.Dater())
+            else:
+                db.migs.rem(keys=(basing.Qb2Migration,))
+    except BaseException:
+        for suber in subers:
+            suber.qb2 = not qb2
+        raise
+    return count
+
+
+def migrate(db):
+    """
+    Convert values of all CESR sub dbs of db given by db.cesrSubers from qb64b
+    text to qb2 binary
+
+    Parameters:
+        db(Baser): Baser database object on which to run the migration
+    """
+    if not _check_if_needed(db):
+        print(f"{__name__} migration not needed, database already in correct state")
+        return
+
+    count = _convertAll(db, qb2=True)
+    db.qb2 = True
+    print(f"{__name__} converted {count} values to qb2")
+
+
+def revert(db):
+    """
+    Convert values of all CESR sub dbs of db given by db.cesrSubers from qb2
+    binary back to qb64b text so that the database may be opened by a version
+    without qb2 storage
+
+    Parameters:
+        db(Baser): Baser database object on which to run the migration
+    """
+    if _check_if_needed(db):
+        print(f"{__name__} revert not needed, database already in correct state")
+        return
+
+    _convertAll(db, qb2=False)
+    db.qb2 = False
@@ -106,7 +106,7 @@ from . import dbing
 logger = help.ogler.getLogger()
 
 
-class SuberBase():
+class SuberBase(dbing.Bulker):
     """
     Base class for Sub DBs of LMDBer
     Provides common methods for subclasses
@@ -825,10 +825,19 @@ class CesrSuberBase(SuberBase):
     instance such as Matter, Indexer, Counter with .qb64b property when provided
     as fully qualified serialization
     Automatically serializes and deserializes from qb64b to/from CESR instance
+    or from qb2 when .qb2 is True
+
+    Attributes:
+        klas (Type[coring.Matter]): Class reference to subclass of Matter or
+                Indexer or Counter or any ducktyped class of Matter
+        qb2 (bool): True means store values as qb2 binary, one third smaller
+                than qb64b and parsed without Base64 decoding.
+                False means store values as qb64b text
 
     """
 
-    def __init__(self, *pa, klas: Type[coring.Matter] = coring.Matter, **kwa):
+    def __init__(self, *pa, klas: Type[coring.Matter] = coring.Matter,
+                 qb2: bool = False, **kwa):
         """
         Inherited Parameters:
             db (dbing.LMDBer): base db
@@ -843,10 +852,13 @@ class CesrSuberBase(SuberBase):
         Parameters:
             klas (Type[coring.Matter]): Class reference to subclass of Matter or
                 Indexer or Counter or any ducktyped class of Matter
+            qb2 (bool): True means store values as qb2 binary
+                False means store values as qb64b text. Default False
 
         """
         super(CesrSuberBase, self).__init__(*pa, **kwa)
         self.klas = klas
+        self.qb2 = qb2
 
 
     def _ser(self, val: coring.Matter):
@@ -855,7 +867,7 @@ class CesrSuberBase(SuberBase):
         Parameters:
             val (coring.Matter): instance Matter ducktype with .qb64b attribute
         """
-        return val.qb64b
+        return val.qb2 if self.qb2 else val.qb64b
 
 
     def _des(self, val: memoryview | bytes):
@@ -866,6 +878,8 @@ class CesrSuberBase(SuberBase):
         """
         if isinstance(val, memoryview):  # memoryview is always bytes
             val = bytes(val)  # convert to bytes
+        if self.qb2:
+            return self.klas(qb2=val)
         return self.klas(qb64b=val)  # qb64b parameter accepts str
 
 
@@ -978,6 +992,8 @@ class CatCesrSuberBase(CesrSuberBase):
         """
         if not isNonStringIterable(val):  # not iterable
             val = (val, )  # make iterable
+        if self.qb2:
+            return (b''.join(obj.qb2 for obj in val))
         return (b''.join(obj.qb64b for obj in val))
 
 
@@ -995,6 +1011,8 @@ class CatCesrSuberBase(CesrSuberBase):
         """
         if not isinstance(val, bytearray):  # is memoryview or bytes
             val = bytearray(val)  # convert so may strip
+        if self.qb2:
+            return tuple(klas(qb2=val, strip=True) for klas in self.klas)
         return tuple(klas(qb64b=val, strip=True) for klas in self.klas)
 
 
@@ -1431,7 +1449,7 @@ class SignerSuber(CesrSuber):
         val = self.db.getVal(db=self.sdb, key=key)
         keys = self._tokeys(key)  # verkey is last split if any
         verfer = coring.Verfer(qb64b=keys[-1])  # last split
-        return (self.klas(qb64b=bytes(val), transferable=verfer.transferable)
+        return (self._designer(val, transferable=verfer.transferable)
                 if val is not None else None)
 
 
@@ -1462,8 +1480,21 @@ class SignerSuber(CesrSuber):
                                         top=self._tokey(keys, topive=topive)):
             ikeys = self._tokeys(key)  # verkey is last split if any
             verfer = coring.Verfer(qb64b=ikeys[-1])   # last split
-            yield (ikeys, self.klas(qb64b=bytes(val),
-                                   transferable=verfer.transferable))
+            yield (ikeys, self._designer(val, transferable=verfer.transferable))
+
+
+    def _designer(self, val: memoryview | bytes, transferable: bool):
+        """
+        Returns Signer instance deserialized from val stored as qb2 or qb64b
+        per .qb2 with .transferable from the verfer of the db key
+
+        Parameters:
+            val (memoryview | bytes): stored signer serialization
+            transferable (bool): True means verfer of signer is transferable
+        """
+        if self.qb2:
+            return self.klas(qb2=bytes(val), transferable=transferable)
+        return self.klas(qb64b=bytes(val), transferable=transferable)
 
 
 class CryptSignerSuber(SignerSuber):
@@ -381,11 +381,9 @@ def codeB2ToB64(b, l):
     n = sceil(l * 3 / 4)  # number of bytes needed for l sextets
     if n > len(b):
         raise ValueError("Not enough bytes in {} to nab {} sextets.".format(b, l))
-    i = int.from_bytes(b[:n], 'big')  # convert only first n bytes to int
-    # check if prepad bits are zero
-    tbs = 2 * (l % 4)  # trailing bit size in bits
-    i >>= tbs  # right shift out trailing bits to make right aligned
-    return (intToB64(i, l))  # return as B64
+    # zero pad to whole triplets so Base64 encode of front n bytes in C gives
+    # one char per sextet then keep first l chars dropping trailing pad bits
+    return base64.urlsafe_b64encode(bytes(b[:n]) + bytes(-n % 3))[:l].decode()
 
 
 def nabSextets(b, l):
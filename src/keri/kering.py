@@ -227,7 +227,8 @@ def smell(raw):
     if len(raw) < SMELLSIZE:
         raise ShortageError(f"Need more raw bytes to smell full version string.")
 
-    match = Rever.search(raw)  # Rever regex takes bytes/bytearray not str
+    # bound search to SMELLSIZE so never scans rest of large stream
+    match = Rever.search(raw, 0, SMELLSIZE)  # Rever regex takes bytes/bytearray not str
     if not match or match.start() > MAXVSOFFSET:
         raise VersionError(f"Invalid version string from smelled raw = "
                            f"{raw[: SMELLSIZE]}.")
@@ -57,7 +57,8 @@ class Exchanger:
 
         self.routes[handler.resource] = handler
 
-    def processEvent(self, serder, tsgs=None, cigars=None, ptds=None, essrs=None, **kwa):
+    def processEvent(self, serder, tsgs=None, cigars=None, ptds=None, essrs=None,
+                     verifieds=None, **kwa):
         """ Process one serder event with attached indexed signatures representing a Peer to Peer exchange message.
 
         Parameters:
@@ -71,6 +72,8 @@ class Exchanger:
             cigars (list): of Cigar instances of attached non-trans sigs
             ptds (list[bytes]): pathed Cesr Streams
             essrs (list[Texter]): ESSR streams as Texters
+            verifieds (frozenset): of (code, key, sig, ser) quadruples of
+                signatures already verified. See eventing.verifySigs
 
         """
         ptds = ptds if ptds is not None else []
@@ -119,7 +122,9 @@ class Exchanger:
                     logger.debug("Exchange message body=\n%s\n", serder.pretty())
                     raise MissingSignatureError(msg)
 
-                if not cigar.verfer.verify(cigar.raw, serder.raw):  # cig not verify
+                if ((not verifieds or (cigar.verfer.code, cigar.verfer.raw, cigar.raw,
+                                       serder.raw) not in verifieds)
+                        and not cigar.verfer.verify(cigar.raw, serder.raw)):  # cig not verify
                     msg = (f"Failure satisfying exn on cigs for {cigar} route={route} "
                            f"for evt = {serder.said} recipient={serder.ked.get('rp', '')}")
                     logger.info(msg)
@@ -725,7 +725,7 @@ class Registrar(doing.DoDoer):
 
     def processWitnessEscrow(self):
         """
-        Process escrow of group multisig events that do not have a full complement of receipts
+        Process escrow of group multisig events that do not have a witness threshold (toad) of receipts
         from witnesses yet.  When receipting is complete, remove from escrow and cue up a message
         that the event is complete.
         """
@@ -736,7 +736,7 @@ class Registrar(doing.DoDoer):
             # Load all the witness receipts we have so far
             wigs = self.hby.db.getWigs(dgkey)
             if kever.wits:
-                if len(wigs) == len(kever.wits):  # We have all of them, this event is finished
+                if len(wigs) >= kever.toader.num:  # witness threshold met so this event is finished
                     hab = self.hby.habs[prefixer.qb64]
                     witnessed = False
                     for cue in self.witDoer.cues:
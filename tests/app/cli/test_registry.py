@@ -0,0 +1,84 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.app.cli.test_registry module
+
+"""
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+from keri.app.cli import commands, registry
+
+
+def test_manifest():
+    """
+    Test static Manifest matches commands package so lazy parser offers the
+    same commands as multicommand
+    """
+    assert registry.scan(commands) == registry.Manifest
+
+    assert registry.summary(None) is None
+    assert registry.summary("Short") == "Short"
+    assert registry.summary("x" * 60) == "x" * 46 + " ..."
+
+    assert "escrow" in registry.children("")
+    assert "escrow.list" not in registry.children("")
+    assert registry.children("escrow") == ["clear", "list"]
+    assert registry.children("version") == []
+
+    """End Test"""
+
+
+def test_create_parser():
+    """
+    Test lazily created parser parses the same args as the selected command
+    module parser and imports only that module
+    """
+    argvs = [["version"],
+             ["init", "--name", "test", "--nopasscode"],
+             ["incept", "--name", "test", "--alias", "aid", "--file", "f.json"],
+             ["escrow", "list", "--name", "test", "--escrow", "ooes"],
+             ["vc", "registry", "list", "--name", "test"],
+             ["multisig", "incept", "--name", "test", "--alias", "aid", "--group", "g",
+              "--file", "f.json"]]
+    for argv in argvs:
+        lazy = registry.createParser(argv, prog="kli")
+        depth = next(i for i in range(len(argv), 0, -1) if ".".join(argv[:i]) in registry.Manifest)
+        module = importlib.import_module(f"{registry.Package}.{'.'.join(argv[:depth])}")
+        assert vars(lazy.parse_args(argv)) == vars(module.parser.parse_args(argv[depth:]))
+
+    # group without command has no handler so kli prints help
+    args = registry.createParser(["escrow"], prog="kli").parse_args(["escrow"])
+    assert not hasattr(args, "handler")
+
+    # unknown commands still fail with choices of all commands
+    with pytest.raises(SystemExit):
+        registry.createParser(["bogus"], prog="kli").parse_args(["bogus"])
+
+    """End Test"""
+
+
+def test_help_imports():
+    """
+    Test kli --help imports no command modules or heavy dependencies
+    """
+    result = subprocess.run([sys.executable, "-c",
+                             "import sys; sys.argv = ['kli', '--help']\n"
+                             "from keri.app.cli import kli\n"
+                             "try:\n"
+                             "    kli.main()\n"
+                             "finally:\n"
+                             "    sys.stderr.write('\\n'.join(sys.modules))"],
+                            capture_output=True, text=True)
+    assert result.returncode == 0
+    assert "incept" in result.stdout
+
+    modules = set(result.stderr.splitlines())
+    assert "keri.app.cli.kli" in modules
+    for name in ("keri.app.habbing", "keri.app.directing", "keri.vdr.credentialing",
+                 "keri.app.cli.commands.incept", "falcon"):
+        assert name not in modules
+
+    """End Test"""
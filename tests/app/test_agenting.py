@@ -109,6 +109,63 @@ class ReceiptDoer(doing.DoDoer):
         return True
 
 
+def test_witness_receiptor_quorum(seeder):
+    """
+    Test WitnessReceiptor cues event once toad witnesses receipt it while
+    an unresponsive witness is waited on in the background
+    """
+    with habbing.openHby(name="wan4", salt=core.Salter(raw=b'wann-the-witness').qb64) as wanHby, \
+            habbing.openHby(name="wil4", salt=core.Salter(raw=b'will-the-witness').qb64) as wilHby, \
+            habbing.openHby(name="wes4", salt=core.Salter(raw=b'wess-the-witness').qb64) as wesHby, \
+            habbing.openHby(name="pal4", salt=core.Salter(raw=b'0123456789abcdef').qb64) as palHby:
+
+        wanDoers = indirecting.setupWitness(alias="wan", hby=wanHby, tcpPort=5632, httpPort=5642)
+        wilDoers = indirecting.setupWitness(alias="wil", hby=wilHby, tcpPort=5633, httpPort=5643)
+        wesHab = wesHby.makeHab(name="wes", transferable=False)  # never runs
+
+        wanHab = wanHby.habByName(name="wan")
+        wilHab = wilHby.habByName(name="wil")
+        seeder.seedWitEnds(palHby.db, witHabs=[wanHab, wilHab, wesHab], protocols=[kering.Schemes.tcp])
+
+        palHab = palHby.makeHab(name="pal", wits=[wanHab.pre, wilHab.pre, wesHab.pre],
+                                toad=2, transferable=True)
+        assert palHab.kever.toader.num == 2
+
+        witDoer = agenting.WitnessReceiptor(hby=palHby, timeout=0.5)
+        witDoer.msgs.append(dict(pre=palHab.pre))
+        assert not witDoer.idle
+
+        doist = doing.Doist(limit=5.0, tock=0.03125, doers=wanDoers + wilDoers + [witDoer])
+        doist.enter()
+        tymer = tyming.Tymer(tymth=doist.tymen(), duration=doist.limit)
+        while not (witDoer.cues or tymer.expired):
+            doist.recur()
+            time.sleep(doist.tock)
+
+        assert witDoer.cues.pull() == dict(pre=palHab.pre)  # cued at toad
+        assert not witDoer.idle  # still waiting on wes
+        assert set(witDoer.latencies) == {wanHab.pre, wilHab.pre}
+        assert all(sum(histogram) == 1 for histogram in witDoer.latencies.values())
+        assert all(len(histogram) == len(witDoer.Buckets) + 1
+                   for histogram in witDoer.latencies.values())
+
+        ser = palHab.kever.serder
+        dgkey = dbing.dgKey(ser.preb, ser.saidb)
+        while not (witDoer.idle or tymer.expired):
+            doist.recur()
+            time.sleep(doist.tock)
+
+        assert witDoer.idle
+        assert not witDoer.cues  # cued only once
+        assert len(palHby.db.getWigs(dgkey)) == 2
+        for hab in (wanHab, wilHab):  # propagated receipts of each other
+            assert len(hab.db.getWigs(dgkey)) == 2
+
+        doist.exit()
+
+    """End Test"""
+
+
 def test_witness_sender(seeder):
     with habbing.openHby(name="wan2", salt=core.Salter(raw=b'wann-the-witness').qb64) as wanHby, \
             habbing.openHby(name="wil2", salt=core.Salter(raw=b'will-the-witness').qb64) as wilHby, \
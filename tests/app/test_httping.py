@@ -3,13 +3,18 @@
 tests.peer.httping module
 
 """
+import datetime
+import time
 
 import falcon
 import pytest
 from falcon.testing import helpers
+from hio.base import doing
+from hio.core import http, tcp
 
 from keri.app import habbing, httping
 from keri.core import coring, serdering
+from keri.help import helping
 from keri.vdr import credentialing, verifying
 
 
@@ -202,3 +207,137 @@ def test_stream_cesr_request(mockHelpingNowUTC):
 
 if __name__ == '__main__':
     test_parse_cesr_request()
+
+
+class EchoEnd:
+    """ Echoes request body """
+
+    def on_post(self, req, rep):
+        rep.status = falcon.HTTP_200
+        rep.data = req.bounded_stream.read()
+
+
+def test_clienter_pool():
+    """
+    Test Clienter pools keep alive connections per origin
+    """
+    app = falcon.App()
+    end = EchoEnd()
+    app.add_route("/", end)
+    server = http.Server(host="127.0.0.1", port=5698, app=app)
+    assert server.reopen()
+    try:
+        clienter = httping.Clienter(limit=2, depth=4)
+        doist = doing.Doist(tock=0.0, real=False, limit=5.0, doers=[clienter])
+        doist.enter()
+
+        def pump(done, limit=2000):
+            for _ in range(limit):
+                server.service()
+                doist.recur()
+                server.service()
+                if done():
+                    return True
+                time.sleep(0.0005)
+            return False
+
+        # sequential requests reuse one connection
+        patron = clienter.patron("http://127.0.0.1:5698/")
+        assert patron.origin == ("http", "127.0.0.1", 5698)
+        assert patron.idle
+        for i in range(5):
+            patron.request(method="POST", body=f"{i}")
+            assert pump(lambda: patron.responses)
+            rep = patron.respond()
+            assert rep.status == 200
+            assert rep.body == f"{i}".encode()
+        assert patron.idle
+        stats = clienter.stats
+        assert stats["opened"] == 1
+        assert stats["connections"] == 1
+        assert stats["sent"] == 5
+        assert stats["reused"] == 4
+
+        # concurrent patrons share at most limit connections in request order
+        patrons = [clienter.request("POST", "http://127.0.0.1:5698/", body=f"p{i}")
+                   for i in range(10)]
+        assert clienter.stats["connections"] == 2
+        assert clienter.stats["flights"] == 8  # two connections at depth 4
+        assert clienter.stats["waiting"] == 2
+        assert pump(lambda: all(p.responses for p in patrons))
+        assert [p.respond().body for p in patrons] == [f"p{i}".encode() for i in range(10)]
+        assert clienter.stats["opened"] == 2
+
+        # removed patron's response is dropped
+        patron = clienter.request("POST", "http://127.0.0.1:5698/", body=b"gone")
+        clienter.remove(patron)
+        assert pump(lambda: clienter.stats["flights"] == 0)
+        assert not patron.responses
+
+        # connection closed by server is evicted and reopened
+        for ca in list(server.servant.ixes):
+            server.closeConnection(ca)
+        assert pump(lambda: clienter.stats["connections"] == 0)
+        patron = clienter.request("POST", "http://127.0.0.1:5698/", body=b"again")
+        assert pump(lambda: patron.responses)
+        assert patron.respond().body == b"again"
+        assert clienter.stats["opened"] == 3
+
+        # idle connections are evicted
+        clienter.idle = 0.0
+        assert pump(lambda: clienter.stats["connections"] == 0)
+        assert clienter.stats["evicted"] == 3
+
+        assert clienter.request("GET", "ftp://127.0.0.1/") is None
+        doist.exit()
+    finally:
+        server.close()
+
+    """End Test"""
+
+
+def test_clienter_timeout(monkeypatch):
+    """
+    Test Clienter times out each request from when it was sent so later
+    requests on the same connection do not extend the wait of earlier ones
+    """
+    server = tcp.Server(host="127.0.0.1", port=5699)  # accepts but never responds
+    assert server.reopen()
+    now = [helping.nowUTC()]
+    monkeypatch.setattr(httping.helping, "nowUTC", lambda: now[0])
+    try:
+        clienter = httping.Clienter(limit=1, depth=4, timeout=10.0)
+        doist = doing.Doist(tock=0.0, real=False, doers=[clienter])
+        doist.enter()
+
+        def pump(seconds):
+            now[0] += datetime.timedelta(seconds=seconds)
+            for _ in range(50):
+                server.serviceConnects()
+                doist.recur()
+                time.sleep(0.0005)
+
+        first = clienter.request("POST", "http://127.0.0.1:5699/", body=b"first")
+        pump(0)
+        pump(6)
+        second = clienter.request("POST", "http://127.0.0.1:5699/", body=b"second")
+        assert clienter.stats["flights"] == 2  # same connection
+        pump(0)
+
+        pump(6)  # first timed out, second not so retried on new connection
+        assert first.respond().status == 504
+        assert not second.responses
+        assert clienter.timeouts == 1
+        assert clienter.stats["flights"] == 1
+        assert clienter.stats["opened"] == 2
+
+        pump(6)  # retried second not yet timed out
+        assert not second.responses
+        pump(6)
+        assert second.respond().status == 504
+        assert clienter.timeouts == 2
+        doist.exit()
+    finally:
+        server.close()
+
+    """End Test"""
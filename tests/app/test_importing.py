@@ -0,0 +1,210 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.app.importing module
+
+"""
+import os
+import tempfile
+
+from keri import core
+from keri.kering import Vrsn_1_0
+from keri.app import habbing, importing
+from keri.core import eventing, parsing, serdering
+from keri.db import dbing
+
+
+def makeDump(hby, count=3, ixns=5):
+    """
+    Returns list of per prefix lists of exported event messages of count
+    identifiers each with ixns interaction events
+    """
+    pres = []
+    for i in range(count):
+        hab = hby.makeHab(name=f"aid{i}", isith='1', icount=1, transferable=True)
+        for j in range(ixns):
+            hab.interact()
+        pres.append(hab.pre)
+
+    return [[bytes(msg) for msg in hby.db.clonePreIter(pre=pre)] for pre in pres]
+
+
+def test_chunker():
+    """
+    Test chunker reads file in chunks through memory map
+    """
+    with tempfile.TemporaryDirectory() as dirpath:
+        path = os.path.join(dirpath, "stream.cesr")
+        with open(path, 'wb') as f:
+            pass
+        assert list(importing.chunker(path)) == []  # empty file
+
+        data = bytes(range(256)) * 10
+        with open(path, 'wb') as f:
+            f.write(data)
+        chunks = list(importing.chunker(path, size=1000))
+        assert [len(chunk) for chunk in chunks] == [1000, 1000, 560]
+        assert b''.join(chunks) == data
+
+    """End Test"""
+
+
+def test_importer():
+    """
+    Test Importer bulk import of out of order stream in small chunks
+    """
+    with habbing.openHby(name="src", salt=core.Salter(raw=b'0123456789abcdef').qb64) as src:
+        dump = makeDump(src, count=3, ixns=5)
+        pres = [serdering.SerderKERI(raw=msgs[0]).pre for msgs in dump]
+
+        # interleave prefixes and reverse each prefix's events
+        stream = bytearray()
+        for evts in zip(*[reversed(msgs) for msgs in dump]):
+            for evt in evts:
+                stream.extend(evt)
+
+        with habbing.openHby(name="dst") as dst, tempfile.TemporaryDirectory() as dirpath:
+            path = os.path.join(dirpath, "stream.cesr")
+            with open(path, 'wb') as f:
+                f.write(stream)
+
+            reports = []
+            importer = importing.Importer(db=dst.db, kvy=dst.kvy, rvy=dst.rvy,
+                                          size=100, batch=len(dump[0]) * 3,
+                                          progress=lambda c, r: reports.append(c))
+            count = importer.importFile(path)
+            assert count == 18
+            assert reports == [18]
+            assert importer.rate > 0.0
+            assert not importer.ims
+            assert not importer.pending
+
+            for pre in pres:
+                assert dst.db.kevers[pre].sn == 5
+                assert dst.db.kevers[pre].serder.said == src.db.kevers[pre].serder.said
+            assert dst.db.cnt(dst.db.ooes) == 0  # deferral in batch avoided escrow
+
+            # reimport is idempotent
+            importer = importing.Importer(db=dst.db, kvy=dst.kvy, size=64)
+            assert importer.importFile(path) == 18
+            for pre in pres:
+                assert dst.db.kevers[pre].sn == 5
+
+        # partial writes of a message that fails are discarded, others kept
+        with habbing.openHby(name="bad") as dst:
+            bad = serdering.SerderKERI(raw=dump[1][0])
+            processEvent = dst.kvy.processEvent
+
+            def failing(serder, **kwa):  # fails after event is logged
+                processEvent(serder=serder, **kwa)
+                if serder.said == bad.said:
+                    raise ValueError("failed after writes")
+
+            dst.kvy.processEvent = failing
+            importer = importing.Importer(db=dst.db, kvy=dst.kvy)
+            importer.feed(b''.join(dump[0]) + dump[1][0])
+            assert importer.finish() == 7
+            assert dst.db.kevers[pres[0]].sn == 5
+            assert dst.db.getEvt(dbing.dgKey(bad.pre, bad.said)) is None
+            assert dst.db.states.get(keys=bad.pre) is None
+            assert bad.pre not in dst.db.kevers
+
+        # failed message of prefix with committed key state keeps its kever
+        with habbing.openHby(name="kept") as dst:
+            bad = serdering.SerderKERI(raw=dump[0][3])
+            processEvent = dst.kvy.processEvent
+
+            def failing(serder, **kwa):
+                if serder.said == bad.said:
+                    raise ValueError("failed before writes")
+                processEvent(serder=serder, **kwa)
+
+            dst.kvy.processEvent = failing
+            importer = importing.Importer(db=dst.db, kvy=dst.kvy, size=64, batch=2)
+            importer.feed(b''.join(dump[0][:3]))  # first batch committed
+            assert importer.count == 2
+            kever = dst.db.kevers[pres[0]]
+            importer.feed(b''.join(dump[0][3:]))
+            assert importer.finish() == 6
+            assert dst.db.kevers[pres[0]] is kever  # not evicted
+            assert kever.sn == 2  # later events escrowed
+            assert dst.db.cnt(dst.db.ooes) == 2
+
+        # batches smaller than reorder distance fall back to escrow processing
+        with habbing.openHby(name="esc") as dst:
+            importer = importing.Importer(db=dst.db, kvy=dst.kvy, batch=2)
+            for i in range(0, len(stream), 50):
+                importer.feed(stream[i:i + 50])
+            assert importer.finish() == 18
+            for pre in pres:
+                assert dst.db.kevers[pre].sn == 5
+
+    """End Test"""
+
+
+def test_importer_recovery():
+    """
+    Test Importer keeps source stream order so that a recovery rotation logged
+    after the interaction events it supersedes imports to the same FEL
+    """
+    signers = core.Salter(raw=b'0123456789abcdef').signers(count=3, path="rec",
+                                                           temp=True)
+
+    def message(serder, signer):
+        return (serder.raw + core.Counter(core.Codens.ControllerIdxSigs,
+                                          version=Vrsn_1_0).qb64b
+                + signer.sign(serder.raw, index=0).qb64b)
+
+    icp = eventing.incept(keys=[signers[0].verfer.qb64],
+                          ndigs=[core.Diger(ser=signers[1].verfer.qb64b).qb64])
+    ixn1 = eventing.interact(pre=icp.pre, dig=icp.said, sn=1)
+    ixn2 = eventing.interact(pre=icp.pre, dig=ixn1.said, sn=2)
+    rot = eventing.rotate(pre=icp.pre, keys=[signers[1].verfer.qb64], dig=icp.said,
+                          ndigs=[core.Diger(ser=signers[2].verfer.qb64b).qb64], sn=1)
+    ixn3 = eventing.interact(pre=icp.pre, dig=rot.said, sn=2)
+    stream = (message(icp, signers[0]) + message(ixn1, signers[0]) +
+              message(ixn2, signers[0]) + message(rot, signers[1]) +
+              message(ixn3, signers[1]))
+
+    with habbing.openHby(name="src") as src, habbing.openHby(name="dst") as dst:
+        parsing.Parser(kvy=src.kvy, local=False,
+                       version=Vrsn_1_0).parse(ims=bytearray(stream))
+        fel = [bytes(dig) for _, _, dig in src.db.getFelItemPreIter(icp.pre.encode())]
+        assert len(fel) == 5  # recovery rotation logged after superseded ixns
+        assert src.db.kevers[icp.pre].serder.said == ixn3.said
+
+        importer = importing.Importer(db=dst.db, kvy=dst.kvy)
+        importer.feed(b''.join(src.db.clonePreIter(pre=icp.pre)))
+        assert importer.finish() == 5
+        assert [bytes(dig) for _, _, dig in dst.db.getFelItemPreIter(icp.pre.encode())] == fel
+        assert dst.db.kevers[icp.pre].serder.said == ixn3.said
+
+    """End Test"""
+
+
+def test_importer_chunked():
+    """
+    Test Importer fed a stream in small chunks ends with the same key state
+    as one shot parse of whole stream
+    """
+    with habbing.openHby(name="src", salt=core.Salter(raw=b'0123456789abcdef').qb64) as src:
+        dump = makeDump(src, count=4, ixns=19)
+        stream = b''.join(msg for msgs in dump for msg in msgs)
+        total = sum(len(msgs) for msgs in dump)
+        pres = [serdering.SerderKERI(raw=msgs[0]).pre for msgs in dump]
+
+        with (habbing.openHby(name="one") as one,
+              habbing.openHby(name="bulk") as dst):
+            parsing.Parser(kvy=one.kvy, local=False,
+                           version=Vrsn_1_0).parse(ims=bytearray(stream))
+            one.kvy.processEscrows()
+            assert all(one.db.kevers[pre].sn == 19 for pre in pres)
+
+            importer = importing.Importer(db=dst.db, kvy=dst.kvy, size=1 << 12)
+            for i in range(0, len(stream), 1 << 12):
+                importer.feed(stream[i:i + (1 << 12)])
+            assert importer.finish() == total
+            for pre in pres:
+                assert dst.db.kevers[pre].sn == 19
+                assert dst.db.kevers[pre].serder.said == one.db.kevers[pre].serder.said
+
+    """End Test"""
@@ -3,6 +3,7 @@
 tests.app.indirecting module
 
 """
+import asyncio
 import json
 import platform
 import time
@@ -18,7 +19,9 @@ from hio.help import decking
 
 from keri import kering
 from keri import core
-from keri.app import indirecting, storing, habbing, agenting
+from keri.app import indirecting, storing, habbing, agenting, httping
+from keri.core import serdering
+from keri.db import basing
 
 
 def test_mailbox_iter():
@@ -106,6 +109,42 @@ def test_mailbox_multiple_iter():
         next(mbi)
 
 
+def test_mailbox_iter_idle():
+    """
+    Test idle mailbox streams are only woken by announcer for their own topics
+    """
+    pre = "EA3mbE6upuYnFlx68GmLYCQd7cCcwG_AtHM6dW_GT068"
+    mbx = storing.Mailboxer(temp=True)
+    count = 100
+    mbis = []
+    for i in range(count):
+        mb = indirecting.MailboxIterable(mbx=mbx, pre=f"{pre}{i}",
+                                         topics={"/receipt": 0, "/challenge": 0, "/multisig": 0})
+        mbi = iter(mb)
+        assert next(mbi) == b'retry: 5000\n\n'
+        assert next(mbi) == b''  # initial scan of all topics
+        mbis.append(mbi)
+
+    for mbi in mbis:
+        assert next(mbi) == b''
+    assert all(not mb.listener.pending for mb in mbis)
+
+    # one stored message wakes only its own stream
+    mbx.storeMsg(topic=f"{pre}7/challenge", msg=b'{"t": "exn"}')
+    assert [i for i, mb in enumerate(mbis) if mb.listener.pending] == [7]
+    assert next(mbis[7]).startswith(b'id: 0\nevent: /challenge')
+    assert mbis[7].topics["/challenge"] == 1
+
+    for mb in mbis:  # rescan of all topics finds nothing new
+        mb.listener.pending.update(mb.listener.keys)
+        assert next(mb) == b''
+    assert mbis[7].topics["/challenge"] == 1
+
+    mbx.close(clear=True)
+
+    """End Test"""
+
+
 def test_qrymailbox_iter():
     with habbing.openHab(name="test", transferable=True, temp=True, salt=b'0123456789abcdef') as (hby, hab):
         assert hab.pre == 'EIaGMMWJFPmtXznY1IIiKDIrg-vIyge6mBl2QV8dDjI3'
@@ -300,3 +339,88 @@ if __name__ == "__main__":
     test_mailbox_iter()
     test_qrymailbox_iter()
     test_wit_query_ends()
+
+
+def test_async_http_end():
+    """
+    Test witness async HTTP ingress with processing tied responses and backpressure
+    """
+    with habbing.openHby(name="wes", salt=core.Salter(raw=b'wess-the-witness').qb64) as wesHby, \
+            habbing.openHby(name="pal", salt=core.Salter(raw=b'0123456789abcdef').qb64) as palHby:
+        doers = indirecting.setupWitness(alias="wes", hby=wesHby, tcpPort=None,
+                                         httpPort=5644, asgi=True)
+        ingress = next(d for d in doers if isinstance(d, indirecting.Ingress))
+        serverDoer = next(d for d in doers if isinstance(d, indirecting.AsgiServerDoer))
+        bridge = serverDoer.app
+        assert isinstance(bridge, indirecting.AsgiBridge)
+        assert serverDoer.port == 5644
+        assert serverDoer.server is None  # uvicorn only started on enter
+
+        palHab = palHby.makeHab(name="pal", transferable=True)
+        msgs = [palHab.makeOwnInception(), palHab.interact(), palHab.interact()]
+
+        def request(msg, attachments=None):
+            serder = serdering.SerderKERI(raw=bytes(msg))
+            atc = bytes(msg[serder.size:]).decode("utf-8")
+            return dict(body=serder.raw,
+                        headers={"Content-Type": httping.CESR_CONTENT_TYPE,
+                                 httping.CESR_ATTACHMENT_HEADER:
+                                     attachments if attachments is not None else atc})
+
+        async def pump():
+            while True:
+                ingress.process()
+                await asyncio.sleep(0.001)
+
+        async def run():
+            pumper = asyncio.create_task(pump())
+            async with testing.ASGIConductor(bridge) as conductor:
+                # processed and accepted before response, connection kept alive
+                res = await conductor.simulate_post("/", **request(msgs[0]))
+                assert res.status_code == 204
+                assert "connection" not in res.headers
+                assert palHab.pre in wesHby.db.kevers
+
+                # out of order is escrowed
+                res = await conductor.simulate_post("/", **request(msgs[2]))
+                assert res.status_code == 202
+                res = await conductor.simulate_post("/", **request(msgs[1]))
+                assert res.status_code == 204
+                assert wesHby.db.kevers[palHab.pre].sn == 1
+
+                # invalid attachments rejected
+                res = await conductor.simulate_post("/", **request(msgs[1], attachments="-AAB"))
+                assert res.status_code == 400
+                res = await conductor.simulate_post("/", body=b'{}',
+                                                    headers={"Content-Type": httping.CESR_CONTENT_TYPE})
+                assert res.status_code == 412
+
+                # other routes served by wsgi app through bridge
+                res = await conductor.simulate_get("/query", params={"typ": "kel", "pre": palHab.pre})
+                assert res.status_code == 200
+                assert res.headers['Content-Type'] == "application/json+cesr"
+                assert res.content == b''.join(bytes(msg) for msg in
+                                               wesHby.db.clonePreIter(pre=palHab.pre))
+
+                # backpressure when queue full and processing stalled
+                pumper.cancel()
+                ingress.size = 1
+                bridge.end.timeout = 0.01
+                res = await conductor.simulate_post("/", **request(msgs[2]))
+                assert res.status_code == 202  # queued not yet processed
+                assert ingress.full
+                res = await conductor.simulate_post("/", **request(msgs[2]))
+                assert res.status_code == 503
+                assert res.headers["Retry-After"] == "1"
+
+                assert ingress.process() == 1
+                assert not ingress.full
+
+        asyncio.run(run())
+        assert wesHby.db.kevers[palHab.pre].sn == 2  # queued at timeout still processed
+
+        for doer in doers:  # doers never ran so close registry they opened
+            if isinstance(doer, basing.BaserDoer):
+                doer.baser.close()
+
+    """End Test"""
@@ -688,6 +688,26 @@ def test_creator():
     assert isinstance(creator, keeping.SaltyCreator)
     assert creator.salter.qb64 == salt
 
+    # stretcher derives same keys and primed batches are taken by create
+    stretcher = core.Stretcher()
+    creator = keeping.Creatory(algo=keeping.Algos.salty).make(salt=salt, stretcher=stretcher)
+    assert creator.stretcher is stretcher
+    assert creator.paths(codes=[coring.MtrDex.Ed25519_Seed] * 2, pidx=1, ridx=2, kidx=3) == ["123", "124"]
+    creator.prime(batches=[([coring.MtrDex.Ed25519_Seed], 0, 0, 0),
+                           ([coring.MtrDex.Ed25519_Seed] * 2, 0, 1, 1)], temp=True)
+    assert len(stretcher.primed) == 3
+    signers = creator.create(count=1, transferable=False, temp=True)
+    assert signers[0].qb64 == 'AMGrAM0noxLpRteO9mxGT-yzYSrKFwJMuNI4KlmSk26e'
+    assert signers[0].verfer.qb64 == 'BFRtyHAjSuJaRX6TDPva35GN11VHAruaOXMc79ZYDKsT'
+    assert len(stretcher.primed) == 2
+    assert len(creator.create(count=2, ridx=1, kidx=1, temp=True)) == 2
+    assert not stretcher.primed
+    assert not stretcher.cache
+
+    creator = keeping.Creatory(algo=keeping.Algos.randy).make(stretcher=stretcher)
+    assert isinstance(creator, keeping.RandyCreator)
+    creator.prime(batches=[([coring.MtrDex.Ed25519_Seed], 0, 0, 0)])
+
     creator = keeping.Creatory(algo=keeping.Algos.randy).make()
     assert isinstance(creator, keeping.RandyCreator)
     """End Test"""
@@ -1761,6 +1781,114 @@ def test_manager_with_aeid():
 
     """End Test"""
 
+def test_manager_stretcher():
+    """
+    Test Manager clears opt in Stretcher seed cache when private keys are
+    erased and when aeid changes
+    """
+    cryptsigner = core.Signer(raw=bytes(range(32)), code=coring.MtrDex.Ed25519_Seed, transferable=False)
+
+    with keeping.openKS() as keeper:
+        manager = keeping.Manager(ks=keeper, salt=core.Salter(raw=b'0123456789abcdef').qb64)
+        assert manager.stretcher.size == 0  # default keeps no seeds
+        manager.incept(icount=2, temp=True)
+        assert not manager.stretcher.cache
+        assert not manager.stretcher.primed
+
+    with keeping.openKS() as keeper:
+        stretcher = core.Stretcher(size=16)
+        manager = keeping.Manager(ks=keeper, salt=core.Salter(raw=b'0123456789abcdef').qb64,
+                                  stretcher=stretcher)
+        verfers, digers = manager.incept(icount=2, temp=True)
+        assert len(stretcher.cache) == 3  # two current and one next
+        assert not stretcher.primed
+        pre = verfers[0].qb64
+
+        manager.rotate(pre=pre, temp=True, erase=False)
+        assert len(stretcher.cache) == 4
+        manager.rotate(pre=pre, temp=True)  # erases stale private keys
+        assert not stretcher.cache
+
+        manager.rotate(pre=pre, temp=True, erase=False)
+        assert stretcher.cache
+        manager.updateAeid(aeid=cryptsigner.verfer.qb64, seed=cryptsigner.qb64)
+        assert not stretcher.cache
+
+    """End Test"""
+
+
+def test_signer_cache():
+    """
+    Test SignerCache of decrypted signers with ttl, size and Manager.sign
+    """
+    tyme = [0.0]
+    cache = keeping.SignerCache(ttl=10.0, size=2, clock=lambda: tyme[0])
+    assert cache.ttl == 10.0
+    assert cache.size == 2
+    signers = [core.Signer(raw=bytes([i + 1]) * 32) for i in range(3)]
+    pubs = [signer.verfer.qb64 for signer in signers]
+
+    assert cache.get(pubs[0]) is None
+    cache.put(pubs[0], signers[0])
+    cache.put(pubs[1], signers[1])
+    assert cache.get(pubs[0]) is signers[0]  # now most recently used
+    cache.put(pubs[2], signers[2])  # evicts least recently used
+    assert list(cache.entries) == [pubs[0], pubs[2]]
+    assert signers[1].raw == bytes([2]) * 32  # evicted signer still usable
+
+    tyme[0] = 10.0  # expired
+    assert cache.get(pubs[0]) is None
+    assert len(cache) == 1
+    assert (cache.hits, cache.misses, cache.evictions) == (1, 2, 2)
+    cache.clear()
+    assert not cache.entries
+
+    cryptseed0 = b'h,#|\x8ap"\x12\xc43t2\xa6\xe1\x18\x19\xf0f2,y\xc4\xc21@\xf5@\x15.\xa2\x1a\xcf'
+    cryptsigner0 = core.Signer(raw=cryptseed0, code=coring.MtrDex.Ed25519_Seed, transferable=False)
+    seed0 = cryptsigner0.qb64
+    aeid0 = cryptsigner0.verfer.qb64
+    cryptsigner1 = core.Signer(raw=bytes(range(32)), code=coring.MtrDex.Ed25519_Seed, transferable=False)
+    ser = b'abcdefghijklmnopqrstuvwxyz0123456789'
+
+    with keeping.openKS() as keeper:
+        cache = keeping.SignerCache()
+        manager = keeping.Manager(ks=keeper, seed=seed0, aeid=aeid0, salt=core.Salter(raw=b'0123456789abcdef').qb64,
+                                  cache=cache)
+        assert manager.cache is cache
+        verfers, digers = manager.incept(icount=2, temp=True)
+        pubs = [verfer.qb64 for verfer in verfers]
+
+        sigers = manager.sign(ser, pubs=pubs)
+        assert len(cache) == 2
+        assert (cache.hits, cache.misses) == (0, 2)
+        assert [siger.qb64 for siger in manager.sign(ser, verfers=verfers)] == [siger.qb64 for siger in sigers]
+        assert (cache.hits, cache.misses) == (2, 2)
+        assert all(verfer.verify(siger.raw, ser) for verfer, siger in zip(verfers, sigers))
+
+        # rotation erases stale private keys and evicts them
+        manager.rotate(pre=pubs[0], temp=True)
+        manager.rotate(pre=pubs[0], temp=True)
+        assert not cache.entries
+
+        # changing aeid clears all cached signers
+        manager.sign(ser, pubs=manager.ks.sits.get(pubs[0]).new.pubs)
+        assert len(cache) == 1  # rotated to one key
+        manager.updateAeid(aeid=cryptsigner1.verfer.qb64, seed=cryptsigner1.qb64)
+        assert not cache.entries
+
+    with keeping.openKS() as keeper:  # more keys in one call than cache size
+        cache = keeping.SignerCache(size=1)
+        manager = keeping.Manager(ks=keeper, salt=core.Salter(raw=b'0123456789abcdef').qb64,
+                                  cache=cache)
+        verfers, digers = manager.incept(icount=2, temp=True)
+        for i in range(2):  # cold then partly cached
+            sigers = manager.sign(ser, verfers=verfers)
+            assert [verfer.verify(siger.raw, ser) for verfer, siger in zip(verfers, sigers)] == [True, True]
+            assert len(cache) == 1
+
+    """End Test"""
+
+
 def test_manager_sign_dual_indices():
     """
     test Manager signing with dual indices
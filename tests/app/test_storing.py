@@ -3,15 +3,18 @@
 tests.app.storing
 
 """
+import datetime
 import os
 
 import lmdb
 
-from keri.app import keeping
+from keri.app import indirecting, keeping
 from keri.core import coring, serdering
 from keri.db import dbing, basing, subing
 from keri.peer import exchanging
-from keri.app.storing import Mailboxer
+from keri.app.storing import (Mailboxer, Announcer, Listener, Retainage,
+                               Retainer)
+from keri.help import helping
 
 
 def test_mailboxing():
@@ -111,5 +114,156 @@ def test_mailboxing():
 
 
 
+def test_announcer():
+    """
+    Test Announcer wakes only listeners of stored topic
+    """
+    pre = "EA3mbE6upuYnFlx68GmLYCQd7cCcwG_AtHM6dW_GT068"
+    mber = Mailboxer(temp=True)
+    announcer = mber.announcer
+    assert isinstance(announcer, Announcer)
+
+    rct = announcer.listen([f"{pre}/receipt"])
+    both = announcer.listen([f"{pre}/receipt", f"{pre}/challenge".encode()])
+    assert isinstance(rct, Listener)
+    assert rct.drain() == {f"{pre}/receipt".encode()}  # first drain scans all
+    assert both.drain() == {f"{pre}/receipt".encode(), f"{pre}/challenge".encode()}
+    assert rct.drain() == set()
+
+    mber.storeMsg(topic=f"{pre}/challenge", msg=b'{"t": "exn"}')
+    assert rct.drain() == set()
+    assert both.drain() == {f"{pre}/challenge".encode()}
+
+    mber.storeMsg(topic=f"{pre}/receipt".encode(), msg=b'{"t": "rct"}')
+    mber.storeMsg(topic=f"{pre}/receipt", msg=b'{"t": "rct", "x": 1}')
+    assert rct.drain() == {f"{pre}/receipt".encode()}
+    assert both.drain() == {f"{pre}/receipt".encode()}
+
+    assert mber.storeMsg(topic=f"{pre}/replay", msg=b'{"t": "rpy"}')
+    assert announcer.announce(f"{pre}/replay") == 0
+
+    announcer.ignore(both)
+    assert f"{pre}/challenge".encode() not in announcer.listeners
+    assert announcer.announce(f"{pre}/receipt") == 1
+
+    del rct  # abandoned listeners drop out
+    assert announcer.announce(f"{pre}/receipt") == 0
+    assert announcer.listeners == {}
+
+    mber.close(clear=True)
+
+    """End Test"""
+
+
+def test_mailbox_retention():
+    """
+    Test Mailboxer reference counting, retention pruning and compaction
+    """
+    pre = "EA3mbE6upuYnFlx68GmLYCQd7cCcwG_AtHM6dW_GT068"
+    rct = f"{pre}/receipt"
+    chl = f"{pre}/challenge"
+    mber = Mailboxer(temp=True, retention={"/receipt": Retainage(count=2)},
+                     retain=Retainage(age=60))
+    assert mber.retainage(rct) == Retainage(count=2, age=None)
+    assert mber.retainage(chl.encode()) == Retainage(count=None, age=60)
+    assert mber.retainage(pre) == Retainage(count=None, age=60)
+
+    # shared body is reference counted and removed with its last topic entry
+    shared = b'{"t": "exn", "shared": true}'
+    dig = coring.Diger(ser=shared, code=coring.MtrDex.Blake3_256).qb64
+    assert mber.storeMsg(topic=rct, msg=shared)
+    assert mber.storeMsg(topic=chl, msg=shared)
+    assert mber.rcts.get(keys=dig).num == 2
+    assert mber.tdts.getOn(keys=rct, on=0) is not None
+    assert mber.delTopic(key=rct, on=0)
+    assert not mber.delTopic(key=rct, on=0)
+    assert mber.rcts.get(keys=dig).num == 1
+    assert mber.msgs.get(keys=dig) == shared.decode()
+    assert mber.delTopic(key=chl, on=0)
+    assert mber.rcts.get(keys=dig) is None
+    assert mber.msgs.get(keys=dig) is None
+    assert mber.tdts.getOn(keys=chl, on=0) is None
+
+    # count policy keeps newest entries
+    for i in range(5):
+        mber.storeMsg(topic=rct, msg=f'{{"t": "rct", "i": {i}}}')
+    for i in range(3):
+        mber.storeMsg(topic=chl, msg=f'{{"t": "exn", "i": {i}}}')
+    assert mber.prune() == 3
+    assert mber.getTopicMsgs(topic=rct) == [b'{"t": "rct", "i": 3}', b'{"t": "rct", "i": 4}']
+    assert mber.msgs.cntAll() == 5
+
+    # age policy removes entries older than age and stamps legacy entries
+    legacy = b'{"t": "exn", "legacy": true}'
+    ldig = coring.Diger(ser=legacy, code=coring.MtrDex.Blake3_256).qb64b
+    mber.tpcs.appendOn(keys=chl, val=ldig)  # as stored before retention
+    mber.msgs.pin(keys=ldig, val=legacy)
+    later = helping.nowUTC() + datetime.timedelta(seconds=120)
+    assert mber.prune(now=later) == 3
+    assert mber.getTopicMsgs(topic=chl) == [legacy]
+    assert mber.tdts.getOn(keys=chl, on=3).datetime == later
+    assert mber.prune(now=later + datetime.timedelta(seconds=61)) == 1
+    assert mber.getTopicMsgs(topic=chl) == []
+    assert mber.msgs.get(keys=ldig) == legacy.decode()  # uncounted so left
+
+    # collect removes uncounted orphans and rebuilds counts
+    mber.msgs.pin(keys="orphan", val=b'{"t": "exn"}')
+    assert mber.collect() == 2
+    assert mber.msgs.cntAll() == 2
+    assert mber.rcts.cntAll() == 2
+
+    # compaction gives back disk space of removed messages
+    for i in range(200):
+        mber.storeMsg(topic=f"{pre}/replay", msg=os.urandom(2048).hex())
+    mber.retention["/replay"] = Retainage(count=0)
+    mbi = iter(indirecting.MailboxIterable(mbx=mber, pre=pre, topics={"/receipt": 0}))
+    next(mbi)
+    assert mber.maintain().reclaimed == 0  # online pass does not compact
+    for i in range(200):
+        mber.storeMsg(topic=f"{pre}/replay", msg=os.urandom(2048).hex())
+    compactage = mber.maintain(compact=True)
+    assert compactage.pruned == 200
+    assert compactage.collected == 0
+    assert compactage.reclaimed > 200 * 4096 // 2
+    assert compactage.duration > 0.0
+    assert mber.getTopicMsgs(topic=rct) == [b'{"t": "rct", "i": 3}', b'{"t": "rct", "i": 4}']
+    mber.storeMsg(topic=rct, msg=b'{"t": "rct", "i": 5}')  # reopened stream still woken
+    assert b'"i": 5' in next(mbi)
+
+    mber.close(clear=True)
+
+    """End Test"""
+
+
+def test_retainer():
+    """
+    Test Retainer runs online maintenance passes once per period
+    """
+    mber = Mailboxer(temp=True, retain=Retainage(count=1))
+    for i in range(3):
+        mber.storeMsg(topic="pre/receipt", msg=f"{i}")
+
+    retainer = Retainer(mbx=mber, period=10.0)
+    retainer.enter()
+    assert not retainer.recur(tyme=0.0)
+    assert retainer.compactage is None
+    assert not retainer.recur(tyme=5.0)
+    assert retainer.compactage is None
+    assert not retainer.recur(tyme=10.0)
+    assert retainer.compactage.pruned == 2
+    assert retainer.compactage.collected == 0
+    assert retainer.compactage.reclaimed == 0
+    assert mber.getTopicMsgs(topic="pre/receipt") == [b"2"]
+    assert not retainer.recur(tyme=15.0)
+    assert retainer.last == 10.0
+
+    mber.close(clear=True)
+
+    """End Test"""
+
+
 if __name__ == '__main__':
     test_mailboxing()
+    test_announcer()
+    test_mailbox_retention()
+    test_retainer()
@@ -3,11 +3,14 @@
 tests.app.watching
 
 """
-from dataclasses import asdict
+from dataclasses import asdict, replace
+from unittest import mock
 
 import pytest
+from hio.base import doing
+from hio.help import decking
 
-from keri import core
+from keri import core, kering
 from keri.app import watching, habbing
 from keri.app.watching import DiffState
 from keri.core import coring
@@ -165,3 +168,170 @@ def test_adjudicator():
 
         with pytest.raises(ValueError):
             adj.adjudicate(hab.pre, 2)
+
+
+def test_adjudicator_incremental():
+    default_salt = core.Salter(raw=b'0123456789abcdef').qb64
+    with habbing.openHby(name="test", base="test", salt=default_salt) as hby:
+        hab = hby.makeHab("test")
+        habs = [hby.makeHab(f"watched{i}") for i in range(3)]
+        wats = ["BbIg_3-11d3PYxSInLN-Q9_T2axD6kkXd3XRgbGZTm6s",
+                "BDkq35LUU63xnFmfhljYYRY0ymkCg7goyeCxN30tsvmS"]
+        for watched in habs:
+            for wat in wats:
+                hab.db.obvs.pin(keys=(hab.pre, wat, watched.pre), val=ObservedRecord(enabled=True))
+
+        adj = watching.Adjudicator(hby=hby, hab=hab)
+
+        # first round queries every watched AID batched per watcher
+        batches = adj.queries()
+        assert set(batches.keys()) == set(wats)
+        for wat in wats:
+            assert batches[wat].count(b'"t":"qry"') == 3
+            assert batches[wat].count(b'"r":"ksn"') == 3
+        assert len(adj.pending) == 6
+
+        # nothing changed locally so nothing to query and no notices so nothing to adjudicate
+        assert adj.queries() == {}
+        assert adj.round() == set()
+        assert len(adj.cues) == 0
+
+        # both watchers report even key state for first watched AID only
+        watched = habs[0]
+        ksr = watched.kever.state()
+        saider = coring.Saider(qb64=ksr.d)
+        hab.db.ksns.pin(keys=(saider.qb64,), val=ksr)
+        for wat in wats:
+            hab.db.knas.pin(keys=(watched.pre, wat), val=saider)
+
+        assert adj.round(toad=2) == {watched.pre}
+        assert len(adj.pending) == 4
+        cue = adj.cues.pull()
+        assert cue["kin"] == "keyStateConsistent"
+        assert cue["oid"] == watched.pre
+        assert [state.state for state in cue["states"]] == [watching.States.even] * 2
+        assert len(adj.cues) == 0
+
+        # unchanged notices are not adjudicated again
+        assert adj.round() == set()
+        assert len(adj.cues) == 0
+
+        # only the rotated AID is queried again and re-diffed against its cached notices
+        watched.rotate()
+        batches = adj.queries()
+        assert set(batches.keys()) == set(wats)
+        for wat in wats:
+            assert batches[wat].count(b'"t":"qry"') == 1
+        diffs = dict(adj.diffs)
+        adj.msgs.append(dict(toad=1))
+        adj.performAdjudications()
+        cue = adj.cues.pull()
+        assert cue["kin"] == "keyStateLagging"
+        assert cue["oid"] == watched.pre
+        assert len(cue["behind"]) == 2
+        assert adj.diffs != diffs
+        assert len(adj.cues) == 0
+
+        # new notice from one watcher adjudicates just that AID reusing cached diff of the other
+        other = habs[1]
+        ksr = other.kever.state()
+        saider = coring.Saider(qb64=ksr.d)
+        hab.db.ksns.pin(keys=(saider.qb64,), val=ksr)
+        hab.db.knas.pin(keys=(other.pre, wats[0]), val=saider)
+        assert adj.round(toad=1) == {other.pre}
+        cue = adj.cues.pull()
+        assert cue["kin"] == "keyStateConsistent"
+        assert cue["oid"] == other.pre
+        assert len(cue["states"]) == 1
+        assert len(adj.pending) == 5  # rotated AID still awaits fresh notices
+
+        # scheduled queries ask again for unchanged AIDs once period has elapsed
+        batches = adj.queries(tyme=0.0)  # never queried on schedule so all due
+        for wat in wats:
+            assert batches[wat].count(b'"t":"qry"') == 3
+        assert adj.queries(tyme=30.0) == {}
+        batches = adj.queries(tyme=60.0)
+        for wat in wats:
+            assert batches[wat].count(b'"t":"qry"') == 3
+        assert len(adj.pending) == 6
+
+        # repeated notice is not diffed again
+        assert adj.round(toad=1) == set()
+        assert len(adj.cues) == 0
+
+        # remote rotation reported by re-queried watcher is picked up
+        ksr = replace(other.kever.state(), s="1", d=habs[2].kever.serder.said)
+        saider = coring.Saider(qb64=ksr.d)
+        hab.db.ksns.pin(keys=(saider.qb64,), val=ksr)
+        hab.db.knas.pin(keys=(other.pre, wats[0]), val=saider)
+        assert adj.round(toad=1) == {other.pre}
+        cue = adj.cues.pull()
+        assert cue["kin"] == "keyStateUpdate"
+        assert cue["sn"] == 1
+        assert len(adj.pending) == 5
+
+    """End Test"""
+
+
+def test_surveyor():
+    """
+    Test Surveyor sends due query batches to watchers and runs rounds
+    """
+    class Witer(doing.Doer):  # sends all its msgs on each recur
+        def __init__(self, wit):
+            self.wit = wit
+            self.msgs = decking.Deck()
+            self.sent = decking.Deck()
+            super(Witer, self).__init__()
+
+        def recur(self, tyme):
+            while self.msgs:
+                self.sent.append(self.msgs.popleft())
+            return False
+
+    default_salt = core.Salter(raw=b'0123456789abcdef').qb64
+    with habbing.openHby(name="test", base="test", salt=default_salt) as hby:
+        hab = hby.makeHab("test")
+        watched = hby.makeHab("watched")
+        wats = ["BbIg_3-11d3PYxSInLN-Q9_T2axD6kkXd3XRgbGZTm6s",
+                "BDkq35LUU63xnFmfhljYYRY0ymkCg7goyeCxN30tsvmS"]
+        for wat in wats:
+            hab.db.obvs.pin(keys=(hab.pre, wat, watched.pre), val=ObservedRecord(enabled=True))
+
+        witers = []
+
+        def messenger(hab, pre):
+            if pre == wats[1]:
+                raise kering.ConfigurationError(f"unable to find a valid endpoint for witness {pre}")
+            witers.append(Witer(wit=pre))
+            return witers[-1]
+
+        adj = watching.Adjudicator(hby=hby, hab=hab, period=10.0)
+        surveyor = watching.Surveyor(adjudicator=adj, toad=1)
+        doist = doing.Doist(tock=1.0, real=False)
+        with mock.patch.object(watching.agenting, "messenger", messenger):
+            doist.doers = [surveyor]
+            doist.enter()
+            doist.recur()
+            assert [witer.wit for witer in witers] == [wats[0]]
+            assert witers[0].sent[0].count(b'"r":"ksn"') == 1
+            assert len(surveyor.messengers) == 1
+
+            doist.recur()  # sent so removed and nothing new is due
+            assert surveyor.messengers == []
+            assert len(witers) == 1
+
+            # notice from watcher is adjudicated
+            ksr = watched.kever.state()
+            saider = coring.Saider(qb64=ksr.d)
+            hab.db.ksns.pin(keys=(saider.qb64,), val=ksr)
+            hab.db.knas.pin(keys=(watched.pre, wats[0]), val=saider)
+            doist.recur()
+            assert adj.cues.pull()["kin"] == "keyStateConsistent"
+
+            while doist.tyme <= 10.0:  # queried again once period elapsed
+                doist.recur()
+            assert len(witers) == 2
+            doist.exit()
+
+    """End Test"""
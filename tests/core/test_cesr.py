@@ -0,0 +1,164 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.core.test_cesr module
+
+Parity of optional compiled codec keri.core._cesr with pure python codec
+"""
+import pytest
+
+from keri.kering import Vrsn_1_0, Vrsn_2_0
+from keri.help.helping import intToB64
+from keri.core import coring, indexing, counting
+from keri.core.coring import Matter
+from keri.core.indexing import Indexer
+from keri.core.counting import Counter
+
+pytestmark = pytest.mark.skipif(coring._cesr is None,
+                                reason="compiled codec keri.core._cesr not built")
+
+
+def run(make):
+    """Returns result of make() or type of exception raised by make()"""
+    try:
+        return make()
+    except Exception as ex:
+        return type(ex)
+
+
+def parity(monkeypatch, module, make):
+    """Returns result of make() after asserting it is the same with compiled
+    codec as with pure python codec of module"""
+    fast = run(make)
+    with monkeypatch.context() as m:
+        m.setattr(module, "_cesr", None)
+        slow = run(make)
+    assert fast == slow
+    return fast
+
+
+def mutants(qb64):
+    """Yields qb64 str mutated at front and back, truncated and extended"""
+    for i in sorted({0, 1, 2, 3, 4, 5, len(qb64) - 2, len(qb64) - 1}):
+        if 0 <= i < len(qb64):
+            for c in ("A", "B", "_", "-", "!", "=", "\xe9"):
+                yield qb64[:i] + c + qb64[i + 1:]
+    yield qb64[:-1]
+    yield qb64[:1]
+    yield qb64 + "AAAA"
+
+
+def forms(qb64):
+    """Yields qb64 str as each supported stream type"""
+    yield qb64
+    qb64b = qb64.encode()
+    yield qb64b
+    yield bytearray(qb64b)
+    yield memoryview(qb64b)
+
+
+def raws(rs):
+    """Returns deterministic raw bytes of size rs"""
+    return bytes((i * 37 + 11) % 256 for i in range(rs))
+
+
+def test_matter_parity(monkeypatch):
+    """
+    Test Matter compiled codec matches python codec for all codes in .Sizes
+    """
+    def matter(**kwa):
+        return lambda: (lambda m: (m.code, m.soft, m.raw, m.qb64b))(Matter(**kwa))
+
+    count = 0
+    for code, (hs, ss, xs, fs, ls) in Matter.Sizes.items():
+        cs = hs + ss
+        soft = "".join("MAbz_-"[i % 6] for i in range(ss - xs)) if fs else ""
+        sizes = [(fs - cs) * 3 // 4 - ls] if fs else range(0, 10)
+        for rs in sizes:
+            made = parity(monkeypatch, coring, matter(raw=raws(rs), code=code, soft=soft))
+            if isinstance(made, type):  # python raises too
+                continue
+            qb64b = made[-1]
+            qb64 = qb64b.decode()
+            for qb64 in [qb64, *mutants(qb64)]:
+                for qb in forms(qb64):
+                    parity(monkeypatch, coring, matter(qb64b=qb))
+                    count += 1
+                parity(monkeypatch, coring, matter(qb64=qb64))
+
+            # stripped from stream leaves rest of stream
+            stream = bytearray(qb64b + b"-AAB")
+            assert Matter(qb64b=stream, strip=True).qb64b == qb64b
+            assert stream == bytearray(b"-AAB")
+
+    assert count > 1000
+
+    # compiled codec directly
+    assert coring._cesr.matterExfil(b"BAAA", Matter.Hards, Matter.Sizes) is None  # short
+    assert coring._cesr.matterExfil(12, Matter.Hards, Matter.Sizes) is None  # wrong type
+    with pytest.raises(TypeError):
+        coring._cesr.matterExfil(b"BAAA")
+    """End Test"""
+
+
+def test_indexer_parity(monkeypatch):
+    """
+    Test Indexer compiled codec matches python codec for all codes in .Sizes
+    """
+    def indexer(**kwa):
+        return lambda: (lambda i: (i.code, i.index, i.ondex, i.raw, i.qb64b))(Indexer(**kwa))
+
+    count = 0
+    for code, (hs, ss, os, fs, ls) in Indexer.Sizes.items():
+        cs = hs + ss
+        ms = ss - os
+        raw = raws((fs - cs) * 3 // 4) if fs else b""
+        indices = [0, 1, 5, 64 ** ms - 1, 64 ** ms]
+        ondices = [None, 0, 1, 64 ** os - 1, 64 ** os] if os else [None, 0, 1]
+        for index in indices:
+            for ondex in ondices + [index]:
+                made = parity(monkeypatch, indexing,
+                              indexer(raw=raw, code=code, index=index, ondex=ondex))
+                if isinstance(made, type):  # python raises too
+                    continue
+                qb64 = made[-1].decode()
+                for qb64 in [qb64, *mutants(qb64)]:
+                    for qb in forms(qb64):
+                        parity(monkeypatch, indexing, indexer(qb64b=qb))
+                        count += 1
+
+    assert count > 1000
+
+    # ondex of current only sig must be zero
+    qb64 = Indexer(raw=raws(64), code=indexing.IdrDex.Ed25519_Crt_Sig, index=3).qb64
+    assert parity(monkeypatch, indexing, indexer(qb64=qb64))[2] is None
+    """End Test"""
+
+
+def test_counter_parity(monkeypatch):
+    """
+    Test Counter compiled codec matches python codec for all codes of each version
+    """
+    def counter(**kwa):
+        return lambda: (lambda c: (c.code, c.count, c.qb64b))(Counter(**kwa))
+
+    count = 0
+    for version in (Vrsn_1_0, Vrsn_2_0):
+        sizes = Counter.Sizes[version.major]
+        for code, (hs, ss, fs) in sizes[max(sizes)].items():
+            for cnt in (0, 1, 64 ** ss - 1, 64 ** ss):
+                made = parity(monkeypatch, counting,
+                              counter(code=code, count=cnt, version=version))
+                if isinstance(made, type):  # python raises too
+                    continue
+                qb64 = made[-1].decode()
+                for qb64 in [qb64, *mutants(qb64)]:
+                    for qb in forms(qb64):
+                        parity(monkeypatch, counting, counter(qb64b=qb, version=version))
+                        count += 1
+
+    assert count > 1000
+
+    # from count in base64
+    assert parity(monkeypatch, counting,
+                  counter(code="-A", countB64=intToB64(5, l=2), version=Vrsn_1_0))[1] == 5
+    """End Test"""
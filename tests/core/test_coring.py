@@ -7090,6 +7090,51 @@ def test_tholder():
     """ Done Test """
 
 
+def test_satisfier():
+    """
+    Test compiled weighted thresholds and Satisfier incremental satisfaction
+    """
+    tholder = Tholder(sith=[[{"1/3": ["1/2", "1/2", "1/2"]}, "1/2", {"1/2": ["1", "1"]}],
+                            ["1/2", {"1/2": ["1", "1"]}]])
+    assert tholder._scale == 6
+    assert tholder._leaves == [(0, 0, 3), (0, 0, 3), (0, 0, 3), (0, -1, 3), (0, 1, 6), (0, 1, 6),
+                               (1, -1, 3), (1, 2, 6), (1, 2, 6)]
+    assert tholder._groups == [(0, 2), (0, 3), (1, 3)]
+    assert tholder.satisfy(indices=[3, 4, 6, 7])
+    assert not tholder.satisfy(indices=[0, 1, 4, 7])  # nested 1/3 set plus 1/2 set is short
+    assert tholder.satisfy(indices=[0, 1, 3, 4, 6, 8])
+    assert not tholder.satisfy(indices=[3, 4, 6, 9])  # out of range index
+    assert tholder.satisfy(indices=[3, 4, -3, -2])  # negative indices offset from end
+
+    satisfier = tholder.satisfier()
+    assert not satisfier.satisfied
+    assert not satisfier.add([3])
+    assert not satisfier.add([4, 4])
+    assert not satisfier.add([6])
+    assert satisfier.add([8])
+    assert satisfier.indices == {3, 4, 6, 8}
+    assert satisfier.add([3])  # duplicates ignored
+    assert not satisfier.add([9])  # out of range makes unsatisfiable as satisfy does
+    assert not tholder.satisfy(indices=[3, 4, 6, 8, 9])
+
+    tholder = Tholder(sith="2")
+    satisfier = tholder.satisfier()
+    assert not satisfier.add([0, 0])
+    assert satisfier.add([1])
+    assert not Tholder(sith="0").satisfier().add([0])
+
+    # large threshold satisfied incrementally at same sig as whole threshold
+    size = 200
+    tholder = Tholder(sith=[[f"1/{size // 2}"] * size, [{"1/2": [f"1/{size // 4}"] * size}, "1/2"]])
+    order = list(range(tholder.size - 1, -1, -1))
+    satisfier = tholder.satisfier()
+    for i, idx in enumerate(order):
+        assert satisfier.add([idx]) == tholder.satisfy(indices=order[:i + 1])
+    assert satisfier.satisfied
+
+    """ Done Test """
+
+
 if __name__ == "__main__":
     test_icemapdom()
     test_mapcodex()
@@ -7112,5 +7157,6 @@ if __name__ == "__main__":
     test_decimer()
     test_dater()
     test_tholder()
+    test_satisfier()
 
 
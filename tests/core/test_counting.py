@@ -1183,6 +1183,12 @@ def test_counter_v1():
     assert counter.qb2 == qscb2
     assert counter.version == Vrsn_1_0
 
+    ims = memoryview(bytearray(qscb + qscb))  # zero copy cursor read
+    counter = Counter(qb64b=ims[len(qscb):], version=Vrsn_1_0)
+    assert counter.code == CtrDex.ControllerIdxSigs
+    assert counter.count == count
+    assert counter.qb64b == qscb
+
     ims = bytearray(qscb2)  # test with qb2
     counter = Counter(qb2=ims, strip=True, version=Vrsn_1_0)
     assert not ims  # deleted
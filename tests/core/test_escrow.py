@@ -77,6 +77,10 @@ def test_partial_signed_escrow():
         assert len(escrows) == 1
         assert escrows[0] == srdr.saidb  #  escrow entry for event
 
+        # escrowed sigs alone can not satisfy threshold so reprocessing is skipped
+        assert not kvy.satisfiable(serder=srdr, sigers=[sigers[0]])
+        assert kvy.satisfiable(serder=srdr, sigers=[sigers[0], sigers[2]])
+
         time.sleep(0.001)
         # verify Kevery process partials escrow is idempotent to previously escrowed events
         # assuming not stale but nothing else has changed
@@ -1484,6 +1488,71 @@ def test_unverified_trans_receipt_escrow():
     """End Test"""
 
 
+def test_out_of_order_escrow_woken():
+    """
+    Test out of order escrow processes only entries woken by their dependency
+    """
+    from keri.app import habbing
+
+    with habbing.openHby(name="wes", base="test", salt=core.Salter(raw=b'0123456789abcdef').qb64) as hby, \
+            basing.openDB(name="bob") as db:
+        habA = hby.makeHab(name="alice", isith="1", icount=1)
+        habC = hby.makeHab(name="carol", isith="1", icount=1)
+        for _ in range(3):
+            habA.interact()
+            habC.interact()
+
+        kvy = eventing.Kevery(db=db, lax=False, local=False)
+        psr = parsing.Parser(kvy=kvy, version=Vrsn_1_0)
+        processed = []
+        process = kvy._processEscrowOutOfOrder
+
+        def count(ekey, edig):
+            processed.append(bytes(ekey))
+            return process(ekey, edig)
+
+        kvy._processEscrowOutOfOrder = count
+
+        for hab in (habA, habC):  # escrow all but inceptions out of order
+            for sn in range(1, 4):
+                psr.parse(ims=bytearray(hab.makeOwnEvent(sn=sn)))
+        waker = db.wakers["ooes"]
+        assert waker.full
+        assert len(waker.dates) == 6
+        assert not waker.woken
+
+        kvy.processEscrows()  # first pass walks whole escrow
+        assert len(processed) == 6
+        assert not waker.full
+        assert len(list(db.getOoeItemIter())) == 6
+
+        processed.clear()
+        kvy.processEscrows()  # nothing woken or stale so nothing processed
+        assert processed == []
+
+        psr.parse(ims=bytearray(habA.makeOwnInception()))  # wakes next event of habA only
+        assert habA.pre in kvy.kevers
+        assert waker.woken == basing.oset([dbing.snKey(habA.pre, 1)])
+        assert db.wakers["ures"].woken == basing.oset([dbing.snKey(habA.pre, 0)])
+        kvy.processEscrows()  # each accepted event wakes only the next one
+        assert processed == [dbing.snKey(habA.pre, sn) for sn in range(1, 4)]
+        assert kvy.kevers[habA.pre].sn == 3
+        assert habC.pre not in kvy.kevers
+        assert len(list(db.getOoeItemIter())) == 3
+        assert not waker.woken
+
+        processed.clear()
+        kvy.TimeoutOOE = 0  # stale entries found by escrow time index
+        time.sleep(0.001)
+        kvy.processEscrows()
+        assert len(processed) == 3
+        assert all(key.startswith(habC.pre.encode()) for key in processed)
+        assert list(db.getOoeItemIter()) == []
+        assert not waker.dates
+
+    """End Test"""
+
+
 if __name__ == "__main__":
     #test_unverified_receipt_escrow()
     test_missing_delegator_escrow()
@@ -3,6 +3,7 @@
 tests.core.test_eventing module
 
 """
+import dataclasses
 import os
 
 import blake3
@@ -4770,6 +4771,15 @@ def test_reload_kever(mockHelpingNowUTC):
 
         # now create new Kever with state
         kever = eventing.Kever(state=state, db=natHby.db)
+        # derived attributes not hydrated until first access
+        assert kever._serder is None and kever._raw is not None
+        assert kever._verfers is None and kever._ndigers is None
+        assert kever._tholder is None and kever._ntholder is None
+        assert [verfer.qb64 for verfer in kever.verfers] == state.k
+        assert [diger.qb64 for diger in kever.ndigers] == state.n
+        assert kever.tholder.sith == state.kt
+        assert kever.ntholder.sith == state.nt
+        assert kever.verfers is kever.verfers  # hydrated once
         assert kever.sn == 6
         assert kever.fn == 6
         assert kever.serder.ked == natHab.kever.serder.ked
@@ -4777,6 +4787,12 @@ def test_reload_kever(mockHelpingNowUTC):
 
         kstate = kever.state()
         assert kstate == state
+        assert kever._raw is None  # hydrated
+
+        # missing current event still raises on reload
+        with pytest.raises(kering.MissingEntryError):
+            eventing.Kever(state=dataclasses.replace(state, d=state.n[0]),
+                           db=natHby.db)
         assert state._asjson() == (b'{"vn":[1,0],"i":"EBm9JqQKS4a3EYv5I7BmAPiwhdSQvFAOpqe0dgk3kgH_","s":"6","p":"'
                             b'ED_HpKSCQJoeGxHYjPRD2tgUhbIrLf6fH3e3xJFSq2dL","d":"EA3QbTpV15MvLSXHSedm4lRYd'
                             b'QhmYXqXafsD4i75B_yo","f":"6","dt":"2021-01-01T00:00:00.000000+00:00","et":"i'
@@ -501,6 +501,12 @@ def test_indexer():
     assert indexer.qb2 == qsig2b
     assert not ims
 
+    ims = memoryview(bytearray(qsig64b + qsig64b))  # zero copy cursor read
+    indexer = Indexer(qb64b=ims[len(qsig64b):])
+    assert indexer.raw == sig
+    assert indexer.index == 5
+    assert indexer.qb64b == qsig64b
+
     ims = bytearray(qsig2b)
     indexer = Indexer(qb2=ims, strip=True)
     assert indexer.raw == sig
@@ -14,7 +14,7 @@ from keri.kering import ValidationError, Vrsn_1_0, Vrsn_2_0, Kinds
 from keri import help
 
 from keri import core
-from keri.core import coring
+from keri.core import coring, parsing
 from keri.core import (Counter, GenDex, Codens, Seqner, Dater, Texter, Pather,
                        Blinder, Mediar, TypeMedia, Sealer, SealKind, Verser)
 from keri.core.parsing import Parser
@@ -4836,6 +4836,124 @@ def test_parse_native_cesr_fixed_field():
     """ Done Test """
 
 
+def makeKelStream(aids=4, ixns=4, path="pipe"):
+    """Returns stream of multisig KELs, one per aid each with an icp, rot and
+    ixns ixn events, and the list of their prefixes"""
+    msgs = bytearray()
+    pres = []
+    for i in range(aids):
+        signers = core.Salter(raw=b"ABCDEFGH01234567").signers(count=9,
+                                                               path=f"{path}{i}",
+                                                               temp=True)
+        serder = incept(keys=[signer.verfer.qb64 for signer in signers[:3]],
+                        ndigs=[coring.Diger(ser=signer.verfer.qb64b).qb64
+                               for signer in signers[3:6]])
+        pres.append(serder.pre)
+        events = [(serder, signers[:3])]
+        serder = rotate(pre=serder.pre,
+                        keys=[signer.verfer.qb64 for signer in signers[3:6]],
+                        dig=serder.said,
+                        ndigs=[coring.Diger(ser=signer.verfer.qb64b).qb64
+                               for signer in signers[6:9]],
+                        sn=1)
+        events.append((serder, signers[3:6]))
+        for sn in range(2, ixns + 2):
+            serder = interact(pre=serder.pre, dig=serder.said, sn=sn)
+            events.append((serder, signers[3:6]))
+
+        for serder, esigners in events:
+            msgs.extend(serder.raw)
+            msgs.extend(Counter(Codens.ControllerIdxSigs, count=len(esigners),
+                                version=Vrsn_1_0).qb64b)
+            for index, signer in enumerate(esigners):
+                msgs.extend(signer.sign(serder.raw, index=index).qb64b)
+
+    return msgs, pres
+
+
+def test_parser_pipelined():
+    """Test Parser in pipelined mode with Pipeliner worker processes"""
+    logger.setLevel("ERROR")
+
+    msgs, pres = makeKelStream(aids=4, ixns=4)
+
+    with openDB(name="inline") as inDB, openDB(name="piped") as pipeDB:
+        kevery = Kevery(db=inDB, lax=False, local=False)
+        Parser(version=Vrsn_1_0).parse(ims=bytearray(msgs), kvy=kevery)
+        for pre in pres:
+            assert kevery.kevers[pre].sn == 5
+
+        with parsing.Pipeliner(workers=2, size=4, limit=2) as pipeliner:
+            kevery = Kevery(db=pipeDB, lax=False, local=False)
+            verifieds = []  # verifieds given to each processEvent
+            processEvent = kevery.processEvent
+            def process(**kwa):
+                verifieds.append(kwa.get("verifieds"))
+                return processEvent(**kwa)
+
+            kevery.processEvent = process
+            parser = Parser(version=Vrsn_1_0, pipeliner=pipeliner)
+            assert parser.pipeliner is pipeliner
+            parser.parse(ims=bytearray(msgs), kvy=kevery)
+            assert pipeliner.count == 4 * 6
+            assert pipeliner.inflight == 0
+            assert len(verifieds) == 4 * 6
+            assert all(verifieds)  # every event was prechecked by a worker
+            assert len(pipeliner.keys) == 2  # only most recently seen kept
+            assert list(pipeliner.keys) == pres[-2:]
+            for pre in pres:
+                assert kevery.kevers[pre].sn == 5
+                assert kevery.kevers[pre].serder.said == inDB.kevers[pre].serder.said
+
+            # bad said is dropped by worker precheck
+            bad, bpres = makeKelStream(aids=1, ixns=0, path="bad")
+            bad = bad.replace(bpres[0].encode(), bpres[0][:-1].encode() + b"A", 1)
+            parser.parse(ims=bad, kvy=kevery)
+            assert bpres[0] not in kevery.kevers
+
+    """ Done Test """
+
+
+def test_parser_stream_multi_mb():
+    """Test extracting primitives and parsing messages from multi MB replay
+    streams both by stripping a bytearray ims and by cursor over a memoryview"""
+    logger.setLevel("ERROR")
+
+    siger = core.Siger(raw=b'\x01' * 64, code=core.IdrDex.Ed25519_Sig, index=1)
+    count = 100_000  # about 8.8 MB
+    ims = bytearray(siger.qb64b * count)
+    stripped = 0
+    while ims:
+        assert core.Siger(qb64b=ims, strip=True).qb64b == siger.qb64b
+        stripped += 1
+    assert stripped == count
+
+    ims = memoryview(bytearray(siger.qb64b * count))
+    offset = 0
+    cursored = 0
+    while offset < len(ims):  # cursor over memoryview without strip
+        offset += len(core.Siger(qb64b=ims[offset:]).qb64b)
+        cursored += 1
+    assert cursored == count
+    assert offset == len(ims)
+
+    class Counter:  # counts dispatched events
+        def __init__(self):
+            self.count = 0
+
+        def processEvent(self, **kwa):
+            self.count += 1
+
+    msgs, _ = makeKelStream(aids=4, ixns=96, path="scale")  # 4 * 98 events
+    ims = bytearray(msgs * 50)
+    kvy = Counter()
+    Parser(version=Vrsn_1_0).parse(ims=ims, kvy=kvy)
+    assert kvy.count == 4 * 98 * 50
+    assert not ims
+
+    """ Done Test """
+
+
 if __name__ == "__main__":
     test_parser_v1_basic()
     test_parser_v1_version()
@@ -4849,3 +4967,5 @@ if __name__ == "__main__":
     test_parse_generic_group()
     test_group_parsator()
     test_parse_native_cesr_fixed_field()
+    test_parser_pipelined()
+    test_parser_stream_multi_mb()
@@ -0,0 +1,112 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.core.test_routing module
+
+"""
+import pytest
+
+from keri import kering
+from keri.core import routing
+
+
+class Resource:
+    """ Reply resource recording dispatched calls """
+
+    def __init__(self):
+        self.calls = []
+
+    def processReply(self, **kwa):
+        self.calls.append(("", kwa["route"], {k: v for k, v in kwa.items()
+                                                if k not in ("serder", "saider", "route", "cigars", "tsgs")}))
+
+    def processReplyEndRole(self, **kwa):
+        self.calls.append(("EndRole", kwa["route"], dict(action=kwa["action"])))
+
+
+class Serder:
+    """ Minimal stand in for reply serder with route """
+
+    def __init__(self, route):
+        self.ked = dict(r=route)
+
+
+def linear(rtr, route):
+    """ Returns template and params of first registered route whose regex matches route """
+    for r in rtr.routes:
+        if res := r.regex.search(route):
+            return r.template, res.groupdict()
+    return None
+
+
+def test_router_trie():
+    """
+    Test Router trie lookup matches linear regex search of registered routes
+    """
+    rtr = routing.Router()
+    res = Resource()
+    templates = ["/end/role/{action}", "/loc/scheme", "/ksn/{aid}", "/watcher/{aid}/{action}",
+                 "/tsn/registry/{aid}", "/tsn/credential/{aid}", "/books/{isbn}.json", "/",
+                 "/a/{x}/b", "/a/lit/b", "/ksn/fixed/"]
+    for template in templates:
+        rtr.addRoute(template, res)
+
+    routes = ["/end/role/add", "/END/Role/Cut", "/loc/scheme", "/loc/scheme/", "/ksn/EABC",
+              "/ksn/", "/ksn/x/y", "/watcher/EAID/add", "/tsn/registry/EREG", "/books/123.json",
+              "/books/123.JSON", "/books/123xjson", "/", "", "ksn/x", "/a/lit/b", "/a/q/b",
+              "/ksn/fixed", "/unknown"]
+    for route in routes:
+        found, params = rtr._find(route)
+        assert ((found.template, params) if found is not None else None) == linear(rtr, route)
+        assert rtr._find(route) == (found, params)  # cached
+
+    # earlier registered template wins over later literal just as in linear search
+    found, params = rtr._find("/a/lit/b")
+    assert found.template == "/a/{x}/b"
+    assert params == dict(x="lit")
+
+    # cache is bounded and cleared when routes are added
+    rtr = routing.Router(size=2)
+    rtr.addRoute("/ksn/{aid}", res)
+    for aid in ("A", "B", "C"):
+        assert rtr._find(f"/ksn/{aid}")[1] == dict(aid=aid)
+    assert list(rtr.cache.keys()) == ["/ksn/B", "/ksn/C"]
+    assert rtr._find("/loc/scheme") == (None, None)
+    rtr.addRoute("/loc/scheme", res)
+    assert not rtr.cache
+    assert rtr._find("/loc/scheme")[0].template == "/loc/scheme"
+
+    # dispatch passes captured params to suffixed resource method
+    rtr.addRoute("/end/role/{action}", res, suffix="EndRole")
+    rtr.dispatch(serder=Serder("/end/role/add"), saider=None, cigars=None, tsgs=None)
+    rtr.dispatch(serder=Serder("/ksn/EAID"), saider=None, cigars=None, tsgs=None)
+    assert res.calls == [("EndRole", "/end/role/add", dict(action="add")),
+                         ("", "/ksn/EAID", dict(aid="EAID"))]
+
+    with pytest.raises(kering.ValidationError):
+        rtr.dispatch(serder=Serder("/nope"), saider=None, cigars=None, tsgs=None)
+
+    """End Test"""
+
+
+def test_router_many_routes():
+    """
+    Test Router trie lookup matches linear regex search at 10, 100 and 1000
+    registered routes
+    """
+    res = Resource()
+    for count in (10, 100, 1000):
+        rtr = routing.Router()
+        for i in range(count):
+            rtr.addRoute(f"/route{i}/{{aid}}/{{action}}", res)
+        routes = [f"/route{i}/EAID{i}/add" for i in range(0, count, max(1, count // 10))]
+        routes.append(f"/route{count - 1}/EAID/cut")  # worst case for linear search
+        routes.append(f"/route{count}/EAID/cut")  # not registered
+
+        for route in routes:
+            found, params = rtr._find(route)
+            assert ((found.template, params) if found is not None else None) == linear(rtr, route)
+            assert rtr._find(route) == (found, params)  # cached
+
+        assert len(rtr.cache) == len(routes)
+
+    """End Test"""
@@ -26,7 +26,7 @@ from keri import core
 
 from keri.core import Sealer, SealEvent, SealSource
 
-from keri.core.serdering import (FieldDom, FieldDom, Serdery, Serder,
+from keri.core.serdering import (FieldDom, FieldDom, Serdery, Serder, SaidCache,
                                  SerderKERI, SerderACDC, )
 
 from keri.core.eventing import (incept, interact, rotate, delcept, deltate,
@@ -2681,6 +2681,55 @@ def test_serdery():
     """End Test"""
 
 
+def test_said_cache():
+    """Test SaidCache opt in cache of verified raws"""
+    assert Serder.Cache is None  # opt in so default off
+
+    serder = incept(keys=["DAUDqkmn-hqlQKD8W-FAEa5JUvJC2I9yarEem-AAEg3e"])
+    raw = serder.raw
+    acdc = SerderACDC(makify=True, proto=Protocols.acdc, verify=False,
+                      sad=dict(i=serder.pre))
+
+    cache = SaidCache(size=2)
+    try:
+        Serder.Cache = cache
+        assert SerderKERI.Cache is cache  # shared by subclasses
+        assert len(cache) == 0 and cache.ratio == 0.0
+
+        first = SerderKERI(raw=raw)  # miss so verified and cached
+        assert (cache.hits, cache.misses, len(cache)) == (0, 1, 1)
+        second = SerderKERI(raw=bytearray(raw))  # hit so not reverified
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert second.said == first.said and second.sad == first.sad
+        assert cache.ratio == 0.5
+
+        # same raw as base class is keyed separately from subclass
+        Serder(raw=raw)
+        assert (cache.hits, cache.misses, len(cache)) == (1, 2, 2)
+
+        SerderACDC(raw=acdc.raw)  # evicts least recent SerderKERI
+        assert len(cache) == 2
+        assert cache.verified(Serder(raw=raw, verify=False))
+        assert not cache.verified(SerderKERI(raw=raw, verify=False))
+
+        # tampered raw never hits so still fails verification
+        bad = raw.replace(serder.said.encode(), b"E" + b"A" * 43, 1)
+        with pytest.raises(kering.ValidationError):
+            SerderKERI(raw=bad)
+
+        SerderKERI(raw=raw, verify=False)  # no verify no lookup
+        hits, misses = cache.hits, cache.misses
+        SerderKERI(raw=raw, verify=False)
+        assert (cache.hits, cache.misses) == (hits, misses)
+
+        cache.clear()
+        assert (len(cache), cache.hits, cache.misses) == (0, 0, 0)
+    finally:
+        Serder.Cache = None
+
+    """End Test"""
+
+
 def test_keri_native_dumps_loads():
     """Test KERI messages with CESR native Serder._dumps and Serder._loads"""
 
@@ -451,6 +451,82 @@ def test_gensignerswithsalter():
 
     """ End Test """
 
+
+def test_stretcher():
+    """
+    Test Stretcher concurrent, memory bounded and opt in cached stretching of salts
+    """
+    raw = b'g\x15\x89\x1a@\xa4\xa47\x07\xb9Q\xb8\x18\xcdJW'
+    salter = Salter(raw=raw)
+    paths = [f"{i:x}" for i in range(4)]
+
+    stretcher = core.Stretcher()  # default keeps no seeds
+    assert stretcher.size == 0
+    seeds = stretcher.stretch(salter, paths=paths, temp=True)
+    assert seeds == [salter.stretch(path=path, temp=True) for path in paths]
+    assert not stretcher.cache
+    assert not stretcher.primed
+
+    stretcher = core.Stretcher(workers=4, size=16)
+    assert stretcher.workers == 4
+    assert stretcher.budget == core.Stretcher.Budget
+    assert stretcher.stretch(salter, paths=paths, temp=True) == seeds
+    assert len(stretcher.cache) == 4
+
+    # same keys as Salter.signers, stretched at once
+    signers = stretcher.signers(salter, paths=paths, codes=[MtrDex.Ed25519_Seed] * 4, tier=Tiers.low)
+    assert [signer.qb64 for signer in signers] == ['AK8F6AAiYDpXlWdj2O5F5-6wNCCNJh2A4XOlqwR_HwwH',
+                                                   'AOs8-zNPPh0EhavdrCfCiTk9nGeO8e6VxUCzwdKXJAd0',
+                                                   'AHMBU5PsIJN2U9m7j0SGyvs8YD8fkym2noELzxIrzfdG',
+                                                   'AJZ7ZLd7unQ4IkMUwE69NXcvDO9rrmmRH_Xk3TPu9BpP']
+    assert len(stretcher.cache) == 8  # cached per tier and temp
+
+    class Counter(Salter):
+        """ Salter counting stretches and their concurrency """
+        def __init__(self, **kwa):
+            super().__init__(**kwa)
+            self.count = 0
+
+        def stretch(self, **kwa):
+            self.count += 1
+            return super().stretch(**kwa)
+
+    # cached seeds are not stretched again, duplicates are stretched once
+    counter = Counter(raw=raw)
+    assert stretcher.stretch(counter, paths=paths + paths[:1], temp=True) == seeds + seeds[:1]
+    assert counter.count == 0
+    stretcher.clear()
+    assert not stretcher.cache
+    assert stretcher.stretch(counter, paths=paths + paths[:1], temp=True) == seeds + seeds[:1]
+    assert counter.count == 4
+
+    # cache is bounded least recently used first out
+    stretcher = core.Stretcher(size=2)
+    assert stretcher.stretch(salter, paths=paths, temp=True) == seeds
+    assert [key[1] for key in stretcher.cache] == paths[2:]
+
+    # primed seeds are held only until taken
+    counter = Counter(raw=raw)
+    stretcher = core.Stretcher()
+    assert stretcher.stretch(counter, paths=paths, temp=True, prime=True) == seeds
+    assert len(stretcher.primed) == 4
+    assert stretcher.stretch(counter, paths=paths[:3], temp=True) == seeds[:3]
+    assert counter.count == 4
+    assert [key[1] for key in stretcher.primed] == paths[3:]
+    assert not stretcher.cache
+    stretcher.clear()
+    assert not stretcher.primed
+
+    # memory budget below one stretch still stretches serially
+    assert Salter.limits(tier=Tiers.high) == (4, 1073741824)
+    stretcher = core.Stretcher(workers=8, budget=1024)
+    assert stretcher.stretch(salter, paths=paths, temp=True) == seeds
+
+    with pytest.raises(ValueError):
+        stretcher.stretch(salter, paths=paths, tier="bad")
+
+    """ End Test """
+
 def test_cipher_closs():
     """
     Test class attributes of Cipher
@@ -7,13 +7,14 @@ import json
 import os
 import platform
 import tempfile
+from contextlib import nullcontext
 from dataclasses import dataclass, asdict
 
 import pytest
 
 import lmdb
 from hio.base import doing
-from keri import core
+from keri import core, kering
 from keri.app import habbing
 from keri.core import coring, eventing, serdering
 from keri.core.coring import Kinds, versify, Seqner
@@ -21,6 +22,7 @@ from keri.core.eventing import incept, rotate, interact, Kever
 from keri.core.serdering import Serder
 from keri.db import basing
 from keri.db import dbing
+from keri.db import koming
 from keri.db import subing
 from keri.db.basing import openDB, Baser, KeyStateRecord, OobiRecord
 from keri.db.dbing import (dgKey, onKey, snKey)
@@ -1294,6 +1296,76 @@ def test_clean_baser():
     """End Test"""
 
 
+def test_clean_baser_qb2():
+    """
+    Test Baser.clean of qb2 database clones into qb2 storage that matches the
+    copied .migs records so that reopen after clean reads cleaned values
+    """
+    with habbing.openHby(name="nat", salt=core.Salter(raw=b'0123456789abcdef').qb64) as hby:
+        natHab = hby.makeHab(name="nat")
+        natHab.interact()
+        hby.db.qb2 = True  # migrate to qb2 storage
+        hby.db.reopen(reuse=True)
+        fons = [(keys, number.sn) for keys, number in hby.db.fons.getItemIter()]
+        assert sorted(sn for _, sn in fons) == [0, 0, 1]  # signator and nat
+
+        hby.db.clean()
+        hby.db.reopen(reuse=True)
+        assert hby.db.qb2
+        assert hby.db.migs.get(keys=(basing.Qb2Migration,)) is not None
+        assert all(suber.qb2 for suber in hby.db.cesrSubers())
+        assert [(keys, number.sn) for keys, number in hby.db.fons.getItemIter()] == fons
+        assert hby.db.kevers[natHab.pre].sn == 1
+
+    """End Test"""
+
+
+def test_clean_baser_packed():
+    """
+    Test Baser.clean of packed database clones into packed records that match
+    the copied .migs records so that reopen after clean reads cleaned records
+    """
+    with habbing.openHby(name="nat", salt=core.Salter(raw=b'0123456789abcdef').qb64) as hby:
+        natHab = hby.makeHab(name="nat")
+        natHab.interact()
+        hby.db.packed = True  # migrate to packed records
+        hby.db.reopen(reuse=True)
+        state = hby.db.states.get(keys=natHab.pre)
+        assert state.s == '1'
+
+        hby.db.clean()
+        hby.db.reopen(reuse=True)
+        assert hby.db.packed
+        assert hby.db.migs.get(keys=(basing.PackedMigration,)) is not None
+        assert all(komer.packed for komer in hby.db.komers())
+        cleaned = hby.db.states.get(keys=natHab.pre)
+        assert (cleaned.s, cleaned.d, cleaned.k) == (state.s, state.d, state.k)
+        assert hby.db.habs.get(keys=natHab.pre).hid == natHab.pre
+        assert hby.db.kevers[natHab.pre].sn == 1
+
+    """End Test"""
+
+
+def test_fetch_sealing_event_transaction():
+    """
+    Test Baser fetch of sealing event inside active transaction where
+    iterated events are bytes not memoryviews
+    """
+    with habbing.openHby(name="nat", salt=core.Salter(raw=b'0123456789abcdef').qb64) as hby:
+        natHab = hby.makeHab(name="nat")
+        seal = dict(i=natHab.pre, s="0", d=natHab.pre)
+        natHab.interact(data=[seal])
+        said = natHab.kever.serder.said
+
+        for context in (hby.db.transaction, nullcontext):
+            with context():
+                assert hby.db.fetchAllSealingEventByEventSeal(natHab.pre, seal=seal).said == said
+                assert hby.db.fetchLastSealingEventByEventSeal(natHab.pre, seal=seal).said == said
+                assert hby.db.fetchLastSealingEventBySeal(natHab.pre, seal=dict(d=said)) is None
+
+    """End Test"""
+
+
 def test_fetchkeldel():
     """
     Test fetching full KEL and full DEL from Baser
@@ -1404,6 +1476,62 @@ def test_fetchkeldel():
 
 
 
+def test_clone_chunk_iter():
+    """
+    Test replay of first seen events with one read transaction and chunking
+    """
+    with habbing.openHby(name="test", salt=core.Salter(raw=b'0123456789abcdef').qb64) as hby:
+        hab = hby.makeHab(name="aid", isith='1', icount=1, transferable=True)
+        for i in range(20):
+            hab.interact()
+        db = hby.db
+
+        msgs = [bytes(msg) for msg in db.clonePreIter(pre=hab.pre)]
+        assert len(msgs) == 21
+        assert all(isinstance(m, bytes) for m in msgs)
+        assert bytes(db.cloneEvtMsg(pre=hab.pre, fn=3,
+                                    dig=db.getFe(onKey(hab.pre, 3)))) == msgs[3]
+        assert [bytes(m) for m in db.clonePreIter(pre=hab.pre, fn=19)] == msgs[19:]
+
+        # first seen replay couple encoded as Number and Dater would
+        serder = serdering.SerderKERI(raw=msgs[3])
+        dgkey = dgKey(hab.pre, serder.said)
+        fsc = (core.Number(num=3, code=core.NumDex.Huge).qb64b +
+               coring.Dater(dts=bytes(db.getDts(dgkey))).qb64b)
+        assert msgs[3].endswith(fsc)
+
+        # chunks hold whole messages and are at least size except last
+        chunks = list(db.cloneChunkIter(pre=hab.pre, size=1000))
+        assert b''.join(chunks) == b''.join(msgs)
+        assert all(len(chunk) >= 1000 for chunk in chunks[:-1])
+        ends = set()
+        total = 0
+        for msg in msgs:
+            total += len(msg)
+            ends.add(total)
+        total = 0
+        for chunk in chunks:
+            total += len(chunk)
+            assert total in ends
+
+        assert b''.join(db.cloneChunkIter(pre=hab.pre, fn=19)) == b''.join(msgs[19:])
+        assert b''.join(db.cloneChunkIter()) == b''.join(db.cloneAllPreIter())
+        assert hab.pre.encode() in b''.join(db.cloneChunkIter())
+        assert list(db.cloneChunkIter(pre=b'Enope')) == []
+
+        # events with missing entries are skipped
+        dig = db.getFe(onKey(hab.pre, 5))
+        dts = db.getDts(dgKey(hab.pre, dig))
+        assert db.delDts(dgKey(hab.pre, dig))
+        assert [bytes(m) for m in db.clonePreIter(pre=hab.pre)] == msgs[:5] + msgs[6:]
+        assert b''.join(db.cloneChunkIter(pre=hab.pre, size=1)) == b''.join(msgs[:5] + msgs[6:])
+        with pytest.raises(kering.MissingEntryError):
+            db.cloneEvtMsg(pre=hab.pre, fn=5, dig=dig)
+        assert db.putDts(dgKey(hab.pre, dig), dts)
+
+    """End Test"""
+
+
 def test_usebaser():
     """
     Test using Baser
@@ -1694,6 +1822,87 @@ def test_dbdict():
 
 
 
+    """End Test"""
+
+
+def test_dbdict_lru():
+    """
+    Test bounded least recently used dbdict with pinned local prefixes
+    """
+    dbd = basing.dbdict(cap=3)
+    assert dbd.cap == 3
+    assert (dbd.hits, dbd.misses, dbd.evictions) == (0, 0, 0)
+
+    for k, v in (('a', 1), ('b', 2), ('c', 3)):
+        dbd[k] = v
+    assert list(dbd.keys()) == ['a', 'b', 'c']
+
+    assert dbd['a'] == 1  # hit moves to most recent
+    assert list(dbd.keys()) == ['b', 'c', 'a']
+    assert dbd.hits == 1
+
+    dbd['d'] = 4  # evicts least recent
+    assert list(dbd.keys()) == ['c', 'a', 'd']
+    assert dbd.evictions == 1
+    assert 'b' not in dbd  # no db so miss
+    assert dbd.misses == 1
+
+    dbd['c'] = 5  # update moves to most recent
+    assert list(dbd.keys()) == ['a', 'd', 'c']
+
+    with basing.openDB(name="lru", kevercap=2) as db:
+        assert db.kevers.cap == 2
+        dig = 'EAskHI462CuIMS_gNkcl_QewzrRSKH2p9zHQIO132Z30'
+        signers = core.Salter(raw=b'0123456789abcdef').signers(count=4, transferable=False)
+        pres = [signer.verfer.qb64 for signer in signers]
+        for pre in pres:
+            serder = eventing.interact(pre=pre, dig=dig, sn=1)
+            eevt = eventing.StateEstEvent(s='0', d=dig, br=[], ba=[])
+            state = eventing.state(pre=pre, sn=1, pig=dig, dig=serder.said,
+                                   fn=1, eilk=coring.Ilks.ixn, keys=[pre],
+                                   eevt=eevt)
+            db.putEvt(key=eventing.dgKey(pre=pre, dig=serder.said), val=serder.raw)
+            db.states.pin(keys=pre, val=state)
+
+        db.prefixes.add(pres[0])  # pin local prefix
+        kevers = db.kevers
+        kever = kevers[pres[0]]  # read through
+        assert kevers.misses == 1
+        for pre in pres[1:]:
+            assert kevers[pre].prefixer.qb64 == pre
+
+        assert len(kevers) == 2
+        assert list(kevers.keys()) == [pres[0], pres[3]]  # pinned kept
+        assert kevers.evictions == 2
+        assert kevers[pres[0]] is kever  # hit
+
+        assert pres[1] in kevers  # evicted entry reloaded from state
+        assert kevers[pres[1]].state() == db.states.get(keys=pres[1])
+        assert list(kevers.keys()) == [pres[0], pres[1]]
+        assert kevers.misses == 5
+        assert kevers.evictions == 3
+
+        db.prefixes.add(pres[1])  # all pinned so may exceed cap
+        assert kevers[pres[2]].prefixer.qb64 == pres[2]
+        assert len(kevers) == 3
+        assert kevers.evictions == 3  # just added so kept
+        assert kevers.evict() == 1
+        assert set(kevers.keys()) == {pres[0], pres[1]}
+
+    assert not os.path.exists(db.path)
+
+    os.environ["KERI_BASER_KEVER_CAP"] = "10"
+    try:
+        db = Baser(reopen=False, temp=True)
+        assert db.kevers.cap == 10
+        os.environ["KERI_BASER_KEVER_CAP"] = "foo"  # Not an int
+        with pytest.raises(ValueError):
+            Baser(reopen=False, temp=True)
+    finally:
+        os.environ.pop("KERI_BASER_KEVER_CAP")
+
+    assert Baser(reopen=False, temp=True).kevers.cap is None
+
     """End Test"""
 
 
@@ -1913,10 +2122,255 @@ def test_clear_escrows():
         assert db.epsd.cntAll() == 0
         assert db.dpub.cntAll() == 0
 
+
+def test_baser_qb2():
+    """
+    Test Baser qb2 storage of CESR sub dbs and migration of existing qb64b
+    values, and that qb2 values take less space
+    """
+    from keri.db.migrations import qb2_storage
+
+    saider = coring.Saider(qb64='EPkZ3LHbzAfn3A5Ff-G5fEfsEyOyIIzHEaHh8nhk_5ey')
+    dater = coring.Dater(dts='2021-01-01T00:00:00.000000+00:00')
+
+    with openDB() as db:  # default is qb64b text
+        assert not db.qb2
+        assert not any(suber.qb2 for suber in db.cesrSubers())
+        assert db.migs not in db.cesrSubers()
+        db.knas.pin(keys=("pre", "said"), val=saider)
+        db.udes.pin(keys=("pre", "said"), val=(Seqner(sn=1), saider))
+        db.wits.put(keys="pre", vals=[coring.Prefixer(qb64=saider.qb64)])
+        assert bytes(db.getVal(db=db.knas.sdb, key=b'pre.said')) == saider.qb64b
+
+        db.qb2 = True  # opt in on reopen migrates existing values
+        db.reopen(reuse=True)
+        assert db.qb2
+        assert all(suber.qb2 for suber in db.cesrSubers())
+        assert db.migs.get(keys=(basing.Qb2Migration,)) is not None
+        assert bytes(db.getVal(db=db.knas.sdb, key=b'pre.said')) == saider.qb2
+        assert db.knas.get(keys=("pre", "said")).qb64 == saider.qb64
+        assert [val.qb64 for val in db.udes.get(keys=("pre", "said"))] == ["0AAAAAAAAAAAAAAAAAAAAAAB",
+                                                                           saider.qb64]
+        assert [val.qb64 for val in db.wits.get(keys="pre")] == [saider.qb64]
+
+        db.qb2 = False  # stored storage wins over request
+        db.reopen(reuse=True)
+        assert db.qb2
+        assert db.knas.get(keys=("pre", "said")).qb64 == saider.qb64
+
+        qb2_storage.revert(db)
+        assert not db.qb2
+        assert db.migs.get(keys=(basing.Qb2Migration,)) is None
+        assert bytes(db.getVal(db=db.knas.sdb, key=b'pre.said')) == saider.qb64b
+        db.reopen(reuse=True)
+        assert not db.qb2
+        assert [val.qb64 for val in db.udes.get(keys=("pre", "said"))][1] == saider.qb64
+
+    # stored size of text versus binary
+    n = 5000
+    sizes = {}
+    for qb2 in (False, True):
+        with openDB(qb2=qb2) as db:
+            for i in range(n):
+                key = (f"pre{i:07}", f"said{i:07}")
+                db.knas.pin(keys=key, val=saider)
+                db.kdts.pin(keys=key, val=dater)
+                db.udes.pin(keys=key, val=(Seqner(sn=i), saider))
+
+            with db.env.begin() as txn:
+                sizes[qb2] = sum(txn.stat(sdb)["psize"] * (txn.stat(sdb)["leaf_pages"] +
+                                                           txn.stat(sdb)["branch_pages"] +
+                                                           txn.stat(sdb)["overflow_pages"])
+                                 for sdb in (db.knas.sdb, db.kdts.sdb, db.udes.sdb))
+
+            assert sum(1 for _ in db.knas.getItemIter()) == n
+            assert sum(1 for _ in db.kdts.getItemIter()) == n
+            assert sum(1 for _ in db.udes.getItemIter()) == n
+            assert db.udes.get(keys=("pre0000007", "said0000007"))[0].sn == 7
+
+    assert sizes[True] < sizes[False]
+
+    """End Test"""
+
+
+def test_baser_qb2_interrupted():
+    """
+    Test interrupted qb2 migration and revert leave the database unchanged
+    and openable
+    """
+    from keri.db.migrations import qb2_storage
+
+    saider = coring.Saider(qb64='EPkZ3LHbzAfn3A5Ff-G5fEfsEyOyIIzHEaHh8nhk_5ey')
+    convert = qb2_storage.convert
+
+    def failing(db, suber, qb2=True):  # fails on last sub db after the rest converted
+        if suber is db.cesrSubers()[-1]:
+            raise ValueError("Interrupted")
+        return convert(db, suber, qb2=qb2)
+
+    with openDB() as db:
+        db.knas.pin(keys=("pre", "said"), val=saider)
+        db.wits.put(keys="pre", vals=[coring.Prefixer(qb64=saider.qb64)])
+        assert db.knas is not db.cesrSubers()[-1]
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(qb2_storage, "convert", failing)
+            db.qb2 = True
+            with pytest.raises(ValueError):
+                db.reopen(reuse=True)
+
+        assert db.migs.get(keys=(basing.Qb2Migration,)) is None
+        assert not any(suber.qb2 for suber in db.cesrSubers())
+        assert bytes(db.getVal(db=db.knas.sdb, key=b'pre.said')) == saider.qb64b
+
+        db.qb2 = False  # still opens as qb64b
+        db.reopen(reuse=True)
+        assert not db.qb2
+        assert db.knas.get(keys=("pre", "said")).qb64 == saider.qb64
+        assert [val.qb64 for val in db.wits.get(keys="pre")] == [saider.qb64]
+
+        db.qb2 = True  # rerun of migration converts every sub db once
+        db.reopen(reuse=True)
+        assert db.qb2
+        assert bytes(db.getVal(db=db.knas.sdb, key=b'pre.said')) == saider.qb2
+        assert [val.qb64 for val in db.wits.get(keys="pre")] == [saider.qb64]
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(qb2_storage, "convert", failing)
+            with pytest.raises(ValueError):
+                qb2_storage.revert(db)
+
+        assert db.qb2
+        assert db.migs.get(keys=(basing.Qb2Migration,)) is not None
+        assert all(suber.qb2 for suber in db.cesrSubers())
+        assert bytes(db.getVal(db=db.knas.sdb, key=b'pre.said')) == saider.qb2
+        db.reopen(reuse=True)
+        assert db.knas.get(keys=("pre", "said")).qb64 == saider.qb64
+
+    """End Test"""
+
+
+def test_baser_packed():
+    """
+    Test Baser packed records of Komer sub dbs and migration of existing JSON
+    records
+    """
+    from keri.db.migrations import packed_records
+
+    ksr = basing.KeyStateRecord(vn=[1, 0], i="EABC" * 11, s='1', d="EDEF" * 11,
+                                k=["DKEY" * 11] * 3, n=["ENXT" * 11] * 3,
+                                ee=basing.StateEERecord(s='1', d="EDEF" * 11))
+    end = basing.EndpointRecord(allowed=True, name="wit")
+
+    with openDB() as db:  # default is JSON
+        assert not db.packed
+        assert db.states in db.komers() and db.wkas in db.komers()
+        db.states.pin(keys="EABC", val=ksr)
+        db.ends.pin(keys=("cid", "role", "eid"), val=end)
+        assert bytes(db.getVal(db=db.states.sdb, key=b'EABC')) == ksr._asjson()
+
+        db.packed = True  # opt in on reopen migrates existing records
+        db.reopen(reuse=True)
+        assert db.packed
+        assert all(komer.packed for komer in db.komers())
+        assert db.migs.get(keys=(basing.PackedMigration,)) is not None
+        assert bytes(db.getVal(db=db.states.sdb, key=b'EABC')) == koming.packer(
+            basing.KeyStateRecord).pack(ksr)
+        assert db.states.get(keys="EABC") == ksr
+        assert db.ends.get(keys=("cid", "role", "eid")) == end
+
+        db.packed = False  # stored serialization wins over request
+        db.reopen(reuse=True)
+        assert db.packed
+        assert db.states.get(keys="EABC") == ksr
+
+        packed_records.revert(db)
+        assert not db.packed
+        assert bytes(db.getVal(db=db.states.sdb, key=b'EABC')) == ksr._asjson()
+        db.reopen(reuse=True)
+        assert not db.packed
+        assert db.states.get(keys="EABC") == ksr
+
+    # many key state reads of JSON versus packed
+    n = 200
+    for packed in (False, True):
+        with openDB(packed=packed) as db:
+            for i in range(n):
+                db.states.pin(keys=f"E{i:043}", val=ksr)
+            for i in range(n):
+                assert db.states.get(keys=f"E{i:043}") == ksr
+
+    """End Test"""
+
+
+def test_baser_packed_interrupted():
+    """
+    Test interrupted packed records migration and revert leave the database
+    unchanged and openable
+    """
+    from keri.db.migrations import packed_records
+
+    ksr = basing.KeyStateRecord(vn=[1, 0], i="EABC" * 11, s='1', d="EDEF" * 11,
+                                k=["DKEY" * 11] * 3, n=["ENXT" * 11] * 3,
+                                ee=basing.StateEERecord(s='1', d="EDEF" * 11))
+    convert = packed_records.convert
+
+    def failing(db, komer, packed=True):  # fails on last sub db after the rest converted
+        if komer is db.komers()[-1]:
+            raise ValueError("Interrupted")
+        return convert(db, komer, packed=packed)
+
+    with openDB() as db:
+        db.states.pin(keys="EABC", val=ksr)
+        assert db.states is not db.komers()[-1]
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(packed_records, "convert", failing)
+            db.packed = True
+            with pytest.raises(ValueError):
+                db.reopen(reuse=True)
+
+        assert db.migs.get(keys=(basing.PackedMigration,)) is None
+        assert not any(komer.packed for komer in db.komers())
+        assert bytes(db.getVal(db=db.states.sdb, key=b'EABC')) == ksr._asjson()
+
+        db.packed = False  # still opens as JSON
+        db.reopen(reuse=True)
+        assert not db.packed
+        assert db.states.get(keys="EABC") == ksr
+
+        db.packed = True  # rerun of migration converts every sub db once
+        db.reopen(reuse=True)
+        assert db.packed
+        assert bytes(db.getVal(db=db.states.sdb, key=b'EABC')) == koming.packer(
+            basing.KeyStateRecord).pack(ksr)
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(packed_records, "convert", failing)
+            with pytest.raises(ValueError):
+                packed_records.revert(db)
+
+        assert db.packed
+        assert db.migs.get(keys=(basing.PackedMigration,)) is not None
+        assert all(komer.packed for komer in db.komers())
+        db.reopen(reuse=True)
+        assert db.states.get(keys="EABC") == ksr
+
+    """End Test"""
+
+
 if __name__ == "__main__":
     test_baser()
     test_clean_baser()
+    test_clean_baser_qb2()
+    test_clean_baser_packed()
+    test_fetch_sealing_event_transaction()
     test_fetchkeldel()
     test_usebaser()
     test_dbdict()
+    test_dbdict_lru()
     test_baserdoer()
+    test_baser_qb2()
+    test_baser_qb2_interrupted()
+    test_baser_packed()
+    test_baser_packed_interrupted()
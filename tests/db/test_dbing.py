@@ -1159,8 +1159,172 @@ def test_lmdber():
     """ End Test """
 
 
+def test_lmdber_transaction():
+    """
+    Test LMDBer.transaction unit of work
+    """
+    with openLMDB() as dber:
+        db = dber.env.open_db(key=b'beep.')
+        dupdb = dber.env.open_db(key=b'boop.', dupsort=True)
+        assert dber.txn is None
+
+        # helpers join one write transaction that commits once at exit
+        with dber.transaction() as txn:
+            assert dber.txn is txn
+            assert dber.putVal(db, b'A', b'whatever')
+            assert dber.putVals(dupdb, b'A', [b'z', b'm'])
+            assert dber.getVal(db, b'A') == b'whatever'  # sees uncommitted
+            assert dber.getVals(dupdb, b'A') == [b'm', b'z']
+            # iterators also read through the active transaction
+            assert list(dber.getTopItemIter(db)) == [(b'A', b'whatever')]
+            assert list(dber.getValsIter(dupdb, b'A')) == [b'm', b'z']
+            with dber.transaction() as inner:  # reentrant joins outer
+                assert inner is txn
+                assert dber.setVal(db, b'B', b'still')
+            assert dber.txn is txn
+            # separate read transaction does not see uncommitted writes
+            with dber.env.begin(db=db) as rtxn:
+                assert rtxn.get(b'A') is None
+
+        assert dber.txn is None
+        assert dber.getVal(db, b'A') == b'whatever'
+        assert dber.getVal(db, b'B') == b'still'
+        assert dber.getVals(dupdb, b'A') == [b'm', b'z']
+
+        # exception aborts all writes of unit of work
+        with pytest.raises(ValueError):
+            with dber.transaction():
+                assert dber.setVal(db, b'A', b'changed')
+                assert dber.delVal(db, b'B')
+                with dber.transaction():
+                    assert dber.putVal(db, b'C', b'never')
+                raise ValueError("abort")
+
+        assert dber.txn is None
+        assert dber.getVal(db, b'A') == b'whatever'
+        assert dber.getVal(db, b'B') == b'still'
+        assert dber.getVal(db, b'C') is None
+
+        # exception in savepoint discards only its writes
+        with dber.transaction() as txn:
+            assert dber.putVal(db, b'D', b'kept')
+            with pytest.raises(ValueError):
+                with dber.savepoint() as sub:
+                    assert dber.txn is sub
+                    assert dber.putVal(db, b'E', b'never')
+                    with dber.transaction() as inner:  # joins savepoint
+                        assert inner is sub
+                        assert dber.setVal(db, b'D', b'never')
+                    raise ValueError("abort")
+            assert dber.txn is txn
+            with dber.savepoint():
+                assert dber.putVal(db, b'F', b'kept')
+            assert dber.getVal(db, b'D') == b'kept'
+            assert dber.getVal(db, b'E') is None
+
+        assert dber.getVal(db, b'D') == b'kept'
+        assert dber.getVal(db, b'E') is None
+        assert dber.getVal(db, b'F') == b'kept'
+        for key in (b'D', b'F'):
+            assert dber.delVal(db, key)
+
+        with dber.savepoint():  # without transaction same as transaction
+            assert dber.txn is not None
+            assert dber.putVal(db, b'G', b'kept')
+        assert dber.txn is None
+        assert dber.delVal(db, b'G')
+
+        # reads share one read only transaction of one snapshot
+        with dber.reading() as txn:
+            assert dber.txn is txn
+            assert dber.getVal(db, b'A') == b'whatever'
+            assert isinstance(dber.getVal(db, b'A'), bytes)
+            with dber.reading() as inner:  # joins outer
+                assert inner is txn
+            with pytest.raises(ValueError):
+                with dber.transaction():
+                    pass
+            with pytest.raises(ValueError):
+                with dber.savepoint():
+                    pass
+        assert dber.txn is None
+
+        with dber.transaction() as txn:  # joins active write transaction
+            with dber.reading() as inner:
+                assert inner is txn
+
+        # many writes in one transaction
+        count = 1000
+        with dber.transaction():
+            for i in range(count):
+                dber.putVal(db, b'y%06d' % i, b'val')
+        assert dber.cnt(db) == 2 + count
+
+    """ Done Test """
+
+
+def test_kever_log_transaction():
+    """
+    Test Kever.logEvent writes commit in one transaction
+    """
+    from keri.app import habbing
+
+    with habbing.openHby(name="test", temp=True) as hby:
+        hab = hby.makeHab(name="test", isith="1", icount=1)
+        commits = []
+
+        class Txn:  # proxy counts commits of outermost transactions
+            def __init__(self, txn):
+                self.txn = txn
+
+            def __getattr__(self, name):
+                return getattr(self.txn, name)
+
+            def __enter__(self):
+                self.txn.__enter__()
+                return self
+
+            def __exit__(self, *exc):
+                if exc[0] is None:
+                    self.commit()
+                    return False
+                return self.txn.__exit__(*exc)
+
+            def commit(self):
+                commits.append(True)
+                return self.txn.commit()
+
+        begin = hby.db.env.begin
+        env = hby.db.env
+
+        class Env:
+            def __getattr__(self, name):
+                return getattr(env, name)
+
+            def begin(self, **kwa):
+                if isinstance(kwa.get("parent"), Txn):  # nested so not counted
+                    return begin(**dict(kwa, parent=kwa["parent"].txn))
+                txn = begin(**kwa)
+                return Txn(txn) if kwa.get("write") else txn
+
+        hby.db.env = Env()
+        try:
+            hab.interact()
+        finally:
+            hby.db.env = env
+
+        assert len(commits) == 1  # whole accepted event in one commit
+        assert hby.db.txn is None
+        assert hab.kever.sn == 1
+        assert hby.db.getKeLast(dbing.snKey(hab.pre, 1)) is not None
+
+    """ Done Test """
+
+
 if __name__ == "__main__":
     test_key_funcs()
     test_suffix()
     test_lmdber()
     test_opendatabaser()
+    test_lmdber_transaction()
+    test_kever_log_transaction()
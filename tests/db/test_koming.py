@@ -6,8 +6,10 @@ tests.app.apping module
 
 import json
 import os
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
+from typing import Optional
 
+import msgpack
 import pytest
 
 from keri.core.coring import Kinds
@@ -837,6 +839,128 @@ def test_ioset_komer():
     assert not db.opened
 
 
+def test_packed_komer():
+    """
+    Test Packer positional codec and Komer packed serialization
+    """
+
+    @dataclass
+    class Inner:
+        a: str = ''
+        b: list = field(default_factory=list)
+
+    @dataclass
+    class Record:
+        name: str
+        zip: int
+        inner: Inner = field(default_factory=Inner)
+        maybe: Optional[Inner] = None
+        tags: list[str] = field(default_factory=list)
+        extra: dict = field(default_factory=dict)
+
+    packer = koming.packer(Record)
+    assert packer is koming.packer(Record)  # compiled once and cached
+    assert packer.names == ("name", "zip", "inner", "maybe", "tags", "extra")
+    assert [i for i, _ in packer.nesteds] == [2, 3]
+    assert len(packer.tags) == 7
+    inner = koming.packer(Inner).tags[-1]
+
+    rec = Record(name="Sue", zip=84058, inner=Inner(a="x", b=[1, 2]),
+                 tags=["a", "b"], extra=dict(k=[1, "v"]))
+    raw = packer.pack(rec)
+    assert raw == msgpack.dumps([packer.tags[6], "Sue", 84058, [inner, "x", [1, 2]], None,
+                                 ["a", "b"], dict(k=[1, "v"])])
+    assert len(raw) < len(json.dumps(asdict(rec)))
+    assert packer.unpack(raw) == rec
+    rec.maybe = Inner(a="y")
+    assert packer.unpack(packer.pack(rec)) == rec
+
+    # records packed before fields were appended unpack with defaults
+    assert packer.unpack(msgpack.dumps([packer.tags[2], "Sam", 1])) == Record(name="Sam", zip=1)
+    with pytest.raises(ValueError):
+        packer.unpack(msgpack.dumps([packer.tags[6], "Sam", 1, None, None, [], {}, "more"]))
+    with pytest.raises(ValueError):  # untagged
+        packer.unpack(msgpack.dumps(["Sam", 1]))
+
+    # records packed before fields were reordered or inserted do not unpack
+    @dataclass
+    class Reordered:
+        zip: int
+        name: str
+
+    @dataclass
+    class Inserted:
+        name: str
+        city: str
+        zip: int
+
+    old = koming.Packer(Reordered).pack(Reordered(zip=1, name="Sam"))
+    with pytest.raises(ValueError):
+        packer.unpack(old)
+    old = koming.Packer(Inserted).pack(Inserted(name="Sam", city="Provo", zip=1))
+    with pytest.raises(ValueError):
+        packer.unpack(old)
+    with pytest.raises(ValueError):
+        koming.Packer(dict)
+
+    with dbing.openLMDB() as db:
+        mydb = koming.Komer(db=db, schema=Record, subkey='recs.', packed=True)
+        assert mydb.packed
+        assert mydb.put(keys=("a", "b"), val=rec)
+        assert bytes(db.getVal(db=mydb.sdb, key=b'a.b')) == packer.pack(rec)
+        assert mydb.get(keys=("a", "b")) == rec
+        assert mydb.getDict(keys=("a", "b")) == asdict(rec)
+        assert list(mydb.getItemIter()) == [(("a", "b"), rec)]
+        with pytest.raises(ValueError):
+            mydb.put(keys="c", val=Inner())
+
+        mydb.packed = False  # rebinds serializer to kind
+        assert mydb.pin(keys=("a", "b"), val=rec)
+        assert bytes(db.getVal(db=mydb.sdb, key=b'a.b')) == json.dumps(
+            asdict(rec), separators=(",", ":")).encode()
+
+        iodb = koming.IoSetKomer(db=db, schema=Inner, subkey='ios.', packed=True)
+        assert iodb.put(keys="a", vals=[Inner(a="1"), Inner(a="2")])
+        assert not iodb.add(keys="a", val=Inner(a="1"))
+        assert iodb.get(keys="a") == [Inner(a="1"), Inner(a="2")]
+
+    """End Test"""
+
+
+def test_bulk_komer():
+    """
+    Test putMany, pinMany, getMany and remMany of Komer and IoSetKomer
+    """
+
+    @dataclass
+    class Record:
+        first: str
+        zip: int = 0
+
+    with dbing.openLMDB() as db:
+        mydb = koming.Komer(db=db, schema=Record, subkey='recs.')
+        sue, sam, ann = Record(first="Sue"), Record(first="Sam"), Record(first="Ann", zip=1)
+        assert mydb.putMany([(("b", "2"), sue), ("a.1", sam)]) == [True, True]
+        assert mydb.putMany([("a.1", ann)]) == [False]
+        assert mydb.getMany([("b", "2"), "z", ("a", "1")]) == [sue, None, sam]
+        assert mydb.pinMany([("a.1", ann)]) == [True]
+        assert mydb.get("a.1") == ann
+        assert mydb.remMany(["a.1", "z"]) == [True, False]
+        assert list(mydb.getItemIter()) == [(("b", "2"), sue)]
+
+        with pytest.raises(ValueError):  # invalid schema rolls back batch
+            mydb.pinMany([("c", sam), ("d", dict(first="x"))])
+        assert mydb.get("c") is None
+
+        iodb = koming.IoSetKomer(db=db, schema=Record, subkey='sets.')
+        assert iodb.putMany([("b", [sue, sam]), ("a", [ann])]) == [True, True]
+        assert iodb.getMany(["a", "b"]) == [[ann], [sue, sam]]
+        assert iodb.remMany(["b"]) == [True]
+        assert iodb.getMany(["b"]) == [[]]
+
+    """End Test"""
+
+
 if __name__ == "__main__":
     test_kom_happy_path()
     test_kom_get_item_iter()
@@ -848,3 +972,5 @@ if __name__ == "__main__":
     test_deserialization()
     test_dup_komer()
     test_ioset_komer()
+    test_packed_komer()
+    test_bulk_komer()
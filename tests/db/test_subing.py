@@ -3286,6 +3286,105 @@ def test_crypt_signer_suber():
 
 
 
+def test_cesr_suber_qb2():
+    """
+    Test CESR sub db classes storing values as qb2 binary
+    """
+    seed = (b'\x18;0\xc4\x0f*vF\xfa\xe3\xa2Eee\x1f\x96o\xce)G\x85\xe3X\x86\xda\x04\xf0\xdc'
+            b'\xde\x06\xc0+')
+    signer = core.Signer(raw=seed, code=coring.MtrDex.Ed25519_Seed, transferable=False)
+    saider = coring.Saider(qb64='EPkZ3LHbzAfn3A5Ff-G5fEfsEyOyIIzHEaHh8nhk_5ey')
+    seqner = coring.Seqner(sn=20)
+    siger = signer.sign(ser=b'abc', index=0)
+
+    with dbing.openLMDB() as db:
+        sdb = subing.CesrSuber(db=db, subkey='bags.', klas=coring.Saider, qb2=True)
+        assert sdb.qb2
+        assert sdb.put(keys=("a", "b"), val=saider)
+        assert bytes(db.getVal(db=sdb.sdb, key=b'a.b')) == saider.qb2
+        assert len(saider.qb2) == len(saider.qb64b) * 3 // 4
+        actual = sdb.get(keys=("a", "b"))
+        assert isinstance(actual, coring.Saider)
+        assert actual.qb64 == saider.qb64
+        assert [(keys, val.qb64) for keys, val in sdb.getItemIter()] == [(("a", "b"), saider.qb64)]
+
+        cdb = subing.CatCesrSuber(db=db, subkey='cats.', klas=(coring.Seqner, coring.Saider),
+                                  qb2=True)
+        assert cdb.put(keys="a", val=(seqner, saider))
+        assert bytes(db.getVal(db=cdb.sdb, key=b'a')) == seqner.qb2 + saider.qb2
+        actual = cdb.get(keys="a")
+        assert [val.qb64 for val in actual] == [seqner.qb64, saider.qb64]
+
+        idb = subing.CesrIoSetSuber(db=db, subkey='sets.', klas=indexing.Siger, qb2=True)
+        assert idb.put(keys="a", vals=[siger])
+        assert not idb.add(keys="a", val=siger)  # set membership compares qb2
+        assert [val.qb64 for val in idb.get(keys="a")] == [siger.qb64]
+        assert idb.rem(keys="a", val=siger)
+        assert idb.cnt(keys="a") == 0
+
+        gdb = subing.SignerSuber(db=db, subkey='sigs.', qb2=True)
+        assert gdb.put(keys=signer.verfer.qb64, val=signer)
+        assert bytes(db.getVal(db=gdb.sdb, key=signer.verfer.qb64b)) == signer.qb2
+        actual = gdb.get(keys=signer.verfer.qb64)
+        assert actual.qb64 == signer.qb64
+        assert not actual.verfer.transferable
+        (keys, actual), = gdb.getItemIter()
+        assert actual.qb64 == signer.qb64
+
+    """End Test"""
+
+
+def test_bulk_suber():
+    """
+    Test putMany, pinMany, getMany and remMany of Suber, IoSetSuber, DupSuber
+    """
+    with dbing.openLMDB() as db:
+        sdb = subing.Suber(db=db, subkey='bags.')
+        items = [(("b", "2"), "v2"), ("a.1", "v1"), (("c", "3"), "v3")]
+        assert sdb.putMany(items) == [True, True, True]
+        assert sdb.putMany([("a.1", "x"), ("d", "v4")]) == [False, True]  # no overwrite
+        assert sdb.getMany([("c", "3"), "a.1", "z", ("b", "2")]) == ["v3", "v1", None, "v2"]
+        assert sdb.pinMany([("a.1", "x"), ("e", "v5")]) == [True, True]
+        assert sdb.get("a.1") == "x"
+        assert sdb.remMany(["e", "z", ("b", "2")]) == [True, False, True]
+        assert [keys for keys, _ in sdb.getItemIter()] == [("a", "1"), ("c", "3"), ("d",)]
+
+        # all in one transaction so failure rolls back entire batch
+        with pytest.raises(TypeError):
+            sdb.pinMany([("f", "v6"), ("g", 7.0)])
+        assert sdb.get("f") is None
+
+        cdb = subing.CesrSuber(db=db, subkey='cesr.', klas=coring.Seqner)
+        assert cdb.putMany((f"k{i}", coring.Seqner(sn=i)) for i in range(3)) == [True] * 3
+        assert [val.sn for val in cdb.getMany(["k2", "k0"])] == [2, 0]
+
+        idb = subing.IoSetSuber(db=db, subkey='sets.')
+        assert idb.putMany([("b", ["z", "y"]), ("a", ["x"])]) == [True, True]
+        assert idb.getMany(["a", "b", "c"]) == [["x"], ["z", "y"], []]
+        assert idb.pinMany([("a", ["w"])]) == [True]
+        assert idb.remMany(["a"]) == [True]
+        assert idb.getMany(["a", "b"]) == [[], ["z", "y"]]
+
+        ddb = subing.DupSuber(db=db, subkey='dups.')
+        assert ddb.putMany([("b", ["z", "y"]), ("a", ["x"])]) == [True, True]
+        assert ddb.getMany(["b", "a"]) == [["y", "z"], ["x"]]  # lexicographic dups
+        assert ddb.remMany(["b"]) == [True]
+        assert ddb.getMany(["b"]) == [[]]
+
+    with dbing.openLMDB() as db:
+        n = 2000
+        sdb = subing.CesrSuber(db=db, subkey='bulk.', klas=coring.Seqner)
+        items = [(f"E{(i * 7919) % n:043}", coring.Seqner(sn=i)) for i in range(n)]
+        assert sdb.putMany(items) == [True] * n
+
+        # gets share one read only transaction that joins none left behind
+        vals = sdb.getMany(keys for keys, _ in items)
+        assert [val.sn for val in vals] == list(range(n))
+        assert db.txn is None
+
+    """End Test"""
+
+
 if __name__ == "__main__":
     test_suber()
     test_on_suber()
@@ -3307,3 +3406,5 @@ if __name__ == "__main__":
     test_schemer_suber()
     test_signer_suber()
     test_crypt_signer_suber()
+    test_cesr_suber_qb2()
+    test_bulk_suber()